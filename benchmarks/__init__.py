@@ -0,0 +1,11 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+from benchmarks.dataset_generator import DatasetGenerator, DatasetSpec
+from benchmarks.benchmark_runner import SIZE_PRESETS, BenchmarkRunner, compare_results
+
+__all__ = [
+    "DatasetGenerator",
+    "DatasetSpec",
+    "SIZE_PRESETS",
+    "BenchmarkRunner",
+    "compare_results",
+]
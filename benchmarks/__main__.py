@@ -0,0 +1,96 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import argparse
+import json
+import sys
+
+from benchmarks.benchmark_runner import SIZE_PRESETS, BenchmarkRunner, compare_results
+from benchmarks.dataset_generator import DatasetGenerator, DatasetSpec
+
+
+def _add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the DatasetSpec parameters as optional arguments (None keeps the preset value)."""
+    parser.add_argument("--n-indicators", type=int, help="Number of indicators, including the root.")
+    parser.add_argument("--depth", type=int, help="Number of levels of the indicator tree.")
+    parser.add_argument("--n-rows", type=int, help="Number of rows of the value spreadsheets.")
+    parser.add_argument("--future-years", type=int, help="Number of temporal symbols after the base year.")
+    parser.add_argument("--n-scenarios", type=int, help="Number of scenarios.")
+    parser.add_argument("--scenario-share", type=float, help="Share of the leaf indicators with scenarios.")
+    parser.add_argument("--legend-groups", type=int, help="Number of legend groups.")
+    parser.add_argument(
+        "--no-proportionality", dest="proportionality", action="store_false", default=None, help="Skip the proportionality spreadsheet."
+    )
+    parser.add_argument("--error-rate", type=float, help="Share of the value and proportionality cells made invalid.")
+    parser.add_argument("--seed", type=int, help="Seed of the random generator.")
+
+
+def _spec_overrides(args: argparse.Namespace) -> dict:
+    """Collect the DatasetSpec parameters given on the command line."""
+    names = [
+        "n_indicators",
+        "depth",
+        "n_rows",
+        "future_years",
+        "n_scenarios",
+        "scenario_share",
+        "legend_groups",
+        "proportionality",
+        "error_rate",
+        "seed",
+    ]
+    return {name: getattr(args, name) for name in names if getattr(args, name) is not None}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Adapta Parser - Benchmarks the validation of synthetic submissions.", allow_abbrev=False)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="Write a synthetic submission.")
+    generate_parser.add_argument("--output_folder", required=True, help="Folder receiving the spreadsheets.")
+    generate_parser.add_argument("--size", choices=list(SIZE_PRESETS), default="small", help="Size preset used as a starting point.")
+    _add_spec_arguments(generate_parser)
+
+    run_parser = subparsers.add_parser("run", help="Benchmark the validation at several sizes; other arguments are forwarded to every run.")
+    run_parser.add_argument("--sizes", nargs="+", choices=list(SIZE_PRESETS), default=["small", "medium"], help="Size presets to run.")
+    run_parser.add_argument("--repeats", type=int, default=3, help="Number of timed runs per size.")
+    run_parser.add_argument("--work_folder", default="data/output/benchmarks", help="Folder of the generated submissions and reports.")
+    run_parser.add_argument("--results", default="data/output/benchmarks/results.json", help="Path of the JSON results file.")
+    run_parser.add_argument("--no-memory", dest="memory", action="store_false", help="Skip the memory profiling run.")
+    _add_spec_arguments(run_parser)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare the median times of two results files.")
+    compare_parser.add_argument("baseline", help="Results of the reference version.")
+    compare_parser.add_argument("current", help="Results of the version under test.")
+
+    args, extra_args = parser.parse_known_args(argv)
+    if extra_args and args.command != "run":
+        parser.error(f"unrecognized arguments: {' '.join(extra_args)}")
+
+    if args.command == "generate":
+        generator = DatasetGenerator(DatasetSpec(**{**SIZE_PRESETS[args.size], **_spec_overrides(args)}))
+        generator.write(args.output_folder)
+        print(f"Submissão gerada em: {args.output_folder} ({generator.injected_errors} erros injetados)")
+    elif args.command == "run":
+        runner = BenchmarkRunner(args.sizes, args.repeats, args.work_folder, extra_args, args.memory, _spec_overrides(args))
+        results = runner.run()
+        for result in results["sizes"]:
+            total = result["timings"]["total"]["median"]
+            print(f"[{result['size']}] {total:.3f}s (mediana), {result['errors']} erros, {result['warnings']} avisos")
+        print(f"\nResultados salvos em: {runner.save(results, args.results)}")
+    else:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        with open(args.current, encoding="utf-8") as file:
+            current = json.load(file)
+        for row in compare_results(baseline, current):
+            ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+            print(f"{row['size']:<8} {row['span']:<70} {row['baseline']:>10.4f}s {row['current']:>10.4f}s {ratio:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# Example usage:
+# python3 -m benchmarks run --sizes small medium --repeats 3 --no-spellchecker --results data/output/benchmarks/new.json
+# python3 -m benchmarks compare data/output/benchmarks/old.json data/output/benchmarks/new.json
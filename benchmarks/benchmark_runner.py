@@ -0,0 +1,264 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for benchmarking the validation pipeline on synthetic submissions.
+
+This module defines the `BenchmarkRunner` class, which generates a submission for
+each size preset, validates it a number of times, and collects the time of every
+stage of `SpreadsheetProcessor` and of every validator (the `--timings` tree) plus,
+in one extra run, the memory allocated by each stage (`--profile-memory`). Results
+are saved as JSON, and `compare_results` lines up two result files, e.g. of two
+versions of the package.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import data_validate
+from data_validate.config import ApplicationConfig
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs, LoggerManager
+from data_validate.helpers.tools import LanguageManager
+
+from benchmarks.dataset_generator import DatasetGenerator, DatasetSpec
+
+# Shape of the submission of each size preset
+SIZE_PRESETS: Dict[str, Dict[str, Any]] = {
+    "small": {"n_indicators": 30, "depth": 4, "n_rows": 100, "legend_groups": 3},
+    "medium": {"n_indicators": 150, "depth": 5, "n_rows": 1000, "legend_groups": 10},
+    "large": {"n_indicators": 600, "depth": 6, "n_rows": 5570, "legend_groups": 30},
+}
+
+
+class BenchmarkRunner:
+    """
+    Times and memory-profiles the validation of synthetic submissions.
+
+    The services every run needs (localization, application configuration and
+    logging) are created once, as in a warm batch process, so the timings cover the
+    validation pipeline only. Runs are silent: their console output is discarded.
+
+    Attributes:
+        sizes (List[str]): Names of the size presets to run, in order.
+        repeats (int): Number of timed runs per size.
+        work_folder (str): Folder receiving the generated submissions and the reports.
+        extra_args (List[str]): Command-line arguments forwarded to every run (e.g. `--no-spellchecker`).
+        memory (bool): If True, adds one `--profile-memory` run per size.
+        spec_overrides (Dict[str, Any]): DatasetSpec parameters applied to every size (e.g. `error_rate`).
+    """
+
+    def __init__(
+        self,
+        sizes: Iterable[str] = ("small",),
+        repeats: int = 3,
+        work_folder: str = "data/output/benchmarks",
+        extra_args: Iterable[str] = (),
+        memory: bool = True,
+        spec_overrides: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the BenchmarkRunner.
+
+        Args:
+            sizes (Iterable[str]): Names of the size presets to run. Defaults to ("small",).
+            repeats (int): Number of timed runs per size. Defaults to 3.
+            work_folder (str): Folder receiving the generated submissions and the reports. Defaults to "data/output/benchmarks".
+            extra_args (Iterable[str]): Command-line arguments forwarded to every run. Defaults to ().
+            memory (bool): Adds one `--profile-memory` run per size. Defaults to True.
+            spec_overrides (Optional[Dict[str, Any]]): DatasetSpec parameters applied to every size. Defaults to None.
+
+        Raises:
+            ValueError: If a size is not a preset or repeats is not positive.
+        """
+        self.sizes = list(sizes)
+        unknown_sizes = [size for size in self.sizes if size not in SIZE_PRESETS]
+        if unknown_sizes:
+            raise ValueError(f"Unknown sizes: {unknown_sizes}. Available sizes: {list(SIZE_PRESETS)}.")
+        if repeats < 1:
+            raise ValueError("repeats must be a positive integer.")
+        self.repeats = repeats
+        self.work_folder = work_folder
+        self.extra_args = list(extra_args)
+        self.memory = memory
+        self.spec_overrides = dict(spec_overrides or {})
+        self._warm_resources: Dict[str, Any] = {}
+
+    def spec_for(self, size: str) -> DatasetSpec:
+        """
+        Build the DatasetSpec of a size preset, with the overrides applied.
+
+        Args:
+            size (str): Name of the size preset.
+
+        Returns:
+            DatasetSpec: The shape of the submission of that size.
+        """
+        return DatasetSpec(**{**SIZE_PRESETS[size], **self.spec_overrides})
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the benchmark for every size.
+
+        Returns:
+            Dict[str, Any]: The environment of the benchmark and the results of each size.
+        """
+        return {
+            "version": data_validate.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "repeats": self.repeats,
+            "extra_args": self.extra_args,
+            "sizes": [self.run_size(size) for size in self.sizes],
+        }
+
+    def run_size(self, size: str) -> Dict[str, Any]:
+        """
+        Generate the submission of a size and benchmark its validation.
+
+        Args:
+            size (str): Name of the size preset.
+
+        Returns:
+            Dict[str, Any]: The spec, the error and warning counts, the time of each span
+                (min, median and max in seconds) and, if requested, the memory of each stage.
+        """
+        spec = self.spec_for(size)
+        generator = DatasetGenerator(spec)
+        input_folder = generator.write(os.path.join(self.work_folder, size, "input"))
+        output_folder = os.path.join(self.work_folder, size, "output")
+
+        span_seconds: Dict[str, List[float]] = {}
+        processor = None
+        for _ in range(self.repeats):
+            processor = self._validate(input_folder, output_folder)
+            for path, seconds in self.flatten_timings(processor.timings.to_dict()["timings"]).items():
+                span_seconds.setdefault(path, []).append(seconds)
+
+        result = {
+            "size": size,
+            "spec": spec.to_dict(),
+            "injected_errors": generator.injected_errors,
+            "errors": processor.validation_reports.get_total_errors(),
+            "warnings": processor.validation_reports.get_total_warnings(),
+            "timings": {path: {"min": min(values), "median": statistics.median(values), "max": max(values)} for path, values in span_seconds.items()},
+        }
+        if self.memory:
+            result["memory"] = self._validate(input_folder, output_folder, ["--profile-memory"]).profiler.stages
+        return result
+
+    def _validate(self, input_folder: str, output_folder: str, run_args: Iterable[str] = ()) -> SpreadsheetProcessor:
+        """
+        Validate a submission silently with the warm services.
+
+        Args:
+            input_folder (str): Folder of the submission.
+            output_folder (str): Folder receiving the reports.
+            run_args (Iterable[str]): Command-line arguments of this run only. Defaults to ().
+
+        Returns:
+            SpreadsheetProcessor: The finished processor, with its timings and reports.
+        """
+        if not self._warm_resources:
+            self._warm_resources = {
+                "language_manager": LanguageManager(),
+                "config": ApplicationConfig(),
+                "logger_manager": LoggerManager(
+                    log_folder="data/output/logs",
+                    console_logger="console_logger",
+                    prefix="data_validate",
+                    logger_name="data_validate_file_logger",
+                ),
+            }
+        data_args = DataArgs(
+            argv=["--input_folder", input_folder, "--output_folder", output_folder, "--no-time", "--no-version", *self.extra_args, *run_args],
+            language_manager=self._warm_resources["language_manager"],
+        )
+        context = GeneralContext(data_args=data_args, **self._warm_resources)
+        with contextlib.redirect_stdout(io.StringIO()):
+            processor = SpreadsheetProcessor(context=context)
+        context.finalize()
+        return processor
+
+    @staticmethod
+    def flatten_timings(spans: List[Dict[str, Any]], prefix: str = "") -> Dict[str, float]:
+        """
+        Flatten a timings tree into ``parent/child`` paths.
+
+        Spans with the same path (e.g. a stage measured twice) have their times added.
+
+        Args:
+            spans (List[Dict[str, Any]]): Spans of `TimingRecorder.to_dict()`.
+            prefix (str): Path of the parent span. Defaults to "".
+
+        Returns:
+            Dict[str, float]: The seconds of each span path, depth first.
+        """
+        flat: Dict[str, float] = {}
+        for span in spans:
+            path = f"{prefix}{span['name']}"
+            if span["seconds"] is not None:
+                flat[path] = flat.get(path, 0.0) + span["seconds"]
+            for child_path, seconds in BenchmarkRunner.flatten_timings(span["children"], f"{path}/").items():
+                flat[child_path] = flat.get(child_path, 0.0) + seconds
+        return flat
+
+    @staticmethod
+    def save(results: Dict[str, Any], path: str) -> str:
+        """
+        Write the results of a benchmark as JSON.
+
+        Args:
+            results (Dict[str, Any]): The results of `run()`.
+            path (str): Path of the JSON file.
+
+        Returns:
+            str: The path of the written file.
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+        return path
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare the median time of each span of two benchmark results.
+
+    Only the sizes and spans present in both results are compared.
+
+    Args:
+        baseline (Dict[str, Any]): Results of the reference version.
+        current (Dict[str, Any]): Results of the version under test.
+
+    Returns:
+        List[Dict[str, Any]]: One row per size and span, with the baseline and current
+            median seconds and their ratio (current / baseline; below 1 is faster).
+    """
+    baseline_sizes = {result["size"]: result for result in baseline["sizes"]}
+    rows = []
+    for result in current["sizes"]:
+        reference = baseline_sizes.get(result["size"])
+        if reference is None:
+            continue
+        for path, seconds in result["timings"].items():
+            if path not in reference["timings"]:
+                continue
+            baseline_median = reference["timings"][path]["median"]
+            rows.append(
+                {
+                    "size": result["size"],
+                    "span": path,
+                    "baseline": baseline_median,
+                    "current": seconds["median"],
+                    "ratio": round(seconds["median"] / baseline_median, 3) if baseline_median else None,
+                }
+            )
+    return rows
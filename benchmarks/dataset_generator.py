@@ -0,0 +1,403 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for generating synthetic AdaptaBrasil submissions of any size.
+
+This module defines the `DatasetSpec` class, which describes the shape of a
+submission (number of indicators, tree depth, temporal symbols, scenarios, legend
+groups, rows, proportionality and injected error rate), and the
+`DatasetGenerator` class, which writes a submission with that shape as CSV files.
+Generated submissions are valid: with an error rate of zero, every validation passes
+(only the spell checker may flag words missing from its dictionary). Errors are
+injected in the values and proportionality spreadsheets, the largest ones.
+"""
+
+import csv
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+class DatasetSpec:
+    """
+    Data model describing the shape of a synthetic submission.
+
+    Attributes:
+        n_indicators (int): Number of indicators, including the level 1 root.
+        depth (int): Number of levels of the indicator tree (at least 2).
+        n_rows (int): Number of rows (spatial units, e.g. municipalities) of the value spreadsheets.
+        future_years (int): Number of temporal symbols after the base year.
+        n_scenarios (int): Number of scenarios.
+        scenario_share (float): Share of the leaf indicators with scenarios (their ancestors also get scenarios).
+        legend_groups (int): Number of legend groups.
+        proportionality (bool): If True, writes the optional proportionality spreadsheet.
+        error_rate (float): Share of the value and proportionality cells replaced by invalid values.
+        seed (int): Seed of the random generator; the same spec always generates the same submission.
+    """
+
+    SCENARIOS = (("Otimista", "O"), ("Pessimista", "P"), ("Moderado", "M"), ("Intermediário", "I"), ("Extremo", "E"), ("Controle", "C"))
+    BASE_YEAR = 2015
+
+    def __init__(
+        self,
+        n_indicators: int = 50,
+        depth: int = 4,
+        n_rows: int = 100,
+        future_years: int = 2,
+        n_scenarios: int = 2,
+        scenario_share: float = 0.3,
+        legend_groups: int = 3,
+        proportionality: bool = True,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Initialize a DatasetSpec.
+
+        Args:
+            n_indicators (int): Number of indicators, including the root. Defaults to 50.
+            depth (int): Number of levels of the indicator tree. Defaults to 4.
+            n_rows (int): Number of rows of the value spreadsheets. Defaults to 100.
+            future_years (int): Number of temporal symbols after the base year. Defaults to 2.
+            n_scenarios (int): Number of scenarios. Defaults to 2.
+            scenario_share (float): Share of the leaf indicators with scenarios. Defaults to 0.3.
+            legend_groups (int): Number of legend groups. Defaults to 3.
+            proportionality (bool): Writes the optional proportionality spreadsheet. Defaults to True.
+            error_rate (float): Share of the value and proportionality cells made invalid. Defaults to 0.0.
+            seed (int): Seed of the random generator. Defaults to 0.
+
+        Raises:
+            ValueError: If a parameter is out of its valid range.
+        """
+        self.n_indicators = n_indicators
+        self.depth = depth
+        self.n_rows = n_rows
+        self.future_years = future_years
+        self.n_scenarios = n_scenarios
+        self.scenario_share = scenario_share
+        self.legend_groups = legend_groups
+        self.proportionality = proportionality
+        self.error_rate = error_rate
+        self.seed = seed
+        self._validate()
+
+    def _validate(self) -> None:
+        """
+        Validate the parameters of the spec.
+
+        Raises:
+            ValueError: If a parameter is out of its valid range.
+        """
+        if self.depth < 3:
+            raise ValueError("depth must be at least 3.")
+        if self.n_indicators < self.depth:
+            raise ValueError("n_indicators must be at least the depth of the tree.")
+        if self.n_rows < 1:
+            raise ValueError("n_rows must be a positive integer.")
+        if self.future_years < 1:
+            raise ValueError("future_years must be a positive integer.")
+        if not 1 <= self.n_scenarios <= len(self.SCENARIOS):
+            raise ValueError(f"n_scenarios must be between 1 and {len(self.SCENARIOS)}.")
+        if not 0.0 <= self.scenario_share <= 1.0:
+            raise ValueError("scenario_share must be between 0 and 1.")
+        if not 1 <= self.legend_groups < self.n_indicators:
+            raise ValueError("legend_groups must be between 1 and the number of indicators below the root.")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1.")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the spec to a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The parameters of the spec.
+        """
+        return dict(vars(self))
+
+
+class DatasetGenerator:
+    """
+    Writes synthetic submissions described by a `DatasetSpec`.
+
+    The indicator tree has one level 1 root and at least one indicator per level;
+    each indicator has a parent in the level above. Leaf indicators get scenarios
+    with probability ``scenario_share`` and pass them on to their ancestors (the root
+    never has scenarios). Values are drawn in [0, 1] with two decimal places, and the
+    proportions of the children of each proportionality parent sum to exactly 1.
+
+    Attributes:
+        spec (DatasetSpec): The shape of the generated submission.
+        injected_errors (int): Number of invalid cells written by the last `write()`.
+    """
+
+    INDICATOR_ID_START = 1100015
+    LEGEND_LABELS = (("Muito baixo", "#F40000"), ("Baixo", "#FF8300"), ("Médio", "#FFCD00"), ("Alto", "#A9DE00"), ("Muito alto", "#02C650"))
+    INVALID_VALUES = ("abc", "1.5", "-0.2")
+
+    def __init__(self, spec: DatasetSpec):
+        """
+        Initialize the DatasetGenerator.
+
+        Args:
+            spec (DatasetSpec): The shape of the generated submission.
+        """
+        self.spec = spec
+        self.injected_errors = 0
+        self._rng = np.random.default_rng(spec.seed)
+
+    @property
+    def years(self) -> List[int]:
+        """List[int]: Temporal symbols: the base year followed by decades after the current year."""
+        first_future = (datetime.now().year // 10 + 1) * 10
+        return [DatasetSpec.BASE_YEAR, *(first_future + 20 * index for index in range(self.spec.future_years))]
+
+    @property
+    def scenarios(self) -> List[Tuple[str, str]]:
+        """List[Tuple[str, str]]: Name and symbol of each scenario."""
+        return list(DatasetSpec.SCENARIOS[: self.spec.n_scenarios])
+
+    def write(self, output_folder: str) -> str:
+        """
+        Write the submission as CSV files.
+
+        Args:
+            output_folder (str): Folder receiving the spreadsheets (created if needed).
+
+        Returns:
+            str: The output folder.
+        """
+        self._rng = np.random.default_rng(self.spec.seed)
+        self.injected_errors = 0
+        os.makedirs(output_folder, exist_ok=True)
+
+        levels, parents = self._build_tree()
+        scenario = self._assign_scenarios(levels, parents)
+        columns = self._value_columns(levels, scenario)
+
+        self._write_table(output_folder, "descricao", self._description_rows(levels, scenario))
+        self._write_table(
+            output_folder, "composicao", [["codigo_pai", "codigo_filho"], *([parent, child] for child, parent in sorted(parents.items()))]
+        )
+        self._write_table(output_folder, "referencia_temporal", self._temporal_rows())
+        self._write_table(output_folder, "cenarios", self._scenario_rows())
+        self._write_table(output_folder, "legenda", self._legend_rows())
+        self._write_table(output_folder, "dicionario", [["palavra"], ["AdaptaBrasil"], ["INPE"], ["MCTI"]])
+        self._write_table(output_folder, "valores", self._value_rows([column for code_columns in columns.values() for column in code_columns]))
+        if self.spec.proportionality:
+            self._write_table(output_folder, "proporcionalidades", self._proportionality_rows(levels, parents, columns))
+        return output_folder
+
+    def _build_tree(self) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """
+        Build the indicator tree, with codes numbered level by level.
+
+        Returns:
+            Tuple[Dict[int, int], Dict[int, int]]: The level of each code and the parent of each non-root code.
+        """
+        spec = self.spec
+        # One indicator per level, the others spread with twice the weight of the level above.
+        # Levels never shrink below level 2, so that every indicator above the last level has children.
+        weights = np.array([2.0**level for level in range(1, spec.depth)])
+        extra = self._rng.multinomial(spec.n_indicators - spec.depth, weights / weights.sum())
+        counts = [1, *sorted(1 + int(count) for count in extra)]
+
+        levels: Dict[int, int] = {}
+        parents: Dict[int, int] = {}
+        code = 1
+        previous_level_codes: List[int] = []
+        for level, count in enumerate(counts, start=1):
+            level_codes = list(range(code, code + count))
+            for position, child in enumerate(level_codes):
+                levels[child] = level
+                if previous_level_codes:
+                    # Every indicator of the level above gets a child before any gets a second one
+                    if position < len(previous_level_codes):
+                        parents[child] = previous_level_codes[position]
+                    else:
+                        parents[child] = int(self._rng.choice(previous_level_codes))
+            previous_level_codes = level_codes
+            code += count
+        return levels, parents
+
+    def _assign_scenarios(self, levels: Dict[int, int], parents: Dict[int, int]) -> Dict[int, int]:
+        """
+        Choose the indicators with scenarios: all level 2 indicators, some leaves and their ancestors below the root.
+
+        Args:
+            levels (Dict[int, int]): Level of each code.
+            parents (Dict[int, int]): Parent of each non-root code.
+
+        Returns:
+            Dict[int, int]: 1 for the codes with scenarios, 0 for the others.
+        """
+        # Level 2 indicators without scenarios have no values, so all of them get scenarios
+        scenario = {code: int(level == 2) for code, level in levels.items()}
+        leaves = set(levels) - set(parents.values())
+        for leaf in sorted(leaves):
+            if self._rng.random() < self.spec.scenario_share:
+                code = leaf
+                while levels[code] > 1 and not scenario[code]:
+                    scenario[code] = 1
+                    code = parents[code]
+        return scenario
+
+    def _value_columns(self, levels: Dict[int, int], scenario: Dict[int, int]) -> Dict[int, List[str]]:
+        """
+        List the value columns of each indicator below the root.
+
+        Args:
+            levels (Dict[int, int]): Level of each code.
+            scenario (Dict[int, int]): Scenario flag of each code.
+
+        Returns:
+            Dict[int, List[str]]: The value columns of each code, base year first.
+        """
+        base_year, future_years = self.years[0], self.years[1:]
+        columns = {}
+        for code, level in levels.items():
+            if level == 1:
+                continue
+            columns[code] = [f"{code}-{base_year}"]
+            if scenario[code]:
+                columns[code] += [f"{code}-{year}-{symbol}" for year in future_years for _, symbol in self.scenarios]
+        return columns
+
+    def _description_rows(self, levels: Dict[int, int], scenario: Dict[int, int]) -> List[List[Any]]:
+        """Build the rows of the description spreadsheet."""
+        rows = [
+            [
+                "codigo",
+                "nivel",
+                "nome_simples",
+                "nome_completo",
+                "unidade",
+                "desc_simples",
+                "desc_completa",
+                "cenario",
+                "relacao",
+                "fontes",
+                "meta",
+                "legenda",
+            ]
+        ]
+        for code, level in levels.items():
+            legend = "" if level == 1 else (code - 2) % self.spec.legend_groups + 1
+            rows.append(
+                [
+                    code,
+                    level,
+                    f"Indicador {code}",
+                    f"Índice do indicador {code}",
+                    "",
+                    f"Descrição simples do indicador {code}.",
+                    f"Descrição completa do indicador {code}, com o detalhamento do método de cálculo.",
+                    scenario[code],
+                    1,
+                    "AdaptaBrasil MCTI/INPE",
+                    "6.2",
+                    legend,
+                ]
+            )
+        return rows
+
+    def _temporal_rows(self) -> List[List[Any]]:
+        """Build the rows of the temporal reference spreadsheet."""
+        rows = [["nome", "descricao", "simbolo"], [self.years[0], "Tempo presente.", self.years[0]]]
+        rows += [[year, f"Década de {year}.", year] for year in self.years[1:]]
+        return rows
+
+    def _scenario_rows(self) -> List[List[Any]]:
+        """Build the rows of the scenarios spreadsheet."""
+        rows = [["nome", "descricao", "simbolo"]]
+        rows += [[name, f"Cenário {name.lower()} de evolução das condições climáticas e socioeconômicas.", symbol] for name, symbol in self.scenarios]
+        return rows
+
+    def _legend_rows(self) -> List[List[Any]]:
+        """Build the rows of the legend spreadsheet: five contiguous classes covering [0, 1] per group."""
+        rows = [["codigo", "label", "cor", "minimo", "maximo", "ordem"]]
+        n_classes = len(self.LEGEND_LABELS)
+        for group in range(1, self.spec.legend_groups + 1):
+            # Even hundredths: each class spans at least two hundredths
+            bounds = sorted(2 * int(bound) for bound in self._rng.choice(np.arange(2, 48), size=n_classes - 1, replace=False))
+            minimums = [0, *(bound / 100 for bound in bounds)]
+            maximums = [*((bound - 1) / 100 for bound in bounds), 1]
+            for order, ((label, color), minimum, maximum) in enumerate(zip(self.LEGEND_LABELS, minimums, maximums), start=1):
+                rows.append([group, label, color, minimum, maximum, order])
+            rows.append([group, "Dado indisponível", "#DCDCDC", "", "", n_classes + 1])
+        return rows
+
+    def _ids(self) -> np.ndarray:
+        """Return the identifiers of the rows (municipality-like codes)."""
+        return self.INDICATOR_ID_START + 8 * np.arange(self.spec.n_rows)
+
+    def _inject_errors(self, cells: np.ndarray, invalid_values) -> np.ndarray:
+        """
+        Replace a share of the cells (``error_rate``) by invalid values.
+
+        Args:
+            cells (np.ndarray): Text cells, modified in place.
+            invalid_values: Callable returning the invalid text of a cell from its current text.
+
+        Returns:
+            np.ndarray: The cells.
+        """
+        if self.spec.error_rate <= 0 or cells.size == 0:
+            return cells
+        mask = self._rng.random(cells.shape) < self.spec.error_rate
+        for row, column in zip(*np.nonzero(mask)):
+            cells[row, column] = invalid_values(cells[row, column])
+        self.injected_errors += int(mask.sum())
+        return cells
+
+    def _value_rows(self, columns: List[str]) -> List[List[Any]]:
+        """Build the rows of the values spreadsheet, with the injected errors."""
+        values = np.round(self._rng.random((self.spec.n_rows, len(columns))), 2)
+        cells = np.char.mod("%.2f", values).astype(object)
+        invalid_cycle = iter(range(cells.size))
+        self._inject_errors(cells, lambda _: self.INVALID_VALUES[next(invalid_cycle) % len(self.INVALID_VALUES)])
+        ids = self._ids()
+        return [["id", *columns], *([int(ids[index]), *cells[index]] for index in range(self.spec.n_rows))]
+
+    def _proportionality_rows(self, levels: Dict[int, int], parents: Dict[int, int], columns: Dict[int, List[str]]) -> List[List[Any]]:
+        """
+        Build the rows of the proportionality spreadsheet (two header rows).
+
+        Every parent below the root has one group per value column, listing one column
+        per child: the child column of the same year and scenario when the child has it,
+        otherwise the base year column. Every indicator below the root is thus listed.
+        """
+        children: Dict[int, List[int]] = {}
+        for child, parent in sorted(parents.items()):
+            children.setdefault(parent, []).append(child)
+        selected = [code for code in sorted(children) if levels[code] >= 2]
+
+        parent_header, child_header = [""], ["id"]
+        groups = []
+        for parent in selected:
+            for parent_column in columns[parent]:
+                suffix = parent_column.split("-", 1)[1]
+                child_columns = [f"{child}-{suffix}" if f"{child}-{suffix}" in columns[child] else columns[child][0] for child in children[parent]]
+                parent_header += [parent_column] + [""] * (len(child_columns) - 1)
+                child_header += child_columns
+                groups.append(len(child_columns))
+
+        blocks = []
+        for size in groups:
+            # Integer thousandths: every row sums to exactly 1.000
+            weights = self._rng.random((self.spec.n_rows, size)) + 0.1
+            thousandths = np.floor(weights / weights.sum(axis=1, keepdims=True) * 1000).astype(int)
+            thousandths[:, 0] += 1000 - thousandths.sum(axis=1)
+            blocks.append(thousandths / 1000)
+        proportions = np.hstack(blocks) if blocks else np.empty((self.spec.n_rows, 0))
+        cells = np.char.mod("%.3f", proportions).astype(object)
+        self._inject_errors(cells, lambda text: f"{float(text) + 0.1:.3f}")
+
+        ids = self._ids()
+        return [parent_header, child_header, *([int(ids[index]), *cells[index]] for index in range(self.spec.n_rows))]
+
+    @staticmethod
+    def _write_table(output_folder: str, name: str, rows: List[List[Any]]) -> None:
+        """Write the rows of a spreadsheet as a '|' separated CSV file."""
+        with open(os.path.join(output_folder, f"{name}.csv"), "w", encoding="utf-8", newline="") as file:
+            csv.writer(file, delimiter="|", lineterminator="\n").writerows(rows)
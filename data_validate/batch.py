@@ -0,0 +1,49 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import argparse
+import os
+import sys
+
+import data_validate
+from data_validate.controllers import BatchProcessor
+from data_validate.helpers.base import DataArgs
+from data_validate.middleware import Bootstrap
+
+
+def main(argv=None):
+    # Batch options; every other argument is forwarded to each run
+    parser = argparse.ArgumentParser(
+        description="Adapta Parser - Validates many submissions in one warm process.",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "--input_folders",
+        nargs="+",
+        required=True,
+        help="Input folders, .zip archives or glob patterns (e.g. 'submissions/*').",
+    )
+    parser.add_argument("--output_folder", default="output_data/", type=str, help="Root folder of the report sets and of the summary.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes.")
+    args, extra_args = parser.parse_known_args(argv)
+
+    print(f"{data_validate.__welcome__}\n")
+    batch_processor = BatchProcessor(args.input_folders, args.output_folder, extra_args=extra_args, workers=args.workers)
+
+    # Validate the forwarded arguments once and configure the locale for all runs
+    first_folder = next((folder for folder in batch_processor.input_folders if os.path.exists(folder)), batch_processor.input_folders[0])
+    Bootstrap(DataArgs(argv=["--input_folder", first_folder, "--output_folder", args.output_folder, *extra_args]))
+
+    summaries = batch_processor.run()
+    for summary in summaries:
+        detail = summary["message"] if summary["status"] != "ok" else f"{summary['errors']} erros, {summary['warnings']} avisos"
+        print(f"[{summary['status']}] {summary['input_folder']}: {detail} ({summary['seconds']}s)")
+    print(f"\nResumo consolidado: {os.path.join(batch_processor.output_folder, BatchProcessor.SUMMARY_FILE_NAME)}")
+
+    return 1 if any(summary["status"] != "ok" for summary in summaries) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# Example usage:
+# python3 data_validate/batch.py --input_folders "data/input/*" --output_folder data/output/batch/ --workers 4 --no-spellchecker
@@ -96,6 +96,10 @@ class ApplicationConfig:
                                 """
     """str: Default HTML template for reports when the custom template cannot be loaded."""
 
+    # PROFILING
+    PROFILE_TOP_N_ALLOCATIONS = 10
+    """int: Number of allocation sites listed per stage in the memory profile (--profile-memory)."""
+
     def __init__(self):
         """
         Initializes the ApplicationConfig instance.
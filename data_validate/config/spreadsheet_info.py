@@ -27,8 +27,11 @@ class SpreadsheetInfo(ConstantBase):
         # FILES
         self.CSV: str = ".csv"
         self.XLSX: str = ".xlsx"
-        self.ALLOWED_EXTENSIONS: List[str] = [self.CSV, self.XLSX]
-        """List[str]: Allowed file extensions for input files."""
+        self.PARQUET: str = ".parquet"
+        self.FEATHER: str = ".feather"
+        self.QML: str = ".qml"
+        self.ALLOWED_EXTENSIONS: List[str] = [self.CSV, self.XLSX, self.PARQUET, self.FEATHER]
+        """List[str]: Built-in file extensions for input files (readers registered in the data loader add theirs)."""
 
         # Expected and optional files with their respective extensions
         self.EXPECTED_FILES: Dict[str, List[str]] = {
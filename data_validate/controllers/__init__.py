@@ -4,6 +4,9 @@ from data_validate.controllers.context.general_context import GeneralContext
 from data_validate.controllers.spreadsheet_processor import SpreadsheetProcessor
 from data_validate.controllers.report.validation_report import ValidationReport
 from data_validate.controllers.report.file_report_generator import FileReportGenerator
+from data_validate.controllers.batch_processor import BatchProcessor
+from data_validate.controllers.validation_service import ValidationService, ValidationServer
+from data_validate.controllers.watch_processor import WatchProcessor
 
 __all__ = [
     "DataModelContext",
@@ -11,4 +14,8 @@ __all__ = [
     "ValidationReport",
     "FileReportGenerator",
     "SpreadsheetProcessor",
+    "BatchProcessor",
+    "ValidationService",
+    "ValidationServer",
+    "WatchProcessor",
 ]
@@ -0,0 +1,215 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for validating many submissions in a single warm process.
+
+This module defines the `BatchProcessor` class, which runs the validation pipeline
+for a list of input folders (or .zip archives). The services every run needs
+(imports, localization, application configuration and logging) are created once
+per worker process and reused by all the folders it validates. Folders are fanned
+out over a process pool, each one gets its own report set, and a consolidated
+summary is written at the end.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from data_validate.config import ApplicationConfig
+from data_validate.controllers.context.general_context import GeneralContext
+from data_validate.controllers.spreadsheet_processor import SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs, LoggerManager
+from data_validate.helpers.tools import ArchivePath, LanguageManager
+
+# Services shared by all the runs of a worker process
+_WARM_RESOURCES: Dict[str, Any] = {}
+
+
+def _init_worker() -> None:
+    """Create the services shared by all the runs of a worker process."""
+    _WARM_RESOURCES["language_manager"] = LanguageManager()
+    _WARM_RESOURCES["config"] = ApplicationConfig()
+    _WARM_RESOURCES["logger_manager"] = LoggerManager(
+        log_folder="data/output/logs",
+        console_logger="console_logger",
+        prefix="data_validate",
+        logger_name="data_validate_file_logger",
+    )
+
+
+def validate_folder(input_folder: str, output_folder: str, extra_args: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Validate a single submission with the warm services of the current process.
+
+    Args:
+        input_folder (str): Path to the input folder or .zip archive.
+        output_folder (str): Folder where the reports of this submission are written.
+        extra_args (Iterable[str]): Other command-line arguments of the run (e.g. `--no-spellchecker`).
+
+    Returns:
+        Dict[str, Any]: Summary of the run, with the status, error and warning counts,
+            the paths of the written reports and the failure message when the run
+            could not be completed.
+    """
+    if not _WARM_RESOURCES:
+        _init_worker()
+
+    start_time = time.time()
+    summary: Dict[str, Any] = {
+        "input_folder": input_folder,
+        "output_folder": output_folder,
+        "status": "ok",
+        "errors": 0,
+        "warnings": 0,
+        "message": "",
+        "reports": [],
+    }
+    try:
+        data_args = DataArgs(
+            argv=["--input_folder", input_folder, "--output_folder", output_folder, *extra_args],
+            language_manager=_WARM_RESOURCES["language_manager"],
+        )
+        context = GeneralContext(data_args=data_args, **_WARM_RESOURCES)
+        processor = SpreadsheetProcessor(context=context)
+        context.finalize()
+
+        summary["errors"] = processor.validation_reports.get_total_errors()
+        summary["warnings"] = processor.validation_reports.get_total_warnings()
+        summary["reports"] = processor.report_files
+    except SystemExit as e:
+        # Invalid command-line arguments (argparse exits after printing the usage)
+        summary.update(status="failed", message=f"Argumentos inválidos (código {e.code}).")
+    except Exception as e:
+        summary.update(status="failed", message=f"{type(e).__name__}: {e}")
+    summary["seconds"] = round(time.time() - start_time, 1)
+    return summary
+
+
+class BatchProcessor:
+    """
+    Validates many submissions reusing warm worker processes.
+
+    Each input folder (or .zip archive) is validated as in a single
+    `canoa-data-validate` run, with its reports written to its own subfolder of
+    `output_folder`. The run summaries are consolidated in `SUMMARY_FILE_NAME`,
+    in input order.
+
+    Attributes:
+        input_folders (List[str]): Submissions to validate, after glob expansion.
+        output_folder (str): Root folder of the report sets and of the summary.
+        extra_args (List[str]): Command-line arguments forwarded to every run.
+        workers (int): Number of worker processes.
+        summaries (List[Dict[str, Any]]): Summary of each run, filled by `run()`.
+    """
+
+    SUMMARY_FILE_NAME = "batch_summary.json"
+
+    def __init__(self, input_patterns: Iterable[str], output_folder: str, extra_args: Iterable[str] = (), workers: int = 1):
+        """
+        Initialize the BatchProcessor.
+
+        Args:
+            input_patterns (Iterable[str]): Input folders, .zip archives or glob patterns.
+            output_folder (str): Root folder of the report sets and of the summary.
+            extra_args (Iterable[str]): Command-line arguments forwarded to every run. Defaults to ().
+            workers (int): Number of worker processes. Defaults to 1 (runs in the current process).
+
+        Raises:
+            ValueError: If workers is not a positive integer or no input folder is found.
+        """
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive integer.")
+
+        self.input_folders = self.expand_inputs(input_patterns)
+        if not self.input_folders:
+            raise ValueError("No input folder found for the given patterns.")
+        self.output_folder = output_folder
+        self.extra_args = list(extra_args)
+        self.workers = workers
+        self.summaries: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def expand_inputs(patterns: Iterable[str]) -> List[str]:
+        """
+        Expand glob patterns into input paths, keeping the given order.
+
+        Patterns without matches and plain paths are kept as they are, so missing
+        folders are reported as failed runs.
+
+        Args:
+            patterns (Iterable[str]): Input folders, .zip archives or glob patterns.
+
+        Returns:
+            List[str]: Input paths, without duplicates.
+        """
+        input_folders: List[str] = []
+        for pattern in patterns:
+            matches = sorted(glob(pattern)) if any(char in pattern for char in "*?[") else []
+            for path in matches or [pattern]:
+                if path not in input_folders:
+                    input_folders.append(path)
+        return input_folders
+
+    def output_folders(self) -> List[str]:
+        """
+        Build the output subfolder of each submission.
+
+        Subfolders are named after the submission folder (or archive stem); repeated
+        names get a numeric suffix.
+
+        Returns:
+            List[str]: Output folder of each input, in input order.
+        """
+        used: Dict[str, int] = {}
+        output_folders: List[str] = []
+        for input_folder in self.input_folders:
+            name = ArchivePath(input_folder).stem if ArchivePath.is_archive(input_folder) else Path(input_folder).name
+            used[name] = used.get(name, 0) + 1
+            if used[name] > 1:
+                name = f"{name}_{used[name]}"
+            output_folders.append(os.path.join(self.output_folder, name))
+        return output_folders
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Validate all the submissions and write the consolidated summary.
+
+        Returns:
+            List[Dict[str, Any]]: Summary of each run, in input order.
+        """
+        tasks = list(zip(self.input_folders, self.output_folders()))
+        if self.workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(tasks)), initializer=_init_worker) as executor:
+                futures = [executor.submit(validate_folder, input_folder, output_folder, self.extra_args) for input_folder, output_folder in tasks]
+                self.summaries = [future.result() for future in futures]
+        else:
+            self.summaries = [validate_folder(input_folder, output_folder, self.extra_args) for input_folder, output_folder in tasks]
+
+        self.write_summary()
+        return self.summaries
+
+    def write_summary(self, path: Optional[str] = None) -> str:
+        """
+        Write the consolidated summary as JSON.
+
+        Args:
+            path (Optional[str]): Destination file. Defaults to `SUMMARY_FILE_NAME` in the output folder.
+
+        Returns:
+            str: Path of the written file.
+        """
+        path = path or os.path.join(self.output_folder, self.SUMMARY_FILE_NAME)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        summary = {
+            "total_folders": len(self.summaries),
+            "failed_folders": sum(1 for item in self.summaries if item["status"] != "ok"),
+            "total_errors": sum(item["errors"] for item in self.summaries),
+            "total_warnings": sum(item["warnings"] for item in self.summaries),
+            "folders": self.summaries,
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+        return path
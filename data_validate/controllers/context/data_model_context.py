@@ -11,6 +11,8 @@ from typing import List, Any
 from typing import Type, Optional
 
 from data_validate.controllers.context.general_context import GeneralContext
+from data_validate.helpers.common.processing.timing_recorder import TimingRecorder
+from data_validate.helpers.common.validation.indicator_index import IndicatorIndex
 from data_validate.models.sp_model_abc import SpModelABC
 
 
@@ -24,12 +26,16 @@ class DataModelContext:
     Attributes:
         context (GeneralContext): The parent context containing configuration, logger, etc.
         initialized_models (List[Any]): List of initialized model instances.
+        timings (Optional[TimingRecorder]): Recorder of the elapsed time of each validation check, if the run is timed.
+        indicator_index (Optional[IndicatorIndex]): Lookups over the indicators of the description and composition, built once per run.
     """
 
     def __init__(
         self,
         context: GeneralContext,
         initialized_models: List[Any] = None,
+        timings: Optional[TimingRecorder] = None,
+        indicator_index: Optional[IndicatorIndex] = None,
     ):
         """
         Initialize the DataModelContext.
@@ -37,9 +43,13 @@ class DataModelContext:
         Args:
             context (GeneralContext): The parent application context.
             initialized_models (List[Any], optional): List of models to be managed. Defaults to None.
+            timings (Optional[TimingRecorder], optional): Recorder of the elapsed time of each check. Defaults to None.
+            indicator_index (Optional[IndicatorIndex], optional): Shared indicator lookups. Defaults to None.
         """
         self.context = context
         self.initialized_models = initialized_models or []
+        self.timings = timings
+        self.indicator_index = indicator_index
 
     def get_instance_of(self, model_class: Type[SpModelABC]) -> Optional[SpModelABC]:
         """
@@ -16,7 +16,7 @@ Components managed by GeneralContext:
     - DataArgs (command line arguments)
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from data_validate.config import ApplicationConfig
 from data_validate.helpers.base import DataArgs, FileSystemUtils, LoggerManager
@@ -46,6 +46,9 @@ class GeneralContext:
     def __init__(
         self,
         data_args: DataArgs = None,
+        language_manager: Optional[LanguageManager] = None,
+        config: Optional[ApplicationConfig] = None,
+        logger_manager: Optional[LoggerManager] = None,
         **kwargs: Dict[str, Any],
     ):
         """
@@ -53,6 +56,9 @@ class GeneralContext:
 
         Args:
             data_args (DataArgs): Data arguments containing input and output folder paths and execution flags.
+            language_manager (Optional[LanguageManager]): Already loaded localization manager to reuse.
+            config (Optional[ApplicationConfig]): Already built application configuration to reuse.
+            logger_manager (Optional[LoggerManager]): Already configured logging system to reuse.
             **kwargs: Additional keyword arguments for extended context configuration.
 
         The initialization process involves:
@@ -68,10 +74,11 @@ class GeneralContext:
         self.extra_config = kwargs
 
         # Configure the Toolkit
-        self.language_manager: LanguageManager = LanguageManager()
-        self.config: ApplicationConfig = ApplicationConfig()
+        # Warm services may be shared by consecutive runs in the same process (batch mode)
+        self.language_manager: LanguageManager = language_manager or LanguageManager()
+        self.config: ApplicationConfig = config or ApplicationConfig()
         self.file_system_utils: FileSystemUtils = FileSystemUtils()
-        self.logger_manager = LoggerManager(
+        self.logger_manager = logger_manager or LoggerManager(
             log_folder="data/output/logs",
             console_logger="console_logger",
             prefix="data_validate",
@@ -85,6 +92,21 @@ class GeneralContext:
 
         self.skipped_validations = []
 
+    @property
+    def message_budget(self) -> Optional[int]:
+        """
+        Number of messages per report category built by the per-cell checks.
+
+        With `--truncate-messages`, checks stop building messages once the report
+        message limit is reached and only count the remaining issues.
+
+        Returns:
+            Optional[int]: The report message limit, or None if every message is built.
+        """
+        if self.data_args.data_performance.truncate_messages:
+            return self.config.REPORT_LIMIT_N_MESSAGES
+        return None
+
     def finalize(self):
         """
         Finalize the application context and cleanup resources.
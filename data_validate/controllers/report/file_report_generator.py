@@ -12,16 +12,19 @@ import os
 import platform
 import re
 import sys
-from typing import List, Dict, Any
+from contextlib import nullcontext
+from typing import List, Dict, Any, Optional
 
 import pdfkit
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from data_validate.config import NamesEnum
 from data_validate.controllers.context.general_context import GeneralContext
 from data_validate.controllers.report.validation_report import ValidationReport
 from data_validate.config.metadata_info import METADATA
 from data_validate.helpers.common.formatting.number_formatting_processing import NumberFormattingProcessing
+from data_validate.helpers.common.processing.timing_recorder import TimingRecorder
+from data_validate.helpers.tools import ArchivePath
 
 
 class FileReportGenerator:
@@ -42,8 +45,13 @@ class FileReportGenerator:
         template_data_text (str): Content of the HTML template.
         required_variables (List[str]): List of required variables in the template.
         env (Environment): Jinja2 environment for template rendering.
+        report_files (List[str]): Paths of the report files written by `build_report()`.
+        timings (Optional[TimingRecorder]): Recorder of the run, timing the HTML and PDF generation.
     """
 
+    # Compiled templates, keyed by template text; shared by all the runs of a process
+    _compiled_templates: Dict[str, Template] = {}
+
     def __init__(self, context: GeneralContext = None):
         """
         Initialize the report generator with context configuration.
@@ -66,6 +74,8 @@ class FileReportGenerator:
         self.template_data_text = ""
         self.required_variables = []
         self.env = Environment(loader=FileSystemLoader(self.output_folder))
+        self.report_files: List[str] = []
+        self.timings: Optional[TimingRecorder] = None
 
         self._prepare_environment()
         self._validate_html_template()
@@ -101,7 +111,7 @@ class FileReportGenerator:
         if any(var not in self.template_data_text for var in self.required_variables):
             self.template_data_text = self.context.config.REPORT_TEMPLATE_DEFAULT_BASIC_NO_CSS
 
-    def build_report(self, report_list: ValidationReport) -> None:
+    def build_report(self, report_list: ValidationReport, timings: Optional[TimingRecorder] = None) -> None:
         """
         Generate and save HTML and PDF reports from validation results.
 
@@ -113,10 +123,15 @@ class FileReportGenerator:
         5. Saves the HTML file and converts it to PDF.
         6. Prints a JSON summary to stdout.
 
+        With `--report-timings`, the HTML report also lists the elapsed times recorded
+        so far (stages still running when the report is written are marked as such).
+
         Args:
             report_list (ValidationReport): List of validation test reports.
+            timings (Optional[TimingRecorder]): Recorder of the run; times the HTML and PDF generation. Defaults to None.
         """
-        file_name = self.context.file_system_utils.get_last_directory_name(path=self.input_folder)
+        self.timings = timings
+        file_name = self.get_report_name(self.context)
         html_output_file = self.context.config.REPORT_OUTPUT_REPORT_HTML
 
         self.error_count = report_list.get_total_errors()
@@ -136,15 +151,17 @@ class FileReportGenerator:
                 skipped_tests.append(report.test_name)
 
         try:
-            html_content = self._generate_html_content(flattened_reports, skipped_tests)
             output_html_path = os.path.join(self.output_folder, file_name + html_output_file)
-
-            self._save_html_file(html_content, output_html_path, logger=self.context.logger)
-            self._save_pdf_file(
-                pdf_options=self._get_pdf_options(),
-                html_file_path=output_html_path,
-                logger=self.context.logger,
-            )
+            with self._measure("html_report"):
+                html_content = self._generate_html_content(flattened_reports, skipped_tests)
+                self._save_html_file(html_content, output_html_path, logger=self.context.logger)
+            with self._measure("pdf_report"):
+                self._save_pdf_file(
+                    pdf_options=self._get_pdf_options(),
+                    html_file_path=output_html_path,
+                    logger=self.context.logger,
+                )
+            self.report_files = [path for path in (output_html_path, output_html_path.replace(".html", ".pdf")) if os.path.exists(path)]
             self._print_json_summary()
 
         except Exception as error:
@@ -152,6 +169,35 @@ class FileReportGenerator:
             self.context.logger.info(error_message)
             print(error_message, file=sys.stderr)
 
+    @staticmethod
+    def get_report_name(context: GeneralContext) -> str:
+        """
+        Get the name of the submission, used as prefix of the report file names.
+
+        Args:
+            context (GeneralContext): General context containing the input folder.
+
+        Returns:
+            str: The name of the input folder, or the stem of the input .zip archive.
+        """
+        input_folder = context.data_args.data_file.input_folder
+        if ArchivePath.is_archive(input_folder):
+            # Compressed submissions produce the same report name as the extracted folder
+            return ArchivePath(input_folder).stem
+        return context.file_system_utils.get_last_directory_name(path=input_folder)
+
+    def _measure(self, name: str):
+        """
+        Time a report generation step, when the run is timed.
+
+        Args:
+            name (str): Name of the step.
+
+        Returns:
+            ContextManager: The timing span of the step, or a no-op context.
+        """
+        return self.timings.measure(name) if self.timings is not None else nullcontext()
+
     def _generate_html_content(self, report_list: ValidationReport, skipped_tests: List[str]) -> str:
         """
         Generate HTML content from template and report data.
@@ -166,7 +212,9 @@ class FileReportGenerator:
         Returns:
             str: Rendered HTML content as string.
         """
-        template = self.env.from_string(self.template_data_text)
+        template = self._compiled_templates.get(self.template_data_text)
+        if template is None:
+            template = self._compiled_templates.setdefault(self.template_data_text, self.env.from_string(self.template_data_text))
         template_vars = self._build_template_variables(report_list, skipped_tests)
         return template.render(template_vars)
 
@@ -198,6 +246,7 @@ class FileReportGenerator:
             else f"<strong>Vers&atilde;o do validador: <strong class='text-gray'>{METADATA.__version__} &ndash; {platform.system()}</strong></strong><br>"
         )
         text_html_skipped_tests = f"<ul>{"\n".join([f"<li>{test_name}</li>" for test_name in skipped_tests])}</ul>"
+        display_timings = self.context.data_args.data_performance.report_timings and self.timings is not None
 
         return {
             "name": METADATA.__project_name__,
@@ -214,6 +263,8 @@ class FileReportGenerator:
             "text_display_file": self._get_optional_field_text("file", "Arquivo submetido"),
             "skipped_tests": text_html_skipped_tests,
             "display_skipped_tests": "block" if skipped_tests else "none",
+            "timings": self._format_timings_as_html(self.timings) if display_timings else "",
+            "display_timings": "block" if display_timings else "none",
         }
 
     def _get_optional_field_text(self, field_name: str, display_label: str) -> str:
@@ -290,6 +341,24 @@ class FileReportGenerator:
         result = "\n".join(html_parts)
         return result[4:] if result.startswith("<br>") else result
 
+    @staticmethod
+    def _format_timings_as_html(timings: TimingRecorder) -> str:
+        """
+        Format the recorded elapsed times as an indented HTML outline.
+
+        Args:
+            timings (TimingRecorder): Recorder of the run.
+
+        Returns:
+            str: Formatted HTML string with one line per timed stage.
+        """
+        html_parts = []
+        for depth, name, seconds in timings.rows():
+            elapsed = "em andamento" if seconds is None else f"{NumberFormattingProcessing.format_number_brazilian(round(seconds, 3))} s"
+            indent = "&nbsp;" * 4 * depth
+            html_parts.append(f"<span preserve-spaces>{indent}{name}: <strong class='text-gray'>{elapsed}</strong></span>")
+        return "<br>\n".join(html_parts)
+
     @staticmethod
     def _get_pdf_options() -> Dict[str, Any]:
         """
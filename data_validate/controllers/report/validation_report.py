@@ -3,14 +3,20 @@
 Module for managing validation reports data models.
 
 This module defines structures to store, manage, and retrieve validation errors
-and warnings generated during the data validation process.
+and warnings generated during the data validation process. Messages are either
+plain strings or issue records (see `IssueRecord`), whose text is only rendered when the
+message is displayed or serialized.
 """
 
-from typing import List, Optional, Iterator
+from typing import Any, Dict, List, Optional, Iterator, Union
 
 from data_validate.controllers import GeneralContext
+from data_validate.helpers.common.formatting.issue_record import IssueRecord, Record
 from data_validate.helpers.common.formatting.number_formatting_processing import NumberFormattingProcessing
 
+# A validation message: plain text or a record rendered on demand
+Message = Union[str, Record]
+
 
 class TestReportItem:
     """
@@ -21,40 +27,40 @@ class TestReportItem:
 
     Attributes:
         test_name (str): The identifier of the test or validation.
-        errors (List[str]): List of error messages associated with the test.
-        warnings (List[str]): List of warning messages associated with the test.
+        errors (List[Message]): List of error messages associated with the test.
+        warnings (List[Message]): List of warning messages associated with the test.
         was_executed (bool): Flag indicating if the validation was executed.
     """
 
-    def __init__(self, test_name: str, errors: Optional[List[str]] = None, warnings: Optional[List[str]] = None):
+    def __init__(self, test_name: str, errors: Optional[List[Message]] = None, warnings: Optional[List[Message]] = None):
         """
         Initialize a TestReportItem.
 
         Args:
             test_name (str): The name/identifier of the test.
-            errors (Optional[List[str]]): Initial list of error messages. Defaults to None.
-            warnings (Optional[List[str]]): Initial list of warning messages. Defaults to None.
+            errors (Optional[List[Message]]): Initial list of error messages. Defaults to None.
+            warnings (Optional[List[Message]]): Initial list of warning messages. Defaults to None.
         """
         self.test_name = test_name
         self.errors = errors if errors is not None else []
         self.warnings = warnings if warnings is not None else []
         self.was_executed = True
 
-    def add_error(self, error: str) -> None:
+    def add_error(self, error: Message) -> None:
         """
         Add an error message to the report.
 
         Args:
-            error (str): The error message to add.
+            error (Message): The error message to add.
         """
         self.errors.append(error)
 
-    def add_warning(self, warning: str) -> None:
+    def add_warning(self, warning: Message) -> None:
         """
         Add a warning message to the report.
 
         Args:
-            warning (str): The warning message to add.
+            warning (Message): The warning message to add.
         """
         self.warnings.append(warning)
 
@@ -76,6 +82,26 @@ class TestReportItem:
         """
         return bool(self.warnings)
 
+    @property
+    def error_count(self) -> int:
+        """
+        Number of errors, including the ones omitted by checks limited to a message budget.
+
+        Returns:
+            int: Exact error count.
+        """
+        return IssueRecord.count(self.errors)
+
+    @property
+    def warning_count(self) -> int:
+        """
+        Number of warnings, including the ones omitted by checks limited to a message budget.
+
+        Returns:
+            int: Exact warning count.
+        """
+        return IssueRecord.count(self.warnings)
+
 
 class ValidationReport:
     """
@@ -127,14 +153,14 @@ class ValidationReport:
         """
         self.reports[report.test_name] = report
 
-    def add_by_name(self, name_test: str, errors: Optional[List[str]] = None, warnings: Optional[List[str]] = None) -> None:
+    def add_by_name(self, name_test: str, errors: Optional[List[Message]] = None, warnings: Optional[List[Message]] = None) -> None:
         """
         Create and add a report by name with optional errors and warnings.
 
         Args:
             name_test (str): name of the test.
-            errors (Optional[List[str]]): List of errors. Defaults to None.
-            warnings (Optional[List[str]]): List of warnings. Defaults to None.
+            errors (Optional[List[Message]]): List of errors. Defaults to None.
+            warnings (Optional[List[Message]]): List of warnings. Defaults to None.
         """
         self.reports[name_test] = TestReportItem(name_test, errors, warnings)
 
@@ -147,14 +173,14 @@ class ValidationReport:
         """
         return list(self.reports.keys())
 
-    def extend(self, name_test: str, errors: Optional[List[str]] = None, warnings: Optional[List[str]] = None) -> None:
+    def extend(self, name_test: str, errors: Optional[List[Message]] = None, warnings: Optional[List[Message]] = None) -> None:
         """
         Extend an existing report with new errors/warnings, or create it if missing.
 
         Args:
             name_test (str): The name of the test to extend.
-            errors (Optional[List[str]]): List of errors to append. Defaults to None.
-            warnings (Optional[List[str]]): List of warnings to append. Defaults to None.
+            errors (Optional[List[Message]]): List of errors to append. Defaults to None.
+            warnings (Optional[List[Message]]): List of warnings to append. Defaults to None.
         """
         if name_test in self.reports:
             if errors:
@@ -164,6 +190,102 @@ class ValidationReport:
         else:
             self.add_by_name(name_test, errors, warnings)
 
+    def merge(self, other: "ValidationReport") -> None:
+        """
+        Append all reports of another collection, in their insertion order.
+
+        Merging the reports collected separately by each validator, in pipeline
+        order, gives the same result as collecting them in a single instance.
+
+        Args:
+            other (ValidationReport): The collection to append.
+        """
+        for report in other.reports.values():
+            self.extend(report.test_name, errors=report.errors, warnings=report.warnings)
+            if not report.was_executed:
+                self.reports[report.test_name].was_executed = False
+
+    def render_message(self, message: Message) -> str:
+        """
+        Render a message as text, with the localization manager of the context when available.
+
+        Args:
+            message (Message): Plain text or a record.
+
+        Returns:
+            str: The message text.
+        """
+        if IssueRecord.is_record(message):
+            return IssueRecord.render(message, self.context.language_manager if self.context is not None else None)
+        return str(message)
+
+    def _serialize_message(self, message: Message) -> Any:
+        """
+        Convert a message to a JSON-compatible value: its text, or a list for omitted issues records.
+
+        Args:
+            message (Message): Plain text or a record.
+
+        Returns:
+            Any: The serialized message.
+        """
+        return list(message) if IssueRecord.is_omitted(message) else self.render_message(message)
+
+    @staticmethod
+    def _deserialize_message(value: Any) -> Message:
+        """
+        Convert a value produced by `_serialize_message` back to a message.
+
+        Args:
+            value (Any): The serialized message.
+
+        Returns:
+            Message: The message text, or the omitted issues record.
+        """
+        return tuple(value) if isinstance(value, list) else value
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Serialize the reports as JSON-compatible records, in insertion order.
+
+        Messages are rendered as text; omitted issues records are kept, so counts are preserved.
+
+        Returns:
+            List[Dict[str, Any]]: One record per report, with its name, messages and execution flag.
+        """
+        return [
+            {
+                "test_name": report.test_name,
+                "errors": [self._serialize_message(error) for error in report.errors],
+                "warnings": [self._serialize_message(warning) for warning in report.warnings],
+                "was_executed": report.was_executed,
+            }
+            for report in self.reports.values()
+        ]
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]], context: Optional["GeneralContext"] = None) -> "ValidationReport":
+        """
+        Rebuild a collection from the records produced by `to_records()`.
+
+        Args:
+            records (List[Dict[str, Any]]): Serialized reports.
+            context (Optional[GeneralContext]): DI context. Defaults to None.
+
+        Returns:
+            ValidationReport: The rebuilt collection.
+        """
+        validation_report = cls(context=context)
+        for record in records:
+            report = TestReportItem(
+                record["test_name"],
+                [cls._deserialize_message(error) for error in record["errors"]],
+                [cls._deserialize_message(warning) for warning in record["warnings"]],
+            )
+            report.was_executed = record["was_executed"]
+            validation_report.add_report(report)
+        return validation_report
+
     def get_total_errors(self) -> int:
         """
         Calculate total number of errors across all reports.
@@ -171,7 +293,7 @@ class ValidationReport:
         Returns:
             int: Global error count.
         """
-        return sum(len(report.errors) for report in self.reports.values())
+        return sum(report.error_count for report in self.reports.values())
 
     def get_total_warnings(self) -> int:
         """
@@ -180,14 +302,16 @@ class ValidationReport:
         Returns:
             int: Global warning count.
         """
-        return sum(len(report.warnings) for report in self.reports.values())
+        return sum(report.warning_count for report in self.reports.values())
 
     def flatten(self, n_messages: int, locale: str = "pt_BR") -> "ValidationReport":
         """
         Create a new ModelListReport with truncated error/warning lists.
 
         Limits the number of messages per report to `n_messages`. If messages are
-        truncated, adds a summary message indicating count of omitted items.
+        truncated, adds a summary message indicating count of omitted items. Only the
+        retained messages are rendered as text. Issues omitted by checks limited to a
+        message budget are part of that count.
 
         Args:
             n_messages (int): Maximum number of messages to retain per category.
@@ -200,15 +324,17 @@ class ValidationReport:
         for report in self.reports.values():
             flattened_report = TestReportItem(
                 test_name=report.test_name,
-                errors=report.errors[:n_messages],
-                warnings=report.warnings[:n_messages],
+                errors=[self.render_message(error) for error in IssueRecord.limit(report.errors, n_messages) if not IssueRecord.is_omitted(error)],
+                warnings=[
+                    self.render_message(warning) for warning in IssueRecord.limit(report.warnings, n_messages) if not IssueRecord.is_omitted(warning)
+                ],
             )
-            if len(report.errors) > n_messages:
-                omitted_errors_count = NumberFormattingProcessing.format_number_brazilian(len(report.errors) - n_messages, locale)
+            if report.error_count > n_messages:
+                omitted_errors_count = NumberFormattingProcessing.format_number_brazilian(report.error_count - n_messages, locale)
                 flattened_report.add_error(self.context.language_manager.text("model_report_msg_errors_omitted", count=omitted_errors_count))
 
-            if len(report.warnings) > n_messages:
-                count_omitted_warnings = NumberFormattingProcessing.format_number_brazilian(len(report.warnings) - n_messages, locale)
+            if report.warning_count > n_messages:
+                count_omitted_warnings = NumberFormattingProcessing.format_number_brazilian(report.warning_count - n_messages, locale)
                 flattened_report.add_warning(
                     self.context.language_manager.text(
                         "model_report_msg_warnings_omitted",
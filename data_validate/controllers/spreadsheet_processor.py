@@ -7,7 +7,13 @@ data validation pipeline: loading data, initializing models, running validators,
 aggregating results, and generating reports.
 """
 
+import hashlib
+import inspect
+import sys
 import time
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterator, List, Optional, Type
 
 import data_validate
 import data_validate.config as config
@@ -15,6 +21,21 @@ import data_validate.controllers as controllers
 import data_validate.helpers.tools as tools
 import data_validate.models as models
 import data_validate.validators as validators
+from data_validate.helpers.common.processing.result_cache import ResultCache
+from data_validate.helpers.common.processing.run_profiler import RunProfiler
+from data_validate.helpers.common.processing.task_scheduler import TaskScheduler
+from data_validate.helpers.common.processing.timing_recorder import TimingRecorder
+from data_validate.helpers.common.validation.indicator_index import IndicatorIndex
+
+
+@lru_cache(maxsize=None)
+def _source_hash(source_file: str) -> str:
+    """Return the SHA-256 digest of a source file (empty string if it cannot be read)."""
+    try:
+        with open(source_file, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return ""
 
 
 class SpreadsheetProcessor:
@@ -38,9 +59,25 @@ class SpreadsheetProcessor:
         data_models_context (DataModelContext): Specialized context holding initialized data models.
         initialized_models (List[SpModelABC]): List of instantiated spreadsheet models.
         target_model_classes (List[Type[SpModelABC]]): List of model classes to process.
+        validator_classes (List[Type[BaseValidator]]): Validators of the pipeline, in report order.
         validation_reports (ValidationReport): Aggregator for validation errors and warnings.
+        report_files (List[str]): Paths of the HTML/PDF reports written by the run.
+        result_cache (Optional[ResultCache]): Stored validator results, used with `--reuse-results` and `--watch`.
+        timings (TimingRecorder): Elapsed time of each stage, spreadsheet, model, validator and check of the run.
+        profiler (RunProfiler): CPU and memory profiler of the run, used with `--profile` and `--profile-memory`.
     """
 
+    # Configuration values the validator results depend on (part of the --reuse-results keys)
+    RESULT_CACHE_CONFIG = (
+        "CURRENT_YEAR",
+        "PRECISION_DECIMAL_PLACE_TRUNCATE",
+        "TITLE_OVER_N_CHARS",
+        "SIMPLE_DESCRIPTIONS_OVER_N_CHARS",
+        "LABEL_DATA_UNAVAILABLE",
+        "VALUE_DATA_UNAVAILABLE",
+        "REPORT_LIMIT_N_MESSAGES",
+    )
+
     def __init__(self, context: controllers.GeneralContext):
         """
         Initialize the processor and start the pipeline globally.
@@ -82,7 +119,38 @@ class SpreadsheetProcessor:
             models.SpLegend,
             models.SpDictionary,
         ]
+        self.validator_classes = [
+            # 1. Validate the structure of the data
+            validators.FileStructureValidator,
+            # 2. Validate the spelling of the data
+            validators.SpellCheckerValidator,
+            # 3. Validate spreadsheet data mandatory
+            validators.SpDescriptionValidator,
+            validators.SpCompositionGraphValidator,
+            validators.SpCompositionTreeValidator,
+            validators.SpTemporalReferenceValidator,
+            # 4. Validate spreadsheet data optional
+            validators.SpProportionalityValidator,
+            validators.SpValueValidator,
+            validators.SpScenarioValidator,
+            validators.SpLegendValidator,
+        ]
         self.validation_reports = controllers.ValidationReport(context=self.context)
+        self.report_files: List[str] = []
+        # Watch mode revalidates after every save, so it always reuses the results of unchanged spreadsheets
+        self.result_cache: Optional[ResultCache] = (
+            ResultCache(ResultCache.default_dir())
+            if self.context.data_args.data_performance.incremental or self.context.data_args.data_action.watch
+            else None
+        )
+        self._input_fingerprints: Dict[str, Any] = {}
+        self.timings = TimingRecorder()
+        data_performance = self.context.data_args.data_performance
+        self.profiler = RunProfiler(
+            cpu=data_performance.profile,
+            memory=data_performance.profile_memory,
+            top_n=self.context.config.PROFILE_TOP_N_ALLOCATIONS,
+        )
 
         # Running the main processing function
         self.context.logger.info(data_validate.__welcome__)
@@ -91,12 +159,31 @@ class SpreadsheetProcessor:
         start_time = time.time()
 
         # RUN ALL PROCESS: ETL, VALIDATIONS, REPORTS
-        self.run()
+        self.profiler.start()
+        try:
+            with self.timings.measure("total"):
+                self.run()
+        finally:
+            self.profiler.stop()
+        self._save_timings()
+        self._save_profile()
 
         # End time measurement if --no-time is not set
         if not self.context.data_args.data_action.no_time:
             print("Tempo total de execução: " + str(round(time.time() - start_time, 1)) + " segundos")
 
+    @property
+    def header_only_sheets(self) -> List[str]:
+        """
+        Sheets whose data rows are not used in this run, so only their header is read.
+
+        The dictionary words are only used by the spell checker: with `--no-spellchecker`
+        the dictionary is read header-only, which still reports its column structure.
+        """
+        if self.context.data_args.data_action.no_spellchecker:
+            return [models.SpDictionary.CONSTANTS.SP_NAME]
+        return []
+
     def _prepare_statement(self) -> None:
         """
         Initialize the report structure with all known test categories.
@@ -108,18 +195,45 @@ class SpreadsheetProcessor:
         for name in config.NamesEnum:
             self.validation_reports.add_by_name(self.validation_titles[name.value])
 
-    def _read_data(self) -> None:
+    def _read_data(self, header_only: bool = False) -> None:
         """
         Execute the ETL (Extract) phase of the pipeline.
 
-        Uses `DataLoaderFacade` to read all authorized files from the input folder.
+        Uses `DataLoaderFacade` to read all authorized files from the input folder,
+        reusing previously parsed sheets from the persistent cache when `--cache` is set.
+        With `--prune-columns`, only the columns declared by each model are parsed.
+        The sheets in `header_only_sheets` (e.g. the dictionary with `--no-spellchecker`)
+        have only their header read.
         Populates `raw_data_map`, captures initial load errors (e.g., file not found),
         and extracts global metadata (e.g., available scenarios) for downstream validations.
+
+        Args:
+            header_only (bool): If True, reads only the spreadsheet headers (pre-flight scan).
+                The scenarios file is still read entirely, since its symbols define the
+                valid value columns.
         """
         self.context.logger.info("Data reading and preprocessing...")
 
         # 0 ETL: Extract, Transform, Load
-        self.data_loader_facade = tools.DataLoaderFacade(self.input_folder)
+        data_performance = self.context.data_args.data_performance
+        sheet_cache = tools.SheetCache(tools.SheetCache.default_dir()) if data_performance.cache else None
+        read_columns = {}
+        if data_performance.prune_columns:
+            for model_class in self.target_model_classes:
+                if model_class.get_read_columns() is not None:
+                    read_columns[model_class.CONSTANTS.SP_NAME] = model_class.get_read_columns()
+        self.data_loader_facade = tools.DataLoaderFacade(
+            self.input_folder,
+            jobs=data_performance.jobs,
+            cache=sheet_cache,
+            reader_options={"csv_engine": data_performance.csv_engine},
+            header_only=header_only,
+            full_read=[models.SpScenario.CONSTANTS.SP_NAME],
+            header_only_sheets=self.header_only_sheets,
+            columns=read_columns,
+            compactor=tools.SheetCompactor() if data_performance.compact else None,
+            timings=self.timings,
+        )
         self.raw_data_map, load_errors = self.data_loader_facade.load_all
         self.validation_reports.extend(self.validation_titles[config.NamesEnum.FS.value], errors=load_errors)
 
@@ -159,11 +273,12 @@ class SpreadsheetProcessor:
             attribute_name = f"sp_{sp_name_key.lower()}"
 
             # Model instance creation and initialization
-            model_instance = model_class(
-                context=self.context,
-                data_model=self.raw_data_map.get(sp_name_key),
-                **self.model_configurations,
-            )
+            with self.timings.measure(model_class.__name__):
+                model_instance = model_class(
+                    context=self.context,
+                    data_model=self.raw_data_map.get(sp_name_key),
+                    **self.model_configurations,
+                )
             setattr(self, attribute_name, model_instance)
             self.initialized_models.append(model_instance)
 
@@ -178,41 +293,211 @@ class SpreadsheetProcessor:
                 warnings=model_instance.data_cleaning_warnings,
             )
 
+    def _preflight(self) -> bool:
+        """
+        Execute the header-only pre-flight scan.
+
+        Reads only the headers of the spreadsheets, initializes the models without data
+        cleaning and runs the file structure validator. If structural errors are found,
+        the report keeps only the structure results and every other validation is marked
+        as not executed. Otherwise, the pre-flight state is discarded so that the full
+        pipeline starts from a clean report.
+
+        Returns:
+            bool: True if structural errors were found and the submission was rejected, False otherwise.
+        """
+        self.context.logger.info("Running header-only pre-flight scan...")
+        with self.timings.measure("read_data"):
+            self._read_data(header_only=True)
+        with self.timings.measure("configure"):
+            self._configure()
+
+        self.data_models_context = controllers.DataModelContext(
+            context=self.context, initialized_models=self.initialized_models, timings=self.timings
+        )
+        with self.timings.measure(validators.FileStructureValidator.__name__):
+            validators.FileStructureValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
+
+        if self.validation_reports[self.validation_titles[config.NamesEnum.FS.value]].has_errors():
+            for name in config.NamesEnum:
+                if name != config.NamesEnum.FS:
+                    self.validation_reports.set_not_executed(self.validation_titles[name.value])
+            return True
+
+        # No structural errors: discard the pre-flight results before the full load
+        self.scenarios = []
+        self.initialized_models = []
+        self.data_models_context = None
+        self.validation_reports = controllers.ValidationReport(context=self.context)
+        self._prepare_statement()
+        return False
+
+    def _build_indicator_index(self) -> IndicatorIndex:
+        """
+        Build the indicator lookups shared by the validators.
+
+        The description and composition are parsed once, after `_configure()`, and
+        only read by the validators afterwards, so they can run concurrently.
+
+        Returns:
+            IndicatorIndex: The index of the loaded description and composition.
+        """
+        sp_description = next((model for model in self.initialized_models if isinstance(model, models.SpDescription)), None)
+        sp_composition = next((model for model in self.initialized_models if isinstance(model, models.SpComposition)), None)
+        return IndicatorIndex(
+            df_description=sp_description.data_loader_model.raw_data if sp_description is not None else None,
+            code_column=models.SpDescription.RequiredColumn.COLUMN_CODE.name,
+            level_column=models.SpDescription.RequiredColumn.COLUMN_LEVEL.name,
+            scenario_column=models.SpDescription.DynamicColumn.COLUMN_SCENARIO.name,
+            legend_column=models.SpDescription.DynamicColumn.COLUMN_LEGEND.name,
+            df_composition=sp_composition.data_loader_model.raw_data if sp_composition is not None else None,
+            parent_column=models.SpComposition.RequiredColumn.COLUMN_PARENT_CODE.name,
+            child_column=models.SpComposition.RequiredColumn.COLUMN_CHILD_CODE.name,
+        )
+
     def _build_pipeline(self) -> None:
         """
         Construct and execute the main validation pipeline.
 
         Initializes the `DataModelContext` with the configured models and runs
-        a sequence of validators:
+        the validators of `validator_classes`:
         1. **Structure**: File structure checks.
         2. **Spelling**: Spell checking on text fields.
         3. **Mandatory**: Core business rules (Description, Composition, Timing).
         4. **Optional**: Secondary business rules (Values, Scenarios, Legends).
+
+        Each validator declares the models it reads (``READS``) and writes
+        (``WRITES``). With `--validation-jobs` greater than one, validators that
+        do not conflict run concurrently. Each validator collects its results in
+        its own `ValidationReport`, merged afterwards in pipeline order, so the
+        reports are the same as in a sequential run.
+
+        With `--reuse-results`, the results of each validator are stored, keyed by the
+        content of the spreadsheets it reads; validators whose inputs did not change
+        since a previous run reuse the stored results instead of running again.
         """
         self.context.logger.info("Building validation pipeline...")
 
         # Create the DataContext with the initialized models
-        self.data_models_context = controllers.DataModelContext(context=self.context, initialized_models=self.initialized_models)
+        with self.timings.measure(IndicatorIndex.__name__):
+            indicator_index = self._build_indicator_index()
+        self.data_models_context = controllers.DataModelContext(
+            context=self.context, initialized_models=self.initialized_models, timings=self.timings, indicator_index=indicator_index
+        )
+        if self.result_cache is not None:
+            self._input_fingerprints = {model.CONSTANTS.SP_NAME: self._input_fingerprint(model) for model in self.initialized_models}
 
         # RUN ALL VALIDATIONS PIPELINE
+        scheduler = TaskScheduler(jobs=self.context.data_args.data_performance.validation_jobs)
+        for validator_class in self.validator_classes:
+            reads, writes = validator_class.READS, validator_class.WRITES
+            if reads is None:
+                # Undeclared validators run alone, after all the previous ones
+                reads, writes = (), self.target_model_classes
+            scheduler.add(validator_class.__name__, partial(self._run_validator, validator_class), reads=reads, writes=writes)
+
+        for validator_reports in scheduler.run():
+            self.validation_reports.merge(validator_reports)
+
+    def _run_validator(self, validator_class: Type[validators.BaseValidator]) -> "controllers.ValidationReport":
+        """
+        Run a single validator, collecting its results in a new report.
 
-        # 1. Validate the structure of the data
-        validators.FileStructureValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
+        Args:
+            validator_class (Type[BaseValidator]): The validator to run.
 
-        # 2. Validate the spelling of the data
-        validators.SpellCheckerValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
+        Returns:
+            ValidationReport: The results of the validator.
+        """
+        with self.timings.measure(validator_class.__name__):
+            return self._validate_with(validator_class)
+
+    def _validate_with(self, validator_class: Type[validators.BaseValidator]) -> "controllers.ValidationReport":
+        """
+        Collect the results of a validator, reusing the stored ones when its inputs did not change.
+
+        Args:
+            validator_class (Type[BaseValidator]): The validator to run.
+
+        Returns:
+            ValidationReport: The results of the validator.
+        """
+        cache_key = None
+        if self.result_cache is not None:
+            fingerprint = self._result_fingerprint(validator_class)
+            cache_key = self.result_cache.make_key(fingerprint) if fingerprint is not None else None
+        if cache_key is not None:
+            records = self.result_cache.get(cache_key)
+            if records is not None:
+                self.context.logger.info(f"Reusing stored results of {validator_class.__name__}: its input spreadsheets did not change.")
+                return controllers.ValidationReport.from_records(records, context=self.context)
+
+        validator_reports = controllers.ValidationReport(context=self.context)
+        validator_class(data_models_context=self.data_models_context, validation_reports=validator_reports)
+        if cache_key is not None:
+            self.result_cache.put(cache_key, validator_reports.to_records())
+        return validator_reports
+
+    @staticmethod
+    def _input_fingerprint(model: models.SpModelABC) -> Optional[List[Optional[str]]]:
+        """
+        Describe the spreadsheet read by a model: its file name and content hash.
+
+        Args:
+            model (SpModelABC): An initialized model.
+
+        Returns:
+            Optional[List[Optional[str]]]: File name and content hash (None for a missing file),
+                or None if the file exists but cannot be hashed.
+        """
+        data_loader_model = model.data_loader_model
+        if not data_loader_model.does_file_exist:
+            return [data_loader_model.filename, None]
+        content_hash = tools.SheetCache.content_hash(data_loader_model.path)
+        return [data_loader_model.filename, content_hash] if content_hash is not None else None
+
+    def _result_fingerprint(self, validator_class: Type[validators.BaseValidator]) -> Optional[Dict[str, Any]]:
+        """
+        Describe everything the results of a validator depend on.
 
-        # 3. Validate spreadsheet data mandatory
-        validators.SpDescriptionValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
-        validators.SpCompositionGraphValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
-        validators.SpCompositionTreeValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
-        validators.SpTemporalReferenceValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
+        The fingerprint holds the spreadsheets the validator reads, the source code of
+        the validator and of those models, the package version, the model
+        configurations (scenarios, legend availability), the run options and the
+        configuration values that change the results.
 
-        # 4. Validate spreadsheet data optional
-        validators.SpProportionalityValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
-        validators.SpValueValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
-        validators.SpScenarioValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
-        validators.SpLegendValidator(data_models_context=self.data_models_context, validation_reports=self.validation_reports)
+        Args:
+            validator_class (Type[BaseValidator]): The validator to describe.
+
+        Returns:
+            Optional[Dict[str, Any]]: The fingerprint, or None if the results cannot be reused.
+        """
+        if not validator_class.CACHEABLE or validator_class.READS is None:
+            return None
+
+        inputs: Dict[str, Any] = {}
+        for model_class in validator_class.READS:
+            sp_name = model_class.CONSTANTS.SP_NAME
+            if sp_name in self._input_fingerprints and self._input_fingerprints[sp_name] is None:
+                return None
+            inputs[sp_name] = self._input_fingerprints.get(sp_name, "inactive")
+
+        source_classes = [*validator_class.__mro__, *(cls for model_class in validator_class.READS for cls in model_class.__mro__)]
+        sources = sorted({inspect.getsourcefile(cls) for cls in source_classes if cls.__module__.startswith("data_validate.")})
+        data_args = self.context.data_args
+        return {
+            "validator": f"{validator_class.__module__}.{validator_class.__qualname__}",
+            "version": config.METADATA.__version__,
+            "sources": [_source_hash(source_file) for source_file in sources],
+            "inputs": inputs,
+            "models": self.model_configurations,
+            "options": {
+                "locale": data_args.data_file.locale,
+                "no_spellchecker": data_args.data_action.no_spellchecker,
+                "no_warning_titles_length": data_args.data_action.no_warning_titles_length,
+                "truncate_messages": data_args.data_performance.truncate_messages,
+            },
+            "config": {name: getattr(self.context.config, name) for name in self.RESULT_CACHE_CONFIG},
+        }
 
     def _report(self) -> None:
         """
@@ -230,24 +515,80 @@ class SpreadsheetProcessor:
 
             for report in self.validation_reports:
                 self.context.logger.info(f"Report: {report.test_name}")
-                self.context.logger.error(f"  Errors: {len(report.errors)}")
+                self.context.logger.error(f"  Errors: {report.error_count}")
                 for error in report.errors:
-                    self.context.logger.error(f"    - {error}")
-                self.context.logger.warning(f"  Warnings: {len(report.warnings)}")
+                    self.context.logger.error(f"    - {self.validation_reports.render_message(error)}")
+                self.context.logger.warning(f"  Warnings: {report.warning_count}")
                 for warning in report.warnings:
-                    self.context.logger.warning(f"    - {warning}")
+                    self.context.logger.warning(f"    - {self.validation_reports.render_message(warning)}")
                 self.context.logger.info("---------------------------------------------------------------")
 
         # Set summary of total errors and warnings
-        total_errors = sum(len(report.errors) for report in self.validation_reports)
-        total_warnings = sum(len(report.warnings) for report in self.validation_reports)
+        total_errors = self.validation_reports.get_total_errors()
+        total_warnings = self.validation_reports.get_total_warnings()
 
         if self.context.data_args.data_action.debug:
             self.context.logger.error(f"Total errors: {total_errors}")
             self.context.logger.warning(f"Total warnings: {total_warnings}")
 
         # Generate report in HTML and PDF formats
-        controllers.FileReportGenerator(context=self.context).build_report(report_list=self.validation_reports)
+        report_generator = controllers.FileReportGenerator(context=self.context)
+        report_generator.build_report(report_list=self.validation_reports, timings=self.timings)
+        self.report_files = report_generator.report_files
+
+    def _save_timings(self) -> None:
+        """
+        Write the recorded elapsed times to the JSON file given by `--timings`, if any.
+        """
+        timings_path = self.context.data_args.data_performance.timings
+        if timings_path is None:
+            return
+        try:
+            self.timings.save(timings_path)
+            info_message = f"Tempos de execução salvos em: {timings_path}"
+            self.context.logger.info(info_message)
+            print(info_message, file=sys.stdout)
+        except OSError as error:
+            error_message = f"Erro ao salvar os tempos de execução: {error}"
+            self.context.logger.error(error_message)
+            print(error_message, file=sys.stderr)
+
+    def _save_profile(self) -> None:
+        """
+        Write the CPU and memory profiles to the output folder, if `--profile` or `--profile-memory` is set.
+        """
+        if not self.profiler.enabled:
+            return
+        for warning in self.profiler.warnings:
+            warning_message = f"Perfil de execução incompleto: {warning}"
+            self.context.logger.warning(warning_message)
+            print(warning_message, file=sys.stderr)
+        for stage in self.profiler.stages:
+            self.context.logger.info(
+                f"Memória alocada em {stage['stage']}: {stage['size_diff_kib']} KiB (pico: {stage['peak_kib']} KiB, atual: {stage['current_kib']} KiB)"
+            )
+        try:
+            profile_files = self.profiler.save(self.output_folder, controllers.FileReportGenerator.get_report_name(self.context))
+        except OSError as error:
+            error_message = f"Erro ao salvar o perfil de execução: {error}"
+            self.context.logger.error(error_message)
+            print(error_message, file=sys.stderr)
+            return
+        for profile_file in profile_files:
+            info_message = f"Perfil de execução salvo em: {profile_file}"
+            self.context.logger.info(info_message)
+            print(info_message, file=sys.stdout)
+
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """
+        Time a stage of the run and, with `--profile-memory`, summarize the memory it allocated.
+
+        Args:
+            name (str): Name of the stage.
+        """
+        with self.timings.measure(name), self.profiler.stage(name):
+            yield
 
     def run(self):
         """
@@ -255,15 +596,32 @@ class SpreadsheetProcessor:
 
         Orchestrates the sequential execution of:
         1. `_prepare_statement()`: Setup.
-        2. `_read_data()`: Data loading.
-        3. `_configure()`: Model initialization and cleaning.
-        4. `_build_pipeline()`: Core validation logic.
-        5. `_report()`: Output generation.
+        2. `_preflight()`: Header-only structural scan, if `--preflight` is set.
+           Submissions with structural errors go straight to `_report()`.
+        3. `_read_data()`: Data loading.
+        4. `_configure()`: Model initialization and cleaning.
+        5. `_build_pipeline()`: Core validation logic.
+        6. `_report()`: Output generation.
+
+        Each stage is timed in `timings` and, with `--profile-memory`, its allocations
+        are summarized by `profiler`.
         """
         self.context.logger.info("Starting processing...")
 
         self._prepare_statement()
-        self._read_data()
-        self._configure()
-        self._build_pipeline()
-        self._report()
+        if self.context.data_args.data_action.preflight:
+            with self._stage("preflight"):
+                rejected = self._preflight()
+            if rejected:
+                with self._stage("report"):
+                    self._report()
+                return
+
+        with self._stage("read_data"):
+            self._read_data()
+        with self._stage("configure"):
+            self._configure()
+        with self._stage("validation"):
+            self._build_pipeline()
+        with self._stage("report"):
+            self._report()
@@ -0,0 +1,393 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for serving validations from a long-running local process.
+
+This module defines the `ValidationService` class, which keeps a pool of warm
+worker processes (imports, localization, configuration, logging and compiled report
+templates loaded once) and validates the submissions queued by its clients, and the
+`ValidationServer` class, a small HTTP front end for it. Jobs wait in a bounded
+queue; a job that exceeds the per-job timeout has its worker process replaced.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from data_validate.controllers.batch_processor import _init_worker, validate_folder
+
+
+def _serve_jobs(connection) -> None:
+    """
+    Main loop of a worker process: validate each received job until `None` arrives.
+
+    Args:
+        connection: Worker end of the pipe shared with the service.
+    """
+    # Ctrl+C reaches the whole process group: the service stops the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _init_worker()
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        connection.send(validate_folder(*task))
+
+
+class ValidationJob:
+    """
+    Data model for a submission queued in a `ValidationService`.
+
+    Attributes:
+        job_id (str): Identifier of the job.
+        input_folder (str): Path to the input folder or .zip archive.
+        output_folder (str): Folder where the reports of this submission are written.
+        extra_args (List[str]): Command-line arguments of the run.
+        status (str): "queued", "running", or the final status of the run ("ok", "failed" or "timeout").
+        summary (Optional[Dict[str, Any]]): Summary of the run, once finished.
+    """
+
+    def __init__(self, job_id: str, input_folder: str, output_folder: str, extra_args: Iterable[str] = ()):
+        """
+        Initialize a ValidationJob.
+
+        Args:
+            job_id (str): Identifier of the job.
+            input_folder (str): Path to the input folder or .zip archive.
+            output_folder (str): Folder where the reports of this submission are written.
+            extra_args (Iterable[str]): Command-line arguments of the run. Defaults to ().
+        """
+        self.job_id = job_id
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        self.extra_args = list(extra_args)
+        self.status = "queued"
+        self.summary: Optional[Dict[str, Any]] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished."""
+        return self._done.is_set()
+
+    def finish(self, summary: Dict[str, Any]) -> None:
+        """
+        Store the summary of the run and wake up the clients waiting for it.
+
+        Args:
+            summary (Dict[str, Any]): Summary of the run.
+        """
+        self.summary = summary
+        self.status = summary["status"]
+        self._done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the job to finish.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait, in seconds. Defaults to None (no limit).
+
+        Returns:
+            bool: True if the job has finished, False on timeout.
+        """
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the JSON representation of the job.
+
+        Returns:
+            Dict[str, Any]: Identifier, status and, once finished, the summary of the run.
+        """
+        return {"job_id": self.job_id, "status": self.status, "summary": self.summary}
+
+
+class _WorkerProcess:
+    """Warm worker process that validates one job at a time."""
+
+    def __init__(self, mp_context):
+        self._mp_context = mp_context
+        self._start()
+
+    def _start(self) -> None:
+        self.connection, worker_connection = self._mp_context.Pipe()
+        self.process = self._mp_context.Process(target=_serve_jobs, args=(worker_connection,), daemon=True)
+        self.process.start()
+        worker_connection.close()
+
+    def restart(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+        self._start()
+
+    def run(self, job: ValidationJob, timeout: float) -> Dict[str, Any]:
+        start_time = time.time()
+        summary: Dict[str, Any] = {
+            "input_folder": job.input_folder,
+            "output_folder": job.output_folder,
+            "status": "failed",
+            "errors": 0,
+            "warnings": 0,
+            "message": "",
+            "reports": [],
+        }
+        try:
+            self.connection.send((job.input_folder, job.output_folder, job.extra_args))
+            if self.connection.poll(timeout):
+                return self.connection.recv()
+            summary.update(status="timeout", message=f"Tempo limite de {timeout:g} segundos excedido.")
+        except (EOFError, OSError) as e:
+            summary["message"] = f"O processo de validação foi encerrado inesperadamente: {type(e).__name__}."
+        # The worker is still busy or gone: replace it by a fresh one
+        self.restart()
+        summary["seconds"] = round(time.time() - start_time, 1)
+        return summary
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+
+class ValidationService:
+    """
+    Validates submissions in warm worker processes, reused across jobs.
+
+    Jobs are validated in submission order by `workers` processes, each one as in a
+    single `canoa-data-validate` run, with its reports written to its own folder.
+    At most `queue_size` jobs wait in the queue; a job running for longer than
+    `timeout` seconds is stopped and reported with the "timeout" status.
+
+    Attributes:
+        output_folder (str): Root folder of the report sets.
+        workers (int): Number of worker processes.
+        queue_size (int): Maximum number of jobs waiting to run.
+        timeout (float): Maximum duration of a job, in seconds.
+        extra_args (List[str]): Command-line arguments forwarded to every run.
+    """
+
+    MAX_FINISHED_JOBS = 1000
+
+    def __init__(self, output_folder: str, workers: int = 2, queue_size: int = 16, timeout: float = 600.0, extra_args: Iterable[str] = ()):
+        """
+        Initialize the ValidationService. Worker processes start with `start()`.
+
+        Args:
+            output_folder (str): Root folder of the report sets.
+            workers (int): Number of worker processes. Defaults to 2.
+            queue_size (int): Maximum number of jobs waiting to run. Defaults to 16.
+            timeout (float): Maximum duration of a job, in seconds. Defaults to 600.
+            extra_args (Iterable[str]): Command-line arguments forwarded to every run. Defaults to ().
+
+        Raises:
+            ValueError: If workers or queue_size is not a positive integer, or timeout is not positive.
+        """
+        for name, value in (("workers", workers), ("queue_size", queue_size)):
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ValueError(f"{name} must be a positive integer.")
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0:
+            raise ValueError("timeout must be a positive number.")
+
+        self.output_folder = output_folder
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = float(timeout)
+        self.extra_args = list(extra_args)
+
+        self._queue: "queue.Queue[Optional[ValidationJob]]" = queue.Queue(maxsize=queue_size)
+        self._jobs: "OrderedDict[str, ValidationJob]" = OrderedDict()
+        self._jobs_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker processes and the threads feeding them."""
+        if self._threads:
+            return
+        # Spawned workers do not inherit the locks held by the server threads
+        mp_context = multiprocessing.get_context("spawn")
+        for index in range(self.workers):
+            worker = _WorkerProcess(mp_context)
+            thread = threading.Thread(target=self._consume, args=(worker,), name=f"validation-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Finish the queued jobs, then stop the worker processes."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, input_folder: str, output_folder: Optional[str] = None, extra_args: Iterable[str] = ()) -> ValidationJob:
+        """
+        Queue a submission for validation.
+
+        Args:
+            input_folder (str): Path to the input folder or .zip archive.
+            output_folder (Optional[str]): Folder of the reports. Defaults to a folder named after the job.
+            extra_args (Iterable[str]): Command-line arguments added to the service ones. Defaults to ().
+
+        Returns:
+            ValidationJob: The queued job.
+
+        Raises:
+            queue.Full: If `queue_size` jobs are already waiting.
+        """
+        job_id = uuid.uuid4().hex
+        job = ValidationJob(job_id, input_folder, output_folder or os.path.join(self.output_folder, job_id), [*self.extra_args, *extra_args])
+        self._queue.put_nowait(job)
+        with self._jobs_lock:
+            self._jobs[job_id] = job
+            # Forget the oldest finished jobs
+            finished = [key for key, item in self._jobs.items() if item.done]
+            for key in finished[: max(0, len(self._jobs) - self.MAX_FINISHED_JOBS)]:
+                del self._jobs[key]
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ValidationJob]:
+        """
+        Retrieve a job by identifier.
+
+        Args:
+            job_id (str): Identifier of the job.
+
+        Returns:
+            Optional[ValidationJob]: The job, or None if it is unknown or was forgotten.
+        """
+        with self._jobs_lock:
+            return self._jobs.get(job_id)
+
+    def queued_jobs(self) -> int:
+        """
+        Count the jobs waiting to run.
+
+        Returns:
+            int: Number of queued jobs.
+        """
+        return self._queue.qsize()
+
+    def _consume(self, worker: _WorkerProcess) -> None:
+        """Validate queued jobs with the given worker process until the service stops."""
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    break
+                job.status = "running"
+                job.finish(worker.run(job, self.timeout))
+        finally:
+            worker.stop()
+
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP API of the `ValidationServer`.
+
+    Endpoints:
+        POST /validate: Body `{"input_folder": ..., "output_folder": ..., "args": [...], "wait": true}`.
+            Returns the job with the summary of the run, or only the queued job when `wait` is false.
+        GET /jobs/<job_id>: Returns the job.
+        GET /health: Returns the service state.
+    """
+
+    server: "ValidationServer"
+
+    def do_GET(self) -> None:
+        """Handle the job and health requests."""
+        service = self.server.service
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok", "workers": service.workers, "queued_jobs": service.queued_jobs()})
+        elif self.path.startswith("/jobs/"):
+            job = service.get_job(self.path[len("/jobs/") :])
+            if job is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": "Job não encontrado."})
+            else:
+                self._send_json(HTTPStatus.OK, job.to_dict())
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Recurso não encontrado."})
+
+    def do_POST(self) -> None:
+        """Handle the validation requests."""
+        if self.path != "/validate":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Recurso não encontrado."})
+            return
+
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            input_folder = body["input_folder"]
+            extra_args = body.get("args", [])
+            if not isinstance(input_folder, str) or not isinstance(extra_args, list) or not all(isinstance(arg, str) for arg in extra_args):
+                raise TypeError
+        except (ValueError, KeyError, TypeError):
+            self._send_json(
+                HTTPStatus.BAD_REQUEST, {"error": "Corpo inválido: informe 'input_folder' e, opcionalmente, 'output_folder', 'args' e 'wait'."}
+            )
+            return
+
+        try:
+            job = self.server.service.submit(input_folder, body.get("output_folder"), extra_args)
+        except queue.Full:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Fila de validação cheia. Tente novamente mais tarde."})
+            return
+
+        if not body.get("wait", True):
+            self._send_json(HTTPStatus.ACCEPTED, job.to_dict())
+            return
+        job.wait()
+        self._send_json(HTTPStatus.OK, job.to_dict())
+
+    def _send_json(self, status: HTTPStatus, payload: Dict[str, Any]) -> None:
+        """Write a JSON response."""
+        content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Send the access log to the service logger instead of stderr."""
+        self.server.logger.info("%s - %s", self.address_string(), format % args)
+
+
+class ValidationServer(ThreadingHTTPServer):
+    """
+    HTTP front end of a `ValidationService`.
+
+    Attributes:
+        service (ValidationService): Service validating the submitted jobs.
+        logger (logging.Logger): Logger of the access log.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: ValidationService, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the ValidationServer.
+
+        Args:
+            address (Tuple[str, int]): Host and port to listen on.
+            service (ValidationService): Service validating the submitted jobs.
+            logger (Optional[logging.Logger]): Logger of the access log. Defaults to the module logger.
+        """
+        super().__init__(address, ValidationRequestHandler)
+        self.service = service
+        self.logger = logger or logging.getLogger(__name__)
@@ -0,0 +1,80 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for revalidating a submission whenever its files change.
+
+This module defines the `WatchProcessor` class, used by `--watch`. It keeps the
+process alive, polls the input folder and runs the validation pipeline again after
+every change, rewriting the reports. The services of the context stay warm between
+runs, unchanged spreadsheets are taken from the sheet cache and validators whose
+spreadsheets did not change reuse their stored results.
+"""
+
+import threading
+from typing import Optional
+
+from data_validate.controllers.context.general_context import GeneralContext
+from data_validate.controllers.spreadsheet_processor import SpreadsheetProcessor
+from data_validate.helpers.common.processing.folder_watcher import FolderWatcher
+
+
+class WatchProcessor:
+    """
+    Runs the validation pipeline again every time the input files change.
+
+    Attributes:
+        context (GeneralContext): The application context shared by all runs.
+        watcher (FolderWatcher): Poller of the input folder (or .zip archive).
+        processor (Optional[SpreadsheetProcessor]): Processor of the last successful run.
+        runs (int): Number of validation runs started.
+    """
+
+    def __init__(self, context: GeneralContext, interval: float = FolderWatcher.DEFAULT_INTERVAL):
+        """
+        Initialize the WatchProcessor.
+
+        Args:
+            context (GeneralContext): The application context shared by all runs.
+            interval (float): Seconds between polls of the input folder. Defaults to FolderWatcher.DEFAULT_INTERVAL.
+        """
+        self.context = context
+        data_file = self.context.data_args.data_file
+        # Reports and logs written inside the input folder must not trigger new runs
+        self.watcher = FolderWatcher(
+            data_file.input_folder,
+            interval=interval,
+            exclude=[data_file.output_folder, self.context.logger_manager.log_folder],
+        )
+        self.processor: Optional[SpreadsheetProcessor] = None
+        self.runs = 0
+
+    def validate(self) -> None:
+        """
+        Run the validation pipeline once.
+
+        Failures are reported and do not stop the watch, so a spreadsheet saved in
+        an unexpected state can be fixed and saved again.
+        """
+        self.runs += 1
+        try:
+            self.processor = SpreadsheetProcessor(context=self.context)
+        except Exception as e:
+            self.context.logger.exception("Validation run failed while watching the input folder.")
+            print(f"Falha na validação: {type(e).__name__}: {e}")
+
+    def run(self, stop_event: Optional[threading.Event] = None, max_runs: Optional[int] = None) -> None:
+        """
+        Validate the input folder, then again after every change, until stopped.
+
+        Args:
+            stop_event (Optional[threading.Event]): When set, watching stops. Defaults to None (runs until interrupted).
+            max_runs (Optional[int]): Stops after this number of runs. Defaults to None (no limit).
+        """
+        stop_event = stop_event or threading.Event()
+        self.validate()
+        while not stop_event.is_set() and (max_runs is None or self.runs < max_runs):
+            print(f"\nMonitorando alterações em: {self.context.data_args.data_file.input_folder} (Ctrl+C para encerrar)")
+            changes = self.watcher.wait_for_change(stop_event)
+            if not changes:
+                break
+            print(f"Arquivos alterados: {', '.join(changes)}. Validando novamente...")
+            self.validate()
@@ -6,14 +6,16 @@ This module defines classes for managing command-line arguments related to:
 - Input/output files and folders (DataFile)
 - Execution flags and actions (DataAction)
 - Report metadata (DataReport)
+- Performance tuning options (DataPerformance)
 - Main argument orchestration (DataArgs)
 """
 
 import argparse
+import importlib.util
 import os
 from abc import ABC, abstractmethod
 
-from data_validate.helpers.tools import LanguageManager
+from data_validate.helpers.tools import ArchivePath, LanguageManager
 
 
 class DataModelABC(ABC):
@@ -50,7 +52,7 @@ class DataFile(DataModelABC):
     Executes validation logic immediately upon instantiation.
 
     Attributes:
-        input_folder (str): Absolute or relative path to the input data directory.
+        input_folder (str): Absolute or relative path to the input data directory or .zip archive.
         output_folder (str): Absolute or relative path to the output directory.
         locale (str): Language/region code (e.g., 'pt_BR', 'en_US').
     """
@@ -60,7 +62,7 @@ class DataFile(DataModelABC):
         Initialize the DataFile class with file paths and locale.
 
         Args:
-            input_folder (str, optional): Path to the input folder.
+            input_folder (str, optional): Path to the input folder or .zip archive.
             output_folder (str, optional): Path to the output folder.
             locale (str, optional): Locale setting.
         """
@@ -76,13 +78,13 @@ class DataFile(DataModelABC):
         """
         Validate the file-related arguments.
 
-        Checks if the input folder exists and if the output folder name is valid
+        Checks if the input folder (or .zip archive) exists and if the output folder name is valid
         (cannot be a file name, must be a directory path).
 
         Raises:
             ValueError: If the input folder does not exist or the output folder name is invalid.
         """
-        if not os.path.isdir(self.input_folder):
+        if not os.path.isdir(self.input_folder) and not ArchivePath.is_archive(self.input_folder):
             raise ValueError(f"Input folder does not exist: {self.input_folder}")
 
         if os.path.splitext(os.path.basename(self.output_folder))[1] != "" or "." in os.path.basename(self.output_folder):
@@ -106,6 +108,8 @@ class DataAction(DataModelABC):
         no_time (bool): If True, hides execution time metadata.
         no_version (bool): If True, hides version information in reports.
         debug (bool): If True, enables verbose debug logging.
+        preflight (bool): If True, stops after a header-only scan when it finds structural errors.
+        watch (bool): If True, keeps running and validates the input folder again whenever its files change.
     """
 
     def __init__(
@@ -115,6 +119,8 @@ class DataAction(DataModelABC):
         no_time=None,
         no_version=None,
         debug=None,
+        preflight=False,
+        watch=False,
     ):
         """
         Initialize the DataAction class with configuration flags.
@@ -125,6 +131,8 @@ class DataAction(DataModelABC):
             no_time (bool, optional): Hides execution time and date information. Defaults to None.
             no_version (bool, optional): Hides the script version in the final report. Defaults to None.
             debug (bool, optional): Runs the program in debug mode. Defaults to None.
+            preflight (bool, optional): Rejects structurally broken submissions after a header-only scan. Defaults to False.
+            watch (bool, optional): Validates the input folder again whenever its files change. Defaults to False.
         """
         super().__init__()
         self.no_spellchecker = no_spellchecker
@@ -132,6 +140,8 @@ class DataAction(DataModelABC):
         self.no_time = no_time
         self.no_version = no_version
         self.debug = debug
+        self.preflight = preflight
+        self.watch = watch
 
         # Run the argument parser
         self.run()
@@ -155,6 +165,10 @@ class DataAction(DataModelABC):
             raise ValueError("no_version must be a boolean value.")
         if not isinstance(self.debug, bool):
             raise ValueError("debug must be a boolean value.")
+        if not isinstance(self.preflight, bool):
+            raise ValueError("preflight must be a boolean value.")
+        if not isinstance(self.watch, bool):
+            raise ValueError("watch must be a boolean value.")
 
     def run(self):
         """Execute parsing and validation of action arguments."""
@@ -210,34 +224,163 @@ class DataReport(DataModelABC):
         self._validate_arguments()
 
 
+class DataPerformance(DataModelABC):
+    """
+    Handles performance-related arguments.
+
+    Manages options that change how the validation pipeline uses the available
+    resources, without changing the produced reports.
+
+    Attributes:
+        jobs (int): Number of spreadsheets read concurrently during data loading.
+        cache (bool): If True, reuses parsed spreadsheets from a persistent cache in the user cache folder.
+        csv_engine (str): Parser used for CSV files ('c' or 'pyarrow').
+        chunk_size (int): Rows validated at once in the values spreadsheet (0 disables chunking). The spreadsheet itself is still loaded whole.
+        prune_columns (bool): If True, parses only the columns each model uses; other columns are kept empty.
+        compact (bool): If True, compacts the text columns of the parsed spreadsheets to use less memory.
+        validation_jobs (int): Number of validators run concurrently in the validation pipeline.
+        incremental (bool): If True, reuses the stored results of validators whose input spreadsheets did not change.
+        truncate_messages (bool): If True, the per-cell checks stop building messages once the report message limit is reached.
+        timings (Optional[str]): Path of the JSON file receiving the elapsed time of each stage, validator and check.
+        report_timings (bool): If True, adds the elapsed time of each stage to the HTML report.
+        profile (bool): If True, profiles the run with cProfile and writes the statistics and collapsed stacks to the output folder.
+        profile_memory (bool): If True, summarizes the memory allocated in each stage with tracemalloc.
+    """
+
+    CSV_ENGINES = ("c", "pyarrow")
+
+    def __init__(
+        self,
+        jobs=1,
+        cache=False,
+        csv_engine="c",
+        chunk_size=0,
+        prune_columns=False,
+        compact=False,
+        validation_jobs=1,
+        incremental=False,
+        truncate_messages=False,
+        timings=None,
+        report_timings=False,
+        profile=False,
+        profile_memory=False,
+    ):
+        """
+        Initialize the DataPerformance class with tuning options.
+
+        Args:
+            jobs (int, optional): Number of spreadsheets read concurrently. Defaults to 1.
+            cache (bool, optional): Enables the parsed spreadsheet cache. Defaults to False.
+            csv_engine (str, optional): Parser used for CSV files. Defaults to 'c'.
+            chunk_size (int, optional): Rows validated at once in the values spreadsheet. Defaults to 0 (disabled).
+            prune_columns (bool, optional): Parses only the columns used by the models. Defaults to False.
+            compact (bool, optional): Compacts the parsed spreadsheets in memory. Defaults to False.
+            validation_jobs (int, optional): Number of validators run concurrently. Defaults to 1.
+            incremental (bool, optional): Reuses the results of validators whose inputs did not change. Defaults to False.
+            truncate_messages (bool, optional): Stops building messages past the report message limit. Defaults to False.
+            timings (str, optional): Path of the JSON file with the elapsed times. Defaults to None (not written).
+            report_timings (bool, optional): Adds the elapsed times to the HTML report. Defaults to False.
+            profile (bool, optional): Profiles the run with cProfile. Defaults to False.
+            profile_memory (bool, optional): Summarizes the memory allocated in each stage. Defaults to False.
+        """
+        super().__init__()
+        self.jobs = jobs
+        self.cache = cache
+        self.csv_engine = csv_engine
+        self.chunk_size = chunk_size
+        self.prune_columns = prune_columns
+        self.compact = compact
+        self.validation_jobs = validation_jobs
+        self.incremental = incremental
+        self.truncate_messages = truncate_messages
+        self.timings = timings
+        self.report_timings = report_timings
+        self.profile = profile
+        self.profile_memory = profile_memory
+
+        # Run the argument parser
+        self.run()
+
+    def _validate_arguments(self):
+        """
+        Validate the performance-related arguments.
+
+        Ensures that the numbers of jobs and validation jobs are positive integers, that flags are booleans,
+        that the selected CSV engine is supported and installed, that the chunk
+        size is a non-negative integer and that the timings path is a non-empty string or None.
+
+        Raises:
+            ValueError: If jobs or validation_jobs is not a positive integer, a flag is not a boolean,
+                the CSV engine is unknown or unavailable, the chunk size is negative or the timings path is invalid.
+        """
+        if isinstance(self.jobs, bool) or not isinstance(self.jobs, int) or self.jobs < 1:
+            raise ValueError("jobs must be a positive integer.")
+        if not isinstance(self.cache, bool):
+            raise ValueError("cache must be a boolean value.")
+        if self.csv_engine not in self.CSV_ENGINES:
+            raise ValueError(f"csv_engine must be one of: {', '.join(self.CSV_ENGINES)}.")
+        if self.csv_engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None:
+            raise ValueError("csv_engine 'pyarrow' requires the pyarrow package to be installed.")
+        if isinstance(self.chunk_size, bool) or not isinstance(self.chunk_size, int) or self.chunk_size < 0:
+            raise ValueError("chunk_size must be a non-negative integer.")
+        if not isinstance(self.prune_columns, bool):
+            raise ValueError("prune_columns must be a boolean value.")
+        if not isinstance(self.compact, bool):
+            raise ValueError("compact must be a boolean value.")
+        if isinstance(self.validation_jobs, bool) or not isinstance(self.validation_jobs, int) or self.validation_jobs < 1:
+            raise ValueError("validation_jobs must be a positive integer.")
+        if not isinstance(self.incremental, bool):
+            raise ValueError("incremental must be a boolean value.")
+        if not isinstance(self.truncate_messages, bool):
+            raise ValueError("truncate_messages must be a boolean value.")
+        if self.timings is not None and (not isinstance(self.timings, str) or not self.timings.strip()):
+            raise ValueError("timings must be a non-empty path or None.")
+        if not isinstance(self.report_timings, bool):
+            raise ValueError("report_timings must be a boolean value.")
+        if not isinstance(self.profile, bool):
+            raise ValueError("profile must be a boolean value.")
+        if not isinstance(self.profile_memory, bool):
+            raise ValueError("profile_memory must be a boolean value.")
+
+    def run(self):
+        """Execute parsing and validation of performance arguments."""
+        self._validate_arguments()
+
+
 class DataArgs:
     """
     Main orchestration class for argument parsing, configuration, and validation.
 
-    Aggregates `DataFile`, `DataAction`, and `DataReport` to provide a centralized
+    Aggregates `DataFile`, `DataAction`, `DataReport`, and `DataPerformance` to provide a centralized
     access point for all application configuration parameters parsed from command line.
 
     Attributes:
         data_file (DataFile): Instance handling file/path inputs.
         data_action (DataAction): Instance handling execution flags.
         data_report (DataReport): Instance handling report metadata.
+        data_performance (DataPerformance): Instance handling performance tuning options.
         allow_abbrev (bool): Whether to allow argument abbreviation in argparse.
         language_manager (LanguageManager): Manager for localization strings.
     """
 
-    def __init__(self, allow_abbrev=True):
+    def __init__(self, allow_abbrev=True, argv=None, language_manager=None):
         """
         Initialize the DataArgs class and parse CLI arguments immediately.
 
         Args:
             allow_abbrev (bool, optional): Allows argument abbreviations. Defaults to True.
+            argv (List[str], optional): Arguments to parse instead of sys.argv. Defaults to None.
+            language_manager (LanguageManager, optional): Already loaded localization manager
+                to reuse. Defaults to None (a new one is created).
         """
 
-        self.language_manager: LanguageManager = LanguageManager()
+        self.language_manager: LanguageManager = language_manager or LanguageManager()
+        self.argv = argv
 
         self.data_file = None
         self.data_action = None
         self.data_report = None
+        self.data_performance = None
         self.allow_abbrev = allow_abbrev
 
         # Run the argument parser
@@ -259,7 +402,7 @@ class DataArgs:
         )
 
         # Arguments for DataFile
-        parser.add_argument("--input_folder", type=str, required=True, help="Path to the input folder.")
+        parser.add_argument("--input_folder", type=str, required=True, help="Path to the input folder or .zip archive.")
         parser.add_argument(
             "--output_folder",
             default="output_data/",
@@ -293,6 +436,16 @@ class DataArgs:
             help="Hides the script version in the final report.",
         )
         parser.add_argument("--debug", action="store_true", help="Runs the program in debug mode.")
+        parser.add_argument(
+            "--preflight",
+            action="store_true",
+            help="Reads only the spreadsheet headers first and stops if structural errors are found.",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keeps running and validates the input folder again whenever its files change.",
+        )
 
         # Arguments for DataReport
         parser.add_argument("--sector", type=str, default=None, help="Name of the strategic sector.")
@@ -300,13 +453,92 @@ class DataArgs:
         parser.add_argument("--user", type=str, default=None, help="Name of the user.")
         parser.add_argument("--file", type=str, default=None, help="Name of the file to be analyzed.")
 
+        # Arguments for DataPerformance
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of spreadsheets read concurrently during data loading.",
+        )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="Reuses parsed spreadsheets from a persistent cache in the user cache folder.",
+        )
+        parser.add_argument(
+            "--csv-engine",
+            type=str,
+            choices=["c", "pyarrow"],
+            default="c",
+            help="Parser used for CSV files (c or pyarrow).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=0,
+            help=(
+                "Rows validated at once in the values spreadsheet (0 validates all rows together). "
+                "Bounds the temporary copies made by the value and legend checks; the whole spreadsheet "
+                "is still loaded first, so the memory peak does not drop below its size."
+            ),
+        )
+        parser.add_argument(
+            "--prune-columns",
+            action="store_true",
+            help="Parses only the spreadsheet columns used by the validations; other columns are kept empty.",
+        )
+        parser.add_argument(
+            "--compact",
+            action="store_true",
+            help="Compacts the text columns of the parsed spreadsheets to use less memory.",
+        )
+        parser.add_argument(
+            "--validation-jobs",
+            type=int,
+            default=1,
+            help="Number of validators run concurrently (validators reading the same data only).",
+        )
+        parser.add_argument(
+            "--reuse-results",
+            dest="incremental",
+            action="store_true",
+            help="Reuses the stored results of the validators whose input spreadsheets did not change since a previous run.",
+        )
+        parser.add_argument(
+            "--truncate-messages",
+            action="store_true",
+            help="Stops building messages in the per-cell checks once the report message limit is reached (totals stay exact).",
+        )
+        parser.add_argument(
+            "--timings",
+            type=str,
+            default=None,
+            metavar="PATH",
+            help="Writes the elapsed time of each stage, spreadsheet, validator and check to a JSON file.",
+        )
+        parser.add_argument(
+            "--report-timings",
+            action="store_true",
+            help="Adds the elapsed time of each stage, validator and check to the HTML report.",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Profiles the run with cProfile and writes a .prof file and collapsed stacks (flame graph input) to the output folder.",
+        )
+        parser.add_argument(
+            "--profile-memory",
+            action="store_true",
+            help="Traces memory allocations and writes the top allocation sites of each stage to the output folder.",
+        )
+
         return parser
 
     def get_dict_args(self):
         """
         Return the parsed arguments as a dictionary.
 
-        Aggregates attributes from all sub-models (file, action, report) into a single
+        Aggregates attributes from all sub-models (file, action, report, performance) into a single
         dictionary for easier serialization or logging.
 
         Returns:
@@ -321,10 +553,25 @@ class DataArgs:
             "no_time": self.data_action.no_time,
             "no_version": self.data_action.no_version,
             "debug": self.data_action.debug,
+            "preflight": self.data_action.preflight,
+            "watch": self.data_action.watch,
             "sector": self.data_report.sector,
             "protocol": self.data_report.protocol,
             "user": self.data_report.user,
             "file": self.data_report.file,
+            "jobs": self.data_performance.jobs,
+            "cache": self.data_performance.cache,
+            "csv_engine": self.data_performance.csv_engine,
+            "chunk_size": self.data_performance.chunk_size,
+            "prune_columns": self.data_performance.prune_columns,
+            "compact": self.data_performance.compact,
+            "validation_jobs": self.data_performance.validation_jobs,
+            "incremental": self.data_performance.incremental,
+            "truncate_messages": self.data_performance.truncate_messages,
+            "timings": self.data_performance.timings,
+            "report_timings": self.data_performance.report_timings,
+            "profile": self.data_performance.profile,
+            "profile_memory": self.data_performance.profile_memory,
         }
 
     def __str__(self):
@@ -340,9 +587,15 @@ class DataArgs:
             f"no_spellchecker={self.data_action.no_spellchecker}, "
             f"no_warning_titles_length={self.data_action.no_warning_titles_length}, "
             f"no_time={self.data_action.no_time}, no_version={self.data_action.no_version}, "
-            f"debug={self.data_action.debug}, sector={self.data_report.sector}, "
+            f"debug={self.data_action.debug}, preflight={self.data_action.preflight}, watch={self.data_action.watch}, sector={self.data_report.sector}, "
             f"protocol={self.data_report.protocol}, user={self.data_report.user}, "
-            f"file={self.data_report.file})"
+            f"file={self.data_report.file}, jobs={self.data_performance.jobs}, "
+            f"cache={self.data_performance.cache}, csv_engine={self.data_performance.csv_engine}, "
+            f"chunk_size={self.data_performance.chunk_size}, prune_columns={self.data_performance.prune_columns}, "
+            f"compact={self.data_performance.compact}, validation_jobs={self.data_performance.validation_jobs}, "
+            f"incremental={self.data_performance.incremental}, truncate_messages={self.data_performance.truncate_messages}, "
+            f"timings={self.data_performance.timings}, report_timings={self.data_performance.report_timings}, "
+            f"profile={self.data_performance.profile}, profile_memory={self.data_performance.profile_memory})"
         )
 
     def run(self):
@@ -351,16 +604,16 @@ class DataArgs:
 
         Orchestrates the parsing flow:
         1. Creates the parser.
-        2. Parses arguments from sys.argv.
-        3. Initializes `DataFile`, `DataAction`, and `DataReport` with parsed values.
+        2. Parses arguments from `argv` (sys.argv when not given).
+        3. Initializes `DataFile`, `DataAction`, `DataReport`, and `DataPerformance` with parsed values.
         """
         # Create argument parser
         parser = self._create_parser()
 
         # Parse arguments
-        args = parser.parse_args()
+        args = parser.parse_args(self.argv)
 
-        # Set attributes: DataFile, DataAction, DataReport
+        # Set attributes: DataFile, DataAction, DataReport, DataPerformance
         self.data_file = DataFile(args.input_folder, args.output_folder, args.locale)
         self.data_action = DataAction(
             args.no_spellchecker,
@@ -368,5 +621,22 @@ class DataArgs:
             args.no_time,
             args.no_version,
             args.debug,
+            args.preflight,
+            args.watch,
         )
         self.data_report = DataReport(args.sector, args.protocol, args.user, args.file)
+        self.data_performance = DataPerformance(
+            args.jobs,
+            args.cache,
+            args.csv_engine,
+            args.chunk_size,
+            args.prune_columns,
+            args.compact,
+            args.validation_jobs,
+            args.incremental,
+            args.truncate_messages,
+            args.timings,
+            args.report_timings,
+            args.profile,
+            args.profile_memory,
+        )
@@ -0,0 +1,164 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module providing compact, lazily rendered validation messages.
+
+This module defines the `IssueRecord` class, which groups the helpers for issue
+records: tuples storing the message key, location and parameters of a validation
+issue instead of its formatted text. The text is rendered from the `LanguageManager`
+templates only when the message is displayed, so checks that find one issue per
+cell do not format a string per cell.
+"""
+
+import threading
+from itertools import islice
+from typing import Any, List, Optional, Tuple, Union
+
+Record = Tuple[Any, ...]
+
+
+class IssueRecord:
+    """
+    Helpers to render issue records, the lazily formatted validation messages.
+
+    A record is a plain tuple laid out as ``(key, file, row, column, *params)``, e.g.
+    ``("value_error_invalid_number", "valores.xlsx", 5, "1-2030-M", "abc")``. Plain
+    tuples of strings and numbers are not tracked by the garbage collector, so
+    building one per cell costs less than formatting the message. The template of
+    ``key`` is formatted with the named fields ``{file}``, ``{row}`` and ``{column}``
+    and the positional fields ``{0}``, ``{1}``, ... taken from ``params``. Parameters
+    that are records themselves are rendered first, so a message may embed another one.
+
+    Checks limited to a message budget end their messages with an omitted issues
+    record, ``(OMITTED_KEY, None, None, None, count)``, which stands for ``count``
+    issues found but not materialized, so that totals stay exact.
+    """
+
+    KEY_INDEX = 0
+    FILE_INDEX = 1
+    ROW_INDEX = 2
+    COLUMN_INDEX = 3
+    PARAMS_INDEX = 4
+
+    OMITTED_KEY = "issues_omitted"
+
+    _default_language_manager = None
+    _default_lock = threading.Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def is_record(message: Any) -> bool:
+        """
+        Check whether a message is an issue record.
+
+        Args:
+            message (Any): The message to check.
+
+        Returns:
+            bool: True if the message is a record, False if it is a plain text.
+        """
+        return isinstance(message, tuple)
+
+    @staticmethod
+    def omitted(count: int) -> Record:
+        """
+        Build the record standing for issues found but not materialized.
+
+        Args:
+            count (int): Number of issues represented.
+
+        Returns:
+            Record: The omitted issues record.
+        """
+        return (IssueRecord.OMITTED_KEY, None, None, None, count)
+
+    @staticmethod
+    def is_omitted(message: Any) -> bool:
+        """
+        Check whether a message is an omitted issues record.
+
+        Args:
+            message (Any): The message to check.
+
+        Returns:
+            bool: True if the message stands for omitted issues, False otherwise.
+        """
+        return isinstance(message, tuple) and message[IssueRecord.KEY_INDEX] == IssueRecord.OMITTED_KEY
+
+    @staticmethod
+    def count(messages: List[Any]) -> int:
+        """
+        Count the issues of a message list, including the omitted ones.
+
+        Args:
+            messages (List[Any]): Messages, possibly with omitted issues records.
+
+        Returns:
+            int: Number of issues.
+        """
+        omitted_key = IssueRecord.OMITTED_KEY
+        return len(messages) + sum(
+            message[IssueRecord.PARAMS_INDEX] - 1 for message in messages if type(message) is tuple and message[IssueRecord.KEY_INDEX] == omitted_key
+        )
+
+    @staticmethod
+    def limit(messages: List[Any], max_messages: Optional[int]) -> List[Any]:
+        """
+        Keep the first messages of a list, replacing the others with one omitted issues record.
+
+        Args:
+            messages (List[Any]): Messages, possibly with omitted issues records.
+            max_messages (Optional[int]): Number of messages to keep. None keeps the list unchanged.
+
+        Returns:
+            List[Any]: The kept messages, followed by an omitted issues record if any issue was left out.
+        """
+        if max_messages is None:
+            return messages
+        kept = list(islice((message for message in messages if not IssueRecord.is_omitted(message)), max_messages))
+        omitted_count = IssueRecord.count(messages) - len(kept)
+        return kept + [IssueRecord.omitted(omitted_count)] if omitted_count else kept
+
+    @classmethod
+    def default_language_manager(cls):
+        """
+        Return the localization manager used when no other one is given (created on first use).
+
+        Returns:
+            LanguageManager: The shared localization manager.
+        """
+        if cls._default_language_manager is None:
+            with cls._default_lock:
+                if cls._default_language_manager is None:
+                    from data_validate.helpers.tools.locale.language_manager import LanguageManager
+
+                    cls._default_language_manager = LanguageManager()
+        return cls._default_language_manager
+
+    @staticmethod
+    def render(message: Union[str, Record], language_manager=None) -> str:
+        """
+        Format the text of a message.
+
+        Args:
+            message (Union[str, Record]): An issue record, or a text returned unchanged.
+            language_manager (Optional[LanguageManager]): Localization manager holding the
+                templates. Defaults to None (the shared default manager).
+
+        Returns:
+            str: The formatted message.
+        """
+        if not IssueRecord.is_record(message):
+            return message
+        language_manager = language_manager or IssueRecord.default_language_manager()
+        params = [
+            IssueRecord.render(value, language_manager) if IssueRecord.is_record(value) else value for value in message[IssueRecord.PARAMS_INDEX :]
+        ]
+        return language_manager.text(
+            message[IssueRecord.KEY_INDEX],
+            *params,
+            file=message[IssueRecord.FILE_INDEX],
+            row=message[IssueRecord.ROW_INDEX],
+            column=message[IssueRecord.COLUMN_INDEX],
+        )
@@ -9,11 +9,13 @@ formatting useful for handling data spreadsheet numeric values.
 
 import math
 from decimal import Decimal, InvalidOperation
-from typing import Tuple, Any
+from typing import Any, Optional, Tuple
 
 import pandas as pd
 from babel.numbers import format_decimal
 
+from data_validate.helpers.common.formatting.issue_record import IssueRecord, Record
+
 
 class NumberFormattingProcessing:
     """
@@ -148,6 +150,24 @@ class NumberFormattingProcessing:
         except (ValueError, TypeError):
             return False, 0.0
 
+    @staticmethod
+    def integer_issue(value: float, min_value: int = 0) -> Optional[Record]:
+        """
+        Find why a float value is not a valid integer within constraints.
+
+        Args:
+            value (float): The numeric value to validate.
+            min_value (int, optional): Minimum allowed value. Default is 0.
+
+        Returns:
+            Optional[Record]: The issue found, or None if the value is valid.
+        """
+        if not value.is_integer():
+            return ("number_error_not_integer", None, None, None, value)
+        if int(value) < min_value:
+            return ("number_error_below_minimum", None, None, None, int(value), min_value)
+        return None
+
     @staticmethod
     def validate_integer(value: float, min_value: int = 0) -> Tuple[bool, str]:
         """
@@ -164,37 +184,47 @@ class NumberFormattingProcessing:
                 - True and an empty string if valid.
                 - False and an error message if invalid.
         """
-        if not value.is_integer():
-            return False, f"O valor '{value}' não é um número inteiro."
-        if int(value) < min_value:
-            return False, f"O valor '{int(value)}' é menor que {min_value}."
-        return True, ""
+        issue = NumberFormattingProcessing.integer_issue(value, min_value)
+        return (True, "") if issue is None else (False, IssueRecord.render(issue))
 
     @staticmethod
-    def check_cell_integer(cell: Any, min_value: int = 0) -> Tuple[bool, str]:
+    def cell_integer_issue(cell: Any, min_value: int = 0) -> Optional[Record]:
         """
-        Validate if a generic cell content contains a valid integer.
+        Find why a generic cell content is not a valid integer.
 
-        Combines numerical parsing and integer validation.
+        Combines numerical parsing and integer validation, without formatting any message.
 
         Args:
             cell (Any): Value to check (string, number, etc.).
             min_value (int, optional): Minimum allowed value. Default is 0.
 
         Returns:
-            Tuple[bool, str]: A tuple containing:
-                - True and an empty string if valid.
-                - False and an error message if invalid.
+            Optional[Record]: The issue found, or None if the cell holds a valid integer.
         """
         if NumberFormattingProcessing.is_nan(cell):
-            return False, f"O valor '{cell}' não é um número."
+            return ("number_error_not_a_number", None, None, None, cell)
 
         ok, num = NumberFormattingProcessing.parse_numeric(cell)
         if not ok:
-            return False, f"O valor '{cell}' não é um número."
+            return ("number_error_not_a_number", None, None, None, cell)
+
+        return NumberFormattingProcessing.integer_issue(num, min_value)
+
+    @staticmethod
+    def check_cell_integer(cell: Any, min_value: int = 0) -> Tuple[bool, str]:
+        """
+        Validate if a generic cell content contains a valid integer.
+
+        Combines numerical parsing and integer validation.
 
-        valid, msg = NumberFormattingProcessing.validate_integer(num, min_value)
-        if not valid:
-            return False, msg
+        Args:
+            cell (Any): Value to check (string, number, etc.).
+            min_value (int, optional): Minimum allowed value. Default is 0.
 
-        return True, ""
+        Returns:
+            Tuple[bool, str]: A tuple containing:
+                - True and an empty string if valid.
+                - False and an error message if invalid.
+        """
+        issue = NumberFormattingProcessing.cell_integer_issue(cell, min_value)
+        return (True, "") if issue is None else (False, IssueRecord.render(issue))
@@ -7,10 +7,11 @@ to clean and validate DataFrame columns, specifically ensuring integer integrity
 and handling empty values.
 """
 
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 import pandas as pd
 
+from data_validate.helpers.common.formatting.issue_record import IssueRecord
 from data_validate.helpers.common.formatting.number_formatting_processing import NumberFormattingProcessing
 
 
@@ -33,6 +34,7 @@ class DataCleaningProcessing:
         file_name: str,
         min_value: int = 0,
         allow_empty: bool = False,
+        max_messages: Optional[int] = None,
     ) -> Tuple[pd.DataFrame, List[str]]:
         """
         Validate and clean a single DataFrame column, enforcing integer constraints.
@@ -46,11 +48,14 @@ class DataCleaningProcessing:
             file_name (str): Original file name for error reporting context.
             min_value (int, optional): The minimum allowed integer value. Defaults to 0.
             allow_empty (bool, optional): If True, treats empty cells as valid. Defaults to False.
+            max_messages (Optional[int], optional): Number of error messages built; further invalid
+                cells are only counted, in an omitted issues record. Defaults to None (no limit).
 
         Returns:
             Tuple[pd.DataFrame, List[str]]: A tuple containing:
                 - pd.DataFrame: A new DataFrame with only valid rows for this column.
-                - List[str]: A list of error messages for invalid cells found.
+                - List[str]: A list of error messages for invalid cells found
+                  (issue records, see `IssueRecord`, rendered only when displayed).
         """
         errors: List[str] = []
         if column not in df.columns:
@@ -62,13 +67,18 @@ class DataCleaningProcessing:
             if allow_empty and (pd.isna(raw) or str(raw).strip() == ""):
                 mask_valid.append(True)
                 continue
-            is_valid, message = NumberFormattingProcessing.check_cell_integer(raw, min_value)
-            if not is_valid:
-                errors.append(f"{file_name}, linha {idx + 2}: A coluna '{column}' contém um valor inválido: {message}")
+            issue = NumberFormattingProcessing.cell_integer_issue(raw, min_value)
+            if issue is not None:
+                if max_messages is None or len(errors) < max_messages:
+                    errors.append(("data_cleaning_error_invalid_integer", file_name, idx + 2, column, issue))
                 mask_valid.append(False)
             else:
                 mask_valid.append(True)
 
+        omitted_count = mask_valid.count(False) - len(errors)
+        if omitted_count:
+            errors.append(IssueRecord.omitted(omitted_count))
+
         df_clean = df.loc[mask_valid].copy()
         if not allow_empty:
             df_clean[column] = df_clean[column].apply(lambda x: int(float(str(x).replace(",", "."))))
@@ -83,6 +93,7 @@ class DataCleaningProcessing:
         columns_to_clean: List[str],
         min_value: int = 0,
         allow_empty: bool = False,
+        max_messages: Optional[int] = None,
     ) -> Tuple[pd.DataFrame, List[str]]:
         """
         Clean multiple columns in the DataFrame, enforcing integer validation on all.
@@ -96,6 +107,8 @@ class DataCleaningProcessing:
             columns_to_clean (List[str]): List of column names to validate and clean.
             min_value (int, optional): Minimum allowed value for integers. Defaults to 0.
             allow_empty (bool, optional): If True, allows empty values in the columns. Defaults to False.
+            max_messages (Optional[int], optional): Number of error messages built; further invalid
+                cells are only counted, in an omitted issues record. Defaults to None (no limit).
 
         Returns:
             Tuple[pd.DataFrame, List[str]]: A tuple containing:
@@ -106,7 +119,7 @@ class DataCleaningProcessing:
         all_errors: List[str] = []
 
         for col in columns_to_clean:
-            df_work, errors = DataCleaningProcessing.clean_column_integer(df_work, col, file_name, min_value, allow_empty)
+            df_work, errors = DataCleaningProcessing.clean_column_integer(df_work, col, file_name, min_value, allow_empty, max_messages)
             all_errors.extend(errors)
 
-        return df_work, all_errors
+        return df_work, IssueRecord.limit(all_errors, max_messages)
@@ -0,0 +1,140 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for detecting changes in a folder by polling.
+
+This module defines the `FolderWatcher` class, which compares the stat signatures
+(size and modification time) of the files of a folder, or of a single file such as
+a .zip archive, between polls. No external notification service is needed.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class FolderWatcher:
+    """
+    Detects added, removed and modified files by polling their stat signatures.
+
+    Hidden files and the lock files spreadsheet editors create while a file is open
+    are ignored, as are the files under the ``exclude`` folders (e.g. an output
+    folder placed inside the watched folder).
+
+    Attributes:
+        path (Path): Watched folder or file.
+        interval (float): Seconds between polls.
+        exclude (List[Path]): Folders whose files are ignored.
+        signature (Dict[str, Tuple[int, int]]): Size and modification time of each file at the last poll.
+    """
+
+    DEFAULT_INTERVAL = 1.0
+    # Prefixes of hidden files and of the lock files of Excel (~$) and LibreOffice (.~lock.)
+    IGNORED_PREFIXES = (".", "~$")
+
+    def __init__(self, path: str, interval: float = DEFAULT_INTERVAL, exclude: Iterable[str] = ()):
+        """
+        Initialize the FolderWatcher and take the first snapshot.
+
+        Args:
+            path (str): Folder or file to watch.
+            interval (float): Seconds between polls. Defaults to DEFAULT_INTERVAL.
+            exclude (Iterable[str]): Folders whose files are ignored. Defaults to ().
+
+        Raises:
+            ValueError: If interval is not a positive number.
+        """
+        if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("interval must be a positive number.")
+
+        self.path = Path(path)
+        self.interval = interval
+        self.exclude = [Path(folder).resolve() for folder in exclude]
+        self.signature: Dict[str, Tuple[int, int]] = self.snapshot()
+
+    def _is_ignored(self, file_path: Path) -> bool:
+        """Check whether a file is hidden, an editor lock file or inside an excluded folder."""
+        if file_path.name.startswith(self.IGNORED_PREFIXES):
+            return True
+        resolved = file_path.resolve()
+        return any(resolved.is_relative_to(folder) for folder in self.exclude)
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Read the stat signature of every watched file.
+
+        Returns:
+            Dict[str, Tuple[int, int]]: Size and modification time (ns) of each file, by path
+                relative to the watched folder (the file name when watching a single file).
+        """
+        if self.path.is_file():
+            stat = self.path.stat()
+            return {self.path.name: (stat.st_size, stat.st_mtime_ns)}
+
+        signature: Dict[str, Tuple[int, int]] = {}
+        for root, folders, files in os.walk(self.path):
+            folders[:] = sorted(folder for folder in folders if not self._is_ignored(Path(root) / folder))
+            for name in files:
+                file_path = Path(root) / name
+                if self._is_ignored(file_path):
+                    continue
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    # Removed between the listing and the stat call
+                    continue
+                signature[file_path.relative_to(self.path).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+        return signature
+
+    @staticmethod
+    def diff(previous: Dict[str, Tuple[int, int]], current: Dict[str, Tuple[int, int]]) -> List[str]:
+        """
+        List the files that differ between two snapshots.
+
+        Args:
+            previous (Dict[str, Tuple[int, int]]): Earlier snapshot.
+            current (Dict[str, Tuple[int, int]]): Later snapshot.
+
+        Returns:
+            List[str]: Sorted names of the added, removed and modified files.
+        """
+        return sorted(name for name in previous.keys() | current.keys() if previous.get(name) != current.get(name))
+
+    def poll(self) -> List[str]:
+        """
+        Take a new snapshot and report what changed since the previous one.
+
+        Returns:
+            List[str]: Sorted names of the changed files (empty if nothing changed).
+        """
+        try:
+            current = self.snapshot()
+        except OSError:
+            # The watched file is being replaced: report it on the next poll
+            return []
+        changes = self.diff(self.signature, current)
+        self.signature = current
+        return changes
+
+    def wait_for_change(self, stop_event: Optional[threading.Event] = None) -> List[str]:
+        """
+        Block until files change and then stay unchanged for one interval.
+
+        Waiting for a quiet interval keeps a save in progress (several writes in a
+        row) from being picked up half written.
+
+        Args:
+            stop_event (Optional[threading.Event]): When set, the wait is interrupted. Defaults to None.
+
+        Returns:
+            List[str]: Sorted names of the changed files, or an empty list if the wait was interrupted.
+        """
+        stop_event = stop_event or threading.Event()
+        changed = set()
+        while not stop_event.wait(self.interval):
+            changes = self.poll()
+            if changes:
+                changed.update(changes)
+            elif changed:
+                return sorted(changed)
+        return []
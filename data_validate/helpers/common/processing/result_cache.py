@@ -0,0 +1,141 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for persisting computed results between runs.
+
+This module defines the `ResultCache` class, a small on-disk store of
+JSON-serializable results keyed by a fingerprint of everything the result
+depends on (input content hashes, code version, configuration).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ResultCache:
+    """
+    Stores JSON-serializable results on disk, keyed by the fingerprint of their inputs.
+
+    Entries are written atomically, so concurrent runs never read a partial entry.
+    The least recently used entries are evicted once the cache holds more than
+    ``max_entries`` entries.
+
+    Attributes:
+        cache_dir (Path): Folder holding the entries.
+        max_entries (int): Maximum number of entries kept.
+    """
+
+    FORMAT_VERSION = 1
+    DEFAULT_MAX_ENTRIES = 5000
+    ENTRY_SUFFIX = ".json"
+
+    def __init__(self, cache_dir: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the ResultCache.
+
+        Args:
+            cache_dir (Path): Folder holding the entries. Created on the first write.
+            max_entries (int): Maximum number of entries kept. Defaults to DEFAULT_MAX_ENTRIES.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def default_dir() -> Path:
+        """
+        Return the default cache folder, under the user cache folder.
+
+        Returns:
+            Path: ``$XDG_CACHE_HOME/canoa_data_validate/results`` (``~/.cache`` when XDG_CACHE_HOME is not set).
+        """
+        base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return Path(base_dir) / "canoa_data_validate" / "results"
+
+    def make_key(self, fingerprint: Dict[str, Any]) -> str:
+        """
+        Build the key of a result from the description of its inputs.
+
+        Args:
+            fingerprint (Dict[str, Any]): JSON-serializable description of everything the result depends on.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest of the fingerprint.
+        """
+        content = json.dumps({"format": self.FORMAT_VERSION, **fingerprint}, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file of an entry."""
+        return self.cache_dir / f"{key}{self.ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a stored result.
+
+        Args:
+            key (str): Key built by `make_key()`.
+
+        Returns:
+            Optional[Any]: The stored result, or None if there is no valid entry for the key.
+        """
+        entry = self._entry_path(key)
+        if not entry.exists():
+            return None
+        try:
+            with open(entry, "r", encoding="utf-8") as file:
+                result = json.load(file)
+            # Mark the access for the LRU policy
+            os.utime(entry)
+        except (OSError, ValueError):
+            self._remove(entry)
+            return None
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Store a result. Failures to write are ignored: the cache is only an optimization.
+
+        Args:
+            key (str): Key built by `make_key()`.
+            result (Any): JSON-serializable result.
+        """
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(result, file, ensure_ascii=False)
+            os.replace(tmp_path, self._entry_path(key))
+        except (OSError, TypeError, ValueError):
+            if tmp_path is not None:
+                self._remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries beyond `max_entries`."""
+        entries = []
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry))
+            except OSError:
+                continue
+        for _, entry in sorted(entries, key=lambda item: item[0])[: max(0, len(entries) - self.max_entries)]:
+            self._remove(entry)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            self._remove(entry)
+
+    @staticmethod
+    def _remove(entry: Path) -> None:
+        """Delete a file, ignoring errors."""
+        try:
+            entry.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,252 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for profiling a validation run without changes to the code.
+
+This module defines the `RunProfiler` class, used by `--profile` and
+`--profile-memory`. It profiles the run with `cProfile`, writing the raw statistics
+(`.prof`, readable by `pstats`, snakeviz, etc.) and the same data as collapsed stacks
+(the input of flame graph tools), and takes `tracemalloc` snapshots at each stage
+boundary, summarizing the lines that allocated the most memory in each stage.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# pstats function key: (file name, line number, function name)
+FunctionKey = Tuple[str, int, str]
+
+
+class RunProfiler:
+    """
+    Profiles the CPU time and the memory allocations of a validation run.
+
+    `cProfile` only observes the thread that starts the profiler, so the work done in
+    worker threads (`--jobs`, `--validation-jobs`) is not included in the CPU profile.
+    `tracemalloc` observes the whole process.
+
+    Attributes:
+        cpu (bool): If True, profiles the CPU time with cProfile.
+        memory (bool): If True, takes tracemalloc snapshots at each stage boundary.
+        top_n (int): Number of allocation sites listed per stage.
+        stages (List[Dict[str, Any]]): Memory summary of each finished stage, in order.
+        warnings (List[str]): Problems that disabled part of the profiling.
+    """
+
+    # Lines of the profiling machinery itself, left out of the allocation summaries
+    IGNORED_ALLOCATION_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>")
+
+    # Call paths with less than this share of the total time are left out of the collapsed stacks
+    MIN_COLLAPSED_SHARE = 1e-4
+
+    def __init__(self, cpu: bool = False, memory: bool = False, top_n: int = 10):
+        """
+        Initialize the RunProfiler.
+
+        Args:
+            cpu (bool): Profiles the CPU time with cProfile. Defaults to False.
+            memory (bool): Takes tracemalloc snapshots at each stage boundary. Defaults to False.
+            top_n (int): Number of allocation sites listed per stage. Defaults to 10.
+        """
+        self.cpu = cpu
+        self.memory = memory
+        self.top_n = top_n
+        self.stages: List[Dict[str, Any]] = []
+        self.warnings: List[str] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        self._last_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def enabled(self) -> bool:
+        """bool: True if any kind of profiling was requested."""
+        return self.cpu or self.memory
+
+    def start(self) -> None:
+        """
+        Start the requested profilers.
+
+        A profiler that cannot start (e.g. another profiling tool is already active
+        in the thread) is skipped and reported in `warnings`.
+        """
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.cpu:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                self._profile = profile
+            except ValueError as error:
+                self.warnings.append(f"cProfile: {error}")
+
+    def stop(self) -> None:
+        """
+        Stop the profilers started by `start()`.
+        """
+        if self._profile is not None:
+            self._profile.disable()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._last_snapshot = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Mark a stage of the run, summarizing the memory it allocated.
+
+        The snapshot taken at the end of a stage is also the starting point of the
+        next one. Taking and comparing snapshots is not part of the CPU profile.
+
+        Args:
+            name (str): Name of the stage.
+        """
+        if not self.memory or not tracemalloc.is_tracing():
+            yield
+            return
+
+        with self._cpu_profile_paused():
+            before = self._last_snapshot or tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            with self._cpu_profile_paused():
+                current, peak = tracemalloc.get_traced_memory()
+                self._last_snapshot = tracemalloc.take_snapshot()
+                self.stages.append(self._summarize(name, before, self._last_snapshot, current, peak))
+
+    @contextmanager
+    def _cpu_profile_paused(self) -> Iterator[None]:
+        """Suspend the CPU profile while the enclosed block runs."""
+        if self._profile is None:
+            yield
+            return
+        self._profile.disable()
+        try:
+            yield
+        finally:
+            self._profile.enable()
+
+    def _summarize(self, name: str, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, current: int, peak: int) -> Dict[str, Any]:
+        """
+        Summarize the allocations of a stage.
+
+        Args:
+            name (str): Name of the stage.
+            before (tracemalloc.Snapshot): Snapshot taken when the stage started.
+            after (tracemalloc.Snapshot): Snapshot taken when the stage finished.
+            current (int): Traced memory at the end of the stage, in bytes.
+            peak (int): Peak of traced memory during the stage, in bytes.
+
+        Returns:
+            Dict[str, Any]: Memory growth, current and peak memory and top allocation sites of the stage.
+        """
+        # Filtering the per-line differences is much cheaper than filtering every trace of the snapshots
+        differences = [
+            difference for difference in after.compare_to(before, "lineno") if difference.traceback[0].filename not in self.IGNORED_ALLOCATION_FILES
+        ]
+        top_allocations = [
+            {
+                "location": f"{difference.traceback[0].filename}:{difference.traceback[0].lineno}",
+                "size_diff_kib": round(difference.size_diff / 1024, 1),
+                "count_diff": difference.count_diff,
+            }
+            for difference in differences[: self.top_n]
+            if difference.size_diff > 0
+        ]
+        return {
+            "stage": name,
+            "size_diff_kib": round(sum(difference.size_diff for difference in differences) / 1024, 1),
+            "current_kib": round(current / 1024, 1),
+            "peak_kib": round(peak / 1024, 1),
+            "top_allocations": top_allocations,
+        }
+
+    @staticmethod
+    def _function_label(function: FunctionKey) -> str:
+        """Format a pstats function key as a frame of a collapsed stack."""
+        file_name, line_number, function_name = function
+        label = function_name if file_name == "~" else f"{os.path.basename(file_name)}:{line_number}({function_name})"
+        return label.replace(";", ":")
+
+    @classmethod
+    def collapsed_stacks(cls, stats: pstats.Stats) -> List[str]:
+        """
+        Convert profile statistics into collapsed stacks.
+
+        cProfile keeps the time of each caller/callee pair, not of whole call stacks,
+        so the stacks are rebuilt from the functions with no callers downwards, sharing
+        the time of each function among its call paths in proportion to the time of
+        each call. Recursive calls are folded into the outermost one.
+
+        Args:
+            stats (pstats.Stats): The profile statistics.
+
+        Returns:
+            List[str]: One ``frame;frame;... microseconds`` line per call path, sorted.
+        """
+        callees: Dict[FunctionKey, Dict[FunctionKey, float]] = defaultdict(dict)
+        roots = []
+        for function, (_, _, _, cumulative_time, callers) in stats.stats.items():
+            if not callers:
+                roots.append(function)
+            for caller, caller_stats in callers.items():
+                callees[caller][function] = caller_stats[3]
+
+        total_time = sum(stats.stats[root][3] for root in roots)
+        min_time = total_time * cls.MIN_COLLAPSED_SHARE
+        self_times: Dict[Tuple[FunctionKey, ...], float] = defaultdict(float)
+        pending: List[Tuple[FunctionKey, Tuple[FunctionKey, ...], float]] = [(root, (), stats.stats[root][3]) for root in roots]
+        while pending:
+            function, path, time_share = pending.pop()
+            _, _, own_time, cumulative_time, _ = stats.stats[function]
+            fraction = time_share / cumulative_time if cumulative_time else 0.0
+            path = (*path, function)
+            self_times[path] += own_time * fraction
+            for callee, call_time in callees.get(function, {}).items():
+                if callee not in path and call_time * fraction >= min_time:
+                    pending.append((callee, path, call_time * fraction))
+
+        lines = []
+        for path, self_time in self_times.items():
+            microseconds = round(self_time * 1_000_000)
+            if microseconds > 0:
+                lines.append(f"{';'.join(cls._function_label(function) for function in path)} {microseconds}")
+        return sorted(lines)
+
+    def save(self, output_folder: str, file_name: str) -> List[str]:
+        """
+        Write the profiling results to the output folder.
+
+        Writes ``<file_name>_profile.prof`` and ``<file_name>_profile.collapsed`` for the
+        CPU profile and ``<file_name>_memory.json`` for the memory summary.
+
+        Args:
+            output_folder (str): Folder receiving the files.
+            file_name (str): Prefix of the file names (the report name).
+
+        Returns:
+            List[str]: Paths of the written files.
+        """
+        os.makedirs(output_folder, exist_ok=True)
+        written = []
+        if self._profile is not None:
+            prof_path = os.path.join(output_folder, f"{file_name}_profile.prof")
+            self._profile.dump_stats(prof_path)
+            collapsed_path = os.path.join(output_folder, f"{file_name}_profile.collapsed")
+            with open(collapsed_path, "w", encoding="utf-8") as file:
+                file.writelines(f"{line}\n" for line in self.collapsed_stacks(pstats.Stats(self._profile)))
+            written += [prof_path, collapsed_path]
+        if self.memory and self.stages:
+            memory_path = os.path.join(output_folder, f"{file_name}_memory.json")
+            with open(memory_path, "w", encoding="utf-8") as file:
+                json.dump({"top_n": self.top_n, "stages": self.stages}, file, ensure_ascii=False, indent=2)
+            written.append(memory_path)
+        return written
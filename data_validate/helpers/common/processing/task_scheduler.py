@@ -0,0 +1,147 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for running tasks concurrently according to the resources they use.
+
+This module defines the `TaskScheduler` class, which runs callables that declare
+the resources they read and write. Tasks that do not conflict run concurrently on
+a thread pool; conflicting tasks keep their insertion order. Results are always
+returned in insertion order.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set
+
+
+class ScheduledTask:
+    """
+    Data model for a task registered in a `TaskScheduler`.
+
+    Attributes:
+        name (str): Identifier of the task, used in error messages.
+        func (Callable[[], Any]): Callable executed with no arguments.
+        reads (FrozenSet[Hashable]): Resources the task only reads.
+        writes (FrozenSet[Hashable]): Resources the task modifies.
+    """
+
+    def __init__(self, name: str, func: Callable[[], Any], reads: Iterable[Hashable] = (), writes: Iterable[Hashable] = ()):
+        """
+        Initialize a ScheduledTask.
+
+        Args:
+            name (str): Identifier of the task.
+            func (Callable[[], Any]): Callable executed with no arguments.
+            reads (Iterable[Hashable]): Resources the task only reads. Defaults to ().
+            writes (Iterable[Hashable]): Resources the task modifies. Defaults to ().
+        """
+        self.name = name
+        self.func = func
+        self.reads: FrozenSet[Hashable] = frozenset(reads)
+        self.writes: FrozenSet[Hashable] = frozenset(writes)
+
+    def conflicts_with(self, other: "ScheduledTask") -> bool:
+        """
+        Check whether two tasks must not run at the same time.
+
+        Tasks conflict when one of them writes a resource the other reads or writes.
+
+        Args:
+            other (ScheduledTask): The task to compare with.
+
+        Returns:
+            bool: True if the tasks share a written resource, False otherwise.
+        """
+        return bool(self.writes & (other.reads | other.writes) or other.writes & self.reads)
+
+
+class TaskScheduler:
+    """
+    Runs registered tasks as a dependency graph, concurrently when possible.
+
+    A task depends on every previously added task it conflicts with, so the
+    insertion order is kept wherever the declared resources overlap. With one
+    job, tasks run sequentially in insertion order.
+
+    If a task raises an exception, no new task is started; once the running
+    tasks finish, the exception of the earliest failed task (in insertion
+    order) is raised, as a sequential run would.
+
+    Attributes:
+        jobs (int): Maximum number of tasks running at the same time.
+        tasks (List[ScheduledTask]): Registered tasks, in insertion order.
+    """
+
+    def __init__(self, jobs: int = 1):
+        """
+        Initialize the TaskScheduler.
+
+        Args:
+            jobs (int): Maximum number of tasks running at the same time. Defaults to 1.
+        """
+        self.jobs = jobs
+        self.tasks: List[ScheduledTask] = []
+
+    def add(self, name: str, func: Callable[[], Any], reads: Iterable[Hashable] = (), writes: Iterable[Hashable] = ()) -> None:
+        """
+        Register a task.
+
+        Args:
+            name (str): Identifier of the task.
+            func (Callable[[], Any]): Callable executed with no arguments.
+            reads (Iterable[Hashable]): Resources the task only reads. Defaults to ().
+            writes (Iterable[Hashable]): Resources the task modifies. Defaults to ().
+        """
+        self.tasks.append(ScheduledTask(name, func, reads, writes))
+
+    def dependencies(self) -> Dict[int, Set[int]]:
+        """
+        Build the dependency graph of the registered tasks.
+
+        Returns:
+            Dict[int, Set[int]]: For each task index, the indexes of the earlier tasks it must wait for.
+        """
+        return {index: {previous for previous in range(index) if task.conflicts_with(self.tasks[previous])} for index, task in enumerate(self.tasks)}
+
+    def run(self) -> List[Any]:
+        """
+        Execute all registered tasks.
+
+        Returns:
+            List[Any]: The value returned by each task, in insertion order.
+
+        Raises:
+            Exception: The exception raised by the earliest failed task.
+        """
+        if self.jobs <= 1 or len(self.tasks) <= 1:
+            return [task.func() for task in self.tasks]
+
+        pending = self.dependencies()
+        results: Dict[int, Any] = {}
+        errors: Dict[int, BaseException] = {}
+        running: Dict[Future, int] = {}
+
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(self.tasks))) as executor:
+            while pending or running:
+                # Start every task whose dependencies are done, in insertion order
+                if not errors:
+                    for index in [index for index, deps in pending.items() if not deps]:
+                        if len(running) >= self.jobs:
+                            break
+                        del pending[index]
+                        running[executor.submit(self.tasks[index].func)] = index
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    error: Optional[BaseException] = future.exception()
+                    if error is not None:
+                        errors[index] = error
+                        continue
+                    results[index] = future.result()
+                    for deps in pending.values():
+                        deps.discard(index)
+
+        if errors:
+            raise errors[min(errors)]
+        return [results[index] for index in range(len(self.tasks))]
@@ -0,0 +1,143 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module for measuring the time spent in each stage of a validation run.
+
+This module defines the `TimingRecorder` class, which records nested, named time
+spans (e.g. reading, per file; configuration, per model; validation, per validator
+and per check) as a tree. The tree is written by `--timings` as a JSON file and can
+be shown in the HTML report.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class TimingSpan:
+    """
+    Data model for a measured span of a `TimingRecorder`.
+
+    Attributes:
+        name (str): Name of the measured stage.
+        seconds (Optional[float]): Elapsed wall-clock time, None while the span is open.
+        children (List[TimingSpan]): Spans measured inside this one, in start order.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize a TimingSpan.
+
+        Args:
+            name (str): Name of the measured stage.
+        """
+        self.name = name
+        self.seconds: Optional[float] = None
+        self.children: List["TimingSpan"] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the span and its children to a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The name, the elapsed seconds and the children of the span.
+        """
+        return {
+            "name": self.name,
+            "seconds": round(self.seconds, 6) if self.seconds is not None else None,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class TimingRecorder:
+    """
+    Records the elapsed time of nested stages as a tree of spans.
+
+    Spans opened with `measure()` inside another span become its children. Each
+    thread keeps its own stack of open spans; spans opened by a worker thread with
+    no open span of its own (e.g. a validator running in the `TaskScheduler` pool or
+    a sheet parsed in the loader pool) are attached to the deepest open span of the
+    thread that created the recorder.
+
+    Attributes:
+        spans (List[TimingSpan]): Top level spans, in start order.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty TimingRecorder.
+        """
+        self.spans: List[TimingSpan] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._owner_stack: List[TimingSpan] = []
+        self._owner_id = threading.get_ident()
+
+    def _stack(self) -> List[TimingSpan]:
+        """Return the stack of open spans of the current thread."""
+        if threading.get_ident() == self._owner_id:
+            return self._owner_stack
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[TimingSpan]:
+        """
+        Measure the wall-clock time of the enclosed block as a new span.
+
+        Args:
+            name (str): Name of the measured stage.
+
+        Yields:
+            TimingSpan: The open span, completed when the block exits (even with an exception).
+        """
+        stack = self._stack()
+        span = TimingSpan(name)
+        with self._lock:
+            parent = stack[-1] if stack else (self._owner_stack[-1] if self._owner_stack else None)
+            (parent.children if parent is not None else self.spans).append(span)
+        stack.append(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.seconds = time.perf_counter() - start
+            stack.pop()
+
+    def rows(self) -> List[Tuple[int, str, Optional[float]]]:
+        """
+        List the spans depth first, as in an indented outline.
+
+        Returns:
+            List[Tuple[int, str, Optional[float]]]: Depth, name and elapsed seconds of each span.
+        """
+        rows = []
+        pending = [(0, span) for span in reversed(self.spans)]
+        while pending:
+            depth, span = pending.pop()
+            rows.append((depth, span.name, span.seconds))
+            pending.extend((depth + 1, child) for child in reversed(span.children))
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the recorded spans to a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The tree of spans, under the key ``"timings"``.
+        """
+        with self._lock:
+            return {"timings": [span.to_dict() for span in self.spans]}
+
+    def save(self, path: str) -> None:
+        """
+        Write the recorded spans to a JSON file.
+
+        Args:
+            path (str): Path of the JSON file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
@@ -63,7 +63,7 @@ class DataFrameProcessing:
                     col_display_name = str(column) if not isinstance(column, tuple) else ".".join(map(str, column))
 
                     for row_idx in error_indices:
-                        errors.append(f"{file_name}, linha {row_idx + 2}: A coluna '{col_display_name}' não pode conter o caracter '|'.")
+                        errors.append(("dataframe_error_vertical_bar_in_cell", file_name, row_idx + 2, col_display_name))
 
         except Exception as e:
             errors.append(f"{file_name}: Erro ao processar a checagem de barra vertical: {str(e)}")
@@ -122,11 +122,9 @@ class DataFrameProcessing:
 
             if invalid_rows.any():
                 invalid_indices = invalid_rows[invalid_rows].index
+                key = "dataframe_error_row_exceeds_column" if valid_columns_count == 1 else "dataframe_error_row_exceeds_columns"
                 for idx in invalid_indices:
-                    text_column = "coluna válida" if valid_columns_count == 1 else "colunas válidas"
-                    errors.append(
-                        f"{file_name}, linha {idx + 2}: A linha possui {non_null_counts[idx]} valores, mas a tabela possui apenas {valid_columns_count} {text_column}."
-                    )
+                    errors.append((key, file_name, idx + 2, None, int(non_null_counts[idx]), valid_columns_count))
 
         except Exception as e:
             errors.append(f"{file_name}: Erro ao processar a checagem de colunas sem nome: {str(e)}")
@@ -263,10 +261,7 @@ class DataFrameProcessing:
             text_lengths = text_series[non_null_mask].str.len()
             exceeds_limit = text_lengths > max_length
 
-            for idx in text_lengths[exceeds_limit].index:
-                actual_length = text_lengths[idx]
-                errors.append(
-                    f'{file_name}, linha {idx + 2}: O texto da coluna "{column}" excede o limite de {max_length} caracteres (encontrado: {actual_length}).'
-                )
+            for idx, actual_length in text_lengths[exceeds_limit].items():
+                errors.append(("dataframe_warning_text_too_long", file_name, idx + 2, column, max_length, int(actual_length)))
 
         return not bool(errors), errors
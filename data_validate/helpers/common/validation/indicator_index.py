@@ -0,0 +1,292 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module providing a shared index of the indicators of a submission.
+
+This module defines the `IndicatorIndex` class, which parses the integer columns
+of the description (code, level, scenario and legend) and the parent/child codes
+of the composition once per run, so validators look indicators up in dictionaries
+and lists instead of cleaning and filtering the DataFrames again.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from data_validate.helpers.common.formatting.number_formatting_processing import NumberFormattingProcessing
+
+
+class IndicatorIndex:
+    """
+    Lookups over the indicators of the description and composition spreadsheets.
+
+    Cells are parsed as in `DataCleaningProcessing.clean_dataframe_integers`: a cell
+    holds an integer if it is a number (comma or dot as decimal separator) without
+    a fractional part. The lookups by level and scenario compare the cell text
+    ("1", "2", "0"), and legends are parsed with `pd.to_numeric`, as the validators
+    did on the raw description. The index is read-only once built, so it can be
+    shared by validators running concurrently.
+
+    Attributes:
+        df_description (pd.DataFrame): Raw description data.
+        df_composition (pd.DataFrame): Raw composition data.
+        code_column (str): Name of the indicator code column of the description.
+        level_column (str): Name of the level column of the description.
+        scenario_column (str): Name of the scenario column of the description.
+        legend_column (str): Name of the legend column of the description.
+        parent_column (str): Name of the parent code column of the composition.
+        child_column (str): Name of the child code column of the composition.
+        codes (List[Optional[int]]): Code of each description row, None if not an integer.
+        levels (List[Optional[int]]): Level of each description row, None if not an integer.
+        scenarios (List[Optional[int]]): Scenario of each description row, None if not an integer or absent.
+        level_texts (List[Any]): Raw level cell of each description row (None if the column is absent).
+        scenario_texts (List[Any]): Raw scenario cell of each description row (None if the column is absent).
+        code_to_row (Dict[int, int]): Position of the first description row of each code.
+        codes_by_level (Dict[str, List[int]]): Codes (>= 0) of each level text, one per row, in row order.
+        parent_codes (Set[int]): Codes with at least one child in the composition.
+        leaf_codes (List[int]): Codes of the composition without children, in order of appearance.
+    """
+
+    def __init__(
+        self,
+        df_description: Optional[pd.DataFrame],
+        code_column: str,
+        level_column: str,
+        scenario_column: str,
+        legend_column: str,
+        df_composition: Optional[pd.DataFrame] = None,
+        parent_column: str = "",
+        child_column: str = "",
+    ):
+        """
+        Initialize the IndicatorIndex, parsing the description and composition.
+
+        Args:
+            df_description (Optional[pd.DataFrame]): Raw description data (None if not loaded).
+            code_column (str): Name of the indicator code column of the description.
+            level_column (str): Name of the level column of the description.
+            scenario_column (str): Name of the scenario column of the description.
+            legend_column (str): Name of the legend column of the description.
+            df_composition (Optional[pd.DataFrame]): Raw composition data. Defaults to None.
+            parent_column (str): Name of the parent code column of the composition. Defaults to "".
+            child_column (str): Name of the child code column of the composition. Defaults to "".
+        """
+        self.df_description = df_description if df_description is not None else pd.DataFrame()
+        self.df_composition = df_composition if df_composition is not None else pd.DataFrame()
+        self.code_column = code_column
+        self.level_column = level_column
+        self.scenario_column = scenario_column
+        self.legend_column = legend_column
+        self.parent_column = parent_column
+        self.child_column = child_column
+
+        self._description_values = {
+            column: self.parse_column(self.df_description, column) for column in (code_column, level_column, scenario_column, legend_column)
+        }
+        self.codes = self._description_values[code_column]
+        self.levels = self._description_values[level_column]
+        self.scenarios = self._description_values[scenario_column]
+        self.level_texts = self.text_column(self.df_description, level_column)
+        self.scenario_texts = self.text_column(self.df_description, scenario_column)
+        self._legends: Optional[List[Optional[int]]] = None
+
+        self.code_to_row: Dict[int, int] = {}
+        self.codes_by_level: Dict[str, List[int]] = {}
+        for row, (code, level) in enumerate(zip(self.codes, self.level_texts)):
+            if code is None:
+                continue
+            self.code_to_row.setdefault(code, row)
+            if isinstance(level, str) and code >= 0:
+                self.codes_by_level.setdefault(level, []).append(code)
+
+        self._composition_values = {column: self.parse_column(self.df_composition, column) for column in (parent_column, child_column)}
+        self.composition = self._clean(self.df_composition, self._composition_values, {parent_column: 0, child_column: 1})
+        self.parent_codes: Set[int] = set()
+        nodes: Dict[int, None] = {}
+        if not self.composition.empty and parent_column in self.composition.columns and child_column in self.composition.columns:
+            for parent, child in zip(self.composition[parent_column], self.composition[child_column]):
+                nodes.setdefault(parent)
+                nodes.setdefault(child)
+                self.parent_codes.add(parent)
+        self.leaf_codes: List[int] = [code for code in nodes if code not in self.parent_codes]
+
+        self._valid_rows: Dict[Tuple[Tuple[str, ...], int], List[int]] = {}
+        self._cleaned: Dict[Tuple[Tuple[str, ...], int], pd.DataFrame] = {}
+
+    @staticmethod
+    def parse_integer(cell) -> Optional[int]:
+        """
+        Parse a cell holding an integer.
+
+        Args:
+            cell (Any): Value to parse (string, number, etc.).
+
+        Returns:
+            Optional[int]: The integer, or None if the cell is empty, not a number or has a fractional part.
+        """
+        if NumberFormattingProcessing.is_nan(cell):
+            return None
+        ok, number = NumberFormattingProcessing.parse_numeric(cell)
+        if not ok or not number.is_integer():
+            return None
+        return int(number)
+
+    @staticmethod
+    def parse_column(df: pd.DataFrame, column: str) -> List[Optional[int]]:
+        """
+        Parse every cell of a column.
+
+        Args:
+            df (pd.DataFrame): The DataFrame holding the column.
+            column (str): Name of the column.
+
+        Returns:
+            List[Optional[int]]: The integer of each row, all None if the column is absent.
+        """
+        if column not in df.columns:
+            return [None] * len(df)
+        return [IndicatorIndex.parse_integer(cell) for cell in df[column].tolist()]
+
+    @staticmethod
+    def text_column(df: pd.DataFrame, column: str) -> List[Any]:
+        """
+        Raw cells of a column.
+
+        Args:
+            df (pd.DataFrame): The DataFrame holding the column.
+            column (str): Name of the column.
+
+        Returns:
+            List[Any]: The cell of each row, all None if the column is absent.
+        """
+        if column not in df.columns:
+            return [None] * len(df)
+        return df[column].tolist()
+
+    @property
+    def legends(self) -> List[Optional[int]]:
+        """
+        List[Optional[int]]: Legend of each description row with a valid code (>= 1).
+
+        Legends are parsed with `pd.to_numeric`, so a text such as "1,0" is not a legend code.
+        None for empty or invalid legends, rows without a valid code, or if the column is absent.
+        As in the validators that parsed the column, a fractional legend raises TypeError.
+        """
+        if self._legends is None:
+            legends: List[Optional[int]] = [None] * len(self.df_description)
+            if self.legend_column in self.df_description.columns:
+                rows = self.valid_rows([self.code_column], min_value=1)
+                parsed = pd.to_numeric(self.df_description[self.legend_column].iloc[rows], errors="coerce").astype("Int64")
+                for row, legend in zip(rows, parsed.tolist()):
+                    legends[row] = None if pd.isna(legend) else int(legend)
+            self._legends = legends
+        return self._legends
+
+    @staticmethod
+    def _rows_at_least(values: Dict[str, List[Optional[int]]], minimums: Dict[str, int], n_rows: int) -> List[int]:
+        """Positions of the rows whose columns all hold an integer of at least the column minimum."""
+        rows = range(n_rows)
+        for column, min_value in minimums.items():
+            column_values = values[column]
+            rows = [row for row in rows if column_values[row] is not None and column_values[row] >= min_value]
+        return list(rows)
+
+    @staticmethod
+    def _clean(df: pd.DataFrame, values: Dict[str, List[Optional[int]]], minimums: Dict[str, int]) -> pd.DataFrame:
+        """
+        Keep the rows valid in every column, converting the columns to integers.
+
+        As in `DataCleaningProcessing.clean_dataframe_integers`, a column absent from
+        the DataFrame does not filter any row.
+        """
+        minimums = {column: min_value for column, min_value in minimums.items() if column in df.columns}
+        rows = IndicatorIndex._rows_at_least(values, minimums, len(df))
+        df_clean = df.iloc[rows].copy()
+        for column in minimums:
+            df_clean[column] = pd.Series([values[column][row] for row in rows], index=df_clean.index, dtype="int64")
+        return df_clean
+
+    def valid_rows(self, columns: Sequence[str], min_value: int = 0) -> List[int]:
+        """
+        Positions of the description rows holding integers of at least `min_value` in the given columns.
+
+        A column absent from the description does not filter any row.
+
+        Args:
+            columns (Sequence[str]): Names of the description columns.
+            min_value (int): Minimum allowed value. Defaults to 0.
+
+        Returns:
+            List[int]: Row positions, in row order.
+        """
+        key = (tuple(columns), min_value)
+        if key not in self._valid_rows:
+            minimums = {column: min_value for column in columns if column in self.df_description.columns}
+            self._valid_rows[key] = self._rows_at_least(self._description_values, minimums, len(self.df_description))
+        return self._valid_rows[key]
+
+    def cleaned(self, columns: Sequence[str], min_value: int = 0) -> pd.DataFrame:
+        """
+        The description cleaned as by `DataCleaningProcessing.clean_dataframe_integers`.
+
+        The DataFrame is cached and shared: callers must not modify it.
+
+        Args:
+            columns (Sequence[str]): Names of the description columns to clean.
+            min_value (int): Minimum allowed value. Defaults to 0.
+
+        Returns:
+            pd.DataFrame: The rows valid in every column, with the columns converted to integers.
+        """
+        key = (tuple(columns), min_value)
+        if key not in self._cleaned:
+            self._cleaned[key] = self._clean(self.df_description, self._description_values, {column: min_value for column in columns})
+        return self._cleaned[key]
+
+    def level_of(self, code: int) -> Optional[int]:
+        """Level of the first description row of a code, None if the code or its level is not valid."""
+        row = self.code_to_row.get(code)
+        return self.levels[row] if row is not None else None
+
+    def scenario_of(self, code: int) -> Optional[int]:
+        """Scenario of the first description row of a code, None if the code or its scenario is not valid."""
+        row = self.code_to_row.get(code)
+        return self.scenarios[row] if row is not None else None
+
+    def legend_of(self, code: int) -> Optional[int]:
+        """Legend of the first description row of a code, None if the code or its legend is not valid."""
+        row = self.code_to_row.get(code)
+        return self.legends[row] if row is not None else None
+
+    def codes_of_level(self, level: int, min_code: int = 0) -> List[int]:
+        """
+        Codes of the description rows of a level (the level cell holds exactly the level text).
+
+        Args:
+            level (int): The level.
+            min_code (int): Minimum code. Defaults to 0.
+
+        Returns:
+            List[int]: One code per row, duplicates included, in row order.
+        """
+        return [code for code in self.codes_by_level.get(str(level), []) if code >= min_code]
+
+    def codes_with_values(self, skip_scenario_zero: bool = True) -> Set[int]:
+        """
+        Codes of the indicators expected in the value and proportionality spreadsheets.
+
+        These are the valid codes (>= 1) of every level but level 1. Level 2 indicators
+        without scenario (scenario 0) are left out when `skip_scenario_zero` is True and
+        the description has a scenario column. Levels and scenarios are compared as text.
+
+        Args:
+            skip_scenario_zero (bool): Leaves out level 2 indicators with scenario 0. Defaults to True.
+
+        Returns:
+            Set[int]: The codes.
+        """
+        skip_scenario_zero = skip_scenario_zero and self.scenario_column in self.df_description.columns
+        return {
+            code
+            for code, level, scenario in zip(self.codes, self.level_texts, self.scenario_texts)
+            if code is not None and code >= 1 and level != "1" and not (skip_scenario_zero and level == "2" and scenario == "0")
+        }
@@ -0,0 +1,96 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Module providing a parsed index of the columns of the value spreadsheet.
+
+This module defines the `ValueColumnIndex` class, which classifies the column
+names of the value spreadsheet (``CODE-YEAR`` or ``CODE-YEAR-SCENARIO``) once per
+run, so the model and the validators look the columns up instead of matching
+every name against the patterns again.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Column of an indicator without scenario, e.g. '12-2015'
+BASE_COLUMN_PATTERN = re.compile(r"^(\d{1,})-(\d{4})$")
+
+
+class ValueColumnIndex:
+    """
+    Code, year and scenario of each column of the value spreadsheet.
+
+    Columns are classified as in `CollectionsProcessing.categorize_strings_by_id_pattern_from_list`:
+    a column is valid if it matches ``CODE-YEAR`` or, when scenarios are given,
+    ``CODE-YEAR-SCENARIO`` with one of the scenario symbols.
+
+    Attributes:
+        columns (List[str]): Name of each column, in order (duplicates included).
+        codes (List[Optional[int]]): Indicator code of each column, None if the column is not valid.
+        years (List[Optional[int]]): Year of each column, None if the column is not valid.
+        scenarios (List[Optional[str]]): Scenario symbol of each column, None if absent or not valid.
+        prefixes (List[str]): Text before the first '-' of each column name (the whole name if there is none).
+        valid_columns (List[str]): Valid columns, in order.
+        invalid_columns (List[str]): Columns out of the patterns, in order.
+        columns_by_code (Dict[int, List[str]]): Valid columns of each indicator code, in order.
+        columns_by_prefix (Dict[str, List[str]]): Columns with a '-' grouped by their prefix, in order.
+    """
+
+    def __init__(self, columns: Iterable[Any], scenarios: Optional[Iterable[Any]] = None):
+        """
+        Initialize the ValueColumnIndex, parsing every column name.
+
+        Args:
+            columns (Iterable[Any]): Column names of the value spreadsheet (converted to strings).
+            scenarios (Optional[Iterable[Any]]): Allowed scenario symbols. Defaults to None.
+        """
+        scenarios = [str(scenario) for scenario in scenarios or []]
+        scenario_pattern = re.compile(r"^(\d{1,})-(\d{4})-(" + "|".join(re.escape(scenario) for scenario in scenarios) + ")$") if scenarios else None
+
+        self.columns: List[str] = [str(column) for column in columns]
+        self.codes: List[Optional[int]] = []
+        self.years: List[Optional[int]] = []
+        self.scenarios: List[Optional[str]] = []
+        self.prefixes: List[str] = []
+        self.valid_columns: List[str] = []
+        self.invalid_columns: List[str] = []
+        self.columns_by_code: Dict[int, List[str]] = {}
+        self.columns_by_prefix: Dict[str, List[str]] = {}
+
+        for column in self.columns:
+            prefix = column.split("-", 1)[0]
+            self.prefixes.append(prefix)
+            if prefix != column:
+                self.columns_by_prefix.setdefault(prefix, []).append(column)
+
+            match = BASE_COLUMN_PATTERN.match(column) or (scenario_pattern.match(column) if scenario_pattern is not None else None)
+            if match is None:
+                self.codes.append(None)
+                self.years.append(None)
+                self.scenarios.append(None)
+                self.invalid_columns.append(column)
+                continue
+
+            code = int(match.group(1))
+            self.codes.append(code)
+            self.years.append(int(match.group(2)))
+            self.scenarios.append(match.group(3) if match.re is not BASE_COLUMN_PATTERN else None)
+            self.valid_columns.append(column)
+            self.columns_by_code.setdefault(code, []).append(column)
+
+    @property
+    def valid_codes(self) -> Set[int]:
+        """Set[int]: Indicator codes with at least one valid column."""
+        return set(self.columns_by_code)
+
+    def unmatched_columns(self, columns_to_ignore: Iterable[Any] = ()) -> List[str]:
+        """
+        Columns out of the patterns, except the ignored ones.
+
+        Args:
+            columns_to_ignore (Iterable[Any]): Column names to leave out (e.g. the ID column). Defaults to ().
+
+        Returns:
+            List[str]: The remaining invalid columns, in order.
+        """
+        ignored = {str(column) for column in columns_to_ignore}
+        return [column for column in self.invalid_columns if column not in ignored]
@@ -5,16 +5,81 @@ Module providing text value processing and validation utilities.
 This module defines the `ValueProcessing` class, which offers methods
 for validating numeric values, checking for excessive decimal places,
 and generating warnings for data quality issues in DataFrame columns.
+Columns are validated a block of columns at a time with vectorized passes, and
+can be validated in bounded row chunks, whose partial results are merged through
+`ValueColumnSummary`.
 """
 
-from typing import List, Tuple, Any, Set
+from typing import Dict, List, Tuple, Any, Set, Iterator, Optional, Union
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from data_validate.helpers.common.formatting.issue_record import Record
 from data_validate.helpers.common.formatting.number_formatting_processing import NumberFormattingProcessing
 
 
+class ValueColumnSummary:
+    """
+    Partial validation results for a single value column.
+
+    Summaries computed over separate row chunks can be merged, so a column can be
+    validated chunk by chunk while producing the same messages as a single pass.
+
+    Attributes:
+        column (str): Name of the validated column.
+        invalid_count (int): Number of invalid values found.
+        first_invalid_row (Optional[int]): Spreadsheet row of the first invalid value.
+        last_invalid_row (Optional[int]): Spreadsheet row of the last invalid value.
+        first_error_message (Union[str, Record]): Error message of the first invalid value.
+        excessive_decimal_rows (Set[int]): Spreadsheet rows with more than 2 decimal places.
+    """
+
+    def __init__(self, column: str) -> None:
+        """
+        Initialize an empty summary for a column.
+
+        Args:
+            column: Name of the validated column
+        """
+        self.column = column
+        self.invalid_count = 0
+        self.first_invalid_row: Optional[int] = None
+        self.last_invalid_row: Optional[int] = None
+        self.first_error_message: Union[str, Record] = ""
+        self.excessive_decimal_rows: Set[int] = set()
+
+    def add_invalid(self, row: int, error_msg: Union[str, Record]) -> None:
+        """
+        Record an invalid value.
+
+        Args:
+            row: Spreadsheet row of the invalid value
+            error_msg: Error message describing the invalid value
+        """
+        if self.first_invalid_row is None:
+            self.first_invalid_row = row
+            self.first_error_message = error_msg
+        self.last_invalid_row = row
+        self.invalid_count += 1
+
+    def merge(self, other: "ValueColumnSummary") -> None:
+        """
+        Merge the summary of a later chunk of the same column into this one.
+
+        Args:
+            other: Summary computed over the rows that follow this summary's rows
+        """
+        if other.invalid_count:
+            if self.first_invalid_row is None:
+                self.first_invalid_row = other.first_invalid_row
+                self.first_error_message = other.first_error_message
+            self.last_invalid_row = other.last_invalid_row
+            self.invalid_count += other.invalid_count
+        self.excessive_decimal_rows.update(other.excessive_decimal_rows)
+
+
 class ValueProcessing:
     """
     Utility class for validating numeric values in DataFrames.
@@ -24,12 +89,16 @@ class ValueProcessing:
     for decimal place violations.
     """
 
+    # Plain decimal numbers ('.' or ',' as separator): always valid, with as many decimal places as digits after the separator
+    PLAIN_NUMBER_PATTERN = r"[+-]?(?:[0-9]+(?:[.,][0-9]*)?|[.,][0-9]+)"
+    EXCESSIVE_DECIMALS_PATTERN = r"[.,][0-9]{3}"
+
     def __init__(self) -> None:
         """Initialize the ValueProcessing class."""
         pass
 
     @staticmethod
-    def check_numeric_value(value: Any, row_index: int, column: str, filename: str) -> Tuple[bool, str, bool]:
+    def check_numeric_value(value: Any, row_index: int, column: str, filename: str) -> Tuple[bool, Union[str, Record], bool]:
         """
         Validate a single numeric value.
 
@@ -40,7 +109,8 @@ class ValueProcessing:
             filename: Name of the file for error messages
 
         Returns:
-            Tuple of (is_valid, error_message, has_excessive_decimals)
+            Tuple of (is_valid, error_message, has_excessive_decimals), where the error
+            message is an issue record (see `IssueRecord`, rendered only when displayed) or an empty string
         """
         # Skip DI (Data Unavailable) values
         if value == "DI":
@@ -49,12 +119,7 @@ class ValueProcessing:
         # Check if value is NaN or can't be converted to numeric
         numeric_value = pd.to_numeric(str(value).replace(",", "."), errors="coerce")
         if pd.isna(value) or pd.isna(numeric_value):
-            error_msg = (
-                f"{filename}, linha {row_index + 2}: "
-                f"O valor {value} não é um número válido e nem DI (Dado Indisponível) "
-                f"para a coluna '{column}'."
-            )
-            return False, error_msg, False
+            return False, ("value_error_invalid_number", filename, row_index + 2, column, value), False
 
         if value in [float("-inf"), float("inf")] or pd.isna(value):
             return False, "", False
@@ -64,8 +129,7 @@ class ValueProcessing:
 
             return True, "", NumberFormattingProcessing.check_two_decimals_places(value)
         except (ValueError, TypeError):
-            error_msg = f"{filename}, linha {row_index + 2}: " f"Erro ao processar valor decimal para a coluna '{column}'."
-            return False, error_msg, False
+            return False, ("value_error_decimal_processing", filename, row_index + 2, column), False
 
     @staticmethod
     def generate_decimal_warning(
@@ -102,54 +166,161 @@ class ValueProcessing:
         )
 
     @staticmethod
-    def process_column_validation(df_values: DataFrame, column: str, filename: str) -> Tuple[List[str], Set[int]]:
+    def iter_row_chunks(dataframe: DataFrame, chunk_size: Optional[int] = None) -> Iterator[DataFrame]:
         """
-        Process validation for a single column.
+        Yield the DataFrame in consecutive row chunks.
+
+        Chunks are positional slices that keep the original index, so row numbers in
+        messages are unaffected.
 
         Args:
-            df_values: The DataFrame containing values to validate
-            column: The column name to validate
+            dataframe: The DataFrame to split
+            chunk_size: Maximum number of rows per chunk. None or 0 yields the whole DataFrame
+
+        Yields:
+            DataFrame slices of at most chunk_size rows
+        """
+        if not chunk_size or len(dataframe) <= chunk_size:
+            yield dataframe
+            return
+
+        for start in range(0, len(dataframe), chunk_size):
+            yield dataframe.iloc[start : start + chunk_size]
+
+    @staticmethod
+    def summarize_column(values: pd.Series, column: str, filename: str) -> ValueColumnSummary:
+        """
+        Validate the values of a column (or of a chunk of it) into a summary.
+
+        Args:
+            values: The column values to validate
+            column: The column name
             filename: The filename for error messages
 
         Returns:
-            Tuple of (error_messages, rows_with_excessive_decimals)
+            ValueColumnSummary with the invalid values and excessive decimal rows found
         """
-        dataframe = df_values
-        errors = []
-        excessive_decimal_rows = set()
+        return ValueProcessing.summarize_columns(values.to_frame(name=column), [column], filename)[column]
 
-        invalid_values = []
-        first_invalid_row = None
-        last_invalid_row = None
+    @staticmethod
+    def summarize_columns(df_values: DataFrame, columns: List[str], filename: str) -> Dict[str, ValueColumnSummary]:
+        """
+        Validate the values of several columns (or of a chunk of them) into summaries.
 
-        for index, value in dataframe[column].items():
-            index = int(index)  # Ensure index is an integer
-            is_valid, error_msg, has_excessive_decimals = ValueProcessing.check_numeric_value(value, index, column, filename)
+        Produces the same results as `check_numeric_value` applied to every cell, in a few
+        vectorized passes over the whole block: 'DI' cells are masked, plain decimal numbers
+        are accepted and their decimal places counted with a pattern, and the remaining cells
+        are parsed together. Only cells that parse as numbers without being plain decimals
+        (e.g. '1e3', 'inf', padded with spaces) are checked one by one, and error messages are
+        built only for the first invalid value of each column.
 
-            if not is_valid:
-                invalid_values.append((index + 2, error_msg))
-                if first_invalid_row is None:
-                    first_invalid_row = index + 2
-                last_invalid_row = index + 2
+        Args:
+            df_values: The DataFrame containing the values to validate
+            columns: The column names to validate
+            filename: The filename for error messages
 
-            if has_excessive_decimals:
-                excessive_decimal_rows.add(index + 2)
+        Returns:
+            Dict mapping each column name to its ValueColumnSummary
+        """
+        summaries = {column: ValueColumnSummary(column) for column in columns}
+
+        # Column-major block: the cells of each column are contiguous
+        block = df_values[columns].to_numpy(dtype=object)
+        n_rows = block.shape[0]
+        if block.size == 0:
+            return summaries
+        row_indexes = np.asarray([int(index) for index in df_values.index])
+        cells = pd.Series(block.ravel(order="F"), dtype=object)
+        texts = cells.astype(str)
+
+        is_di = (texts == "DI").to_numpy()
+        is_plain = texts.str.fullmatch(ValueProcessing.PLAIN_NUMBER_PATTERN).to_numpy(dtype=bool) & ~is_di
+        invalid = np.zeros(len(cells), dtype=bool)
+        excessive = is_plain & texts.str.contains(ValueProcessing.EXCESSIVE_DECIMALS_PATTERN, regex=True).to_numpy(dtype=bool)
+
+        others = ~(is_di | is_plain)
+        if others.any():
+            other_positions = np.flatnonzero(others)
+            numeric = pd.to_numeric(texts.iloc[other_positions].str.replace(",", ".", regex=False), errors="coerce")
+            not_numeric = numeric.isna().to_numpy() | cells.iloc[other_positions].isna().to_numpy()
+            invalid[other_positions[not_numeric]] = True
+
+            # Numbers written in other forms keep the exact rules of the single value check
+            for position in other_positions[~not_numeric]:
+                row, column_position = position % n_rows, position // n_rows
+                is_valid, _, has_excessive_decimals = ValueProcessing.check_numeric_value(
+                    cells.iat[position], int(row_indexes[row]), columns[column_position], filename
+                )
+                invalid[position] = not is_valid
+                excessive[position] = has_excessive_decimals
+
+        invalid = invalid.reshape((n_rows, len(columns)), order="F")
+        excessive = excessive.reshape((n_rows, len(columns)), order="F")
+        for column_position in np.flatnonzero(invalid.any(axis=0) | excessive.any(axis=0)):
+            column = columns[column_position]
+            summary = summaries[column]
+            invalid_rows = np.flatnonzero(invalid[:, column_position])
+            if len(invalid_rows):
+                first_row = invalid_rows[0]
+                _, error_msg, _ = ValueProcessing.check_numeric_value(
+                    block[first_row, column_position], int(row_indexes[first_row]), column, filename
+                )
+                summary.add_invalid(int(row_indexes[first_row]) + 2, error_msg)
+                summary.invalid_count = len(invalid_rows)
+                summary.last_invalid_row = int(row_indexes[invalid_rows[-1]]) + 2
+            summary.excessive_decimal_rows.update((row_indexes[excessive[:, column_position]] + 2).tolist())
+
+        return summaries
 
+    @staticmethod
+    def generate_column_errors(summary: ValueColumnSummary, filename: str) -> List[Union[str, Record]]:
+        """
+        Generate error messages for the invalid values of a column summary.
+
+        Args:
+            summary: The merged summary of the column
+            filename: The filename for error messages
+
+        Returns:
+            List with a single error message (an issue record), or an empty list if all values are valid
+        """
         # Generate error messages based on count
-        if len(invalid_values) == 1:
-            errors.append(invalid_values[0][1])
-        elif len(invalid_values) > 1:
-            error_msg = (
-                f"{filename}: {len(invalid_values)} valores que não são "
-                f"número válido nem DI (Dado Indisponível) para a coluna '{column}', "
-                f"entre as linhas {first_invalid_row} e {last_invalid_row}."
-            )
-            errors.append(error_msg)
-
-        return errors, excessive_decimal_rows
+        if summary.invalid_count == 1:
+            return [summary.first_error_message]
+        if summary.invalid_count > 1:
+            return [
+                (
+                    "value_error_invalid_numbers_range",
+                    filename,
+                    None,
+                    summary.column,
+                    summary.invalid_count,
+                    summary.first_invalid_row,
+                    summary.last_invalid_row,
+                )
+            ]
+        return []
 
     @staticmethod
-    def validate_data_values_in_columns(df_values: DataFrame, valid_columns: List[str], filename: str) -> Tuple[List[str], List[str]]:
+    def process_column_validation(df_values: DataFrame, column: str, filename: str) -> Tuple[List[Union[str, Record]], Set[int]]:
+        """
+        Process validation for a single column.
+
+        Args:
+            df_values: The DataFrame containing values to validate
+            column: The column name to validate
+            filename: The filename for error messages
+
+        Returns:
+            Tuple of (error_messages, rows_with_excessive_decimals)
+        """
+        summary = ValueProcessing.summarize_column(df_values[column], column, filename)
+        return ValueProcessing.generate_column_errors(summary, filename), summary.excessive_decimal_rows
+
+    @staticmethod
+    def validate_data_values_in_columns(
+        df_values: DataFrame, valid_columns: List[str], filename: str, chunk_size: Optional[int] = None
+    ) -> Tuple[List[Union[str, Record]], List[str]]:
         """
         Validate data values in specified columns for numeric validity and decimal places.
 
@@ -157,21 +328,26 @@ class ValueProcessing:
             df_values: The DataFrame containing values to validate
             valid_columns: List of column names to validate
             filename: The filename for error/warning messages
+            chunk_size: Maximum number of rows validated at once. None or 0 validates all rows together
 
         Returns:
             Tuple of (errors, warnings) lists
         """
         errors, warnings = [], []
 
-        # Process each valid column
+        # Process all valid columns together, chunk by chunk, merging partial results
+        summaries = {column: ValueColumnSummary(column) for column in valid_columns}
+        for chunk in ValueProcessing.iter_row_chunks(df_values, chunk_size):
+            for column, summary in ValueProcessing.summarize_columns(chunk, valid_columns, filename).items():
+                summaries[column].merge(summary)
+
         all_excessive_decimal_rows = set()
         count_excessive_decimal_rows = 0
 
         for column in valid_columns:
-            column_errors, excessive_decimal_rows = ValueProcessing.process_column_validation(df_values, column, filename)
-            errors.extend(column_errors)
-            count_excessive_decimal_rows += len(excessive_decimal_rows)
-            all_excessive_decimal_rows.update(excessive_decimal_rows)
+            errors.extend(ValueProcessing.generate_column_errors(summaries[column], filename))
+            count_excessive_decimal_rows += len(summaries[column].excessive_decimal_rows)
+            all_excessive_decimal_rows.update(summaries[column].excessive_decimal_rows)
 
         # Generate warning for excessive decimal places
         decimal_warning = ValueProcessing.generate_decimal_warning(all_excessive_decimal_rows, count_excessive_decimal_rows, filename)
@@ -3,12 +3,18 @@ from data_validate.helpers.tools.data_loader.api.facade import (
     DataLoaderFacade,
     DataLoaderModel,
 )
+from data_validate.helpers.tools.data_loader.common.archive import ArchivePath
+from data_validate.helpers.tools.data_loader.engine.cache import SheetCache
+from data_validate.helpers.tools.data_loader.engine.compactor import SheetCompactor
 from data_validate.helpers.tools.locale.language_manager import LanguageManager
 from data_validate.helpers.tools.spellchecker.spellchecker import SpellChecker
 
 __all__ = [
     "DataLoaderFacade",
     "DataLoaderModel",
+    "SheetCache",
+    "SheetCompactor",
+    "ArchivePath",
     "LanguageManager",
     "SpellChecker",
 ]
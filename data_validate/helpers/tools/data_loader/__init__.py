@@ -4,8 +4,11 @@ Pacote principal que expõe a API de alto nível.
 """
 
 from .api.facade import DataLoaderFacade, DataLoaderModel
+from .common.archive import ArchivePath
 from .common.config import Config
 from .common.exceptions import MissingFileError, ReaderNotFoundError
+from .engine.cache import SheetCache
+from .engine.compactor import SheetCompactor
 
 __all__ = [
     "DataLoaderFacade",
@@ -13,4 +16,7 @@ __all__ = [
     "MissingFileError",
     "ReaderNotFoundError",
     "DataLoaderModel",
+    "SheetCache",
+    "SheetCompactor",
+    "ArchivePath",
 ]
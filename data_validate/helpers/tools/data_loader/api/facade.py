@@ -5,11 +5,16 @@
 Facade para importar todos os arquivos esperados de forma simples.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 
+from ..common.archive import ArchivePath
 from ..common.config import Config
+from ..engine.cache import SheetCache
+from ..engine.compactor import SheetCompactor
 from ..engine.factory import ReaderFactory
 from ..engine.scanner import FileScanner
 from ..strategies.header import SingleHeaderStrategy, DoubleHeaderStrategy
@@ -33,10 +38,13 @@ class DataLoaderModel:
     :type filename: str
     :ivar extension: The file extension.
     :type extension: str
-    :ivar path: Full path to the file.
-    :type path: Path
+    :ivar path: Full path to the file, or an ``ArchivePath`` for files read from a .zip archive.
+    :type path: Path | ArchivePath
     :ivar raw_data: Data extracted from the file as a pandas DataFrame.
     :type raw_data: pd.DataFrame
+    :ivar header_only: True when only the header was read, so ``raw_data`` has the
+        file columns and at most the first data row.
+    :type header_only: bool
     """
 
     def __init__(
@@ -45,13 +53,15 @@ class DataLoaderModel:
         path: Path,
         raw_data: pd.DataFrame,
         is_read_successful: bool = True,
+        header_only: bool = False,
     ):
         # SETUP
         self.input_folder = input_folder
         self.path = path
         self.raw_data = raw_data
         self.is_read_successful = is_read_successful
-        self.does_file_exist = self.path.exists() if isinstance(self.path, Path) else False
+        self.header_only = header_only
+        self.does_file_exist = self.path.exists() if isinstance(self.path, (Path, ArchivePath)) else False
 
         # UNPACKING VARIABLES
         self.name = self.path.stem
@@ -74,6 +84,7 @@ class DataLoaderModel:
             + f"  raw_data dtypes: {self.raw_data.dtypes}\n"
             + f"  header_type: {self.header_type}\n"
             + f"  is_read_successful: {self.is_read_successful}\n"
+            + f"  header_only: {self.header_only}\n"
             + f"  does_file_exist: {self.does_file_exist}\n"
         )
 
@@ -81,19 +92,132 @@ class DataLoaderModel:
 class DataLoaderFacade:
     """
     en_US: Loads all files and returns a dict of base_name→object (DataFrame or text).
+
+    When ``jobs`` is greater than one, the spreadsheets are read concurrently in a
+    thread pool. Results and errors are always collected in scan order, so the
+    output is the same as a sequential load.
+
+    When a ``SheetCache`` is given, unchanged files are taken from the cache
+    instead of being parsed again. ``reader_options`` are forwarded to every
+    reader (e.g. ``csv_engine="pyarrow"`` for CSV files).
+
+    When ``header_only`` is set, only the header rows and the first data row of
+    each spreadsheet are read (the row tells empty files apart), except for the
+    sheets listed in ``full_read``, which are always read entirely. The sheets
+    listed in ``header_only_sheets`` are always read header-only. Header-only
+    reads never use the cache.
+
+    ``columns`` maps a sheet name to the only columns that should be parsed
+    (column projection). The remaining header columns are kept as empty
+    placeholders, so column-name checks see the complete header.
+
+    ``input_dir`` may also be a .zip archive: its members are scanned and read
+    in memory, with no extraction to disk.
+
+    When a ``SheetCompactor`` is given, each parsed sheet is compacted after it is
+    read (or taken from the cache), keeping the same values in less memory.
+
+    When ``timings`` is given (an object with a ``measure(name)`` context manager,
+    e.g. a ``TimingRecorder``), the parse of each sheet is timed under the file name.
     """
 
-    def __init__(self, input_dir: str):
-        self.input_dir = Path(input_dir)
+    HEADER_ONLY_NROWS = 1
+
+    def __init__(
+        self,
+        input_dir: str,
+        jobs: int = 1,
+        cache: Optional[SheetCache] = None,
+        reader_options: Optional[Dict[str, Any]] = None,
+        header_only: bool = False,
+        full_read: Iterable[str] = (),
+        header_only_sheets: Iterable[str] = (),
+        columns: Optional[Dict[str, List[str]]] = None,
+        compactor: Optional[SheetCompactor] = None,
+        timings: Optional[Any] = None,
+    ):
+        self.input_dir = ArchivePath(input_dir) if ArchivePath.is_archive(input_dir) else Path(input_dir)
+        self.jobs = jobs
+        self.cache = cache
+        self.reader_options = reader_options or {}
+        self.header_only = header_only
+        self.full_read = set(full_read)
+        self.header_only_sheets = set(header_only_sheets)
+        self.columns = columns or {}
+        self.compactor = compactor
+        self.timings = timings
         self.scanner = FileScanner(self.input_dir)
         self.config = Config()
 
+    def _parse_file(
+        self, path: Path, strat, header_only: bool = False, columns: Optional[List[str]] = None
+    ) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        # Mede o tempo de leitura de cada planilha, quando solicitado
+        if self.timings is None:
+            return self._parse_sheet(path, strat, header_only, columns)
+        with self.timings.measure(path.name):
+            return self._parse_sheet(path, strat, header_only, columns)
+
+    def _parse_sheet(
+        self, path: Path, strat, header_only: bool = False, columns: Optional[List[str]] = None
+    ) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        reader_options = dict(self.reader_options)
+        if columns is not None:
+            reader_options["usecols"] = columns
+        if header_only:
+            reader_options["nrows"] = self.HEADER_ONLY_NROWS
+        reader = ReaderFactory.get_reader(path, strat, **reader_options)
+
+        # Reuse a previously parsed sheet when the file did not change
+        cache_key = None
+        if self.cache is not None and not header_only:
+            options = ",".join(f"{key}={value}" for key, value in sorted(reader_options.items()))
+            cache_key = self.cache.make_key(path, variant=f"{type(reader).__name__}:{type(strat).__name__}:{options}")
+
+        # Configure DataModel
+        df_local = self.cache.get(cache_key) if cache_key is not None else None
+        error = None
+        try:
+            if df_local is None:
+                df_local = reader.read()
+                if cache_key is not None:
+                    self.cache.put(cache_key, df_local)
+            if self.compactor is not None:
+                df_local = self.compactor.compact(df_local)
+        except FileNotFoundError as e:
+            error = f"{path.name}: Arquivo não encontrado no diretório. Detalhes: {e} ({type(e)})"
+        except UnicodeDecodeError as e:
+            error = f"{path.name}: Erro de codificação do arquivo. Verifique se está em UTF-8. Detalhes: {e} ({type(e)})"
+        except pd.errors.ParserError as e:
+            error = f"{path.name}: Erro na estrutura da planilha. Verifique se há células mescladas ou formato inválido. Detalhes: {e} ({type(e)})"
+        except ValueError as e:
+            error = f"{path.name}: Erro nos valores da planilha. Verifique se os tipos de dados estão corretos. Detalhes: {e} ({type(e)})"
+        except IOError as e:
+            error = (
+                f"{path.name}: Erro de entrada/saída ao ler o arquivo. Verifique se ele não está aberto em outro programa. Detalhes: {e} ({type(e)})"
+            )
+        except Exception as e:
+            error = f"{path.name}: Erro inesperado ao processar o arquivo. Detalhes: {e} ({type(e)})"
+
+        return df_local, error
+
+    def _load_file(self, path: Path, strat, header_only: bool = False, columns: Optional[List[str]] = None) -> Tuple[DataLoaderModel, Optional[str]]:
+        df_local, error = self._parse_file(path, strat, header_only, columns)
+        data_model = DataLoaderModel(
+            input_folder=str(self.input_dir),
+            path=path,
+            raw_data=df_local if df_local is not None else pd.DataFrame(),
+            is_read_successful=True if df_local is not None else False,
+            header_only=header_only and df_local is not None,
+        )
+        return data_model, error
+
     @property
     def load_all(self):
         errors = []
         files_map, qml_files, missing_files = self.scanner.scan()
 
-        data = {}
+        tasks = []
         for name, path in files_map.items():
             _, header_type, _ = self.config.file_specs[name]
             if header_type == "single":
@@ -103,36 +227,19 @@ class DataLoaderFacade:
             else:
                 # qml will not pass through here
                 continue
-            reader = ReaderFactory.get_reader(path, strat)
+            header_only = (self.header_only and name not in self.full_read) or name in self.header_only_sheets
+            tasks.append((name, path, strat, header_only, self.columns.get(name)))
 
-            # Configure DataModel
-            df_local = None
-            try:
-                df_local = reader.read()
-            except FileNotFoundError as e:
-                errors.append(f"{path.name}: Arquivo não encontrado no diretório. Detalhes: {e} ({type(e)})")
-            except UnicodeDecodeError as e:
-                errors.append(f"{path.name}: Erro de codificação do arquivo. Verifique se está em UTF-8. Detalhes: {e} ({type(e)})")
-            except pd.errors.ParserError as e:
-                errors.append(
-                    f"{path.name}: Erro na estrutura da planilha. Verifique se há células mescladas ou formato inválido. Detalhes: {e} ({type(e)})"
-                )
-            except ValueError as e:
-                errors.append(f"{path.name}: Erro nos valores da planilha. Verifique se os tipos de dados estão corretos. Detalhes: {e} ({type(e)})")
-            except IOError as e:
-                errors.append(
-                    f"{path.name}: Erro de entrada/saída ao ler o arquivo. Verifique se ele não está aberto em outro programa. Detalhes: {e} ({type(e)})"
-                )
-            except Exception as e:
-                errors.append(f"{path.name}: Erro inesperado ao processar o arquivo. Detalhes: {e} ({type(e)})")
-
-            data_model = DataLoaderModel(
-                input_folder=str(self.input_dir),
-                path=path,
-                raw_data=df_local if df_local is not None else pd.DataFrame(),
-                is_read_successful=True if df_local is not None else False,
-            )
+        if self.jobs > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(tasks))) as executor:
+                results = list(executor.map(lambda task: self._load_file(*task[1:]), tasks))
+        else:
+            results = [self._load_file(*task[1:]) for task in tasks]
 
+        data = {}
+        for (name, *_), (data_model, error) in zip(tasks, results):
+            if error is not None:
+                errors.append(error)
             data[name] = data_model
 
         # Add raw QMLs
@@ -0,0 +1,123 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+# File: data_loader/common/archive.py
+"""
+Substituto leve de pathlib.Path para entradas de um arquivo .zip.
+"""
+
+import io
+import zipfile
+from pathlib import Path, PurePosixPath
+
+
+class ArchivePath:
+    """
+    Points to the archive root or to a member inside a .zip archive.
+
+    Exposes the subset of the ``pathlib.Path`` API used by the data loader
+    (``name``, ``stem``, ``suffix``, ``exists``, ``is_file``, ``is_dir``,
+    ``iterdir``, ``read_text``), so submissions can be scanned and read straight
+    from the archive. Members are never extracted to disk: readers receive
+    in-memory buffers from ``buffer()``.
+    """
+
+    ARCHIVE_SUFFIX = ".zip"
+
+    def __init__(self, archive, member: str = ""):
+        self.archive = Path(archive)
+        self.member = str(member).strip("/")
+
+    @classmethod
+    def is_archive(cls, path) -> bool:
+        path = Path(path)
+        return path.suffix.lower() == cls.ARCHIVE_SUFFIX and path.is_file() and zipfile.is_zipfile(path)
+
+    @property
+    def name(self) -> str:
+        return PurePosixPath(self.member).name if self.member else self.archive.name
+
+    @property
+    def stem(self) -> str:
+        return PurePosixPath(self.member).stem if self.member else self.archive.stem
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self.member).suffix if self.member else self.archive.suffix
+
+    def __truediv__(self, name):
+        return ArchivePath(self.archive, f"{self.member}/{name}" if self.member else name)
+
+    def __eq__(self, other):
+        return isinstance(other, ArchivePath) and (self.archive, self.member) == (other.archive, other.member)
+
+    def __hash__(self):
+        return hash((self.archive, self.member))
+
+    def __str__(self):
+        return f"{self.archive}/{self.member}" if self.member else str(self.archive)
+
+    def __repr__(self):
+        return f"ArchivePath({str(self.archive)!r}, {self.member!r})"
+
+    def resolve(self) -> "ArchivePath":
+        return ArchivePath(self.archive.resolve(), self.member)
+
+    def _names(self):
+        with zipfile.ZipFile(self.archive) as archive:
+            return archive.namelist()
+
+    def _children(self):
+        # Nomes das entradas logo abaixo deste nível, na ordem do arquivo; pastas sem entrada própria também contam
+        prefix = f"{self.member}/" if self.member else ""
+        children = {}
+        for name in self._names():
+            if not name.startswith(prefix) or name == prefix:
+                continue
+            child = name[len(prefix) :].split("/", 1)[0]
+            if child:
+                children.setdefault(child, None)
+        return list(children)
+
+    def info(self) -> zipfile.ZipInfo:
+        with zipfile.ZipFile(self.archive) as archive:
+            return archive.getinfo(self.member)
+
+    def is_file(self) -> bool:
+        try:
+            return bool(self.member) and self.member in self._names()
+        except (OSError, zipfile.BadZipFile):
+            return False
+
+    def is_dir(self) -> bool:
+        try:
+            if not self.member:
+                return self.is_archive(self.archive)
+            prefix = f"{self.member}/"
+            return any(name.startswith(prefix) for name in self._names())
+        except (OSError, zipfile.BadZipFile):
+            return False
+
+    def exists(self) -> bool:
+        return self.is_file() or self.is_dir()
+
+    def iterdir(self):
+        for child in self._children():
+            yield self / child
+
+    def read_bytes(self) -> bytes:
+        with zipfile.ZipFile(self.archive) as archive:
+            try:
+                return archive.read(self.member)
+            except KeyError as e:
+                raise FileNotFoundError(f"{self.member} não encontrado em {self.archive}") from e
+
+    def read_text(self, encoding: str = None) -> str:
+        return self.read_bytes().decode(encoding or "utf-8")
+
+    def open(self, mode: str = "rb"):
+        if mode != "rb":
+            raise ValueError(f"Modo de abertura não suportado para entradas de arquivo .zip: {mode!r}")
+        return self.buffer()
+
+    def buffer(self) -> io.BytesIO:
+        return io.BytesIO(self.read_bytes())
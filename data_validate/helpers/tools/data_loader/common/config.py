@@ -17,7 +17,8 @@ class SingletonMeta(type):
 
 class Config(metaclass=SingletonMeta):
     """
-    Define quais arquivos são esperados, seu tipo de cabeçalho e separador CSV.
+    Define quais arquivos são esperados, seu tipo de cabeçalho, separador CSV e a
+    precedência entre formatos de uma mesma planilha.
     """
 
     def __init__(self):
@@ -32,7 +33,10 @@ class Config(metaclass=SingletonMeta):
             "legenda": (False, "single", "|"),
             "dicionario": (False, "single", "|"),
         }
-        self.extensions = [".csv", ".xlsx", ".qml"]
+        # Extensões e precedência embutidas; as registradas depois ficam no ReaderFactory
+        self.extensions = [".csv", ".xlsx", ".parquet", ".feather", ".qml"]
+        # Quando a mesma planilha existe em mais de um formato, vence o primeiro desta lista (do mais rápido ao mais lento)
+        self.precedence = [".parquet", ".feather", ".csv", ".xlsx"]
 
 
 config = Config()
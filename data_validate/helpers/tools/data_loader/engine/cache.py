@@ -0,0 +1,158 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+# File: data_loader/engine/cache.py
+"""
+Cache persistente de planilhas já lidas, indexado pela impressão digital do arquivo.
+"""
+
+import hashlib
+import os
+import stat
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from ..common.archive import ArchivePath
+
+
+class SheetCache:
+    """
+    Stores parsed DataFrames on disk so unchanged files are not parsed again.
+
+    Each entry is keyed by the file path, size, modification time and content hash,
+    plus a variant string describing how the file was read (reader and header
+    strategy). Entries are stored as pandas pickles, which keep MultiIndex headers
+    and string dtypes exactly as read. The least recently used entries are evicted
+    once the cache grows beyond ``max_size_bytes``.
+
+    Since loading a pickle can run code, entries are only read from (and written to)
+    a folder owned by the current user that neither the group nor other users can
+    write to; any other folder disables the cache.
+    """
+
+    FORMAT_VERSION = 1
+    DEFAULT_MAX_SIZE_BYTES = 512 * 1024 * 1024
+    ENTRY_SUFFIX = ".pkl"
+    HASH_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+
+    @staticmethod
+    def default_dir() -> Path:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return Path(base_dir) / "canoa_data_validate" / "sheets"
+
+    def make_key(self, file_path: Path, variant: str = "") -> Optional[str]:
+        try:
+            if isinstance(file_path, ArchivePath):
+                # Entradas de um .zip: tamanho e data gravados no próprio arquivo compactado
+                info = file_path.info()
+                location, size, mtime = str(file_path.resolve()), info.file_size, info.date_time
+            else:
+                stat = file_path.stat()
+                location, size, mtime = str(Path(file_path).resolve()), stat.st_size, stat.st_mtime_ns
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return None
+        content_hash = self.content_hash(file_path)
+        if content_hash is None:
+            return None
+
+        fingerprint = "|".join(
+            [
+                str(self.FORMAT_VERSION),
+                location,
+                str(size),
+                str(mtime),
+                content_hash,
+                variant,
+            ]
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def content_hash(cls, file_path: Path) -> Optional[str]:
+        # Hash SHA-256 do conteúdo; None se o arquivo não puder ser lido
+        content_hash = hashlib.sha256()
+        try:
+            with file_path.open("rb") as file:
+                for block in iter(lambda: file.read(cls.HASH_BLOCK_SIZE), b""):
+                    content_hash.update(block)
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return None
+        return content_hash.hexdigest()
+
+    def is_private(self) -> bool:
+        # Pasta do próprio usuário, sem permissão de escrita para o grupo ou outros usuários
+        if not hasattr(os, "getuid"):
+            return True
+        try:
+            dir_stat = self.cache_dir.stat()
+        except OSError:
+            return False
+        return dir_stat.st_uid == os.getuid() and not dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        entry = self._entry_path(key)
+        if not entry.exists() or not self.is_private():
+            return None
+        try:
+            df = pd.read_pickle(entry)
+            # Marca o acesso para a política LRU
+            os.utime(entry)
+        except Exception:
+            self._remove(entry)
+            return None
+        return df if isinstance(df, pd.DataFrame) else None
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self.is_private():
+                return
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            df.to_pickle(tmp_path)
+            # Escrita atômica: leitores concorrentes nunca veem uma entrada parcial
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception:
+            if tmp_path is not None:
+                self._remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total_size <= self.max_size_bytes:
+                break
+            self._remove(entry)
+            total_size -= size
+
+    def clear(self) -> None:
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            self._remove(entry)
+
+    @staticmethod
+    def _remove(entry: Path) -> None:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,64 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+# File: data_loader/engine/compactor.py
+"""
+Compacta as colunas de texto das planilhas lidas, sem alterar os valores.
+"""
+
+import importlib.util
+from typing import Optional
+
+import pandas as pd
+
+
+class SheetCompactor:
+    """
+    Reduces the memory used by sheets read as text (``dtype=str``).
+
+    Columns holding one Python object per cell (``object`` or ``str`` with python
+    storage) are moved to Arrow-backed strings when pyarrow is installed. Without
+    pyarrow, repeated values (codes, levels, scenarios, "DI") are interned, so each
+    distinct text is stored once. Values, missing markers and dtypes semantics are
+    kept: validators and error messages still see the original strings.
+    """
+
+    def __init__(self, use_arrow: Optional[bool] = None):
+        self.use_arrow = importlib.util.find_spec("pyarrow") is not None if use_arrow is None else use_arrow
+
+    def compact(self, df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            return df
+
+        compacted = {}
+        for position in range(df.shape[1]):
+            series = df.iloc[:, position]
+            if self._is_python_text(series):
+                compacted[position] = self._compact_series(series)
+        if not compacted:
+            return df
+
+        # Posições em vez de nomes: cabeçalhos podem repetir nomes de colunas
+        df = df.copy(deep=False)
+        for position, series in compacted.items():
+            df.isetitem(position, series)
+        return df
+
+    @staticmethod
+    def _is_python_text(series: pd.Series) -> bool:
+        dtype = series.dtype
+        if isinstance(dtype, pd.StringDtype):
+            return dtype.storage == "python"
+        return pd.api.types.is_object_dtype(dtype) and pd.api.types.infer_dtype(series, skipna=True) == "string"
+
+    def _compact_series(self, series: pd.Series) -> pd.Series:
+        dtype = series.dtype
+        if self.use_arrow and isinstance(dtype, pd.StringDtype):
+            return series.astype(pd.StringDtype("pyarrow", na_value=dtype.na_value))
+
+        # Sem pyarrow (ou coluna object): cada texto distinto passa a ser um único objeto
+        pool = {}
+        values = series.to_numpy(dtype=object, copy=True)
+        for index, value in enumerate(values):
+            if isinstance(value, str):
+                values[index] = pool.setdefault(value, value)
+        return pd.Series(values, index=series.index, name=series.name, dtype=dtype)
@@ -5,9 +5,14 @@
 Factory Method para instanciar leitores adequados.
 """
 
+import threading
 from pathlib import Path
+from typing import List, Optional, Type
 
+from ..common.config import Config
 from ..common.exceptions import ReaderNotFoundError
+from ..readers.base_reader import BaseReader
+from ..readers.columnar_reader import FeatherReader, ParquetReader
 from ..readers.csv_reader import CSVReader
 from ..readers.excel_reader import ExcelReader
 from ..readers.qml_reader import QMLReader
@@ -15,16 +20,76 @@ from ..strategies.header import HeaderStrategy
 
 
 class ReaderFactory:
+    """
+    Registro dos leitores por extensão e da precedência entre formatos de uma mesma planilha.
+
+    O registro é protegido por um lock e consultado pelo FileScanner e pela validação da
+    estrutura de arquivos. Ele vale apenas para o processo atual: os processos de trabalho
+    (``--workers`` do modo em lote e o serviço de validação) só conhecem os leitores
+    registrados na importação de um módulo que também importam.
+    """
+
+    _lock = threading.Lock()
     _registry = {
         ".csv": CSVReader,
         ".xlsx": ExcelReader,
+        ".parquet": ParquetReader,
+        ".feather": FeatherReader,
         ".qml": QMLReader,
     }
+    # Quando a mesma planilha existe em mais de um formato, vence o primeiro desta lista
+    _precedence = list(Config().precedence)
+
+    @classmethod
+    def register(cls, extension: str, reader_cls: Type[BaseReader], precedence: Optional[int] = None):
+        """
+        Registra (ou substitui) o leitor de uma extensão.
+
+        A extensão passa a ser aceita pelo FileScanner. Com ``precedence``, ela é inserida
+        nessa posição da lista de precedência entre formatos de uma mesma planilha; sem ele,
+        a extensão perde para os formatos já listados. Para valer também nos processos de
+        trabalho, o registro deve ser feito na importação de um módulo que eles importam.
+        """
+        ext = extension.lower() if extension.startswith(".") else f".{extension.lower()}"
+        if not (isinstance(reader_cls, type) and issubclass(reader_cls, BaseReader)):
+            raise TypeError(f"O leitor de '{ext}' deve herdar de BaseReader")
+        with cls._lock:
+            cls._registry[ext] = reader_cls
+            if precedence is not None:
+                if ext in cls._precedence:
+                    cls._precedence.remove(ext)
+                cls._precedence.insert(precedence, ext)
+        return reader_cls
+
+    @classmethod
+    def unregister(cls, extension: str):
+        ext = extension.lower() if extension.startswith(".") else f".{extension.lower()}"
+        with cls._lock:
+            cls._registry.pop(ext, None)
+            if ext in cls._precedence:
+                cls._precedence.remove(ext)
+
+    @classmethod
+    def extensions(cls) -> List[str]:
+        with cls._lock:
+            return list(cls._registry)
+
+    @classmethod
+    def precedence(cls) -> List[str]:
+        with cls._lock:
+            return list(cls._precedence)
+
+    @classmethod
+    def is_available(cls, extension: str) -> bool:
+        with cls._lock:
+            reader_cls = cls._registry.get(extension.lower())
+        return reader_cls is not None and reader_cls.is_available()
 
     @classmethod
-    def get_reader(cls, file_path: Path, header_strategy: HeaderStrategy):
+    def get_reader(cls, file_path: Path, header_strategy: HeaderStrategy, **options):
         ext = file_path.suffix.lower()
-        reader_cls = cls._registry.get(ext)
+        with cls._lock:
+            reader_cls = cls._registry.get(ext)
         if not reader_cls:
             raise ReaderNotFoundError(f"Nenhum leitor para extensão '{ext}'")
-        return reader_cls(file_path, header_strategy)
+        return reader_cls(file_path, header_strategy, **options)
@@ -2,35 +2,44 @@
 
 # File: data_loader/scanner.py
 """
-Escaneia diretório de entrada e valida existência de arquivos.
+Escaneia diretório (ou arquivo .zip) de entrada e valida existência de arquivos.
 """
 
 from pathlib import Path
 
 from ..common.config import Config
+from .factory import ReaderFactory
 
 
 class FileScanner:
-    def __init__(self, directory: Path):
+    def __init__(self, directory: Path, precedence=None):
         self.dir = directory
         self.config = Config()
+        # Ordem de preferência entre formatos da mesma planilha (padrão: a do ReaderFactory)
+        self.precedence = list(precedence) if precedence is not None else ReaderFactory.precedence()
+
+    def _rank(self, ext):
+        # Formatos cujo leitor não pode ser usado (ex.: sem pyarrow) perdem para os demais
+        position = self.precedence.index(ext) if ext in self.precedence else len(self.precedence)
+        return not ReaderFactory.is_available(ext), position
+
+    def select_extension(self, extensions):
+        # Extensão que será lida quando a mesma planilha existe em vários formatos
+        return min(extensions, key=self._rank)
 
     def scan(self):
         found = {}
         qmls = []
+        # Extensões com leitor registrado no ReaderFactory
+        extensions = ReaderFactory.extensions()
         for f in self.dir.iterdir():
             base, ext = f.stem, f.suffix.lower()
-            if base in self.config.file_specs and ext in self.config.extensions:
+            if base in self.config.file_specs and ext in extensions:
                 if ext == ".qml":
                     qmls.append(f)
-                else:
-                    # prefere .csv sobre .xlsx
-                    if base in found and found[base].suffix == ".csv":
-                        continue
-                    if base in found and ext == ".csv":
-                        found[base] = f
-                    elif base not in found:
-                        found[base] = f
+                elif base not in found or self._rank(ext) < self._rank(found[base].suffix.lower()):
+                    # prefere o formato mais rápido de ler (ex.: .parquet sobre .csv, .csv sobre .xlsx)
+                    found[base] = f
         missing = [name for name, (req, _, _) in self.config.file_specs.items() if req and name not in found]
 
         return found, qmls, missing
@@ -6,8 +6,9 @@ Pacote de leitores de arquivos.
 """
 
 from .base_reader import BaseReader
+from .columnar_reader import ColumnarReader, FeatherReader, ParquetReader
 from .csv_reader import CSVReader
 from .excel_reader import ExcelReader
 from .qml_reader import QMLReader
 
-__all__ = ["BaseReader", "CSVReader", "ExcelReader", "QMLReader"]
+__all__ = ["BaseReader", "ColumnarReader", "CSVReader", "ExcelReader", "FeatherReader", "ParquetReader", "QMLReader"]
@@ -7,15 +7,87 @@ Template Method: define passo de leitura comum.
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+import pandas as pd
+
+from ..common.archive import ArchivePath
+
+
+class ColumnProjection:
+    """
+    Callable usecols que lê somente as colunas informadas.
+
+    Registra o cabeçalho completo durante a leitura, para que as colunas descartadas
+    voltem ao DataFrame como colunas vazias, na posição original. Colunas sem nome
+    ("Unnamed: ...") nunca são descartadas, pois fazem parte das checagens de estrutura.
+    """
+
+    def __init__(self, columns):
+        self.columns = set(columns)
+        # nome da coluna -> lida (True) ou descartada (False), na ordem do cabeçalho
+        self.header = {}
+
+    def __call__(self, name):
+        keep = name in self.columns or str(name).startswith("Unnamed")
+        self.header.setdefault(name, keep)
+        return keep
+
+    def restore(self, df):
+        pruned = [name for name, keep in self.header.items() if not keep]
+        if not pruned:
+            return df
+        for name in pruned:
+            df[name] = pd.Series(index=df.index, dtype=str)
+        order = list(self.header) + [column for column in df.columns if column not in self.header]
+        return df[order]
+
 
 class BaseReader(ABC):
-    def __init__(self, file_path, header_strategy):
+    def __init__(self, file_path, header_strategy, **options):
         self.file_path = file_path
         self.header_strategy = header_strategy
+        # Opções específicas de cada leitor (ex.: csv_engine, nrows, usecols); leitores ignoram as que não usam
+        self.options = options
+
+    @classmethod
+    def is_available(cls):
+        # Leitores que dependem de pacotes opcionais retornam False quando o pacote não está instalado
+        return True
 
     def read(self):
         return self._read_file()
 
+    def _source(self):
+        # Membros de um .zip chegam aos leitores como buffers em memória, sem extração em disco
+        return self.file_path.buffer() if isinstance(self.file_path, ArchivePath) else self.file_path
+
+    def _column_projection(self):
+        columns = self.options.get("usecols")
+        return ColumnProjection(columns) if columns is not None else None
+
+    @staticmethod
+    def _forward_fill_labels(labels):
+        # Rótulos vazios ou "Unnamed: ..." herdam o último rótulo válido à esquerda
+        filled = []
+        previous = np.nan
+        for label in labels:
+            if pd.isna(label) or label == "" or (isinstance(label, str) and "Unnamed:" in label):
+                label = previous
+            filled.append(label)
+            previous = label
+        return filled
+
+    @classmethod
+    def _double_header_columns(cls, columns):
+        # Preenche o primeiro nível do cabeçalho duplo com o último rótulo à esquerda (células mescladas)
+        lvl0 = columns.get_level_values(0)
+        lvl1 = columns.get_level_values(1)
+        filled0 = cls._forward_fill_labels(lvl0)
+        # garante rótulo no primeiro
+        if pd.isna(filled0[0]):
+            filled0[0] = lvl0[0] or "Unnamed: 0_level_0"
+        return pd.MultiIndex.from_tuples(list(zip(filled0, lvl1)))
+
     @abstractmethod
     def _read_file(self):
         pass
@@ -0,0 +1,112 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+# File: data_loader/readers/columnar_reader.py
+"""
+Lê arquivos colunares (Parquet e Feather) com pyarrow, mantendo todas as colunas como texto.
+"""
+
+import importlib.util
+from abc import abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from .base_reader import BaseReader
+
+
+class ColumnarReader(BaseReader):
+    """
+    Base dos leitores colunares.
+
+    Os valores são convertidos para texto pelo Arrow, como nas leituras de CSV e XLSX
+    (``dtype=str``). Com cabeçalho duplo, os nomes das colunas formam o primeiro nível
+    e a primeira linha do arquivo forma o segundo, como na planilha de origem; arquivos
+    gravados pelo pandas com colunas MultiIndex mantêm o cabeçalho gravado.
+    """
+
+    @classmethod
+    def is_available(cls):
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def _read_file(self):
+        import pyarrow as pa
+
+        double_header = isinstance(self.header_strategy.get_header(self.file_path), list)
+        schema = self._read_schema(self._source())
+        pandas_metadata = schema.pandas_metadata or {}
+        stored_multiindex = len(pandas_metadata.get("column_indexes", [])) > 1
+
+        # A projeção vale só para cabeçalho simples, em que os nomes do arquivo são os nomes das colunas
+        projection = self._column_projection() if not double_header else None
+        columns = None
+        if projection is not None:
+            columns = [name for name in schema.names if projection(name)]
+
+        nrows = self.options.get("nrows")
+        if nrows is not None and double_header and not stored_multiindex:
+            # A primeira linha do arquivo é o segundo nível do cabeçalho
+            nrows += 1
+
+        table = self._read_table(self._source(), columns, nrows)
+        table = pa.table(
+            [column.cast(pa.string()) for column in table.columns],
+            schema=pa.schema([pa.field(name, pa.string()) for name in table.column_names], metadata=table.schema.metadata),
+        )
+        df = table.to_pandas(types_mapper={pa.string(): pd.StringDtype(na_value=np.nan)}.get).reset_index(drop=True)
+
+        if projection is not None:
+            df = projection.restore(df)
+        if double_header:
+            if not stored_multiindex:
+                df = self._split_header_row(df)
+            df.columns = self._double_header_columns(df.columns)
+        return df
+
+    @staticmethod
+    def _split_header_row(df):
+        level1 = df.iloc[0].tolist() if len(df) else [np.nan] * len(df.columns)
+        level1 = [label if pd.notna(label) else f"Unnamed: {index}_level_1" for index, label in enumerate(level1)]
+        body = df.iloc[1:].reset_index(drop=True)
+        body.columns = pd.MultiIndex.from_arrays([list(df.columns), level1])
+        return body
+
+    @abstractmethod
+    def _read_schema(self, source):
+        pass
+
+    @abstractmethod
+    def _read_table(self, source, columns, nrows):
+        pass
+
+
+class ParquetReader(ColumnarReader):
+    def _read_schema(self, source):
+        import pyarrow.parquet as pq
+
+        return pq.read_schema(source)
+
+    def _read_table(self, source, columns, nrows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(source)
+        if nrows is None:
+            return parquet_file.read(columns=columns)
+        # Leitura parcial: somente os primeiros grupos de linhas necessários são descompactados
+        batch = next(parquet_file.iter_batches(batch_size=max(nrows, 1), columns=columns), None)
+        if batch is None:
+            return parquet_file.schema_arrow.empty_table().select(columns if columns is not None else parquet_file.schema_arrow.names)
+        return pa.Table.from_batches([batch]).slice(0, nrows).replace_schema_metadata(parquet_file.schema_arrow.metadata)
+
+
+class FeatherReader(ColumnarReader):
+    def _read_schema(self, source):
+        import pyarrow as pa
+
+        return pa.ipc.open_file(source).schema
+
+    def _read_table(self, source, columns, nrows):
+        from pyarrow import feather
+
+        table = feather.read_table(source, columns=columns, memory_map=False)
+        return table.slice(0, nrows) if nrows is not None else table
@@ -14,23 +14,88 @@ from ..strategies.header import DoubleHeaderStrategy
 
 
 class CSVReader(BaseReader):
+    ENGINES = ("c", "pyarrow")
+    # Textos lidos como ausentes pelo motor C (valores padrão de na_values em pandas.read_csv)
+    NA_VALUES = (
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    )
+
     def _read_file(self):
         header = self.header_strategy.get_header(self.file_path)
         base = self.file_path.stem
         _, _, sep = Config().file_specs.get(base, (None, None, None))
 
         sep = sep or ","
-        df = pd.read_csv(self.file_path, header=header, sep=sep, low_memory=False, dtype=str)
+        projection = self._column_projection()
+        read_options = {"usecols": projection} if projection is not None else {}
+
+        df = None
+        if self.options.get("nrows") is not None:
+            # Leitura parcial: somente o cabeçalho e as primeiras linhas do corpo são lidos
+            df = pd.read_csv(self._source(), header=header, sep=sep, nrows=self.options["nrows"], dtype=str, **read_options)
+        elif self.options.get("csv_engine", "c") == "pyarrow":
+            df = self._read_with_pyarrow(header, sep, projection)
+        if df is None:
+            df = pd.read_csv(self._source(), header=header, sep=sep, low_memory=False, dtype=str, **read_options)
+        if projection is not None:
+            df = projection.restore(df)
         if isinstance(self.header_strategy, DoubleHeaderStrategy):
-            lvl0 = df.columns.get_level_values(0)
-            lvl1 = df.columns.get_level_values(1)
-            s0 = pd.Series(lvl0)
-            s0 = s0.replace(to_replace=r"Unnamed:.*", value=np.nan, regex=True)
-            s0 = s0.replace("", np.nan)
-            s0 = s0.ffill()
-            filled0 = s0.tolist()
-            # garante rótulo no primeiro
-            if pd.isna(filled0[0]):
-                filled0[0] = lvl0[0] or "Unnamed: 0_level_0"
-            df.columns = pd.MultiIndex.from_tuples(list(zip(filled0, lvl1)))
+            df.columns = self._double_header_columns(df.columns)
+        return df
+
+    def _read_with_pyarrow(self, header, sep, projection=None):
+        """
+        Lê o corpo com o leitor multithread do Arrow, mantendo todas as colunas como texto.
+
+        O cabeçalho é lido pelo pandas para manter os mesmos nomes de colunas do motor C.
+        Com uma projeção de colunas, somente as colunas selecionadas são convertidas.
+        Retorna None quando o Arrow não consegue ler o arquivo, para que o motor C
+        produza o resultado (ou o erro) original.
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        columns = pd.read_csv(self._source(), header=header, sep=sep, nrows=0, dtype=str).columns
+        header_rows = len(header) if isinstance(header, list) else 1
+        column_names = [f"f{index}" for index in range(len(columns))]
+        include_columns = column_names
+        if projection is not None:
+            keep = [projection(column) for column in columns]
+            include_columns = [name for name, kept in zip(column_names, keep) if kept]
+            columns = columns[keep]
+        try:
+            table = pa_csv.read_csv(
+                self._source(),
+                read_options=pa_csv.ReadOptions(column_names=column_names, skip_rows=header_rows),
+                parse_options=pa_csv.ParseOptions(delimiter=sep),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=include_columns,
+                    column_types=dict.fromkeys(column_names, pa.string()),
+                    null_values=list(self.NA_VALUES),
+                    strings_can_be_null=True,
+                ),
+            )
+        except pa.ArrowInvalid:
+            return None
+
+        df = table.to_pandas(types_mapper={pa.string(): pd.StringDtype(na_value=np.nan)}.get)
+        df.columns = columns
         return df
@@ -13,4 +13,14 @@ from .base_reader import BaseReader
 class ExcelReader(BaseReader):
     def _read_file(self):
         header = self.header_strategy.get_header(self.file_path)
-        return pd.read_excel(self.file_path, header=header, dtype=str, engine="calamine")
+        projection = self._column_projection()
+
+        read_options = {}
+        if self.options.get("nrows") is not None:
+            # Leitura parcial: somente o cabeçalho e as primeiras linhas do corpo são convertidos
+            read_options["nrows"] = self.options["nrows"]
+        if projection is not None:
+            read_options["usecols"] = projection
+
+        df = pd.read_excel(self._source(), header=header, dtype=str, engine="calamine", **read_options)
+        return projection.restore(df) if projection is not None else df
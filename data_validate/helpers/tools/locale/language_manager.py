@@ -24,6 +24,7 @@ class LanguageManager:
         self.default_language = LanguageEnum.DEFAULT_LANGUAGE.value
         self.current_language = None
         self.translations = {}
+        self._default_translations = None
 
         # Pipiline to configure the language
         self._congifure_language()
@@ -65,6 +66,17 @@ class LanguageManager:
             print(f"ERROR: Unexpected error loading language '{lang_code}': {e}")
         return False
 
+    def _get_default_translations(self):
+        """Loads (once) the translations of the default language, used for keys missing in the current one."""
+        if self._default_translations is None:
+            filepath = os.path.join(self.path_locale_dir, self.default_language, "messages.json")
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    self._default_translations = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._default_translations = {}
+        return self._default_translations
+
     def set_language(self, lang_code):
         """
         Sets the current language and loads the corresponding translations.
@@ -98,26 +110,31 @@ class LanguageManager:
                     self.current_language = self.default_language
             return False
 
-    def text(self, key, **kwargs):
+    def text(self, key, *args, **kwargs):
         """
         Retrieves the translated string for the given key in the current language.
 
+        Keys missing in the current language fall back to the default language.
+
         Args:
             key (str): The key of the string to translate.
+            *args: Positional arguments for string formatting ({0}, {1}, ...).
             **kwargs: Keyword arguments for string formatting.
 
         Returns:
             str: The translated and formatted string, or a fallback string.
         """
         translation_object = self.translations.get(key)
+        if translation_object is None and self.current_language != self.default_language:
+            translation_object = self._get_default_translations().get(key)
         if isinstance(translation_object, dict):
             text = translation_object.get("message", f"<Message for '{key}' missing in '{self.current_language}'>")
         else:
             text = f"<'{key}' missing or invalid structure in '{self.current_language}'>"
 
         try:
-            return text.format(**kwargs) if kwargs else text
-        except KeyError as e:
+            return text.format(*args, **kwargs) if args or kwargs else text
+        except (KeyError, IndexError) as e:
             print(f"Warning: Formatting error for key '{key}'. Missing placeholder: {e}")
             return text
         except Exception as format_exc:
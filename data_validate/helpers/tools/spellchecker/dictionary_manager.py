@@ -59,6 +59,9 @@ class DictionaryManager:
         """Initialize Enchant dictionary and load custom words.
 
         Loads extra words from extra-words.dic file and adds user-provided words.
+        Words are added to the session of this dictionary instance only, so they
+        are never written to the Enchant configuration folder nor seen by other
+        validations running in the same process.
 
         Args:
             list_words_user: List of custom words to add to dictionary
@@ -78,7 +81,7 @@ class DictionaryManager:
             # Add user words
             for word in list_words_user:
                 if word and not word.startswith("#"):
-                    self.dictionary.add(word)
+                    self.dictionary.add_to_session(word)
 
             return self.dictionary
         except Exception as e:
@@ -98,7 +101,7 @@ class DictionaryManager:
                     for line in file:
                         word = line.strip()
                         if word and not word.startswith("#"):  # Ignore empty lines and comments
-                            self.dictionary.add(word)
+                            self.dictionary.add_to_session(word)
             else:
                 self._errors.append("Arquivo extra-words.dic não encontrado. Reporte o erro ao administrador do sistema.")
 
@@ -1,7 +1,7 @@
 #  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
 
 import data_validate
-from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor, WatchProcessor
 from data_validate.helpers.base import DataArgs
 from data_validate.middleware import Bootstrap
 
@@ -18,7 +18,14 @@ def main():
     general_context = GeneralContext(data_args=data_args)
 
     # Bussiness Logic
-    SpreadsheetProcessor(context=general_context)
+    if data_args.data_action.watch:
+        # Validates again after every change until interrupted
+        try:
+            WatchProcessor(context=general_context).run()
+        except KeyboardInterrupt:
+            print("\nMonitoramento encerrado.")
+    else:
+        SpreadsheetProcessor(context=general_context)
 
     # Finalize the General Context
     general_context.finalize()
@@ -29,3 +36,4 @@ if __name__ == "__main__":
 
 # Example usage:
 # python3 data_validate/main.py --o data/output/temp/ --i data/input/data_ground_truth_01/
+# python3 data_validate/main.py --output_folder data/output/temp/ --input_folder data/input/data_ground_truth_01/ --watch
@@ -87,6 +87,16 @@ class SpComposition(SpModelABC):
 
         self.run()
 
+    @classmethod
+    def get_read_columns(cls) -> List[str]:
+        """
+        Get the columns of the spreadsheet used by this model.
+
+        Returns:
+            List[str]: Names of the used columns.
+        """
+        return list(cls.RequiredColumn.ALL)
+
     def pre_processing(self):
         """Run pre-processing steps (currently empty)."""
         pass
@@ -133,6 +143,7 @@ class SpComposition(SpModelABC):
                 self.filename,
                 [str(column_name)],
                 min_value=1,
+                max_messages=self.context.message_budget,
             )
             self.data_cleaning_errors.extend(errors)
 
@@ -150,8 +161,10 @@ class SpComposition(SpModelABC):
         Execute the full validation pipeline for this model.
 
         Runs pre-processing, structure validation, and data cleaning if the file exists.
+        Data cleaning is skipped when only the header rows were read.
         """
         if self.data_loader_model.does_file_exist:
             self.pre_processing()
             self.expected_structure_columns()
-            self.data_cleaning()
+            if not self.is_header_only:
+                self.data_cleaning()
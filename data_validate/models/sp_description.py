@@ -160,6 +160,18 @@ class SpDescription(SpModelABC):
         super().__init__(context, data_model, **kwargs)
         self.run()
 
+    @classmethod
+    def get_read_columns(cls) -> List[str]:
+        """
+        Get the columns of the spreadsheet used by this model.
+
+        Includes the required, dynamic, optional and plural columns.
+
+        Returns:
+            List[str]: Names of the used columns.
+        """
+        return list(cls.RequiredColumn.ALL) + list(cls.DynamicColumn.ALL) + list(cls.OptionalColumn.ALL) + list(cls.PluralColumn.ALL)
+
     def pre_processing(self):
         """
         Run pre-processing steps including dynamic column handling and filling optional columns.
@@ -242,6 +254,7 @@ class SpDescription(SpModelABC):
                 self.filename,
                 [str(column_name)],
                 min_value=1,
+                max_messages=self.context.message_budget,
             )
             self.data_cleaning_errors.extend(errors_data_clean_local)
 
@@ -258,6 +271,7 @@ class SpDescription(SpModelABC):
                 self.filename,
                 [str(column_name_scenario)],
                 min_value=-1,
+                max_messages=self.context.message_budget,
             )
             if column_name_scenario in dataframe_cleaned.columns:
                 self.DynamicColumn.COLUMN_SCENARIO = dataframe_cleaned[column_name_scenario]
@@ -272,6 +286,7 @@ class SpDescription(SpModelABC):
                 [str(column_name_legend)],
                 min_value=1,
                 allow_empty=True,
+                max_messages=self.context.message_budget,
             )
             if column_name_legend in dataframe_cleaned.columns:
                 self.DynamicColumn.COLUMN_LEGEND = dataframe_cleaned[column_name_legend]
@@ -286,9 +301,11 @@ class SpDescription(SpModelABC):
         Execute the full validation pipeline for this model.
 
         Runs pre-processing, structure validation, and data cleaning if the file exists.
+        Data cleaning is skipped when only the header rows were read.
         """
         # If dataframe is empty, it doesn't make sense to continue
         if self.data_loader_model.does_file_exist:
             self.pre_processing()
             self.expected_structure_columns()
-            self.data_cleaning()
+            if not self.is_header_only:
+                self.data_cleaning()
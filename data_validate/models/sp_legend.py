@@ -110,6 +110,16 @@ class SpLegend(SpModelABC):
 
         self.run()
 
+    @classmethod
+    def get_read_columns(cls) -> List[str]:
+        """
+        Get the columns of the spreadsheet used by this model.
+
+        Returns:
+            List[str]: Names of the used columns.
+        """
+        return list(cls.RequiredColumn.ALL)
+
     def pre_processing(self):
         """Run pre-processing steps (currently empty)."""
         pass
@@ -197,10 +207,11 @@ class SpLegend(SpModelABC):
         Execute the full validation pipeline for this model.
 
         Runs pre-processing, structure validation, and data cleaning if the file exists.
+        Data cleaning is skipped when only the header rows were read.
         """
 
         if self.data_loader_model.does_file_exist:
             self.pre_processing()
             self.expected_structure_columns()
-        if self.is_sanity_check_passed:
+        if self.is_sanity_check_passed and not self.is_header_only:
             self.data_cleaning()
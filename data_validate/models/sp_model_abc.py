@@ -8,7 +8,7 @@ and processing required by all specific spreadsheet implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from data_validate.controllers.context.general_context import GeneralContext
 from data_validate.helpers.base.constant_base import ConstantBase
@@ -64,6 +64,9 @@ class SpModelABC(ABC):
 
     CONSTANTS = None
 
+    # Nested classes holding the column definitions (and, after cleaning, the cleaned Series)
+    COLUMN_NAMESPACES = ("RequiredColumn", "OptionalColumn", "DynamicColumn", "PluralColumn")
+
     def __init__(
         self,
         context: GeneralContext,
@@ -82,6 +85,7 @@ class SpModelABC(ABC):
             **model_configurations: Additional configuration parameters.
         """
         # SETUP
+        self._bind_column_namespaces()
         self.context: GeneralContext = context
         self.data_loader_model: DataLoaderModel = data_model
         self._kwargs: Dict[str, Any] = model_configurations
@@ -112,6 +116,21 @@ class SpModelABC(ABC):
 
         self.initialize()
 
+    def _bind_column_namespaces(self) -> None:
+        """
+        Give this instance its own copy of the column namespaces.
+
+        Data cleaning stores the cleaned Series in the column namespaces (e.g.
+        ``self.RequiredColumn.COLUMN_CODE``). Each instance gets a subclass of the
+        class-level namespace, so the cleaned data of one run is never seen by other
+        instances, whether they run later in the same process or in another thread.
+        Column names and defaults are still inherited from the class definition.
+        """
+        for namespace_name in self.COLUMN_NAMESPACES:
+            namespace = getattr(type(self), namespace_name, None)
+            if isinstance(namespace, type):
+                setattr(self, namespace_name, type(namespace.__name__, (namespace,), {"__qualname__": namespace.__qualname__}))
+
     def initialize(self):
         """
         Initialize the verification process by performing basic sanity checks.
@@ -136,6 +155,29 @@ class SpModelABC(ABC):
         _, errors_unnamed_columns = DataFrameProcessing.check_dataframe_unnamed_columns(self.data_loader_model.raw_data, self.filename)
         self.structural_errors.extend(errors_unnamed_columns)
 
+    @classmethod
+    def get_read_columns(cls) -> Optional[List[str]]:
+        """
+        Get the columns of the spreadsheet used by this model (column projection).
+
+        Only these columns need to be parsed when reading the file; any other column is
+        still reported by the structure checks, since the header is always read.
+
+        Returns:
+            Optional[List[str]]: Names of the used columns, or None if the columns depend on the data.
+        """
+        return None
+
+    @property
+    def is_header_only(self) -> bool:
+        """
+        Check if only the header of the file was read (pre-flight scan).
+
+        Returns:
+            bool: True if the data holds the file columns and at most its first row, False otherwise.
+        """
+        return self.data_loader_model.header_only
+
     @property
     def is_sanity_check_passed(self) -> bool:
         """
@@ -91,6 +91,16 @@ class SpScenario(SpModelABC):
 
         self.run()
 
+    @classmethod
+    def get_read_columns(cls) -> List[str]:
+        """
+        Get the columns of the spreadsheet used by this model.
+
+        Returns:
+            List[str]: Names of the used columns.
+        """
+        return list(cls.RequiredColumn.ALL)
+
     def pre_processing(self):
         """Run pre-processing steps."""
         if self.scenario_exists_file and not self.scenarios:
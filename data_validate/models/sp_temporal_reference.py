@@ -88,6 +88,16 @@ class SpTemporalReference(SpModelABC):
 
         self.run()
 
+    @classmethod
+    def get_read_columns(cls) -> List[str]:
+        """
+        Get the columns of the spreadsheet used by this model.
+
+        Returns:
+            List[str]: Names of the used columns.
+        """
+        return list(cls.RequiredColumn.ALL)
+
     def pre_processing(self):
         """Run pre-processing steps (currently empty)."""
         pass
@@ -134,7 +144,7 @@ class SpTemporalReference(SpModelABC):
             col_symbol = self.RequiredColumn.COLUMN_SYMBOL.name
 
             df, errors_symbol = DataCleaningProcessing.clean_dataframe_integers(
-                self.data_loader_model.raw_data, self.filename, [str(col_symbol)], min_value=0
+                self.data_loader_model.raw_data, self.filename, [str(col_symbol)], min_value=0, max_messages=self.context.message_budget
             )
             self.data_cleaning_errors.extend(errors_symbol)
 
@@ -150,8 +160,10 @@ class SpTemporalReference(SpModelABC):
         Execute the full validation pipeline for this model.
 
         Runs pre-processing, structure validation, and data cleaning if the file exists.
+        Data cleaning is skipped when only the header rows were read.
         """
         if self.data_loader_model.does_file_exist:
             self.pre_processing()
             self.expected_structure_columns()
-            self.data_cleaning()
+            if not self.is_header_only:
+                self.data_cleaning()
@@ -13,7 +13,7 @@ import pandas as pd
 from data_validate.config import SHEET
 from data_validate.controllers.context.general_context import GeneralContext
 from data_validate.helpers.base.constant_base import ConstantBase
-from data_validate.helpers.common.processing.collections_processing import CollectionsProcessing
+from data_validate.helpers.common.validation.value_column_index import ValueColumnIndex
 from data_validate.helpers.tools.data_loader.api.facade import DataLoaderModel
 from data_validate.models.sp_model_abc import SpModelABC
 
@@ -27,6 +27,7 @@ class SpValue(SpModelABC):
 
     Attributes:
         CONSTANTS (INFO): Immutable constants specific to this model.
+        column_index (ValueColumnIndex): Code, year and scenario of each column, parsed once per run.
     """
 
     # CONSTANTS
@@ -79,6 +80,7 @@ class SpValue(SpModelABC):
             **kwargs: Additional keyword arguments.
         """
         super().__init__(context, data_model, **kwargs)
+        self.column_index = ValueColumnIndex(self.data_loader_model.raw_data.columns, self.scenarios)
 
         self.run()
 
@@ -86,12 +88,8 @@ class SpValue(SpModelABC):
         """Run pre-processing steps."""
         self.EXPECTED_COLUMNS = list(self.RequiredColumn.ALL)
 
-        unique_columns = self.data_loader_model.raw_data.columns.unique().tolist()
-
-        # Remove ID self.RequiredColumn.COLUMN_ID.name
-        unique_columns = [col for col in unique_columns if col != self.RequiredColumn.COLUMN_ID.name]
-
-        __, codes_not_matched_by_pattern = CollectionsProcessing.categorize_strings_by_id_pattern_from_list(unique_columns, self.scenarios)
+        # Columns out of the patterns, without the ID column and without repetitions
+        codes_not_matched_by_pattern = list(dict.fromkeys(self.column_index.unmatched_columns([self.RequiredColumn.COLUMN_ID.name])))
 
         if codes_not_matched_by_pattern:
             self.structural_errors.append(
@@ -105,11 +103,8 @@ class SpValue(SpModelABC):
         Checks primarily for the presence of the 'codigo' column.
         Updates structural errors and warnings lists.
         """
-        __, extras_columns = CollectionsProcessing.extract_numeric_ids_and_unmatched_strings_from_list(
-            source_list=self.DF_COLUMNS,
-            strings_to_ignore=[self.RequiredColumn.COLUMN_ID.name],
-            suffixes_for_matching=self.scenarios,
-        )
+        # DF_COLUMNS is empty when the sheet has no rows
+        extras_columns = self.column_index.unmatched_columns([self.RequiredColumn.COLUMN_ID.name]) if self.DF_COLUMNS else []
 
         for extra_column in extras_columns:
             if extra_column.lower().startswith("unnamed"):
@@ -0,0 +1,51 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import argparse
+import sys
+
+import data_validate
+from data_validate.controllers import ValidationServer, ValidationService
+from data_validate.helpers.base import DataArgs
+from data_validate.middleware import Bootstrap
+
+
+def main(argv=None):
+    # Service options; every other argument is forwarded to each run
+    parser = argparse.ArgumentParser(
+        description="Adapta Parser - Local validation service that keeps its workers warm between submissions.",
+        allow_abbrev=False,
+    )
+    parser.add_argument("--host", default="127.0.0.1", type=str, help="Address to listen on.")
+    parser.add_argument("--port", default=8765, type=int, help="Port to listen on.")
+    parser.add_argument("--output_folder", default="output_data/", type=str, help="Root folder of the report sets.")
+    parser.add_argument("--workers", type=int, default=2, help="Number of worker processes.")
+    parser.add_argument("--queue-size", type=int, default=16, help="Maximum number of submissions waiting to run.")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Maximum duration of a submission, in seconds.")
+    args, extra_args = parser.parse_known_args(argv)
+
+    print(f"{data_validate.__welcome__}\n")
+
+    # Validate the forwarded arguments once and configure the locale before the workers start
+    Bootstrap(DataArgs(argv=["--input_folder", ".", "--output_folder", args.output_folder, *extra_args]))
+
+    service = ValidationService(args.output_folder, workers=args.workers, queue_size=args.queue_size, timeout=args.timeout, extra_args=extra_args)
+    server = ValidationServer((args.host, args.port), service)
+
+    service.start()
+    print(f"Serviço de validação em http://{args.host}:{server.server_port} ({args.workers} processos). Pressione Ctrl+C para encerrar.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# Example usage:
+# python3 data_validate/server.py --port 8765 --workers 4 --no-spellchecker
+# curl -X POST http://127.0.0.1:8765/validate -d '{"input_folder": "data/input/data_ground_truth_01"}'
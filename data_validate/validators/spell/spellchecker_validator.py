@@ -43,6 +43,8 @@ class SpellCheckerValidator(BaseValidator):
         Mapping of model types to their respective columns that require spell checking.
     """
 
+    READS = (SpDictionary, SpDescription, SpTemporalReference, SpScenario)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -8,11 +8,13 @@ and integration with the validation pipeline.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Type, Tuple, Callable
+from contextlib import nullcontext
+from typing import Dict, Any, List, Optional, Type, Tuple, Callable
 
 import pandas as pd
 from data_validate.controllers.context.data_model_context import DataModelContext
 from data_validate.controllers.report.validation_report import ValidationReport
+from data_validate.helpers.common.processing.timing_recorder import TimingRecorder
 from data_validate.helpers.common.validation.dataframe_processing import DataFrameProcessing
 
 from data_validate.models.sp_model_abc import SpModelABC
@@ -46,8 +48,22 @@ class BaseValidator(ABC):
         Accumulated list of validation errors.
     _warnings : List[str]
         Accumulated list of validation warnings.
+    READS : Tuple[Type[SpModelABC], ...] or None
+        Model classes the validator reads. Validators that only read models run
+        concurrently in the pipeline. None means undeclared: the validator runs alone.
+    WRITES : Tuple[Type[SpModelABC], ...]
+        Model classes the validator modifies. A validator never runs at the same
+        time as another validator that reads or writes the same models.
+    CACHEABLE : bool
+        Whether the results depend only on the spreadsheets in ``READS`` (plus the
+        run options), so that `--reuse-results` may reuse them while those
+        spreadsheets are unchanged.
     """
 
+    READS: Optional[Tuple[Type[SpModelABC], ...]] = None
+    WRITES: Tuple[Type[SpModelABC], ...] = ()
+    CACHEABLE: bool = True
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -77,7 +93,7 @@ class BaseValidator(ABC):
         # UNPACK DATA
         self._data_model = self._data_models_context.get_instance_of(self._type_class)
         self._filename = self._data_model.filename if self._data_model else "Unknown"
-        self._dataframe = self._data_model.data_loader_model.raw_data.copy() if self._data_model else pd.DataFrame({})
+        self._dataframe = self._data_model.data_loader_model.raw_data.copy(deep=False) if self._data_model else pd.DataFrame({})
         self.TITLES_INFO = self._data_models_context.context.config.get_verify_names()
 
         # LIST OF ERRORS AND WARNINGS
@@ -276,13 +292,20 @@ class BaseValidator(ABC):
         Notes
         -----
         - Each validation function is executed sequentially
+        - When the run is timed, the elapsed time of each function is recorded under its name
+          (lambdas under their report key)
         - Exceptions during validation are caught and reported as errors
         - Results are extended to both the report list and internal error/warning lists
         - Report keys are used to categorize validation results by type
         """
+        timings = getattr(self._data_models_context, "timings", None)
         for func, report_key in validations:
             try:
-                errors, warnings = func()
+                # Lambdas are timed under the report key they fill
+                span_name = getattr(func, "__name__", "<lambda>")
+                span_name = report_key if span_name == "<lambda>" else span_name
+                with timings.measure(span_name) if isinstance(timings, TimingRecorder) else nullcontext():
+                    errors, warnings = func()
                 if errors or warnings:
                     self._report_list.extend(self.TITLES_INFO[report_key], errors=errors, warnings=warnings)
                 self._errors.extend(errors)
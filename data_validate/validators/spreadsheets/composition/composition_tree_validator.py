@@ -13,7 +13,6 @@ import pandas as pd
 from data_validate.config import NamesEnum
 from data_validate.controllers.context.data_model_context import DataModelContext
 from data_validate.controllers.report.validation_report import ValidationReport
-from data_validate.helpers.common.processing.data_cleaning_processing import DataCleaningProcessing
 from data_validate.helpers.common.validation.tree_processing import TreeProcessing
 from data_validate.models import SpComposition, SpDescription
 from data_validate.validators.spreadsheets.base.base_validator import BaseValidator
@@ -51,6 +50,8 @@ class SpCompositionTreeValidator(BaseValidator):
         DataFrames mapping for each model.
     """
 
+    READS = (SpComposition, SpDescription)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -157,31 +158,10 @@ class SpCompositionTreeValidator(BaseValidator):
         if column_errors:
             return column_errors, warnings
 
-        # Create working copies and clean data
-        df_composition = self.model_dataframes[self.sp_name_composition].copy()
-        df_description = self.model_dataframes[self.sp_name_description].copy()
-
-        # Clean integer columns: df_composition
-        df_composition, _ = DataCleaningProcessing.clean_dataframe_integers(
-            df=df_composition,
-            file_name=self.sp_name_composition,
-            columns_to_clean=[self.column_name_parent],
-            min_value=0,
-        )
-        df_composition, _ = DataCleaningProcessing.clean_dataframe_integers(
-            df=df_composition,
-            file_name=self.sp_name_composition,
-            columns_to_clean=[self.column_name_child],
-            min_value=1,
-        )
-
-        # Clean integer columns: df_description
-        df_description, _ = DataCleaningProcessing.clean_dataframe_integers(
-            df=df_description,
-            file_name=self.sp_name_description,
-            columns_to_clean=[self.column_name_code, self.column_name_level],
-            min_value=1,
-        )
+        # Composition and description with valid codes and levels, cleaned once in the indicator index
+        indicator_index = self._data_models_context.indicator_index
+        df_composition = indicator_index.composition
+        df_description = indicator_index.cleaned([self.column_name_code, self.column_name_level], min_value=1)
 
         # Add root node if not present
         if not (df_description[self.column_name_code] == 0).any():
@@ -14,7 +14,6 @@ from data_validate.config import NamesEnum
 from data_validate.controllers.context.data_model_context import DataModelContext
 from data_validate.controllers.report.validation_report import ValidationReport
 from data_validate.helpers.common.processing.collections_processing import CollectionsProcessing
-from data_validate.helpers.common.processing.data_cleaning_processing import DataCleaningProcessing
 from data_validate.helpers.common.validation.dataframe_processing import DataFrameProcessing
 
 from data_validate.helpers.common.validation.graph_processing import GraphProcessing
@@ -74,6 +73,8 @@ class SpCompositionGraphValidator(BaseValidator):
         Graph processing utility for analysis.
     """
 
+    READS = (SpComposition, SpDescription, SpValue, SpProportionality)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -178,22 +179,8 @@ class SpCompositionGraphValidator(BaseValidator):
         }
 
         # Setup graph processing if composition data is available
-        # Create working copies and clean data
-        df_composition: DataFrame = self.model_dataframes[self.sp_name_composition].copy()
-
-        # Clean integer columns: df_composition
-        df_composition, _ = DataCleaningProcessing.clean_dataframe_integers(
-            df=df_composition,
-            file_name=self.sp_name_composition,
-            columns_to_clean=[self.column_name_parent],
-            min_value=0,
-        )
-        df_composition, _ = DataCleaningProcessing.clean_dataframe_integers(
-            df=df_composition,
-            file_name=self.sp_name_composition,
-            columns_to_clean=[self.column_name_child],
-            min_value=1,
-        )
+        # Composition with valid parent and child codes, cleaned once in the indicator index
+        df_composition = self._data_models_context.indicator_index.composition
         # Configure processing helpers
         self.graph_processing = GraphProcessing(
             dataframe=df_composition,
@@ -369,19 +356,12 @@ class SpCompositionGraphValidator(BaseValidator):
         if column_errors:
             return column_errors, warnings
 
-        # Create working copies and clean data
-        df_description: DataFrame = self.model_dataframes[self.sp_name_description].copy()
         root_node = "1"
         column_plural_simple_name = SpDescription.PluralColumn.COLUMN_PLURAL_SIMPLE_NAME.name
         column_plural_complete_name = SpDescription.PluralColumn.COLUMN_PLURAL_COMPLETE_NAME.name
 
-        # Clean integer columns: df_description
-        df_description, _ = DataCleaningProcessing.clean_dataframe_integers(
-            df=df_description,
-            file_name=self.sp_name_description,
-            columns_to_clean=[self.column_name_code],
-            min_value=1,
-        )
+        # Description with valid codes, cleaned once in the indicator index
+        df_description = self._data_models_context.indicator_index.cleaned([self.column_name_code], min_value=1)
         comparison_errors, __ = self.validate_relation_indicators_in_composition()
         if comparison_errors:
             return errors, warnings
@@ -482,14 +462,12 @@ class SpCompositionGraphValidator(BaseValidator):
             return column_errors, warnings
 
         # Create working copies and clean data
-        df_value: DataFrame = self.model_dataframes[self.sp_name_value].copy()
         df_proportionality: DataFrame = self.model_dataframes[self.sp_name_proportionality].copy()
 
         leafs = self.graph_processing.get_leaf_nodes()
 
-        # Validation for values
-        codes_values = df_value.columns.tolist()
-        codes_values = [code.split("-")[0] for code in codes_values]
+        # Validation for values: codes before the first '-' of the value columns
+        codes_values = set(self.model_sp_value.column_index.prefixes)
         for leaf in leafs:
             if leaf not in codes_values:
                 errors.append(f"{self.sp_name_value}: Indicador folha '{leaf}' não possui dados associados.")
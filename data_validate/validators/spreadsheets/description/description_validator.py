@@ -40,6 +40,8 @@ class SpDescriptionValidator(BaseValidator):
     - Text length limits
     """
 
+    READS = (SpDescription,)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -8,14 +8,16 @@ and ensures that indicators at different levels have appropriate legend referenc
 
 from typing import List, Tuple, Dict, Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from data_validate.config import NamesEnum
 from data_validate.controllers.context.data_model_context import DataModelContext
 from data_validate.controllers.report.validation_report import ValidationReport
+from data_validate.helpers.common.formatting.issue_record import IssueRecord
 from data_validate.helpers.common.processing.collections_processing import CollectionsProcessing
 
-from data_validate.helpers.common.processing.data_cleaning_processing import DataCleaningProcessing
+from data_validate.helpers.common.validation.value_processing import ValueProcessing
 from data_validate.models import SpDescription, SpLegend, SpValue
 from data_validate.validators.spreadsheets.base.base_validator import BaseValidator
 
@@ -117,6 +119,8 @@ class SpLegendValidator(BaseValidator):
         DataFrames mapping for each model.
     """
 
+    READS = (SpLegend, SpDescription, SpValue)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -175,7 +179,8 @@ class SpLegendValidator(BaseValidator):
 
         Notes
         -----
-        DataFrames are copied to prevent modification of original data.
+        DataFrames are shallow copies: with copy-on-write, modifications never reach the
+        original data and the values are only duplicated if actually modified.
         """
         # Get model properties once
         self.sp_name_legend = self.model_sp_legend.filename
@@ -184,9 +189,9 @@ class SpLegendValidator(BaseValidator):
 
         # Validate all required columns exist
         self.model_dataframes = {
-            self.sp_name_legend: self.model_sp_legend.data_loader_model.raw_data.copy(),
-            self.sp_name_description: self.model_sp_description.data_loader_model.raw_data.copy(),
-            self.sp_name_value: self.model_sp_value.data_loader_model.raw_data.copy(),
+            self.sp_name_legend: self.model_sp_legend.data_loader_model.raw_data.copy(deep=False),
+            self.sp_name_description: self.model_sp_description.data_loader_model.raw_data.copy(deep=False),
+            self.sp_name_value: self.model_sp_value.data_loader_model.raw_data.copy(deep=False),
         }
 
     def validate_relation_indicators_in_legend(self) -> Tuple[List[str], List[str]]:
@@ -241,41 +246,14 @@ class SpLegendValidator(BaseValidator):
             return errors, warnings
 
         df_legend = self.model_dataframes[self.sp_name_legend].copy()
-        df_description = self.model_dataframes[self.sp_name_description].copy()
-
-        df_description_clean, __ = DataCleaningProcessing.clean_dataframe_integers(
-            df_description,
-            self.sp_name_description,
-            [SpDescription.RequiredColumn.COLUMN_CODE.name],
-            min_value=1,
-        )
-
-        df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name] = pd.to_numeric(
-            df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name],
-            errors="coerce",
-        )
-        df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name] = df_description_clean[
-            SpDescription.DynamicColumn.COLUMN_LEGEND.name
-        ].astype("Int64")
-
-        # Remove all NaN values in column COLUMN_LEGEND
-        df_description_clean = df_description_clean.dropna(subset=[SpDescription.RequiredColumn.COLUMN_CODE.name])
         df_legend = df_legend.dropna(subset=[SpLegend.RequiredColumn.COLUMN_CODE.name])
 
-        legends_id_in_description = (
-            df_description_clean[
-                (df_description_clean[SpDescription.RequiredColumn.COLUMN_LEVEL.name] != "1")
-                & (df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name].notna())
-                & (
-                    pd.to_numeric(
-                        df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name],
-                        errors="coerce",
-                    ).notna()
-                )
-            ][SpDescription.DynamicColumn.COLUMN_LEGEND.name]
-            .astype(str)
-            .tolist()
-        )  # DROP NA VALUES
+        # Rows of the description with a valid indicator code
+        indicator_index = self._data_models_context.indicator_index
+        rows = indicator_index.valid_rows([SpDescription.RequiredColumn.COLUMN_CODE.name], min_value=1)
+        level_texts, legends = indicator_index.level_texts, indicator_index.legends
+
+        legends_id_in_description = [str(legends[row]) for row in rows if level_texts[row] != "1" and legends[row] is not None]
 
         legends_id_in_legend = df_legend[SpLegend.RequiredColumn.COLUMN_CODE.name].astype(str).unique().tolist()
 
@@ -300,23 +278,9 @@ class SpLegendValidator(BaseValidator):
 
         # 1. All codes that are level 1 - Cannot have legends: if they do, error
 
-        codes_indicators_level_one = (
-            df_description_clean[df_description_clean[SpDescription.RequiredColumn.COLUMN_LEVEL.name] == "1"][
-                SpDescription.RequiredColumn.COLUMN_CODE.name
-            ]
-            .astype(str)
-            .tolist()
-        )
+        codes_indicators_level_one = [str(code) for code in indicator_index.codes_of_level(1, min_code=1)]
 
-        legends_id_in_description_level_one = (
-            df_description_clean[
-                (df_description_clean[SpDescription.RequiredColumn.COLUMN_LEVEL.name] == "1")
-                & (df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name].notna())
-            ][SpDescription.DynamicColumn.COLUMN_LEGEND.name]
-            .unique()
-            .astype(str)
-            .tolist()
-        )
+        legends_id_in_description_level_one = [legends[row] for row in rows if level_texts[row] == "1" and legends[row] is not None]
 
         if legends_id_in_description_level_one:
             errors.append(
@@ -324,24 +288,11 @@ class SpLegendValidator(BaseValidator):
             )
 
         # 3. All codes that are not level 1 and not level 2 - Must have a legend reference: if not, error
-        codes_indicators_other_levels = (
-            df_description_clean[
-                (df_description_clean[SpDescription.RequiredColumn.COLUMN_LEVEL.name] != "1")
-                & (df_description_clean[SpDescription.RequiredColumn.COLUMN_LEVEL.name] != "2")
-            ][SpDescription.RequiredColumn.COLUMN_CODE.name]
-            .astype(str)
-            .tolist()
-        )
+        codes_indicators_other_levels = [str(indicator_index.codes[row]) for row in rows if level_texts[row] not in ("1", "2")]
 
-        codes_with_legend_other_levels = (
-            df_description_clean[
-                (df_description_clean[SpDescription.RequiredColumn.COLUMN_LEVEL.name] != "1")
-                & (df_description_clean[SpDescription.RequiredColumn.COLUMN_LEVEL.name] != "2")
-                & (df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name].notna())
-            ][SpDescription.RequiredColumn.COLUMN_CODE.name]
-            .astype(str)
-            .tolist()
-        )
+        codes_with_legend_other_levels = [
+            str(indicator_index.codes[row]) for row in rows if level_texts[row] not in ("1", "2") and legends[row] is not None
+        ]
 
         set_codes_other_levels = set(codes_indicators_other_levels)
         set_codes_with_legend = set(codes_with_legend_other_levels)
@@ -354,6 +305,39 @@ class SpLegendValidator(BaseValidator):
 
         return errors, warnings
 
+    def _build_legend_ranges(self, df_legend: pd.DataFrame) -> Dict[str, Optional[Tuple[Any, Any, Any]]]:
+        """
+        Compute the value range of each legend code.
+
+        Args
+        ----
+        df_legend : pd.DataFrame
+            Legend spreadsheet data.
+
+        Returns
+        -------
+        Dict[str, Optional[Tuple[Any, Any, Any]]]
+            For each legend code, the minimum and maximum of its classes (the
+            unavailable data class excluded) and the legend code, or None when
+            the legend has no class with valid limits.
+        """
+        legend_ranges = {}
+        for key_legend, group_legend in df_legend.groupby(str(SpLegend.RequiredColumn.COLUMN_CODE.name)):
+            legend_ranges[str(key_legend)] = None
+
+            group_legend = group_legend[
+                group_legend[SpLegend.RequiredColumn.COLUMN_LABEL.name] != self._data_models_context.context.config.LABEL_DATA_UNAVAILABLE
+            ]
+            if group_legend.empty:
+                continue
+
+            min_value = pd.to_numeric(group_legend[SpLegend.RequiredColumn.COLUMN_MINIMUM.name], errors="coerce").min()
+            max_value = pd.to_numeric(group_legend[SpLegend.RequiredColumn.COLUMN_MAXIMUM.name], errors="coerce").max()
+            if (not pd.isna(min_value)) and (not pd.isna(max_value)):
+                legend_ranges[str(key_legend)] = (min_value, max_value, group_legend.iloc[0][SpLegend.RequiredColumn.COLUMN_CODE.name])
+
+        return legend_ranges
+
     def validate_range_multiple_legend(self) -> Tuple[List[str], List[str]]:
         """
         Validate that indicator values fall within their legend-defined ranges.
@@ -409,124 +393,100 @@ class SpLegendValidator(BaseValidator):
         if errors:
             return errors, warnings
 
-        df_values = self.model_dataframes[self.sp_name_value].copy()
-        df_legend = self.model_dataframes[self.sp_name_legend].copy()
-        df_description = self.model_dataframes[self.sp_name_description].copy()
+        df_values = self.model_dataframes[self.sp_name_value].copy(deep=False)
+        df_legend = self.model_dataframes[self.sp_name_legend].copy(deep=False)
 
         if SpValue.RequiredColumn.COLUMN_ID.name in df_values.columns:
-            df_values.drop(columns=[SpValue.RequiredColumn.COLUMN_ID.name], inplace=True)
-
-        df_description_clean, __ = DataCleaningProcessing.clean_dataframe_integers(
-            df_description,
-            self.sp_name_description,
-            [SpDescription.RequiredColumn.COLUMN_CODE.name],
-            min_value=1,
-        )
-
-        if SpDescription.DynamicColumn.COLUMN_LEGEND.name not in df_description_clean.columns:
-            df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name] = pd.Series(dtype="Int64")
-        else:
-            df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name] = pd.to_numeric(
-                df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name],
-                errors="coerce",
-            )
-            df_description_clean[SpDescription.DynamicColumn.COLUMN_LEGEND.name] = df_description_clean[
-                SpDescription.DynamicColumn.COLUMN_LEGEND.name
-            ].astype("Int64")
-
-        codes_indicators_level_one = (
-            df_description_clean[df_description_clean[SpDescription.RequiredColumn.COLUMN_LEVEL.name] == "1"][
-                SpDescription.RequiredColumn.COLUMN_CODE.name
-            ]
-            .astype(str)
-            .tolist()
-        )
-        valid_columns_from_values, __ = CollectionsProcessing.categorize_strings_by_id_pattern_from_list(
-            items_to_categorize=df_values.columns.tolist(),
-            allowed_scenario_suffixes=self.scenarios_list,
-        )
-
-        groups_legends = pd.DataFrame({str(SpLegend.RequiredColumn.COLUMN_CODE.name): []}).groupby(str(SpLegend.RequiredColumn.COLUMN_CODE.name))
-        if self.model_sp_legend.is_sanity_check_passed:
-            groups_legends = df_legend.groupby(str(SpLegend.RequiredColumn.COLUMN_CODE.name))
-
+            df_values = df_values.drop(columns=[SpValue.RequiredColumn.COLUMN_ID.name])
+
+        indicator_index = self._data_models_context.indicator_index
+        column_index = self.model_sp_value.column_index
+        codes_indicators_level_one = {str(code) for code in indicator_index.codes_of_level(1, min_code=1)}
+
+        # Legend range of each legend code and legend of each indicator code, computed once
+        legend_ranges = self._build_legend_ranges(df_legend) if self.model_sp_legend.is_sanity_check_passed else {}
+        legend_by_code: Dict[str, Any] = {str(code): indicator_index.legends[row] for code, row in indicator_index.code_to_row.items() if code >= 1}
+
+        # Valid value columns (the ID column never is one) and their indicator codes, but level 1 indicators
+        indicator_of_columns = [
+            (column, prefix)
+            for column, prefix, code in zip(column_index.columns, column_index.prefixes, column_index.codes)
+            if code is not None and prefix not in codes_indicators_level_one
+        ]
+        columns_to_check = [column for column, __ in indicator_of_columns]
         mapping_legends = {}
-        for data_column_sp_value in valid_columns_from_values:
-            aux_indicator_id = data_column_sp_value.split("-")[0]
+        for data_column_sp_value, aux_indicator_id in indicator_of_columns:
             aux_data_mapping_legend = ModelMappingLegend(
                 column_sp_value=data_column_sp_value,
                 default_min_value=min_lower_legend_default,
                 default_max_value=max_upper_legend_default,
             )
-
-            if aux_indicator_id in codes_indicators_level_one:
-                continue
-
-            row_description = df_description_clean[
-                df_description_clean[SpDescription.RequiredColumn.COLUMN_CODE.name].astype(str) == aux_indicator_id
-            ]
-            if not row_description.empty:
+            if aux_indicator_id in legend_by_code:
                 aux_data_mapping_legend.indicator_id = aux_indicator_id
 
-                key_legend = row_description.iloc[0][SpDescription.DynamicColumn.COLUMN_LEGEND.name]
-                group_legend = groups_legends.get_group(str(key_legend)) if str(key_legend) in groups_legends.groups else None
-
-                if group_legend is not None:
+                key_legend = legend_by_code[aux_indicator_id]
+                if str(key_legend) in legend_ranges:
                     aux_data_mapping_legend.legend_id = key_legend
 
-                    group_legend = group_legend[
-                        group_legend[SpLegend.RequiredColumn.COLUMN_LABEL.name] != self._data_models_context.context.config.LABEL_DATA_UNAVAILABLE
-                    ]
-                    if not group_legend.empty:
-                        group_legend[SpLegend.RequiredColumn.COLUMN_MINIMUM.name] = pd.to_numeric(
-                            group_legend[SpLegend.RequiredColumn.COLUMN_MINIMUM.name],
-                            errors="coerce",
-                        )
-                        group_legend[SpLegend.RequiredColumn.COLUMN_MAXIMUM.name] = pd.to_numeric(
-                            group_legend[SpLegend.RequiredColumn.COLUMN_MAXIMUM.name],
-                            errors="coerce",
-                        )
-
-                        aux_min_value = group_legend[SpLegend.RequiredColumn.COLUMN_MINIMUM.name].min()
-                        aux_max_value = group_legend[SpLegend.RequiredColumn.COLUMN_MAXIMUM.name].max()
-                        legend_id = group_legend.iloc[0][SpLegend.RequiredColumn.COLUMN_CODE.name]
-
-                        if (not pd.isna(aux_min_value)) and (not pd.isna(aux_max_value)):
-                            aux_data_mapping_legend.min_value = aux_min_value
-                            aux_data_mapping_legend.max_value = aux_max_value
-                            aux_data_mapping_legend.legend_id = legend_id
+                    legend_range = legend_ranges[str(key_legend)]
+                    if legend_range is not None:
+                        aux_data_mapping_legend.min_value, aux_data_mapping_legend.max_value, aux_data_mapping_legend.legend_id = legend_range
 
             mapping_legends[data_column_sp_value] = aux_data_mapping_legend
 
-        df_values_numeric = df_values.copy()
-        for col in valid_columns_from_values:
-            df_values_numeric[col] = pd.to_numeric(df_values[col].astype(str).str.replace(",", "."), errors="coerce")
-
-        for data_column_sp_value in valid_columns_from_values:
-            code_column = data_column_sp_value.split("-")[0]
-
-            if code_column in codes_indicators_level_one:
+        errors_by_column = {column: [] for column in columns_to_check}
+        omitted_by_column = {column: 0 for column in columns_to_check}
+        chunk_size = self._data_models_context.context.data_args.data_performance.chunk_size
+        max_messages = self._data_models_context.context.message_budget
+        min_values = np.array([float(mapping_legends[column].min_value) for column in columns_to_check])
+        max_values = np.array([float(mapping_legends[column].max_value) for column in columns_to_check])
+
+        # Numeric conversion is done one chunk of rows at a time, so only the chunk is duplicated
+        for df_chunk in ValueProcessing.iter_row_chunks(df_values, chunk_size):
+            # Column-major block of all columns, compared at once with the range of each column
+            values_original = df_chunk[columns_to_check].to_numpy(dtype=object)
+            if values_original.size == 0:
                 continue
-
-            min_value = mapping_legends[data_column_sp_value].min_value
-            max_value = mapping_legends[data_column_sp_value].max_value
-
-            for index, value_numeric in df_values_numeric[data_column_sp_value].items():
-                value_original = df_values[data_column_sp_value][index]
-                if value_original == self._data_models_context.context.config.VALUE_DATA_UNAVAILABLE or pd.isna(value_numeric):
-                    continue
-
-                if value_numeric < min_value or value_numeric > max_value:
-
-                    text_code_legend = "padrão"
-                    if mapping_legends[data_column_sp_value].legend_id is not None:
-                        text_code_legend = f"de código '{mapping_legends[data_column_sp_value].legend_id}'"
-
-                    errors.append(
-                        f"{self.sp_name_value}, linha {index + 2}: O valor {value_original} está fora do intervalo da legenda {text_code_legend} ({min_value} a {max_value}) para a coluna '{data_column_sp_value}'."
+            texts = pd.Series(values_original.ravel(order="F"), dtype=object).astype(str)
+            values_numeric = (
+                pd.to_numeric(texts.str.replace(",", ".", regex=False), errors="coerce")
+                .to_numpy(dtype=float, na_value=np.nan)
+                .reshape(values_original.shape, order="F")
+            )
+            is_available = (
+                (texts != self._data_models_context.context.config.VALUE_DATA_UNAVAILABLE).to_numpy().reshape(values_original.shape, order="F")
+            )
+            with np.errstate(invalid="ignore"):
+                out_of_range = is_available & ~np.isnan(values_numeric) & ((values_numeric < min_values) | (values_numeric > max_values))
+
+            # Messages are formatted only for the values out of range
+            for column_position in np.flatnonzero(out_of_range.any(axis=0)):
+                data_column_sp_value = columns_to_check[column_position]
+                mapping_legend = mapping_legends[data_column_sp_value]
+                out_of_range_rows = np.flatnonzero(out_of_range[:, column_position])
+
+                # Past the message budget, the remaining values out of range are only counted
+                if max_messages is not None:
+                    n_messages = max(max_messages - len(errors_by_column[data_column_sp_value]), 0)
+                    omitted_by_column[data_column_sp_value] += len(out_of_range_rows) - min(n_messages, len(out_of_range_rows))
+                    out_of_range_rows = out_of_range_rows[:n_messages]
+
+                text_code_legend = "padrão"
+                if mapping_legend.legend_id is not None:
+                    text_code_legend = f"de código '{mapping_legend.legend_id}'"
+
+                for row in out_of_range_rows:
+                    errors_by_column[data_column_sp_value].append(
+                        f"{self.sp_name_value}, linha {df_chunk.index[row] + 2}: O valor {values_original[row, column_position]} está fora do intervalo da legenda {text_code_legend} ({mapping_legend.min_value} a {mapping_legend.max_value}) para a coluna '{data_column_sp_value}'."
                     )
 
-        return errors, warnings
+        # Errors are reported column by column, regardless of the chunking
+        for data_column_sp_value in columns_to_check:
+            errors.extend(errors_by_column[data_column_sp_value])
+            if omitted_by_column[data_column_sp_value]:
+                errors.append(IssueRecord.omitted(omitted_by_column[data_column_sp_value]))
+
+        return IssueRecord.limit(errors, max_messages), warnings
 
     def run(self) -> Tuple[List[str], List[str]]:
         """
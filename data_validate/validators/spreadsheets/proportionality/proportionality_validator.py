@@ -17,9 +17,7 @@ from data_validate.controllers.report.validation_report import ValidationReport
 
 from data_validate.helpers.common.processing.collections_processing import CollectionsProcessing
 
-from data_validate.helpers.common.processing.data_cleaning_processing import DataCleaningProcessing
 from data_validate.helpers.common.validation.proportionality_processing import ProportionalityProcessing
-from data_validate.helpers.common.validation.description_processing import DescriptionProcessing
 
 
 from data_validate.models import SpProportionality, SpDescription, SpValue, SpComposition
@@ -77,6 +75,8 @@ class SpProportionalityValidator(BaseValidator):
         DataFrames mapping for each model.
     """
 
+    READS = (SpProportionality, SpDescription, SpValue, SpComposition)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -344,22 +344,13 @@ class SpProportionalityValidator(BaseValidator):
         if column_errors:
             return column_errors, warnings
 
-        # Create working copies and clean data
-        df_description: DataFrame = self.model_dataframes[self.sp_name_description].copy()
+        # Create working copies
         df_proportionality: DataFrame = self.model_dataframes[self.sp_name_proportionality].copy()
 
-        # Clean integer columns: df_description
-        df_description, _ = DataCleaningProcessing.clean_dataframe_integers(
-            df=df_description,
-            file_name=self.sp_name_description,
-            columns_to_clean=[self.column_name_code],
-        )
-
-        # List of codes at level 1 to remove
-        codes_level_to_remove = df_description[df_description[self.column_name_level] == "1"][self.column_name_code].astype(str).tolist()
-        set_valid_codes_description = DescriptionProcessing.get_valids_codes_from_description(
-            self.model_dataframes[self.sp_name_description], self.column_name_level, self.column_name_code, self.column_name_scenario
-        )
+        # Codes at level 1 to remove and codes expected in the proportionality
+        indicator_index = self._data_models_context.indicator_index
+        codes_level_to_remove = [str(code) for code in indicator_index.codes_of_level(1)]
+        set_valid_codes_description = indicator_index.codes_with_values()
 
         # List all codes in proportionality (both levels of MultiIndex)
         level_one_columns = df_proportionality.columns.get_level_values(0).unique().tolist()
@@ -385,7 +376,6 @@ class SpProportionalityValidator(BaseValidator):
             set_valid_codes_prop = set_valid_codes_prop.union(codes_cleaned)
 
         # Convert to integers for comparison
-        set_valid_codes_description = set([int(code) for code in set_valid_codes_description])
         set_valid_codes_prop = set([int(code) for code in set(set_valid_codes_prop)])
 
         # Compare codes between description and proportionality
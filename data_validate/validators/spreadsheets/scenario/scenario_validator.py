@@ -32,6 +32,8 @@ class SpScenarioValidator(BaseValidator):
     existence checks and report generation capabilities.
     """
 
+    READS = (SpScenario,)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
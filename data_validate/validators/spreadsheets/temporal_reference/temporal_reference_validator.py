@@ -33,6 +33,8 @@ class SpTemporalReferenceValidator(BaseValidator):
     existence checks and report generation capabilities.
     """
 
+    READS = (SpTemporalReference,)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -133,7 +135,7 @@ class SpTemporalReferenceValidator(BaseValidator):
                 return errors, []
 
         # Remove first row: This is actual year
-        column_series_symbol = SpTemporalReference.RequiredColumn.COLUMN_SYMBOL.iloc[1:]
+        column_series_symbol = self._data_model.RequiredColumn.COLUMN_SYMBOL.iloc[1:]
         years = column_series_symbol.unique()
 
         # Check if all years are greater than the current year
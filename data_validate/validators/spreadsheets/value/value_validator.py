@@ -61,6 +61,8 @@ class SpValueValidator(BaseValidator):
         DataFrames mapping for each model.
     """
 
+    READS = (SpValue, SpDescription, SpTemporalReference, SpScenario)
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -188,29 +190,14 @@ class SpValueValidator(BaseValidator):
         if errors:
             return errors, warnings
 
-        code_column_name = SpDescription.RequiredColumn.COLUMN_CODE.name
-        level_column_name = SpDescription.RequiredColumn.COLUMN_LEVEL.name
-        scenario_column_name = SpDescription.DynamicColumn.COLUMN_SCENARIO.name
-
-        # Prepare cleaned dataframes
-        # No-need to clean the values dataframe
-        df_values = self.model_dataframes[self.sp_name_value].copy()
-        # Need to clean the description and temporal reference dataframes
-        df_description, _ = DataCleaningProcessing.clean_dataframe_integers(
-            self.model_dataframes[self.sp_name_description],
-            self.sp_name_description,
-            [code_column_name],
-        )
-
-        level_one_codes = df_description[df_description[level_column_name] == "1"][code_column_name].astype(str).tolist()
+        indicator_index = self._data_models_context.indicator_index
+        column_index = self.model_sp_value.column_index
+        level_one_codes = [str(code) for code in indicator_index.codes_of_level(1)]
 
         # Process value columns
-        value_columns = df_values.columns.tolist()
         columns_to_ignore = self.global_required_columns[self.sp_name_value] + level_one_codes
-
-        valid_value_codes, invalid_columns = CollectionsProcessing.extract_numeric_ids_and_unmatched_strings_from_list(
-            value_columns, columns_to_ignore, self.list_scenarios
-        )
+        valid_value_codes = column_index.valid_codes
+        invalid_columns = column_index.unmatched_columns(columns_to_ignore)
 
         # Filter out columns containing ':'
         processed_invalid_columns = sorted({col for col in invalid_columns if ":" not in col})
@@ -218,20 +205,8 @@ class SpValueValidator(BaseValidator):
         if processed_invalid_columns:
             errors.append(f"{self.model_sp_value.filename}: Colunas inválidas: {processed_invalid_columns}.")
 
-        # Get filtered description codes using generic function
-        # Remove level 1 indicators
-        filtered_description_df = df_description[df_description[level_column_name] != "1"].copy()
-
-        # Remove level 2 indicators with scenario 0 if scenario column exists
-        if self.exists_scenario and scenario_column_name in filtered_description_df.columns:
-            filtered_description_df = filtered_description_df[
-                ~((filtered_description_df[level_column_name] == "2") & (filtered_description_df[scenario_column_name] == "0"))
-            ]
-
-        # Extract valid description codes
-        valid_description_codes, _ = CollectionsProcessing.extract_numeric_integer_ids_from_list(
-            id_values_list=set(filtered_description_df[code_column_name].astype(str))
-        )
+        # Description codes but level 1 and, if scenarios exist, level 2 with scenario 0
+        valid_description_codes = indicator_index.codes_with_values(skip_scenario_zero=self.exists_scenario)
 
         # Compare codes between description and values
         comparison_errors = CollectionsProcessing.find_differences_in_two_set_with_message(
@@ -275,8 +250,6 @@ class SpValueValidator(BaseValidator):
         if self.model_dataframes[self.sp_name_description].empty or self.model_dataframes[self.sp_name_temporal_reference].empty:
             return errors, warnings
 
-        code_column_name = SpDescription.RequiredColumn.COLUMN_CODE.name
-        level_column_name = SpDescription.RequiredColumn.COLUMN_LEVEL.name
         scenario_column_name = SpDescription.DynamicColumn.COLUMN_SCENARIO.name
         symbol_column_name = SpTemporalReference.RequiredColumn.COLUMN_SYMBOL.name
 
@@ -291,32 +264,28 @@ class SpValueValidator(BaseValidator):
         if errors:
             return errors, warnings
 
-        # Prepare cleaned dataframes
-        # No-need to clean the values dataframe
-        df_values = self.model_dataframes[self.sp_name_value].copy()
+        # Columns of the values grouped by the code before their first '-'
+        columns_by_prefix = self.model_sp_value.column_index.columns_by_prefix
 
-        # Need to clean the description and temporal reference dataframes
-        df_description, _ = DataCleaningProcessing.clean_dataframe_integers(
-            self.model_dataframes[self.sp_name_description],
-            self.sp_name_description,
-            local_required_columns[self.sp_name_description],
-        )
+        # Need to clean the temporal reference dataframe; the description is parsed in the indicator index
+        indicator_index = self._data_models_context.indicator_index
         df_temporal_reference, _ = DataCleaningProcessing.clean_dataframe_integers(
             self.model_dataframes[self.sp_name_temporal_reference],
             self.sp_name_temporal_reference,
             local_required_columns[self.sp_name_temporal_reference],
+            max_messages=0,
         )
 
         # Get temporal symbols once (sorted for consistency)
         temporal_symbols = sorted(df_temporal_reference[symbol_column_name].unique())
         first_year = temporal_symbols[0]
-        sp_value_columns = set(df_values.columns)
+        sp_value_columns = set(self.model_sp_value.column_index.columns)
 
         # Process each indicator efficiently
-        for _, row in df_description.iterrows():
-            code = str(row[code_column_name])
-            level = int(row[level_column_name])
-            scenario = int(row[scenario_column_name]) if self.exists_scenario else 0
+        for row in indicator_index.valid_rows(local_required_columns[self.sp_name_description]):
+            code = str(indicator_index.codes[row])
+            level = indicator_index.levels[row]
+            scenario = indicator_index.scenarios[row] if self.exists_scenario else 0
 
             # Generate expected combinations based on level and scenario
             expected_combinations = []
@@ -335,7 +304,7 @@ class SpValueValidator(BaseValidator):
                     errors.append(f"{self.model_sp_value.filename}: A coluna '{combination}' é obrigatória.")
 
             # Find actual combinations for this code
-            actual_combinations = [col for col in sp_value_columns if col.startswith(f"{code}-")]
+            actual_combinations = columns_by_prefix.get(code, [])
 
             # Check for extra combinations
             has_extra_error, extra_columns = CombinationsProcessing.find_extra_combinations(expected_combinations, actual_combinations)
@@ -370,6 +339,7 @@ class SpValueValidator(BaseValidator):
         - Only columns matching valid ID patterns are validated
         - "Dado indisponível" (DI) markers are allowed
         - Maximum 2 decimal places enforced for numeric values
+        - Rows are validated in chunks when a chunk size is configured
         """
         errors, warnings = [], []
 
@@ -381,19 +351,16 @@ class SpValueValidator(BaseValidator):
         if errors:
             return errors, warnings
 
-        id_column_name = SpValue.RequiredColumn.COLUMN_ID.name
-
-        # Prepare dataframe for validation using generic function
-        df_values = self.model_dataframes[self.sp_name_value].copy()
-        if id_column_name in df_values.columns:
-            df_values = df_values.drop(columns=[id_column_name])
-
-        # Get valid columns that match ID patterns
-        valid_columns, _ = CollectionsProcessing.categorize_strings_by_id_pattern_from_list(df_values.columns, self.list_scenarios)
+        # Columns that match ID patterns (the ID column never does)
+        df_values = self.model_dataframes[self.sp_name_value]
+        valid_columns = self.model_sp_value.column_index.valid_columns
 
         # Validate data values in columns using generic function
         validation_errors, validation_warnings = ValueProcessing.validate_data_values_in_columns(
-            df_values, valid_columns, self.model_sp_value.filename
+            df_values,
+            valid_columns,
+            self.model_sp_value.filename,
+            chunk_size=self._data_models_context.context.data_args.data_performance.chunk_size,
         )
 
         errors.extend(validation_errors)
@@ -4,15 +4,19 @@ File structure validator module for validating input folder structure and file p
 
 This module provides validation functionality to ensure that the input directory contains
 all required files, does not contain unexpected files or folders, and handles file conflicts
-between different formats (e.g., .xlsx and .csv).
+between different formats (e.g., .xlsx and .csv, or .csv and .parquet).
 """
 
 import os
+from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
 from data_validate.config import NamesEnum
 from data_validate.controllers.context.data_model_context import DataModelContext, GeneralContext
 from data_validate.controllers.report.validation_report import ValidationReport
+from data_validate.helpers.tools import ArchivePath
+from data_validate.helpers.tools.data_loader.engine.factory import ReaderFactory
+from data_validate.helpers.tools.data_loader.engine.scanner import FileScanner
 from data_validate.models import SpDescription
 from data_validate.validators.spreadsheets.base.base_validator import BaseValidator
 
@@ -35,10 +39,19 @@ class FileStructureValidator(BaseValidator):
         Accumulated list of validation errors.
     warnings : List[str]
         Accumulated list of validation warnings.
+    archive : ArchivePath or None
+        Root of the input .zip archive, or None when the input is a directory.
     dir_files : List[str]
-        List of file names in the input directory.
+        List of file names in the input directory (or archive root).
+    allowed_extensions : List[str]
+        Spreadsheet extensions accepted in the input folder, including the ones
+        registered through `ReaderFactory.register`.
     """
 
+    READS = (SpDescription,)
+    # Checks the listing of the input folder, not only the spreadsheets it reads
+    CACHEABLE = False
+
     def __init__(
         self,
         data_models_context: DataModelContext,
@@ -67,7 +80,10 @@ class FileStructureValidator(BaseValidator):
         self.context: GeneralContext = data_models_context.context
         self.errors: List[str] = []
         self.warnings: List[str] = []
-        self.dir_files: List[str] = os.listdir(self.context.data_args.data_file.input_folder)
+        input_folder = self.context.data_args.data_file.input_folder
+        self.archive = ArchivePath(input_folder) if ArchivePath.is_archive(input_folder) else None
+        self.dir_files: List[str] = [entry.name for entry in self.archive.iterdir()] if self.archive else os.listdir(input_folder)
+        self.allowed_extensions: List[str] = self._get_allowed_extensions()
 
         self._prepare_statement()
         self.run()
@@ -81,6 +97,61 @@ class FileStructureValidator(BaseValidator):
         """
         pass
 
+    def _get_allowed_extensions(self) -> List[str]:
+        """
+        Get the spreadsheet extensions the data loader can read.
+
+        Returns
+        -------
+        List[str]
+            The built-in spreadsheet extensions followed by the ones registered in the
+            reader factory, leaving out .qml (layer styles, not spreadsheets).
+        """
+        spreadsheet_info = self.context.config.spreadsheet_info
+        allowed_extensions = list(spreadsheet_info.ALLOWED_EXTENSIONS)
+        for ext in ReaderFactory.extensions():
+            if ext not in allowed_extensions and ext != spreadsheet_info.QML:
+                allowed_extensions.append(ext)
+        return allowed_extensions
+
+    def _is_dir(self, name: str) -> bool:
+        """
+        Check whether an entry of the input directory (or archive root) is a folder.
+
+        Args
+        ----
+        name : str
+            Entry name relative to the input directory or archive root.
+
+        Returns
+        -------
+        bool
+            True if the entry exists and is a folder, False otherwise.
+        """
+        if self.archive:
+            return (self.archive / name).is_dir()
+        is_dir, _ = self.context.file_system_utils.check_directory_exists(os.path.join(self.context.data_args.data_file.input_folder, name))
+        return is_dir
+
+    def _is_file(self, name: str) -> bool:
+        """
+        Check whether an entry of the input directory (or archive root) is a file.
+
+        Args
+        ----
+        name : str
+            Entry name relative to the input directory or archive root.
+
+        Returns
+        -------
+        bool
+            True if the entry exists and is a file, False otherwise.
+        """
+        if self.archive:
+            return (self.archive / name).is_file()
+        is_file, _ = self.context.file_system_utils.check_file_exists(os.path.join(self.context.data_args.data_file.input_folder, name))
+        return is_file
+
     def check_empty_directory(self) -> Tuple[bool, List[str]]:
         """
         Check if the input directory is empty.
@@ -96,7 +167,10 @@ class FileStructureValidator(BaseValidator):
                 - List[str]: List of error messages (empty if directory not empty)
         """
         local_errors = []
-        is_empty, message = self.context.file_system_utils.check_directory_is_empty(self.context.data_args.data_file.input_folder)
+        if self.archive:
+            is_empty = not self.dir_files
+        else:
+            is_empty, _ = self.context.file_system_utils.check_directory_is_empty(self.context.data_args.data_file.input_folder)
         if is_empty:
             local_errors.append(
                 self.context.language_manager.text(
@@ -126,26 +200,21 @@ class FileStructureValidator(BaseValidator):
         local_errors = []
         expected_files: Dict[str, List[str]] = self.context.config.spreadsheet_info.EXPECTED_FILES
         optional_files: Dict[str, List[str]] = self.context.config.spreadsheet_info.OPTIONAL_FILES
+        known_files = set(expected_files) | set(optional_files)
 
         if len(self.dir_files) == 1:
-            dir_path = os.path.join(self.context.data_args.data_file.input_folder, self.dir_files[0])
-            is_dir, _ = self.context.file_system_utils.check_directory_exists(dir_path)
-            if is_dir:
+            if self._is_dir(self.dir_files[0]):
                 local_errors.append(self.context.language_manager.text("validator_structure_error_files_not_in_folder"))
                 return not local_errors, local_errors
 
         for file_name in self.dir_files:
-            file_path = os.path.join(self.context.data_args.data_file.input_folder, file_name)
-            is_file, _ = self.context.file_system_utils.check_file_exists(file_path)
-            if not is_file:
+            if not self._is_file(file_name):
                 local_errors.append(self.context.language_manager.text("validator_structure_error_unexpected_folder").format(file_name=file_name))
                 continue
 
             file_base, file_ext = os.path.splitext(file_name)
 
-            if file_base in expected_files and file_ext in expected_files[file_base]:
-                continue
-            if file_base in optional_files and file_ext in optional_files[file_base]:
+            if file_base in known_files and file_ext in self.allowed_extensions:
                 continue
 
             local_errors.append(self.context.language_manager.text("validator_structure_error_unexpected_file").format(file_name=file_name))
@@ -158,7 +227,7 @@ class FileStructureValidator(BaseValidator):
 
         Validates that all required files defined in the configuration are present
         in the root directory, accepting any of the allowed file extensions
-        (.xlsx or .csv) for each file.
+        (.csv, .xlsx, .parquet, .feather or a registered one) for each file.
 
         Returns
         -------
@@ -170,16 +239,19 @@ class FileStructureValidator(BaseValidator):
         local_errors = []
         expected_files: Dict[str, List[str]] = self.context.config.spreadsheet_info.EXPECTED_FILES
 
-        for file_base, extensions in expected_files.items():
+        for file_base in expected_files:
             file_found = False
-            for ext in extensions:
-                file_path = os.path.join(self.context.data_args.data_file.input_folder, f"{file_base}{ext}")
-                is_file, _ = self.context.file_system_utils.check_file_exists(file_path)
-                if is_file:
+            for ext in self.allowed_extensions:
+                if self._is_file(f"{file_base}{ext}"):
                     file_found = True
                     break
             if not file_found:
-                local_errors.append(self.context.language_manager.text("validator_structure_error_missing_file").format(file_base=file_base))
+                local_errors.append(
+                    self.context.language_manager.text("validator_structure_error_missing_file").format(
+                        file_base=file_base,
+                        extensions=", ".join(self.allowed_extensions),
+                    )
+                )
         return not local_errors, local_errors
 
     def check_ignored_files_in_folder_root(self) -> Tuple[bool, List[str]]:
@@ -187,8 +259,10 @@ class FileStructureValidator(BaseValidator):
         Check for files that will be ignored due to format conflicts.
 
         Validates that there are no conflicting file formats in the root folder.
-        When both .xlsx and .csv files exist with the same base name, this creates
-        ambiguity in which file to use and is considered an error.
+        When the same base name exists in more than one format (e.g. .xlsx and .csv,
+        or .csv and .parquet), this creates ambiguity in which file to use and is
+        considered an error. The message names the format that the data loader reads,
+        following the scanner precedence.
 
         Returns
         -------
@@ -202,14 +276,25 @@ class FileStructureValidator(BaseValidator):
 
         for file_name in self.dir_files:
             file_base, file_ext = os.path.splitext(file_name)
-            if file_ext in [".xlsx", ".csv"]:
+            if file_ext in self.allowed_extensions:
                 if file_base not in file_groups:
                     file_groups[file_base] = []
                 file_groups[file_base].append(file_ext)
 
+        scanner = FileScanner(self.archive if self.archive else Path(self.context.data_args.data_file.input_folder))
         for file_base, extensions in file_groups.items():
-            if ".xlsx" in extensions and ".csv" in extensions:
+            if len(extensions) < 2:
+                continue
+            if sorted(extensions) == [".csv", ".xlsx"]:
                 local_errors.append(self.context.language_manager.text("validator_structure_error_conflicting_files").format(file_base=file_base))
+            else:
+                local_errors.append(
+                    self.context.language_manager.text("validator_structure_error_conflicting_formats").format(
+                        file_base=file_base,
+                        extensions=", ".join(sorted(extensions)),
+                        selected=scanner.select_extension(extensions),
+                    )
+                )
 
         return not local_errors, local_errors
 
@@ -0,0 +1,91 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks import BenchmarkRunner, compare_results
+from benchmarks.__main__ import main
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+class TestBenchmarkRunner:
+    """Test cases for the benchmark runner and its command line."""
+
+    def test_run_collects_stage_validator_and_memory_results(self, tmp_path: Path) -> None:
+        """Test that a run times every stage and validator and summarizes the memory of each stage."""
+        runner = BenchmarkRunner(
+            repeats=2,
+            work_folder=str(tmp_path / "work"),
+            extra_args=["--no-spellchecker"],
+            spec_overrides={"n_indicators": 12, "depth": 3, "n_rows": 20},
+        )
+
+        results = runner.run()
+
+        assert results["repeats"] == 2
+        small = results["sizes"][0]
+        assert small["size"] == "small" and small["errors"] == 0
+        assert {"total", "total/read_data", "total/configure", "total/validation", "total/report"} <= set(small["timings"])
+        assert "total/validation/SpValueValidator" in small["timings"]
+        assert all(timing["min"] <= timing["median"] <= timing["max"] for timing in small["timings"].values())
+        assert [stage["stage"] for stage in small["memory"]] == ["read_data", "configure", "validation", "report"]
+
+    def test_flatten_timings_adds_repeated_paths(self) -> None:
+        """Test that spans with the same path are added and open spans are skipped."""
+        spans = [
+            {
+                "name": "total",
+                "seconds": 3.0,
+                "children": [{"name": "report", "seconds": 1.0, "children": []}, {"name": "report", "seconds": 0.5, "children": []}],
+            },
+            {"name": "watch", "seconds": None, "children": []},
+        ]
+
+        assert BenchmarkRunner.flatten_timings(spans) == {"total": 3.0, "total/report": 1.5}
+
+    def test_unknown_size_raises(self) -> None:
+        """Test that only the size presets are accepted."""
+        with pytest.raises(ValueError):
+            BenchmarkRunner(sizes=["huge"])
+
+    def test_compare_results_lines_up_common_spans(self) -> None:
+        """Test that only the sizes and spans of both results are compared."""
+        baseline = {"sizes": [{"size": "small", "timings": {"total": {"median": 2.0}, "total/report": {"median": 0.0}}}]}
+        current = {
+            "sizes": [
+                {"size": "small", "timings": {"total": {"median": 1.0}, "total/report": {"median": 0.1}, "total/new": {"median": 1.0}}},
+                {"size": "large", "timings": {"total": {"median": 9.0}}},
+            ]
+        }
+
+        assert compare_results(baseline, current) == [
+            {"size": "small", "span": "total", "baseline": 2.0, "current": 1.0, "ratio": 0.5},
+            {"size": "small", "span": "total/report", "baseline": 0.0, "current": 0.1, "ratio": None},
+        ]
+
+    def test_command_line_generates_and_compares(self, tmp_path: Path, capsys) -> None:
+        """Test the generate and compare commands."""
+        assert main(["generate", "--output_folder", str(tmp_path / "input"), "--n-indicators", "10", "--depth", "3", "--n-rows", "5"]) == 0
+        assert sorted(path.stem for path in (tmp_path / "input").iterdir()) == [
+            "cenarios",
+            "composicao",
+            "descricao",
+            "dicionario",
+            "legenda",
+            "proporcionalidades",
+            "referencia_temporal",
+            "valores",
+        ]
+
+        results = {"sizes": [{"size": "small", "timings": {"total": {"median": 2.0}}}]}
+        for name in ("old.json", "new.json"):
+            (tmp_path / name).write_text(json.dumps(results), encoding="utf-8")
+        assert main(["compare", str(tmp_path / "old.json"), str(tmp_path / "new.json")]) == 0
+        assert "1.00x" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.benchmark_runner import BenchmarkRunner
+from benchmarks.dataset_generator import DatasetGenerator, DatasetSpec
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _validate(spec: DatasetSpec, tmp_path: Path):
+    """Generate a submission and validate it without the spell checker."""
+    generator = DatasetGenerator(spec)
+    input_folder = generator.write(str(tmp_path / "input"))
+    processor = BenchmarkRunner(extra_args=["--no-spellchecker"])._validate(input_folder, str(tmp_path / "output"))
+    return generator, processor
+
+
+class TestDatasetGenerator:
+    """Test cases for the synthetic submission generator."""
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            DatasetSpec(n_indicators=12, depth=3, n_rows=20),
+            DatasetSpec(n_indicators=40, depth=5, n_rows=30, future_years=3, n_scenarios=3, scenario_share=1.0, legend_groups=6, seed=7),
+            DatasetSpec(n_indicators=15, depth=4, n_rows=10, n_scenarios=1, scenario_share=0.0, proportionality=False, seed=3),
+        ],
+    )
+    def test_generated_submission_is_valid(self, spec: DatasetSpec, tmp_path: Path) -> None:
+        """Test that a submission without injected errors passes every validation."""
+        generator, processor = _validate(spec, tmp_path)
+
+        assert generator.injected_errors == 0
+        assert processor.validation_reports.get_total_errors() == 0
+        assert processor.validation_reports.get_total_warnings() == 0
+
+    def test_injected_errors_are_reported(self, tmp_path: Path) -> None:
+        """Test that the injected invalid cells are reported as errors."""
+        generator, processor = _validate(DatasetSpec(n_indicators=12, depth=3, n_rows=20, error_rate=0.05), tmp_path)
+
+        assert generator.injected_errors > 0
+        assert processor.validation_reports.get_total_errors() > 0
+
+    def test_same_seed_writes_same_submission(self, tmp_path: Path) -> None:
+        """Test that the submission only depends on the spec."""
+        spec = DatasetSpec(n_indicators=20, depth=4, n_rows=15, error_rate=0.01, seed=42)
+        first = Path(DatasetGenerator(spec).write(str(tmp_path / "first")))
+        second = Path(DatasetGenerator(spec).write(str(tmp_path / "second")))
+
+        assert sorted(path.name for path in first.iterdir()) == sorted(path.name for path in second.iterdir())
+        assert all((first / path.name).read_bytes() == (second / path.name).read_bytes() for path in first.iterdir())
+
+    @pytest.mark.parametrize(
+        "parameters", [{"depth": 2}, {"n_indicators": 3, "depth": 4}, {"n_scenarios": 0}, {"error_rate": 1.5}, {"legend_groups": 0}]
+    )
+    def test_invalid_spec_raises(self, parameters: dict) -> None:
+        """Test that out of range parameters are rejected."""
+        with pytest.raises(ValueError):
+            DatasetSpec(**parameters)
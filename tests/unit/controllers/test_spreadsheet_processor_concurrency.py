@@ -0,0 +1,78 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Concurrency stress tests for SpreadsheetProcessor.
+
+Validates several sample submissions in parallel threads of the same process and
+checks that every run reports exactly what a serial run of the same folder reports.
+"""
+
+import contextlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs
+
+INPUT_ROOT = Path(__file__).resolve().parents[3] / "data" / "input"
+FOLDERS = ["data_ground_truth_01", "data_errors_01", "data_errors_09", "data_errors_13"]
+
+ReportSnapshot = List[Tuple[str, List[str], List[str], bool]]
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _validate(folder: str, output_folder: Path) -> ReportSnapshot:
+    """Validate a sample folder and return its reports."""
+    data_args = DataArgs(
+        argv=[
+            "--input_folder",
+            str(INPUT_ROOT / folder),
+            "--output_folder",
+            str(output_folder),
+            "--no-time",
+            "--no-version",
+        ]
+    )
+    context = GeneralContext(data_args=data_args)
+    processor = SpreadsheetProcessor(context=context)
+    context.finalize()
+    return [
+        (report.test_name, list(map(str, report.errors)), list(map(str, report.warnings)), report.was_executed)
+        for report in processor.validation_reports
+    ]
+
+
+@pytest.mark.skipif(not INPUT_ROOT.is_dir(), reason="Sample input folders are not available.")
+class TestSpreadsheetProcessorConcurrency:
+    """Test suite for running several validations concurrently in one process."""
+
+    def test_parallel_runs_match_serial_runs(self, tmp_path: Path) -> None:
+        """Test that folders validated in parallel threads give the same reports as serial runs."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = {folder: _validate(folder, tmp_path / "serial" / folder) for folder in FOLDERS}
+
+            # Each folder runs several times, interleaved with the others
+            tasks = [(folder, tmp_path / "parallel" / f"{folder}_{repetition}") for repetition in range(3) for folder in FOLDERS]
+            with ThreadPoolExecutor(max_workers=len(FOLDERS)) as executor:
+                results = list(executor.map(lambda task: _validate(*task), tasks))
+
+        for (folder, _), result in zip(tasks, results):
+            assert result == expected[folder], f"Concurrent run of {folder} differs from the serial run."
+
+    def test_serial_runs_do_not_leak_state(self, tmp_path: Path) -> None:
+        """Test that validating other folders first does not change the reports of a folder."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = _validate(FOLDERS[1], tmp_path / "first")
+            for folder in FOLDERS[2:]:
+                _validate(folder, tmp_path / folder)
+            again = _validate(FOLDERS[1], tmp_path / "again")
+
+        assert again == first
@@ -0,0 +1,82 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Tests of the dictionary spreadsheet handling in SpreadsheetProcessor.
+
+The dictionary words are only used by the spell checker, but the structure of the
+dictionary is reported with or without `--no-spellchecker`.
+"""
+
+import contextlib
+import io
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs
+from data_validate.models import SpDictionary
+
+SUBMISSION = {
+    "descricao.csv": "codigo|nivel|nome_simples|nome_completo|unidade|desc_simples|desc_completa|cenario|relacao|fontes|meta|legenda\n"
+    "1|1|Indicador|Indicador completo||Descrição.|Descrição completa.|0|1|Fonte|Meta|\n"
+    "2|2|Seca|Índice de seca||Descrição.|Descrição completa.|0|1|Fonte|Meta|\n",
+    "composicao.csv": "codigo_pai|codigo_filho\n1|2\n",
+    "valores.csv": "id|2-2015\n1100015|0.68\n",
+    "referencia_temporal.csv": "nome|descricao|simbolo\n2015|Tempo Presente.|2015\n",
+    # Dictionary without the 'palavra' header: the first word is read as the column name
+    "dicionario.csv": "AdaptaBrasil\nassignado\ndesassignado\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def submission(tmp_path: Path) -> Path:
+    """Write the sample submission and return its folder."""
+    folder = tmp_path / "submission"
+    folder.mkdir()
+    for name, content in SUBMISSION.items():
+        (folder / name).write_text(content, encoding="utf-8")
+    return folder
+
+
+def _validate(input_folder: Path, output_folder: Path, *extra_args: str) -> SpreadsheetProcessor:
+    """Validate a folder and return the processor."""
+    data_args = DataArgs(argv=["--input_folder", str(input_folder), "--output_folder", str(output_folder), "--no-time", "--no-version", *extra_args])
+    context = GeneralContext(data_args=data_args)
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor = SpreadsheetProcessor(context=context)
+    context.finalize()
+    return processor
+
+
+def _dictionary_messages(processor: SpreadsheetProcessor) -> Tuple[List[str], List[str]]:
+    """Errors and warnings of the reports about the dictionary file."""
+    errors = [str(error) for report in processor.validation_reports for error in report.errors if str(error).startswith("dicionario.csv")]
+    warnings = [str(warning) for report in processor.validation_reports for warning in report.warnings if str(warning).startswith("dicionario.csv")]
+    return errors, warnings
+
+
+class TestSpreadsheetProcessorDictionary:
+    """Test suite for the dictionary structure checks."""
+
+    def test_structure_is_reported_without_spellchecker(self, submission: Path, tmp_path: Path) -> None:
+        """Test that --no-spellchecker keeps the dictionary structure errors and warnings."""
+        processor = _validate(submission, tmp_path / "out", "--no-spellchecker")
+
+        errors, warnings = _dictionary_messages(processor)
+        assert "dicionario.csv: Coluna 'palavra' esperada mas não foi encontrada." in errors
+        assert warnings
+        assert (errors, warnings) == _dictionary_messages(_validate(submission, tmp_path / "out"))
+
+    def test_dictionary_is_read_header_only_without_spellchecker(self, submission: Path, tmp_path: Path) -> None:
+        """Test that --no-spellchecker reads only the header of the dictionary."""
+        processor = _validate(submission, tmp_path / "out", "--no-spellchecker")
+
+        dictionary = processor.data_models_context.get_instance_of(SpDictionary)
+        assert dictionary.data_loader_model.header_only is True
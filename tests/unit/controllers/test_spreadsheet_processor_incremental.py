@@ -0,0 +1,81 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Incremental re-validation tests for SpreadsheetProcessor.
+
+Validates a copy of a sample submission with `--reuse-results`, replaces one spreadsheet
+and checks that only the validators reading it run again, with the same reports as
+a full run.
+"""
+
+import contextlib
+import io
+import shutil
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs
+from data_validate.validators import SpDescriptionValidator, SpProportionalityValidator, SpScenarioValidator
+
+INPUT_ROOT = Path(__file__).resolve().parents[3] / "data" / "input"
+
+ReportSnapshot = List[Tuple[str, List[str], List[str], bool]]
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _validate(input_folder: Path, output_folder: Path, *extra_args: str) -> ReportSnapshot:
+    """Validate a folder and return its reports."""
+    data_args = DataArgs(argv=["--input_folder", str(input_folder), "--output_folder", str(output_folder), "--no-time", "--no-version", *extra_args])
+    context = GeneralContext(data_args=data_args)
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor = SpreadsheetProcessor(context=context)
+    context.finalize()
+    return [
+        (report.test_name, list(map(str, report.errors)), list(map(str, report.warnings)), report.was_executed)
+        for report in processor.validation_reports
+    ]
+
+
+@pytest.mark.skipif(not INPUT_ROOT.is_dir(), reason="Sample input folders are not available.")
+class TestSpreadsheetProcessorIncremental:
+    """Test suite for the --reuse-results option."""
+
+    def test_only_validators_of_changed_sheets_run_again(self, tmp_path: Path, monkeypatch, mocker) -> None:
+        """Test that editing the proportionality spreadsheet re-runs only the validators reading it."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        submission = tmp_path / "submission"
+        shutil.copytree(INPUT_ROOT / "data_ground_truth_01", submission)
+
+        first = _validate(submission, tmp_path / "out", "--reuse-results")
+        assert first == _validate(submission, tmp_path / "out")
+
+        # Edit only the proportionality spreadsheet
+        shutil.copyfile(INPUT_ROOT / "data_errors_01" / "proporcionalidades.xlsx", submission / "proporcionalidades.xlsx")
+        proportionality_run = mocker.spy(SpProportionalityValidator, "run")
+        scenario_run = mocker.spy(SpScenarioValidator, "run")
+        description_run = mocker.spy(SpDescriptionValidator, "run")
+
+        second = _validate(submission, tmp_path / "out", "--reuse-results")
+
+        assert proportionality_run.call_count == 1
+        assert scenario_run.call_count == 0
+        assert description_run.call_count == 0
+        assert second != first
+        assert second == _validate(submission, tmp_path / "out")
+
+    def test_changed_options_do_not_reuse_results(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that results stored with other options are not reused."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        submission = INPUT_ROOT / "data_errors_01"
+
+        _validate(submission, tmp_path / "out", "--reuse-results")
+        reused = _validate(submission, tmp_path / "out", "--reuse-results", "--no-warning-titles-length")
+
+        assert reused == _validate(submission, tmp_path / "out", "--no-warning-titles-length")
@@ -0,0 +1,104 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Tests of the legend references of the description in SpreadsheetProcessor.
+
+A legend reference written with a decimal comma (e.g. "1,0") is not a legend code:
+the indicator is reported without legend and its values are checked against the
+default range.
+"""
+
+import contextlib
+import io
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs
+
+
+def _submission(legend_reference: str) -> dict:
+    """Files of a submission whose level 3 indicator references the given legend."""
+    return {
+        "descricao.csv": "codigo|nivel|nome_simples|nome_completo|unidade|desc_simples|desc_completa|relacao|fontes|meta|legenda\n"
+        "1|1|Indicador|Indicador completo||Descrição.|Descrição completa.|1|Fonte|Meta|\n"
+        "2|2|Seca|Índice de seca||Descrição.|Descrição completa.|1|Fonte|Meta|1\n"
+        f"3|3|Chuva|Índice de chuva||Descrição.|Descrição completa.|1|Fonte|Meta|{legend_reference}\n",
+        "composicao.csv": "codigo_pai|codigo_filho\n1|2\n2|3\n",
+        "valores.csv": "id|2-2015|3-2015\n1100015|0.5|5\n",
+        "referencia_temporal.csv": "nome|descricao|simbolo\n2015|Tempo Presente.|2015\n",
+        "legenda.csv": "codigo|label|cor|minimo|maximo|ordem\n"
+        "1|Baixo|#FF8300|0|0.5|1\n1|Alto|#F40000|0.51|1|2\n1|Dado indisponível|#DCDCDC|||3\n"
+        "2|Baixo|#FF8300|0|5|1\n2|Alto|#F40000|5.01|10|2\n2|Dado indisponível|#DCDCDC|||3\n",
+    }
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _validate(tmp_path: Path, legend_reference: str) -> SpreadsheetProcessor:
+    """Write and validate the submission, returning the processor."""
+    submission = tmp_path / "submission"
+    submission.mkdir()
+    for name, content in _submission(legend_reference).items():
+        (submission / name).write_text(content, encoding="utf-8")
+
+    data_args = DataArgs(
+        argv=[
+            "--input_folder",
+            str(submission),
+            "--output_folder",
+            str(tmp_path / "out"),
+            "--no-time",
+            "--no-version",
+            "--no-spellchecker",
+        ]
+    )
+    context = GeneralContext(data_args=data_args)
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor = SpreadsheetProcessor(context=context)
+    context.finalize()
+    return processor
+
+
+def _messages(processor: SpreadsheetProcessor, kind: str) -> List[str]:
+    """All errors or warnings of the reports."""
+    return [str(message) for report in processor.validation_reports for message in getattr(report, kind)]
+
+
+class TestSpreadsheetProcessorLegendCodes:
+    """Test suite for legend references that are not integer texts."""
+
+    MISSING_LEGEND = (
+        "descricao.csv: Indicadores de níveis diferentes de 1 e 2 devem ter referência de legenda. Indicadores sem referência em legenda.csv: ['3']."
+    )
+    DEFAULT_RANGE = "valores.csv, linha 2: O valor 5 está fora do intervalo da legenda padrão (0 a 1) para a coluna '3-2015'."
+
+    def test_decimal_comma_legend_is_not_a_reference(self, tmp_path: Path) -> None:
+        """Test that a "1,0" legend is reported as a missing reference and the default range is used."""
+        processor = _validate(tmp_path, "1,0")
+
+        errors = _messages(processor, "errors")
+        assert self.MISSING_LEGEND in errors
+        assert self.DEFAULT_RANGE in errors
+        assert "legenda.csv: Códigos de legenda não referenciados em descricao.csv: [2]." in _messages(processor, "warnings")
+
+    def test_decimal_comma_legend_does_not_select_the_legend(self, tmp_path: Path) -> None:
+        """Test that a "2,0" legend does not move the range check to legend 2."""
+        processor = _validate(tmp_path, "2,0")
+
+        errors = _messages(processor, "errors")
+        assert self.MISSING_LEGEND in errors
+        assert self.DEFAULT_RANGE in errors
+
+    def test_integer_legend_is_a_reference(self, tmp_path: Path) -> None:
+        """Test that a "2" legend selects legend 2, whose range holds the value."""
+        processor = _validate(tmp_path, "2")
+
+        errors = _messages(processor, "errors")
+        assert self.MISSING_LEGEND not in errors
+        assert not [error for error in errors if "'3-2015'" in error]
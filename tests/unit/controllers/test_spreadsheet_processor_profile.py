@@ -0,0 +1,63 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Profiling tests for SpreadsheetProcessor.
+
+Validates a sample submission with `--profile` and `--profile-memory` and checks the
+profiling files written to the output folder.
+"""
+
+import contextlib
+import io
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs
+
+INPUT_ROOT = Path(__file__).resolve().parents[3] / "data" / "input"
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.skipif(not INPUT_ROOT.is_dir(), reason="Sample input folders are not available.")
+class TestSpreadsheetProcessorProfile:
+    """Test suite for the --profile and --profile-memory options."""
+
+    def test_profile_files_are_written_to_output_folder(self, tmp_path: Path) -> None:
+        """Test that the CPU profile, the collapsed stacks and the memory summary per stage are written."""
+        output_folder = tmp_path / "out"
+        data_args = DataArgs(
+            argv=[
+                "--input_folder",
+                str(INPUT_ROOT / "data_ground_truth_01"),
+                "--output_folder",
+                str(output_folder),
+                "--no-time",
+                "--no-version",
+                "--no-spellchecker",
+                "--profile",
+                "--profile-memory",
+            ]
+        )
+        context = GeneralContext(data_args=data_args)
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            SpreadsheetProcessor(context=context)
+        context.finalize()
+
+        prof_path = output_folder / "data_ground_truth_01_profile.prof"
+        collapsed_path = output_folder / "data_ground_truth_01_profile.collapsed"
+        memory_path = output_folder / "data_ground_truth_01_memory.json"
+        assert f"Perfil de execução salvo em: {prof_path}" in stdout.getvalue()
+        assert any(function[2] == "_build_pipeline" for function in pstats.Stats(str(prof_path)).stats)
+        assert "(_build_pipeline);" in collapsed_path.read_text(encoding="utf-8")
+        memory = json.loads(memory_path.read_text(encoding="utf-8"))
+        assert [stage["stage"] for stage in memory["stages"]] == ["read_data", "configure", "validation", "report"]
+        assert all(len(stage["top_allocations"]) <= memory["top_n"] for stage in memory["stages"])
@@ -0,0 +1,109 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Tests of SpreadsheetProcessor with a reader registered through ReaderFactory.register.
+
+Validates a small submission whose legend is a pipe-separated `.psv` file and checks
+that the structure validator accepts the registered extension and that the legend
+is loaded like its `.csv` counterpart.
+"""
+
+import contextlib
+import io
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs
+from data_validate.helpers.tools.data_loader.engine.factory import ReaderFactory
+from data_validate.helpers.tools.data_loader.readers.csv_reader import CSVReader
+from data_validate.models import SpLegend
+
+SUBMISSION = {
+    "descricao.csv": "codigo|nivel|nome_simples|nome_completo|unidade|desc_simples|desc_completa|cenario|relacao|fontes|meta|legenda\n"
+    "1|1|Indicador|Indicador completo||Descrição.|Descrição completa.|0|1|Fonte|Meta|\n"
+    "2|2|Seca|Índice de seca||Descrição.|Descrição completa.|0|1|Fonte|Meta|1\n",
+    "composicao.csv": "codigo_pai|codigo_filho\n1|2\n",
+    "valores.csv": "id|2-2015\n1100015|0.68\n",
+    "referencia_temporal.csv": "nome|descricao|simbolo\n2015|Tempo Presente.|2015\n",
+    "legenda.psv": "codigo|label|cor|minimo|maximo|ordem\n1|Baixo|#FF8300|0|0.5|1\n1|Alto|#F40000|0.5|1|2\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def psv_reader():
+    """Register the CSV reader for `.psv` files during the test."""
+    ReaderFactory.register(".psv", CSVReader)
+    yield
+    ReaderFactory.unregister(".psv")
+
+
+def _write_submission(folder: Path, files: dict) -> Path:
+    """Write the files of a submission and return its folder."""
+    folder.mkdir()
+    for name, content in files.items():
+        (folder / name).write_text(content, encoding="utf-8")
+    return folder
+
+
+def _validate(input_folder: Path, output_folder: Path) -> SpreadsheetProcessor:
+    """Validate a folder and return the processor."""
+    data_args = DataArgs(
+        argv=[
+            "--input_folder",
+            str(input_folder),
+            "--output_folder",
+            str(output_folder),
+            "--no-time",
+            "--no-version",
+            "--no-spellchecker",
+        ]
+    )
+    context = GeneralContext(data_args=data_args)
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor = SpreadsheetProcessor(context=context)
+    context.finalize()
+    return processor
+
+
+def _errors(processor: SpreadsheetProcessor) -> List[str]:
+    """All error messages of the reports."""
+    return [str(error) for report in processor.validation_reports for error in report.errors]
+
+
+class TestSpreadsheetProcessorRegisteredReader:
+    """Test suite for submissions using an extension registered in the reader factory."""
+
+    def test_registered_extension_is_accepted(self, tmp_path: Path, psv_reader) -> None:
+        """Test that a `.psv` legend is neither reported as unexpected nor ignored."""
+        submission = _write_submission(tmp_path / "submission", SUBMISSION)
+
+        processor = _validate(submission, tmp_path / "out")
+
+        assert "O arquivo 'legenda.psv' não é esperado." not in _errors(processor)
+        legend = processor.data_models_context.get_instance_of(SpLegend)
+        assert legend.data_loader_model.raw_data["label"].tolist() == ["Baixo", "Alto"]
+
+    def test_missing_file_lists_registered_extension(self, tmp_path: Path, psv_reader) -> None:
+        """Test that the missing file message lists the registered extension."""
+        files = {name: content for name, content in SUBMISSION.items() if name != "valores.csv"}
+        submission = _write_submission(tmp_path / "submission", files)
+
+        processor = _validate(submission, tmp_path / "out")
+
+        assert "valores: O arquivo esperado não foi encontrado. Use uma das extensões: .csv, .xlsx, .parquet, .feather, .psv." in _errors(processor)
+
+    def test_unregistered_extension_is_unexpected(self, tmp_path: Path) -> None:
+        """Test that a `.psv` file is unexpected when no reader handles it."""
+        submission = _write_submission(tmp_path / "submission", SUBMISSION)
+
+        processor = _validate(submission, tmp_path / "out")
+
+        assert "O arquivo 'legenda.psv' não é esperado." in _errors(processor)
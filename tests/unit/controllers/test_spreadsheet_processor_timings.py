@@ -0,0 +1,82 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Timing tests for SpreadsheetProcessor.
+
+Validates a sample submission with `--timings` and `--report-timings` and checks the
+written tree of elapsed times and the timings section of the HTML report.
+"""
+
+import contextlib
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor
+from data_validate.helpers.base import DataArgs
+
+INPUT_ROOT = Path(__file__).resolve().parents[3] / "data" / "input"
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _process(input_folder: Path, output_folder: Path, *extra_args: str) -> SpreadsheetProcessor:
+    """Validate a folder and return its processor."""
+    data_args = DataArgs(argv=["--input_folder", str(input_folder), "--output_folder", str(output_folder), "--no-time", "--no-version", *extra_args])
+    context = GeneralContext(data_args=data_args)
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor = SpreadsheetProcessor(context=context)
+    context.finalize()
+    return processor
+
+
+def _find(span: dict, name: str) -> dict:
+    """Return the first span of a serialized tree with the given name."""
+    if span["name"] == name:
+        return span
+    for child in span["children"]:
+        found = _find(child, name)
+        if found is not None:
+            return found
+    return None
+
+
+@pytest.mark.skipif(not INPUT_ROOT.is_dir(), reason="Sample input folders are not available.")
+class TestSpreadsheetProcessorTimings:
+    """Test suite for the --timings and --report-timings options."""
+
+    def test_timings_file_holds_stage_tree(self, tmp_path: Path) -> None:
+        """Test that the timings file holds the stages, files, models, validators and checks of the run."""
+        timings_path = tmp_path / "timings.json"
+
+        _process(INPUT_ROOT / "data_ground_truth_01", tmp_path / "out", "--no-spellchecker", "--timings", str(timings_path))
+
+        total = json.loads(timings_path.read_text(encoding="utf-8"))["timings"][0]
+        assert total["name"] == "total"
+        assert [stage["name"] for stage in total["children"]] == ["read_data", "configure", "validation", "report"]
+        assert "valores.xlsx" in [span["name"] for span in _find(total, "read_data")["children"]]
+        assert "SpValue" in [span["name"] for span in _find(total, "configure")["children"]]
+        value_validator = _find(total, "SpValueValidator")
+        assert value_validator is not None
+        assert value_validator["children"]
+        assert [span["name"] for span in _find(total, "report")["children"]] == ["html_report", "pdf_report"]
+        assert all(stage["seconds"] >= 0 for stage in total["children"])
+
+    def test_report_timings_adds_html_section(self, tmp_path: Path) -> None:
+        """Test that the timings section is shown in the HTML report only with --report-timings."""
+        input_folder = INPUT_ROOT / "data_ground_truth_01"
+
+        timed = _process(input_folder, tmp_path / "timed", "--no-spellchecker", "--report-timings")
+        untimed = _process(input_folder, tmp_path / "untimed", "--no-spellchecker")
+
+        timed_html = Path(next(path for path in timed.report_files if path.endswith(".html"))).read_text(encoding="utf-8")
+        untimed_html = Path(next(path for path in untimed.report_files if path.endswith(".html"))).read_text(encoding="utf-8")
+        assert 'id="timings" style="display: block"' in timed_html
+        assert "SpValueValidator: " in timed_html
+        assert 'id="timings" style="display: none"' in untimed_html
+        assert "SpValueValidator: " not in untimed_html
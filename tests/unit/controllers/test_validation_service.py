@@ -0,0 +1,127 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Unit tests for the validation service.
+
+Covers argument validation, the bounded job queue, per-job timeouts and the HTTP
+front end, using the sample submissions of the repository.
+"""
+
+import json
+import queue
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from data_validate.controllers import ValidationServer, ValidationService
+
+INPUT_ROOT = Path(__file__).resolve().parents[3] / "data" / "input"
+EXTRA_ARGS = ["--no-time", "--no-version", "--no-spellchecker"]
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files of the runs to the test folder instead of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
+class TestValidationService:
+    """Test suite for ValidationService."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"workers": 0}, {"workers": True}, {"queue_size": 0}, {"queue_size": 1.5}, {"timeout": 0}, {"timeout": "10"}],
+    )
+    def test_invalid_arguments(self, tmp_path: Path, kwargs) -> None:
+        """Test that non-positive sizes and timeouts are rejected."""
+        with pytest.raises(ValueError):
+            ValidationService(str(tmp_path), **kwargs)
+
+    def test_submit_raises_when_queue_is_full(self, tmp_path: Path) -> None:
+        """Test that the queue holds at most queue_size jobs."""
+        service = ValidationService(str(tmp_path), queue_size=2)
+        service.submit("a")
+        service.submit("b")
+
+        with pytest.raises(queue.Full):
+            service.submit("c")
+        assert service.queued_jobs() == 2
+
+    def test_submit_builds_job(self, tmp_path: Path) -> None:
+        """Test that jobs get their own output folder and the service arguments."""
+        service = ValidationService(str(tmp_path), extra_args=["--no-time"])
+        job = service.submit("input", extra_args=["--no-version"])
+
+        assert job.status == "queued"
+        assert job.output_folder == str(tmp_path / job.job_id)
+        assert job.extra_args == ["--no-time", "--no-version"]
+        assert service.get_job(job.job_id) is job
+        assert service.get_job("unknown") is None
+
+
+@pytest.mark.skipif(not INPUT_ROOT.is_dir(), reason="Sample input folders are not available.")
+class TestValidationServiceWorkers:
+    """Test suite for jobs validated by warm worker processes."""
+
+    def test_jobs_are_validated_and_timeouts_replace_the_worker(self, tmp_path: Path) -> None:
+        """Test a successful job, a timed-out job and a job run by the replacement worker."""
+        service = ValidationService(str(tmp_path), workers=1, timeout=60, extra_args=EXTRA_ARGS)
+        service.start()
+        try:
+            first = service.submit(str(INPUT_ROOT / "data_errors_01"))
+            assert first.wait(120)
+
+            service.timeout = 0.001
+            timed_out = service.submit(str(INPUT_ROOT / "data_errors_01"))
+            assert timed_out.wait(120)
+
+            service.timeout = 60
+            again = service.submit(str(INPUT_ROOT / "data_errors_01"))
+            assert again.wait(120)
+        finally:
+            service.stop()
+
+        assert first.status == "ok"
+        assert first.summary["errors"] > 0
+        assert first.summary["reports"] == [str(Path(first.output_folder) / "data_errors_01_report.html")]
+        assert timed_out.status == "timeout"
+        assert again.status == "ok"
+        assert (again.summary["errors"], again.summary["warnings"]) == (first.summary["errors"], first.summary["warnings"])
+
+    def test_http_front_end(self, tmp_path: Path) -> None:
+        """Test the health, validation and job endpoints."""
+        service = ValidationService(str(tmp_path), workers=1, timeout=60, extra_args=EXTRA_ARGS)
+        server = ValidationServer(("127.0.0.1", 0), service)
+        service.start()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        def request(path, body=None):
+            data = None if body is None else json.dumps(body).encode("utf-8")
+            try:
+                with urllib.request.urlopen(urllib.request.Request(base_url + path, data=data), timeout=120) as response:
+                    return response.status, json.loads(response.read())
+            except urllib.error.HTTPError as error:
+                return error.code, json.loads(error.read())
+
+        try:
+            assert request("/health") == (200, {"status": "ok", "workers": 1, "queued_jobs": 0})
+
+            status, job = request("/validate", {"input_folder": str(INPUT_ROOT / "data_errors_01")})
+            assert status == 200
+            assert job["status"] == "ok"
+            assert request(f"/jobs/{job['job_id']}") == (200, job)
+
+            status, job = request("/validate", {"input_folder": str(tmp_path / "missing")})
+            assert status == 200
+            assert job["status"] == "failed"
+
+            assert request("/validate", {"args": []})[0] == 400
+            assert request("/jobs/unknown")[0] == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.stop()
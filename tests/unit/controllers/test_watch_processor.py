@@ -0,0 +1,108 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""
+Tests for the watch mode (`--watch`).
+
+Watches a copy of a sample submission, replaces one spreadsheet and checks that the
+submission is validated again, with only the validators reading the changed
+spreadsheet running and the same reports as a full run.
+"""
+
+import contextlib
+import io
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from data_validate.controllers import GeneralContext, SpreadsheetProcessor, WatchProcessor
+from data_validate.helpers.base import DataArgs
+from data_validate.validators import SpProportionalityValidator, SpScenarioValidator
+
+INPUT_ROOT = Path(__file__).resolve().parents[3] / "data" / "input"
+
+ReportSnapshot = List[Tuple[str, List[str], List[str], bool]]
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path: Path, monkeypatch) -> None:
+    """Write the log files and the result cache of the runs to the test folder."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def _context(input_folder: Path, output_folder: Path, *extra_args: str) -> GeneralContext:
+    """Build the context of a run."""
+    data_args = DataArgs(argv=["--input_folder", str(input_folder), "--output_folder", str(output_folder), "--no-time", "--no-version", *extra_args])
+    return GeneralContext(data_args=data_args)
+
+
+def _snapshot(processor: SpreadsheetProcessor) -> ReportSnapshot:
+    """Return the reports of a run."""
+    return [
+        (report.test_name, list(map(str, report.errors)), list(map(str, report.warnings)), report.was_executed)
+        for report in processor.validation_reports
+    ]
+
+
+class TestWatchProcessor:
+    """Test suite for the --watch option."""
+
+    def test_failed_run_does_not_stop_watching(self, tmp_path: Path, mocker, capsys) -> None:
+        """Test that a run raising an exception is reported and the watch goes on."""
+        context = _context(tmp_path, tmp_path / "out", "--watch")
+        mocker.patch("data_validate.controllers.watch_processor.SpreadsheetProcessor", side_effect=RuntimeError("planilha em uso"))
+        watch_processor = WatchProcessor(context=context, interval=0.01)
+
+        watch_processor.validate()
+
+        assert watch_processor.runs == 1
+        assert watch_processor.processor is None
+        assert "Falha na validação: RuntimeError: planilha em uso" in capsys.readouterr().out
+
+    def test_output_folder_inside_input_is_not_watched(self, tmp_path: Path) -> None:
+        """Test that reports written inside the input folder do not trigger new runs."""
+        (tmp_path / "out").mkdir()
+        (tmp_path / "out" / "report.html").write_text("report", encoding="utf-8")
+        (tmp_path / "descricao.csv").write_text("codigo", encoding="utf-8")
+
+        watch_processor = WatchProcessor(context=_context(tmp_path, tmp_path / "out", "--watch"), interval=0.01)
+
+        assert list(watch_processor.watcher.signature) == ["descricao.csv"]
+
+    @pytest.mark.skipif(not INPUT_ROOT.is_dir(), reason="Sample input folders are not available.")
+    def test_changed_spreadsheet_is_validated_again(self, tmp_path: Path, mocker) -> None:
+        """Test that saving a spreadsheet re-runs only the validators reading it, with the same reports as a full run."""
+        submission = tmp_path / "submission"
+        shutil.copytree(INPUT_ROOT / "data_ground_truth_01", submission)
+        context = _context(submission, tmp_path / "out", "--watch")
+        watch_processor = WatchProcessor(context=context, interval=0.05)
+        proportionality_run = mocker.spy(SpProportionalityValidator, "run")
+        scenario_run = mocker.spy(SpScenarioValidator, "run")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            thread = threading.Thread(target=watch_processor.run, kwargs={"max_runs": 2}, daemon=True)
+            thread.start()
+            deadline = time.time() + 120
+            while watch_processor.processor is None and thread.is_alive() and time.time() < deadline:
+                time.sleep(0.05)
+            assert watch_processor.processor is not None
+            first_processor = watch_processor.processor
+
+            shutil.copyfile(INPUT_ROOT / "data_errors_01" / "proporcionalidades.xlsx", submission / "proporcionalidades.xlsx")
+            thread.join(timeout=120)
+        context.finalize()
+
+        assert not thread.is_alive()
+        assert watch_processor.runs == 2
+        assert watch_processor.processor is not first_processor
+        assert proportionality_run.call_count == 2
+        assert scenario_run.call_count == 1
+
+        full_context = _context(submission, tmp_path / "full")
+        with contextlib.redirect_stdout(io.StringIO()):
+            full_processor = SpreadsheetProcessor(context=full_context)
+        full_context.finalize()
+        assert _snapshot(watch_processor.processor) == _snapshot(full_processor)
@@ -7,12 +7,14 @@ This module provides complete test coverage for all classes in data_args.py:
 - DataFile (file-related arguments)
 - DataAction (action-related arguments)
 - DataReport (report-related arguments)
+- DataPerformance (performance-related arguments)
 - DataArgs (main argument parsing class)
 """
 
 import argparse
 import os
 import tempfile
+import zipfile
 from typing import Any, Dict, Generator
 import pytest
 
@@ -21,6 +23,7 @@ from data_validate.helpers.base.data_args import (
     DataFile,
     DataAction,
     DataReport,
+    DataPerformance,
     DataArgs,
 )
 
@@ -96,6 +99,17 @@ class TestDataFile:
         with pytest.raises(ValueError, match="Input folder does not exist"):
             DataFile(input_folder=invalid_input, output_folder=temp_output_dir, locale="en_US")
 
+    def test_init_with_zip_input(self, temp_output_dir: str) -> None:
+        """Test DataFile initialization accepts a .zip archive as input."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive_path = os.path.join(temp_dir, "submissao.zip")
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("descricao.csv", "codigo|nivel\n")
+
+            data_file = DataFile(input_folder=archive_path, output_folder=temp_output_dir, locale="pt_BR")
+
+            assert data_file.input_folder == archive_path
+
     def test_init_with_invalid_output_folder_extension(self, temp_input_dir: str) -> None:
         """Test DataFile initialization with output folder having file extension."""
         invalid_output = "/path/to/output.txt"
@@ -140,6 +154,20 @@ class TestDataAction:
         assert data_action.no_time is True
         assert data_action.no_version is False
         assert data_action.debug is True
+        assert data_action.preflight is False
+        assert data_action.watch is False
+
+    def test_init_with_preflight(self) -> None:
+        """Test DataAction initialization with the preflight flag enabled."""
+        data_action = DataAction(no_spellchecker=False, no_warning_titles_length=False, no_time=False, no_version=False, debug=False, preflight=True)
+
+        assert data_action.preflight is True
+
+    def test_init_with_watch(self) -> None:
+        """Test DataAction initialization with the watch flag enabled."""
+        data_action = DataAction(no_spellchecker=False, no_warning_titles_length=False, no_time=False, no_version=False, debug=False, watch=True)
+
+        assert data_action.watch is True
 
     def test_init_with_none_values_raises_error(self) -> None:
         """Test DataAction initialization with None values raises validation error."""
@@ -171,6 +199,16 @@ class TestDataAction:
         with pytest.raises(ValueError, match="debug must be a boolean value"):
             DataAction(no_spellchecker=True, no_warning_titles_length=True, no_time=True, no_version=True, debug=1.5)
 
+    def test_validate_arguments_with_invalid_preflight(self) -> None:
+        """Test validation error when preflight is not boolean."""
+        with pytest.raises(ValueError, match="preflight must be a boolean value"):
+            DataAction(no_spellchecker=True, no_warning_titles_length=True, no_time=True, no_version=True, debug=True, preflight="yes")
+
+    def test_validate_arguments_with_invalid_watch(self) -> None:
+        """Test validation error when watch is not boolean."""
+        with pytest.raises(ValueError, match="watch must be a boolean value"):
+            DataAction(no_spellchecker=True, no_warning_titles_length=True, no_time=True, no_version=True, debug=True, watch=1)
+
     def test_run_method_calls_validate(self, mocker) -> None:
         """Test that run method calls _validate_arguments."""
         data_action = DataAction.__new__(DataAction)  # Create without calling __init__
@@ -179,6 +217,8 @@ class TestDataAction:
         data_action.no_time = True
         data_action.no_version = False
         data_action.debug = True
+        data_action.preflight = False
+        data_action.watch = False
 
         mock_validate = mocker.patch.object(data_action, "_validate_arguments")
         data_action.run()
@@ -236,6 +276,146 @@ class TestDataReport:
         mock_validate.assert_called_once()
 
 
+class TestDataPerformance:
+    """Test suite for DataPerformance class."""
+
+    def test_init_with_default_values(self) -> None:
+        """Test DataPerformance initialization with default values."""
+        data_performance = DataPerformance()
+
+        assert data_performance.jobs == 1
+        assert data_performance.cache is False
+        assert data_performance.csv_engine == "c"
+        assert data_performance.chunk_size == 0
+        assert data_performance.prune_columns is False
+        assert data_performance.compact is False
+        assert data_performance.validation_jobs == 1
+        assert data_performance.incremental is False
+        assert data_performance.truncate_messages is False
+        assert data_performance.timings is None
+        assert data_performance.report_timings is False
+        assert data_performance.profile is False
+        assert data_performance.profile_memory is False
+
+    @pytest.mark.parametrize("jobs", [1, 2, 8])
+    def test_init_with_valid_jobs(self, jobs: int) -> None:
+        """Test DataPerformance initialization with positive job counts."""
+        data_performance = DataPerformance(jobs=jobs)
+
+        assert data_performance.jobs == jobs
+
+    @pytest.mark.parametrize("invalid_jobs", [0, -1, 1.5, "2", None, True])
+    def test_init_with_invalid_jobs_raises_error(self, invalid_jobs: Any) -> None:
+        """Test that DataPerformance rejects non-positive or non-integer job counts."""
+        with pytest.raises(ValueError, match="jobs must be a positive integer"):
+            DataPerformance(jobs=invalid_jobs)
+
+    @pytest.mark.parametrize("invalid_cache", ["yes", 1, None])
+    def test_init_with_invalid_cache_raises_error(self, invalid_cache: Any) -> None:
+        """Test that DataPerformance rejects a non-boolean cache flag."""
+        with pytest.raises(ValueError, match="cache must be a boolean value"):
+            DataPerformance(cache=invalid_cache)
+
+    def test_init_with_pyarrow_csv_engine(self, mocker) -> None:
+        """Test DataPerformance accepts the pyarrow engine when pyarrow is installed."""
+        mocker.patch("data_validate.helpers.base.data_args.importlib.util.find_spec", return_value=mocker.MagicMock())
+
+        assert DataPerformance(csv_engine="pyarrow").csv_engine == "pyarrow"
+
+    def test_init_with_pyarrow_csv_engine_not_installed(self, mocker) -> None:
+        """Test DataPerformance rejects the pyarrow engine when pyarrow is missing."""
+        mocker.patch("data_validate.helpers.base.data_args.importlib.util.find_spec", return_value=None)
+
+        with pytest.raises(ValueError, match="requires the pyarrow package"):
+            DataPerformance(csv_engine="pyarrow")
+
+    @pytest.mark.parametrize("invalid_engine", ["python", "", None])
+    def test_init_with_invalid_csv_engine_raises_error(self, invalid_engine: Any) -> None:
+        """Test that DataPerformance rejects unknown CSV engines."""
+        with pytest.raises(ValueError, match="csv_engine must be one of"):
+            DataPerformance(csv_engine=invalid_engine)
+
+    @pytest.mark.parametrize("chunk_size", [0, 1, 50000])
+    def test_init_with_valid_chunk_size(self, chunk_size: int) -> None:
+        """Test DataPerformance initialization with non-negative chunk sizes."""
+        assert DataPerformance(chunk_size=chunk_size).chunk_size == chunk_size
+
+    @pytest.mark.parametrize("invalid_chunk_size", [-1, 2.5, "100", None, False])
+    def test_init_with_invalid_chunk_size_raises_error(self, invalid_chunk_size: Any) -> None:
+        """Test that DataPerformance rejects negative or non-integer chunk sizes."""
+        with pytest.raises(ValueError, match="chunk_size must be a non-negative integer"):
+            DataPerformance(chunk_size=invalid_chunk_size)
+
+    @pytest.mark.parametrize("invalid_prune_columns", ["yes", 1, None])
+    def test_init_with_invalid_prune_columns_raises_error(self, invalid_prune_columns: Any) -> None:
+        """Test that DataPerformance rejects a non-boolean prune_columns flag."""
+        with pytest.raises(ValueError, match="prune_columns must be a boolean value"):
+            DataPerformance(prune_columns=invalid_prune_columns)
+
+    @pytest.mark.parametrize("invalid_compact", ["yes", 1, None])
+    def test_init_with_invalid_compact_raises_error(self, invalid_compact: Any) -> None:
+        """Test that DataPerformance rejects a non-boolean compact flag."""
+        with pytest.raises(ValueError, match="compact must be a boolean value"):
+            DataPerformance(compact=invalid_compact)
+
+    @pytest.mark.parametrize("invalid_validation_jobs", [0, -1, 1.5, "2", None, True])
+    def test_init_with_invalid_validation_jobs_raises_error(self, invalid_validation_jobs: Any) -> None:
+        """Test that DataPerformance rejects non-positive or non-integer validation job counts."""
+        with pytest.raises(ValueError, match="validation_jobs must be a positive integer"):
+            DataPerformance(validation_jobs=invalid_validation_jobs)
+
+    @pytest.mark.parametrize("invalid_incremental", ["yes", 1, None])
+    def test_init_with_invalid_incremental_raises_error(self, invalid_incremental: Any) -> None:
+        """Test that DataPerformance rejects a non-boolean incremental flag."""
+        with pytest.raises(ValueError, match="incremental must be a boolean value"):
+            DataPerformance(incremental=invalid_incremental)
+
+    @pytest.mark.parametrize("invalid_truncate_messages", ["yes", 1, None])
+    def test_init_with_invalid_truncate_messages_raises_error(self, invalid_truncate_messages: Any) -> None:
+        """Test that DataPerformance rejects a non-boolean truncate_messages flag."""
+        with pytest.raises(ValueError, match="truncate_messages must be a boolean value"):
+            DataPerformance(truncate_messages=invalid_truncate_messages)
+
+    @pytest.mark.parametrize("invalid_timings", ["", "  ", 1, True])
+    def test_init_with_invalid_timings_raises_error(self, invalid_timings: Any) -> None:
+        """Test that DataPerformance rejects a timings path that is not a non-empty string."""
+        with pytest.raises(ValueError, match="timings must be a non-empty path or None"):
+            DataPerformance(timings=invalid_timings)
+
+    @pytest.mark.parametrize("invalid_report_timings", ["yes", 1, None])
+    def test_init_with_invalid_report_timings_raises_error(self, invalid_report_timings: Any) -> None:
+        """Test that DataPerformance rejects a non-boolean report_timings flag."""
+        with pytest.raises(ValueError, match="report_timings must be a boolean value"):
+            DataPerformance(report_timings=invalid_report_timings)
+
+    @pytest.mark.parametrize("flag", ["profile", "profile_memory"])
+    def test_init_with_invalid_profile_flags_raises_error(self, flag: str) -> None:
+        """Test that DataPerformance rejects non-boolean profiling flags."""
+        with pytest.raises(ValueError, match=f"{flag} must be a boolean value"):
+            DataPerformance(**{flag: "yes"})
+
+    def test_run_method_calls_validate(self, mocker) -> None:
+        """Test that run method calls _validate_arguments."""
+        data_performance = DataPerformance.__new__(DataPerformance)  # Create without calling __init__
+        data_performance.jobs = 1
+        data_performance.cache = False
+        data_performance.csv_engine = "c"
+        data_performance.chunk_size = 0
+        data_performance.prune_columns = False
+        data_performance.compact = False
+        data_performance.validation_jobs = 1
+        data_performance.incremental = False
+        data_performance.truncate_messages = False
+        data_performance.timings = None
+        data_performance.report_timings = False
+        data_performance.profile = False
+        data_performance.profile_memory = False
+
+        mock_validate = mocker.patch.object(data_performance, "_validate_arguments")
+        data_performance.run()
+        mock_validate.assert_called_once()
+
+
 class TestDataArgs:
     """Test suite for DataArgs main class."""
 
@@ -250,6 +430,49 @@ class TestDataArgs:
         """Mock LanguageManager for testing."""
         return mocker.MagicMock()
 
+    def test_init_with_argv(self, temp_input_dir: str, mock_language_manager, mocker) -> None:
+        """Test DataArgs parses the given argument list instead of sys.argv, reusing the given LanguageManager."""
+        mocker.patch("sys.argv", ["data_validate", "--invalid-option"])
+
+        data_args = DataArgs(
+            argv=["--input_folder", temp_input_dir, "--output_folder", "/batch/output", "--no-spellchecker", "--jobs", "2"],
+            language_manager=mock_language_manager,
+        )
+
+        assert data_args.language_manager is mock_language_manager
+        assert data_args.data_file.input_folder == temp_input_dir
+        assert data_args.data_file.output_folder == "/batch/output"
+        assert data_args.data_action.no_spellchecker is True
+        assert data_args.data_performance.jobs == 2
+
+    def test_init_with_timings_options(self, temp_input_dir: str, mock_language_manager) -> None:
+        """Test DataArgs parses the timings path and the report timings flag."""
+        data_args = DataArgs(
+            argv=["--input_folder", temp_input_dir, "--timings", "out.json", "--report-timings"],
+            language_manager=mock_language_manager,
+        )
+
+        assert data_args.data_performance.timings == "out.json"
+        assert data_args.data_performance.report_timings is True
+
+    def test_init_with_documented_abbreviations(self, temp_input_dir: str, mock_language_manager) -> None:
+        """Test that the abbreviations used in the README, Makefile and scripts (--i, --o, --l, --d) stay unambiguous."""
+        data_args = DataArgs(
+            argv=["--i", temp_input_dir, "--o", "/batch/output", "--l", "en_US", "--d"],
+            language_manager=mock_language_manager,
+        )
+
+        assert data_args.data_file.input_folder == temp_input_dir
+        assert data_args.data_file.output_folder == "/batch/output"
+        assert data_args.data_file.locale == "en_US"
+        assert data_args.data_action.debug is True
+
+    def test_init_with_reuse_results(self, temp_input_dir: str, mock_language_manager) -> None:
+        """Test that --reuse-results enables the reuse of stored validator results."""
+        data_args = DataArgs(argv=["--input_folder", temp_input_dir, "--reuse-results"], language_manager=mock_language_manager)
+
+        assert data_args.data_performance.incremental is True
+
     def test_init_with_mocked_args(self, temp_input_dir: str, mocker) -> None:
         """Test DataArgs initialization with mocked command line arguments."""
         # Setup mock
@@ -266,10 +489,25 @@ class TestDataArgs:
         mock_args.no_time = False
         mock_args.no_version = False
         mock_args.debug = False
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = "Test"
         mock_args.protocol = "v1.0"
         mock_args.user = "test_user"
         mock_args.file = "test.xlsx"
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         data_args = DataArgs(allow_abbrev=True)
@@ -296,10 +534,25 @@ class TestDataArgs:
         mock_args.no_time = False
         mock_args.no_version = False
         mock_args.debug = False
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = None
         mock_args.protocol = None
         mock_args.user = None
         mock_args.file = None
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         data_args = DataArgs(allow_abbrev=False)
@@ -324,10 +577,25 @@ class TestDataArgs:
         mock_args.no_time = True
         mock_args.no_version = True
         mock_args.debug = True
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = "Educação"
         mock_args.protocol = "v2.0"
         mock_args.user = "admin"
         mock_args.file = "data.xlsx"
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         data_args = DataArgs()
@@ -342,10 +610,25 @@ class TestDataArgs:
             "no_time": True,
             "no_version": True,
             "debug": True,
+            "preflight": False,
+            "watch": False,
             "sector": "Educação",
             "protocol": "v2.0",
             "user": "admin",
             "file": "data.xlsx",
+            "jobs": 1,
+            "cache": False,
+            "csv_engine": "c",
+            "chunk_size": 0,
+            "prune_columns": False,
+            "compact": False,
+            "validation_jobs": 1,
+            "incremental": False,
+            "truncate_messages": False,
+            "timings": None,
+            "report_timings": False,
+            "profile": False,
+            "profile_memory": False,
         }
 
         assert result_dict == expected_dict
@@ -366,10 +649,25 @@ class TestDataArgs:
         mock_args.no_time = False
         mock_args.no_version = True
         mock_args.debug = False
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = "Saúde"
         mock_args.protocol = "v1.5"
         mock_args.user = "doctor"
         mock_args.file = "medical.xlsx"
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         data_args = DataArgs()
@@ -384,10 +682,25 @@ class TestDataArgs:
             "no_time=False",
             "no_version=True",
             "debug=False",
+            "preflight=False",
+            "watch=False",
             "sector=Saúde",
             "protocol=v1.5",
             "user=doctor",
-            "file=medical.xlsx)",
+            "file=medical.xlsx",
+            "jobs=1",
+            "cache=False",
+            "csv_engine=c",
+            "chunk_size=0",
+            "prune_columns=False",
+            "compact=False",
+            "validation_jobs=1",
+            "incremental=False",
+            "truncate_messages=False",
+            "timings=None",
+            "report_timings=False",
+            "profile=False",
+            "profile_memory=False)",
         ]
 
         for part in expected_parts:
@@ -409,10 +722,25 @@ class TestDataArgs:
         mock_args.no_time = False
         mock_args.no_version = False
         mock_args.debug = False
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = None
         mock_args.protocol = None
         mock_args.user = None
         mock_args.file = None
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
 
         mock_parser.parse_args.return_value = mock_args
         mock_create_parser.return_value = mock_parser
@@ -420,14 +748,16 @@ class TestDataArgs:
         mocker.patch.object(DataFile, "__init__", return_value=None)
         mocker.patch.object(DataAction, "__init__", return_value=None)
         mocker.patch.object(DataReport, "__init__", return_value=None)
+        mocker.patch.object(DataPerformance, "__init__", return_value=None)
 
         data_args = DataArgs.__new__(DataArgs)
         data_args.language_manager = mocker.MagicMock()
         data_args.allow_abbrev = True
+        data_args.argv = None
         data_args.run()
 
         mock_create_parser.assert_called_once()
-        mock_parser.parse_args.assert_called_once()
+        mock_parser.parse_args.assert_called_once_with(None)
 
 
 class TestDataArgsDataDrivenTests:
@@ -462,10 +792,25 @@ class TestDataArgsDataDrivenTests:
         mock_args.no_time = False
         mock_args.no_version = False
         mock_args.debug = False
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = None
         mock_args.protocol = None
         mock_args.user = None
         mock_args.file = None
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         data_args = DataArgs(allow_abbrev=allow_abbrev)
@@ -495,10 +840,25 @@ class TestDataArgsDataDrivenTests:
         mock_args.no_time = False
         mock_args.no_version = False
         mock_args.debug = False
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = None
         mock_args.protocol = None
         mock_args.user = None
         mock_args.file = None
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         data_args = DataArgs()
@@ -538,10 +898,25 @@ class TestDataArgsDataDrivenTests:
         mock_args.no_time = boolean_flags["no_time"]
         mock_args.no_version = boolean_flags["no_version"]
         mock_args.debug = boolean_flags["debug"]
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = None
         mock_args.protocol = None
         mock_args.user = None
         mock_args.file = None
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         data_args = DataArgs()
@@ -588,10 +963,25 @@ class TestDataArgsEdgeCases:
             "no_time",
             "no_version",
             "debug",
+            "preflight",
+            "watch",
             "sector",
             "protocol",
             "user",
             "file",
+            "jobs",
+            "cache",
+            "csv_engine",
+            "chunk_size",
+            "prune_columns",
+            "compact",
+            "validation_jobs",
+            "incremental",
+            "truncate_messages",
+            "timings",
+            "report_timings",
+            "profile",
+            "profile_memory",
         ]
 
         for arg in expected_args:
@@ -670,10 +1060,25 @@ class TestDataArgsIntegration:
         mock_args.no_time = False
         mock_args.no_version = True
         mock_args.debug = False
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = "Agricultura"
         mock_args.protocol = "v3.0"
         mock_args.user = "farmer"
         mock_args.file = "crops.xlsx"
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         # Test complete initialization
@@ -703,7 +1108,7 @@ class TestDataArgsIntegration:
 
         # Test dictionary output
         result_dict = data_args.get_dict_args()
-        assert len(result_dict) == 12
+        assert len(result_dict) == 27
         assert result_dict["input_folder"] == temp_input_dir
         assert result_dict["sector"] == "Agricultura"
 
@@ -729,10 +1134,25 @@ class TestDataArgsIntegration:
         mock_args.no_time = False
         mock_args.no_version = False
         mock_args.debug = False
+        mock_args.preflight = False
+        mock_args.watch = False
         mock_args.sector = None
         mock_args.protocol = None
         mock_args.user = None
         mock_args.file = None
+        mock_args.jobs = 1
+        mock_args.cache = False
+        mock_args.csv_engine = "c"
+        mock_args.chunk_size = 0
+        mock_args.prune_columns = False
+        mock_args.compact = False
+        mock_args.validation_jobs = 1
+        mock_args.incremental = False
+        mock_args.truncate_messages = False
+        mock_args.timings = None
+        mock_args.report_timings = False
+        mock_args.profile = False
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
 
         data_args = DataArgs()
@@ -766,10 +1186,25 @@ class TestDataArgsIntegration:
                 mock_args1.no_time = True
                 mock_args1.no_version = False
                 mock_args1.debug = True
+                mock_args1.preflight = False
+                mock_args1.watch = False
                 mock_args1.sector = "Sector1"
                 mock_args1.protocol = "v1.0"
                 mock_args1.user = "user1"
                 mock_args1.file = "file1.xlsx"
+                mock_args1.jobs = 1
+                mock_args1.cache = False
+                mock_args1.csv_engine = "c"
+                mock_args1.chunk_size = 0
+                mock_args1.prune_columns = False
+                mock_args1.compact = False
+                mock_args1.validation_jobs = 1
+                mock_args1.incremental = False
+                mock_args1.truncate_messages = False
+                mock_args1.timings = None
+                mock_args1.report_timings = False
+                mock_args1.profile = False
+                mock_args1.profile_memory = False
 
                 mock_args2 = mocker.MagicMock()
                 mock_args2.input_folder = temp_dir2  # Use real temp directory
@@ -780,10 +1215,25 @@ class TestDataArgsIntegration:
                 mock_args2.no_time = False
                 mock_args2.no_version = True
                 mock_args2.debug = False
+                mock_args2.preflight = False
+                mock_args2.watch = False
                 mock_args2.sector = "Sector2"
                 mock_args2.protocol = "v2.0"
                 mock_args2.user = "user2"
                 mock_args2.file = "file2.xlsx"
+                mock_args2.jobs = 1
+                mock_args2.cache = False
+                mock_args2.csv_engine = "c"
+                mock_args2.chunk_size = 0
+                mock_args2.prune_columns = False
+                mock_args2.compact = False
+                mock_args2.validation_jobs = 1
+                mock_args2.incremental = False
+                mock_args2.truncate_messages = False
+                mock_args2.timings = None
+                mock_args2.report_timings = False
+                mock_args2.profile = False
+                mock_args2.profile_memory = False
 
                 # Test first instance
                 mock_parse_args.return_value = mock_args1
@@ -0,0 +1,121 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import json
+from types import SimpleNamespace
+
+import pandas as pd
+
+from data_validate.controllers import ValidationReport
+from data_validate.helpers.common.formatting.issue_record import IssueRecord
+from data_validate.helpers.common.processing.data_cleaning_processing import DataCleaningProcessing
+from data_validate.helpers.tools import LanguageManager
+
+
+class TestIssueRecord:
+    """Test cases for lazily rendered validation messages."""
+
+    def test_render_matches_message_text(self):
+        """Test the rendered record is the same text the validators used to format."""
+        record = ("value_error_invalid_number", "valores.xlsx", 5, "1-2030-M", "abc")
+
+        assert (
+            IssueRecord.render(record)
+            == "valores.xlsx, linha 5: O valor abc não é um número válido e nem DI (Dado Indisponível) para a coluna '1-2030-M'."
+        )
+
+    def test_render_returns_text_unchanged(self):
+        """Test plain text messages are not records and are returned as they are."""
+        assert not IssueRecord.is_record("valores.xlsx: O arquivo enviado está vazio.")
+        assert IssueRecord.render("valores.xlsx: O arquivo enviado está vazio.") == "valores.xlsx: O arquivo enviado está vazio."
+
+    def test_nested_record_is_rendered(self):
+        """Test a record given as parameter is rendered inside the message."""
+        _, errors = DataCleaningProcessing.clean_column_integer(pd.DataFrame({"codigo": ["1", "x", "2.5"]}), "codigo", "descricao.xlsx")
+
+        assert all(IssueRecord.is_record(error) for error in errors)
+        assert [IssueRecord.render(error) for error in errors] == [
+            "descricao.xlsx, linha 3: A coluna 'codigo' contém um valor inválido: O valor 'x' não é um número.",
+            "descricao.xlsx, linha 4: A coluna 'codigo' contém um valor inválido: O valor '2.5' não é um número inteiro.",
+        ]
+
+    def test_render_uses_given_language_manager(self):
+        """Test the text comes from the templates of the given localization manager."""
+        language_manager = SimpleNamespace(text=lambda key, *params, **fields: f"{key}: {params[0]}")
+
+        record = ("number_error_not_integer", None, None, None, 2.5)
+
+        assert IssueRecord.render(record, language_manager) == "number_error_not_integer: 2.5"
+
+    def test_render_in_en_us_falls_back_to_pt_br(self):
+        """Test records without en_US templates render the pt_BR text, as the messages they replaced did."""
+        language_manager = LanguageManager()
+        language_manager.set_language("en_US")
+
+        record = ("data_cleaning_error_invalid_integer", "descricao.xlsx", 3, "codigo", ("number_error_not_a_number", None, None, None, "x"))
+
+        assert (
+            IssueRecord.render(record, language_manager)
+            == "descricao.xlsx, linha 3: A coluna 'codigo' contém um valor inválido: O valor 'x' não é um número."
+        )
+
+    def test_count_includes_omitted_issues(self):
+        """Test an omitted issues record counts as the issues it stands for."""
+        messages = ["erro 1", ("number_error_not_a_number", None, None, None, "x"), IssueRecord.omitted(5)]
+
+        assert IssueRecord.is_omitted(messages[2])
+        assert not IssueRecord.is_omitted(messages[1])
+        assert IssueRecord.count(messages) == 7
+
+    def test_limit_folds_extra_messages_into_one_record(self):
+        """Test the messages past the limit and the omitted records are merged into one record."""
+        messages = ["erro 1", "erro 2", IssueRecord.omitted(3), "erro 3"]
+
+        assert IssueRecord.limit(messages, 2) == ["erro 1", "erro 2", IssueRecord.omitted(4)]
+        assert IssueRecord.limit(messages, 0) == [IssueRecord.omitted(6)]
+        assert IssueRecord.limit(["erro 1"], 2) == ["erro 1"]
+        assert IssueRecord.limit(messages, None) is messages
+
+
+class TestValidationReportRendering:
+    """Test cases for the rendering of records in validation reports."""
+
+    def test_flatten_renders_only_retained_messages(self, mocker):
+        """Test only the displayed messages are rendered, with the omitted count appended."""
+        context = SimpleNamespace(language_manager=LanguageManager())
+        records = [("number_error_not_a_number", None, None, None, f"v{index}") for index in range(1000)]
+        report = ValidationReport(context=context)
+        report.add_by_name("Limpeza", errors=records)
+        render = mocker.spy(IssueRecord, "render")
+
+        flattened = report.flatten(n_messages=3)
+
+        assert render.call_count == 3
+        assert flattened["Limpeza"].errors[:3] == ["O valor 'v0' não é um número.", "O valor 'v1' não é um número.", "O valor 'v2' não é um número."]
+        assert flattened["Limpeza"].errors[3] == "Existem mais 997 erros similares aos anteriores que foram omitidos."
+        assert report.get_total_errors() == 1000
+        assert report.to_records()[0]["errors"][999] == "O valor 'v999' não é um número."
+
+    def test_omitted_issues_are_counted_and_not_displayed(self):
+        """Test a report truncated by a message budget flattens and counts like the complete one."""
+        context = SimpleNamespace(language_manager=LanguageManager())
+        messages = [f"erro {index}" for index in range(30)]
+        complete = ValidationReport(context=context)
+        complete.add_by_name("Legenda", errors=messages)
+        truncated = ValidationReport(context=context)
+        truncated.add_by_name("Legenda", errors=IssueRecord.limit(messages, 20))
+
+        assert truncated.get_total_errors() == complete.get_total_errors() == 30
+        assert truncated["Legenda"].error_count == 30
+        assert truncated.flatten(n_messages=20)["Legenda"].errors == complete.flatten(n_messages=20)["Legenda"].errors
+
+    def test_records_keep_omitted_issues(self):
+        """Test the serialized records keep the count of the omitted issues."""
+        context = SimpleNamespace(language_manager=LanguageManager())
+        report = ValidationReport(context=context)
+        report.add_by_name("Legenda", errors=["erro 1", IssueRecord.omitted(9)])
+
+        records = json.loads(json.dumps(report.to_records()))
+        rebuilt = ValidationReport.from_records(records, context=context)
+
+        assert rebuilt["Legenda"].errors == ["erro 1", IssueRecord.omitted(9)]
+        assert rebuilt.get_total_errors() == 10
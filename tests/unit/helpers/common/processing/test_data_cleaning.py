@@ -2,6 +2,7 @@
 
 import pandas as pd
 import numpy as np
+from data_validate.helpers.common.formatting.issue_record import IssueRecord
 from data_validate.helpers.common.processing.data_cleaning_processing import DataCleaningProcessing
 
 
@@ -24,7 +25,7 @@ class TestDataCleaning:
         df, errors = DataCleaningProcessing.clean_column_integer(self.df, "nonexistent", "test.csv")
 
         assert len(errors) == 1
-        assert "não foi encontrada" in errors[0]
+        assert "não foi encontrada" in IssueRecord.render(errors[0])
         assert df.equals(self.df)
 
     def test_clean_column_integer_basic_cleaning(self):
@@ -41,7 +42,7 @@ class TestDataCleaning:
         df, errors = DataCleaningProcessing.clean_column_integer(self.df, "value", "test.csv")
 
         assert len(errors) == 2  # 'invalid' and empty string are invalid
-        assert "valor inválido" in errors[0]
+        assert "valor inválido" in IssueRecord.render(errors[0])
         assert len(df) == 3  # Two rows removed
         assert df["value"].dtype == "int64"
 
@@ -107,3 +108,27 @@ class TestDataCleaning:
         assert len(errors) == 1  # NaN is invalid
         assert len(df) == 4  # One row removed
         assert df["value"].dtype == "int64"
+
+    def test_clean_column_integer_with_message_budget(self):
+        """Test that invalid cells past the message budget are only counted."""
+        df_invalid = pd.DataFrame({"value": ["1", "a", "b", "2", "c", "d"]})
+
+        df, errors = DataCleaningProcessing.clean_column_integer(df_invalid, "value", "test.csv", max_messages=2)
+        _, all_errors = DataCleaningProcessing.clean_column_integer(df_invalid, "value", "test.csv")
+
+        assert errors[:2] == all_errors[:2]
+        assert errors[2] == IssueRecord.omitted(2)
+        assert IssueRecord.count(errors) == len(all_errors) == 4
+        assert list(df["value"]) == [1, 2]
+
+    def test_clean_dataframe_integers_with_message_budget(self):
+        """Test that the message budget applies to the errors of all the columns together."""
+        df_invalid = pd.DataFrame({"a": ["x", "y", "1"], "b": ["z", "2", "3"]})
+
+        _, errors = DataCleaningProcessing.clean_dataframe_integers(df_invalid, "test.csv", ["a", "b"], max_messages=1)
+        _, no_errors = DataCleaningProcessing.clean_dataframe_integers(df_invalid, "test.csv", ["a", "b"], max_messages=0)
+
+        assert len(errors) == 2
+        assert "linha 2" in IssueRecord.render(errors[0])
+        assert errors[1] == IssueRecord.omitted(1)
+        assert no_errors == [IssueRecord.omitted(2)]
@@ -0,0 +1,81 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from data_validate.helpers.common.processing.folder_watcher import FolderWatcher
+
+
+def _touch(path: Path, content: str) -> None:
+    """Write a file and move its modification time forward, so the change is seen on any file system."""
+    path.write_text(content, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestFolderWatcher:
+    """Test cases for the polling folder watcher."""
+
+    @pytest.mark.parametrize("invalid_interval", [0, -1, "1", True])
+    def test_init_with_invalid_interval_raises_error(self, tmp_path: Path, invalid_interval) -> None:
+        """Test that the poll interval must be a positive number."""
+        with pytest.raises(ValueError, match="interval must be a positive number"):
+            FolderWatcher(tmp_path, interval=invalid_interval)
+
+    def test_snapshot_ignores_hidden_lock_and_excluded_files(self, tmp_path: Path) -> None:
+        """Test that editor lock files, hidden files and excluded folders are not watched."""
+        (tmp_path / "descricao.xlsx").write_text("a", encoding="utf-8")
+        (tmp_path / "~$descricao.xlsx").write_text("lock", encoding="utf-8")
+        (tmp_path / ".~lock.valores.xlsx#").write_text("lock", encoding="utf-8")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "valores.csv").write_text("b", encoding="utf-8")
+        (tmp_path / "output").mkdir()
+        (tmp_path / "output" / "report.html").write_text("c", encoding="utf-8")
+
+        watcher = FolderWatcher(tmp_path, exclude=[str(tmp_path / "output")])
+
+        assert sorted(watcher.signature) == ["descricao.xlsx", "sub/valores.csv"]
+
+    def test_poll_reports_added_modified_and_removed_files(self, tmp_path: Path) -> None:
+        """Test that each kind of change is reported once."""
+        (tmp_path / "descricao.xlsx").write_text("a", encoding="utf-8")
+        (tmp_path / "valores.xlsx").write_text("b", encoding="utf-8")
+        watcher = FolderWatcher(tmp_path)
+
+        assert watcher.poll() == []
+
+        _touch(tmp_path / "descricao.xlsx", "changed")
+        (tmp_path / "valores.xlsx").unlink()
+        (tmp_path / "cenarios.xlsx").write_text("c", encoding="utf-8")
+
+        assert watcher.poll() == ["cenarios.xlsx", "descricao.xlsx", "valores.xlsx"]
+        assert watcher.poll() == []
+
+    def test_watches_a_single_file(self, tmp_path: Path) -> None:
+        """Test that an archive given as input is watched as a whole."""
+        archive = tmp_path / "submission.zip"
+        archive.write_bytes(b"zip")
+        watcher = FolderWatcher(archive)
+
+        _touch(archive, "new zip")
+
+        assert watcher.poll() == ["submission.zip"]
+
+    def test_wait_for_change_returns_changes_after_a_quiet_interval(self, tmp_path: Path) -> None:
+        """Test that the wait ends once the changed files stop changing."""
+        (tmp_path / "descricao.xlsx").write_text("a", encoding="utf-8")
+        watcher = FolderWatcher(tmp_path, interval=0.01)
+        _touch(tmp_path / "descricao.xlsx", "changed")
+
+        assert watcher.wait_for_change() == ["descricao.xlsx"]
+
+    def test_wait_for_change_stops_when_event_is_set(self, tmp_path: Path) -> None:
+        """Test that setting the stop event interrupts the wait without changes."""
+        watcher = FolderWatcher(tmp_path, interval=0.01)
+        stop_event = threading.Event()
+        threading.Timer(0.05, stop_event.set).start()
+
+        assert watcher.wait_for_change(stop_event) == []
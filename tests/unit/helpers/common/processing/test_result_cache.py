@@ -0,0 +1,79 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import os
+from pathlib import Path
+
+from data_validate.helpers.common.processing.result_cache import ResultCache
+
+
+class TestResultCache:
+    """Test cases for the persistent result cache."""
+
+    def test_default_dir_uses_xdg_cache_home(self, monkeypatch, tmp_path: Path):
+        """Test default cache directory honours XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert ResultCache.default_dir() == tmp_path / "canoa_data_validate" / "results"
+
+    def test_make_key_is_stable_and_order_independent(self, tmp_path: Path):
+        """Test equal fingerprints give equal keys, whatever the key order."""
+        cache = ResultCache(tmp_path)
+
+        first = cache.make_key({"inputs": {"descricao": "abc", "valores": "def"}, "version": "1.0"})
+        second = cache.make_key({"version": "1.0", "inputs": {"valores": "def", "descricao": "abc"}})
+
+        assert first == second
+        assert cache.make_key({"inputs": {"descricao": "abd", "valores": "def"}, "version": "1.0"}) != first
+
+    def test_put_and_get_round_trip(self, tmp_path: Path):
+        """Test a stored result is returned as written."""
+        cache = ResultCache(tmp_path / "cache")
+        result = [{"test_name": "Ortografia", "errors": ["descricao.xlsx, linha 2: Palavra 'teste' errada."], "warnings": []}]
+
+        cache.put("key", result)
+
+        assert cache.get("key") == result
+
+    def test_get_missing_or_corrupted_entry_returns_none(self, tmp_path: Path):
+        """Test unknown keys and unreadable entries are cache misses."""
+        cache = ResultCache(tmp_path)
+        entry = tmp_path / f"broken{ResultCache.ENTRY_SUFFIX}"
+        entry.write_text("{not json")
+
+        assert cache.get("missing") is None
+        assert cache.get("broken") is None
+        assert not entry.exists()
+
+    def test_put_ignores_results_that_are_not_serializable(self, tmp_path: Path):
+        """Test a result that cannot be stored leaves no entry behind."""
+        cache = ResultCache(tmp_path)
+
+        cache.put("key", {"value": object()})
+
+        assert cache.get("key") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_evict_keeps_most_recently_used_entries(self, tmp_path: Path):
+        """Test LRU eviction keeps at most max_entries entries."""
+        cache = ResultCache(tmp_path, max_entries=10)
+        for index, key in enumerate(["old", "middle", "new"]):
+            cache.put(key, index)
+            os.utime(tmp_path / f"{key}{ResultCache.ENTRY_SUFFIX}", ns=(index * 10**9, index * 10**9))
+
+        cache.max_entries = 2
+        cache.evict()
+
+        assert cache.get("old") is None
+        assert cache.get("middle") == 1
+        assert cache.get("new") == 2
+
+    def test_clear_removes_all_entries(self, tmp_path: Path):
+        """Test clear empties the cache directory."""
+        cache = ResultCache(tmp_path)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        cache.clear()
+
+        assert cache.get("a") is None
+        assert cache.get("b") is None
@@ -0,0 +1,103 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import cProfile
+import json
+import pstats
+import tracemalloc
+from pathlib import Path
+
+from data_validate.helpers.common.processing.run_profiler import RunProfiler
+
+
+def _leaf(size: int) -> int:
+    """Spend some time in a leaf function."""
+    return sum(index * index for index in range(size))
+
+
+def _branch() -> int:
+    """Call the leaf function twice."""
+    return _leaf(20_000) + _leaf(20_000)
+
+
+def _root() -> int:
+    """Call the leaf function directly and through the branch function."""
+    return _leaf(20_000) + _branch()
+
+
+class TestRunProfiler:
+    """Test cases for the CPU and memory profiler of a run."""
+
+    def test_collapsed_stacks_follow_call_paths(self) -> None:
+        """Test that each call path becomes one line with its self time, leaf last."""
+        profile = cProfile.Profile()
+        profile.runcall(_root)
+
+        lines = RunProfiler.collapsed_stacks(pstats.Stats(profile))
+
+        stacks = [line.rsplit(" ", 1)[0].split(";") for line in lines]
+        assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+        leaf_paths = [[frame.split("(")[-1] for frame in stack if frame.endswith(")")] for stack in stacks if stack[-1].endswith("(_leaf)")]
+        assert sorted(path[-3:] for path in leaf_paths) == [["_root)", "_branch)", "_leaf)"], ["_root)", "_leaf)"]]
+
+    def test_disabled_profiler_writes_nothing(self, tmp_path: Path) -> None:
+        """Test that a profiler without any kind of profiling does nothing."""
+        profiler = RunProfiler()
+
+        profiler.start()
+        with profiler.stage("read_data"):
+            _root()
+        profiler.stop()
+
+        assert not profiler.enabled
+        assert profiler.stages == []
+        assert profiler.save(str(tmp_path), "submissao") == []
+
+    def test_memory_stages_are_summarized(self, tmp_path: Path) -> None:
+        """Test that each stage lists its memory growth and top allocation sites."""
+        profiler = RunProfiler(memory=True, top_n=3)
+        tracing_before = tracemalloc.is_tracing()
+
+        profiler.start()
+        with profiler.stage("read_data"):
+            kept = [str(index) * 10 for index in range(20_000)]
+        with profiler.stage("report"):
+            pass
+        profiler.stop()
+
+        assert tracemalloc.is_tracing() == tracing_before
+        assert [stage["stage"] for stage in profiler.stages] == ["read_data", "report"]
+        read_data = profiler.stages[0]
+        assert read_data["size_diff_kib"] > 100
+        assert len(read_data["top_allocations"]) <= 3
+        assert read_data["top_allocations"][0]["location"].startswith(__file__)
+        assert len(kept) == 20_000
+
+        written = profiler.save(str(tmp_path), "submissao")
+        assert written == [str(tmp_path / "submissao_memory.json")]
+        assert json.loads(Path(written[0]).read_text(encoding="utf-8"))["stages"][0]["stage"] == "read_data"
+
+    def test_cpu_profile_is_saved(self, tmp_path: Path) -> None:
+        """Test that the CPU profile is written as pstats data and collapsed stacks."""
+        profiler = RunProfiler(cpu=True)
+
+        profiler.start()
+        _root()
+        profiler.stop()
+        written = profiler.save(str(tmp_path), "submissao")
+
+        assert written == [str(tmp_path / "submissao_profile.prof"), str(tmp_path / "submissao_profile.collapsed")]
+        assert any(function[2] == "_leaf" for function in pstats.Stats(written[0]).stats)
+        assert "(_leaf) " in Path(written[1]).read_text(encoding="utf-8")
+
+    def test_cpu_profile_is_skipped_when_another_profiler_is_active(self, tmp_path: Path, mocker) -> None:
+        """Test that the run goes on without CPU profile if the thread is already being profiled."""
+        # Python 3.12+ raises this error when another profiler is active in the thread
+        mocker.patch.object(cProfile.Profile, "enable", side_effect=ValueError("Another profiling tool is already active"))
+
+        profiler = RunProfiler(cpu=True)
+        profiler.start()
+        _root()
+        profiler.stop()
+
+        assert profiler.warnings and profiler.warnings[0].startswith("cProfile: ")
+        assert profiler.save(str(tmp_path), "submissao") == []
@@ -0,0 +1,83 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import threading
+import time
+
+import pytest
+
+from data_validate.helpers.common.processing.task_scheduler import ScheduledTask, TaskScheduler
+
+
+class TestTaskScheduler:
+    """Test cases for the task scheduler."""
+
+    def test_conflicts_with(self):
+        """Test tasks conflict only when one writes a resource the other uses."""
+        reader_a = ScheduledTask("reader_a", lambda: None, reads=["a"])
+        reader_ab = ScheduledTask("reader_ab", lambda: None, reads=["a", "b"])
+        writer_b = ScheduledTask("writer_b", lambda: None, writes=["b"])
+
+        assert reader_a.conflicts_with(reader_ab) is False
+        assert reader_ab.conflicts_with(writer_b) is True
+        assert writer_b.conflicts_with(reader_ab) is True
+        assert reader_a.conflicts_with(writer_b) is False
+
+    def test_dependencies(self):
+        """Test each task waits only for the earlier tasks it conflicts with."""
+        scheduler = TaskScheduler(jobs=4)
+        scheduler.add("read_a", lambda: None, reads=["a"])
+        scheduler.add("write_a", lambda: None, writes=["a"])
+        scheduler.add("read_b", lambda: None, reads=["b"])
+        scheduler.add("read_a_again", lambda: None, reads=["a"])
+
+        assert scheduler.dependencies() == {0: set(), 1: {0}, 2: set(), 3: {1}}
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_run_returns_results_in_insertion_order(self, jobs):
+        """Test results keep the insertion order, whatever the completion order."""
+        scheduler = TaskScheduler(jobs=jobs)
+        for index, delay in enumerate([0.03, 0.0, 0.02, 0.01]):
+            scheduler.add(f"task_{index}", lambda index=index, delay=delay: time.sleep(delay) or index, reads=["shared"])
+
+        assert scheduler.run() == [0, 1, 2, 3]
+
+    def test_run_independent_tasks_concurrently(self):
+        """Test tasks that only read run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        scheduler = TaskScheduler(jobs=2)
+        scheduler.add("first", lambda: barrier.wait() is not None, reads=["a"])
+        scheduler.add("second", lambda: barrier.wait() is not None, reads=["a"])
+
+        assert scheduler.run() == [True, True]
+
+    def test_run_conflicting_tasks_in_order(self):
+        """Test a writer waits for the earlier readers, and later readers wait for the writer."""
+        events = []
+        scheduler = TaskScheduler(jobs=4)
+        scheduler.add("read", lambda: time.sleep(0.02) or events.append("read"), reads=["a"])
+        scheduler.add("write", lambda: events.append("write"), writes=["a"])
+        scheduler.add("read_after", lambda: events.append("read_after"), reads=["a"])
+
+        scheduler.run()
+
+        assert events == ["read", "write", "read_after"]
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_run_raises_earliest_error(self, jobs):
+        """Test the exception of the earliest failed task is raised."""
+
+        def fail(message, delay=0.0):
+            time.sleep(delay)
+            raise ValueError(message)
+
+        scheduler = TaskScheduler(jobs=jobs)
+        scheduler.add("ok", lambda: 1)
+        scheduler.add("first_error", lambda: fail("first", 0.02))
+        scheduler.add("second_error", lambda: fail("second"))
+
+        with pytest.raises(ValueError, match="first"):
+            scheduler.run()
+
+    def test_run_without_tasks(self):
+        """Test an empty scheduler returns no results."""
+        assert TaskScheduler(jobs=4).run() == []
@@ -0,0 +1,88 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from data_validate.helpers.common.processing.timing_recorder import TimingRecorder
+
+
+def _names(span: dict) -> list:
+    """Return the span names of a serialized tree, depth first."""
+    return [span["name"], *(name for child in span["children"] for name in _names(child))]
+
+
+class TestTimingRecorder:
+    """Test cases for the hierarchical timing recorder."""
+
+    def test_nested_spans_form_a_tree(self) -> None:
+        """Test that spans opened inside another span become its children, in start order."""
+        timings = TimingRecorder()
+
+        with timings.measure("total"):
+            with timings.measure("read_data"):
+                with timings.measure("valores.xlsx"):
+                    pass
+            with timings.measure("validation"):
+                pass
+
+        tree = timings.to_dict()["timings"]
+        assert len(tree) == 1
+        assert _names(tree[0]) == ["total", "read_data", "valores.xlsx", "validation"]
+        assert [(depth, name) for depth, name, _ in timings.rows()] == [(0, "total"), (1, "read_data"), (2, "valores.xlsx"), (1, "validation")]
+        assert all(seconds is not None and seconds >= 0 for _, _, seconds in timings.rows())
+
+    def test_span_is_closed_when_block_raises(self) -> None:
+        """Test that a span is completed even if the measured block raises an exception."""
+        timings = TimingRecorder()
+
+        with pytest.raises(RuntimeError):
+            with timings.measure("configure"):
+                raise RuntimeError("falha")
+        with timings.measure("report"):
+            pass
+
+        assert [(depth, name) for depth, name, _ in timings.rows()] == [(0, "configure"), (0, "report")]
+        assert timings.spans[0].seconds is not None
+
+    def test_open_span_has_no_duration(self) -> None:
+        """Test that a span still running is listed without elapsed time."""
+        timings = TimingRecorder()
+
+        with timings.measure("total"):
+            assert timings.rows() == [(0, "total", None)]
+            assert timings.to_dict() == {"timings": [{"name": "total", "seconds": None, "children": []}]}
+
+    def test_worker_thread_spans_attach_to_open_owner_span(self) -> None:
+        """Test that spans measured in other threads are nested in the open span of the creating thread."""
+        timings = TimingRecorder()
+
+        def work(name: str) -> None:
+            with timings.measure(name):
+                with timings.measure(f"{name}.check"):
+                    pass
+
+        with timings.measure("validation"):
+            threads = [threading.Thread(target=work, args=(f"Validator{index}",)) for index in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        validation = timings.to_dict()["timings"][0]
+        assert sorted(child["name"] for child in validation["children"]) == [f"Validator{index}" for index in range(4)]
+        assert all([grandchild["name"] for grandchild in child["children"]] == [f"{child['name']}.check"] for child in validation["children"])
+
+    def test_save_writes_json(self, tmp_path: Path) -> None:
+        """Test that the recorded tree is written as JSON."""
+        timings = TimingRecorder()
+        with timings.measure("total"):
+            pass
+
+        timings.save(str(tmp_path / "timings.json"))
+
+        saved = json.loads((tmp_path / "timings.json").read_text(encoding="utf-8"))
+        assert saved["timings"][0]["name"] == "total"
+        assert saved["timings"][0]["seconds"] >= 0
@@ -11,6 +11,7 @@ import pytest
 import pandas as pd
 from typing import List, Tuple, Optional
 
+from data_validate.helpers.common.formatting.issue_record import IssueRecord
 from data_validate.helpers.common.validation.dataframe_processing import DataFrameProcessing
 from data_validate.helpers.common.validation.character_processing import CharacterProcessing
 
@@ -88,10 +89,10 @@ class TestCheckVerticalBar:
         assert len(errors) == 4  # Fixed: Actual count based on test data
 
         # Check specific error messages
-        assert any("linha 2" in error for error in errors)
-        assert any("linha 4" in error for error in errors)
-        assert any("'nome'" in error for error in errors)
-        assert any("'descricao'" in error for error in errors)
+        assert any("linha 2" in IssueRecord.render(error) for error in errors)
+        assert any("linha 4" in IssueRecord.render(error) for error in errors)
+        assert any("'nome'" in IssueRecord.render(error) for error in errors)
+        assert any("'descricao'" in IssueRecord.render(error) for error in errors)
 
     def test_check_vertical_bar_column_names_with_vertical_bars(self, dataframe_with_vertical_bar_columns: pd.DataFrame) -> None:
         """Test check_vertical_bar with vertical bars in column names."""
@@ -103,8 +104,8 @@ class TestCheckVerticalBar:
         assert len(errors) == 2  # Two columns with vertical bars
 
         # Check error messages contain column references
-        assert any("'id|code'" in error for error in errors)
-        assert any("'nome|name'" in error for error in errors)
+        assert any("'id|code'" in IssueRecord.render(error) for error in errors)
+        assert any("'nome|name'" in IssueRecord.render(error) for error in errors)
 
     def test_check_vertical_bar_multiindex_columns(self, multiindex_dataframe: pd.DataFrame) -> None:
         """Test check_vertical_bar with MultiIndex columns containing vertical bars."""
@@ -116,8 +117,8 @@ class TestCheckVerticalBar:
         assert len(errors) == 2  # One level 0, one level 1 error
 
         # Check specific MultiIndex error messages
-        assert any("nível 0" in error for error in errors)
-        assert any("nível 1" in error for error in errors)
+        assert any("nível 0" in IssueRecord.render(error) for error in errors)
+        assert any("nível 1" in IssueRecord.render(error) for error in errors)
 
     def test_check_vertical_bar_empty_dataframe(self, empty_dataframe: pd.DataFrame) -> None:
         """Test check_vertical_bar with empty DataFrame."""
@@ -178,7 +179,7 @@ class TestCheckVerticalBar:
         # Assert
         assert is_valid is False
         assert len(errors) == 1
-        assert "Erro ao processar a checagem de barra vertical" in errors[0]
+        assert "Erro ao processar a checagem de barra vertical" in IssueRecord.render(errors[0])
 
     def test_check_vertical_bar_complex_multiindex_scenario(self) -> None:
         """Test check_vertical_bar with complex MultiIndex structure."""
@@ -254,9 +255,9 @@ class TestCheckUnnamedColumns:
 
         # Check error message format
         for error in errors:
-            assert "linha" in error
-            assert "valores" in error
-            assert "colunas válidas" in error
+            assert "linha" in IssueRecord.render(error)
+            assert "valores" in IssueRecord.render(error)
+            assert "colunas válidas" in IssueRecord.render(error)
 
     def test_check_unnamed_columns_multiindex_with_unnamed(self, multiindex_with_unnamed: pd.DataFrame) -> None:
         """Test check_unnamed_columns with MultiIndex containing unnamed columns."""
@@ -330,7 +331,7 @@ class TestCheckUnnamedColumns:
         # Assert
         assert is_valid is False
         assert len(errors) == 1
-        assert "Erro ao processar a checagem de colunas sem nome" in errors[0]
+        assert "Erro ao processar a checagem de colunas sem nome" in IssueRecord.render(errors[0])
 
 
 class TestCheckPunctuation:
@@ -842,8 +843,8 @@ class TestCheckTextLength:
 
         # Check error message format
         for error in errors:
-            assert "excede o limite" in error
-            assert "encontrado:" in error
+            assert "excede o limite" in IssueRecord.render(error)
+            assert "encontrado:" in IssueRecord.render(error)
 
     def test_check_text_length_nonexistent_column(self, dataframe_with_various_text_lengths: pd.DataFrame) -> None:
         """Test check_text_length with non-existent column."""
@@ -853,8 +854,8 @@ class TestCheckTextLength:
         # Assert
         assert is_valid is False
         assert len(errors) == 1
-        assert "verificação foi abortada" in errors[0]
-        assert "nonexistent" in errors[0]
+        assert "verificação foi abortada" in IssueRecord.render(errors[0])
+        assert "nonexistent" in IssueRecord.render(errors[0])
 
     @pytest.mark.parametrize(
         "text_values,max_length,expected_error_count",
@@ -946,8 +947,8 @@ class TestCheckTextLength:
         assert len(errors) == 2  # First two exceed 20 characters
 
         # Verify character counts in error messages
-        assert "27" in errors[0]
-        assert "22" in errors[1]
+        assert "27" in IssueRecord.render(errors[0])
+        assert "22" in IssueRecord.render(errors[1])
 
 
 class TestDataValidationIntegration:
@@ -1004,7 +1005,7 @@ class TestDataValidationIntegration:
         assert len(all_warnings) > 0  # Should have warnings
 
         # Verify different types of issues are caught
-        error_text = " ".join(all_errors + all_warnings)
+        error_text = " ".join(map(IssueRecord.render, all_errors + all_warnings))
         assert "barra vertical" in error_text or "|" in error_text
         assert "valores repetidos" in error_text
         assert "excede o limite" in error_text
@@ -0,0 +1,104 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""Unit tests for indicator_index module."""
+
+import pandas as pd
+import pytest
+
+from data_validate.helpers.common.processing.data_cleaning_processing import DataCleaningProcessing
+from data_validate.helpers.common.validation.indicator_index import IndicatorIndex
+
+
+class TestIndicatorIndex:
+    """Test suite for IndicatorIndex class."""
+
+    @pytest.fixture
+    def df_description(self) -> pd.DataFrame:
+        """Create a description with valid, invalid and duplicated rows."""
+        return pd.DataFrame(
+            {
+                "codigo": ["1", "2", "3", "4", "abc", "5", "3", "6", "0"],
+                "nivel": ["1", "2", "2", "3", "3", "3,0", "2", "x", "1"],
+                "cenario": ["0", "1", "0", "1", "1", "1", "0", "1", "0"],
+                "legenda": [None, "1", "2", "2", "3", "1,0", "9", "", None],
+            }
+        )
+
+    @pytest.fixture
+    def df_composition(self) -> pd.DataFrame:
+        """Create a composition with an invalid parent and an invalid child."""
+        return pd.DataFrame({"codigo_pai": ["1", "1", "2", "z", "3"], "codigo_filho": ["2", "3", "4", "5", "0"]})
+
+    @pytest.fixture
+    def index(self, df_description: pd.DataFrame, df_composition: pd.DataFrame) -> IndicatorIndex:
+        """Create the index of the sample description and composition."""
+        return IndicatorIndex(
+            df_description=df_description,
+            code_column="codigo",
+            level_column="nivel",
+            scenario_column="cenario",
+            legend_column="legenda",
+            df_composition=df_composition,
+            parent_column="codigo_pai",
+            child_column="codigo_filho",
+        )
+
+    def test_rows_are_parsed_as_integers(self, index: IndicatorIndex) -> None:
+        """Test that each cell becomes an integer or None."""
+        assert index.codes == [1, 2, 3, 4, None, 5, 3, 6, 0]
+        assert index.levels == [1, 2, 2, 3, 3, 3, 2, None, 1]
+        assert index.legends == [None, 1, 2, 2, None, None, 9, None, None]
+        assert index.level_texts[5] == "3,0"
+
+    def test_code_lookups_use_first_row(self, index: IndicatorIndex) -> None:
+        """Test that duplicated codes are looked up in their first row."""
+        assert index.code_to_row[3] == 2
+        assert index.level_of(3) == 2
+        assert index.scenario_of(3) == 0
+        assert index.legend_of(3) == 2
+        assert index.level_of(42) is None
+
+    def test_level_buckets(self, index: IndicatorIndex) -> None:
+        """Test that each level lists the codes of its rows, duplicates included."""
+        assert index.codes_of_level(1) == [1, 0]
+        assert index.codes_of_level(1, min_code=1) == [1]
+        assert index.codes_of_level(2) == [2, 3, 3]
+        # Levels are matched by their text, as the validators compared the raw description
+        assert index.codes_of_level(3) == [4]
+
+    def test_legends_are_parsed_as_numbers(self) -> None:
+        """Test that legends are parsed by pd.to_numeric: a decimal comma is not a legend code."""
+        df_description = pd.DataFrame({"codigo": ["1", "2", "3"], "nivel": ["3", "3", "3"], "legenda": ["1.0", "1,0", "1.5"]})
+        index = IndicatorIndex(df_description, "codigo", "nivel", "cenario", "legenda")
+
+        with pytest.raises(TypeError):
+            index.legends
+
+        index = IndicatorIndex(df_description.iloc[:2], "codigo", "nivel", "cenario", "legenda")
+        assert index.legends == [1, None]
+
+    def test_codes_with_values(self, index: IndicatorIndex) -> None:
+        """Test that level 1 and level 2 without scenario are left out of the codes expected with values."""
+        assert index.codes_with_values() == {2, 4, 5, 6}
+        assert index.codes_with_values(skip_scenario_zero=False) == {2, 3, 4, 5, 6}
+
+    def test_composition_parents_and_leaves(self, index: IndicatorIndex) -> None:
+        """Test that the composition keeps valid edges only and finds parents and leaves."""
+        assert index.composition["codigo_pai"].tolist() == [1, 1, 2]
+        assert index.parent_codes == {1, 2}
+        assert index.leaf_codes == [3, 4]
+
+    @pytest.mark.parametrize("columns, min_value", [(["codigo"], 1), (["codigo", "nivel"], 1), (["codigo", "nivel", "cenario"], 0)])
+    def test_cleaned_matches_data_cleaning(self, index: IndicatorIndex, df_description: pd.DataFrame, columns, min_value) -> None:
+        """Test that the cleaned description is the one of DataCleaningProcessing."""
+        expected, _ = DataCleaningProcessing.clean_dataframe_integers(df_description, "descricao.csv", columns, min_value=min_value, max_messages=0)
+
+        pd.testing.assert_frame_equal(index.cleaned(columns, min_value), expected)
+        assert index.valid_rows(columns, min_value) == [df_description.index.get_loc(label) for label in expected.index]
+
+    def test_missing_description(self) -> None:
+        """Test that an index without description has no indicators."""
+        index = IndicatorIndex(None, "codigo", "nivel", "cenario", "legenda")
+
+        assert index.codes == []
+        assert index.codes_with_values() == set()
+        assert index.leaf_codes == []
@@ -0,0 +1,47 @@
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+"""Unit tests for value_column_index module."""
+
+import pytest
+
+from data_validate.helpers.common.processing.collections_processing import CollectionsProcessing
+from data_validate.helpers.common.validation.value_column_index import ValueColumnIndex
+
+COLUMNS = ["id", "1-2015", "2-2015", "2-2030-O", "2-2050-P", "2-2030-X", "3-abc", "4", "12-2015", "12-20150", "Unnamed: 9", "2-2015"]
+
+
+class TestValueColumnIndex:
+    """Test suite for ValueColumnIndex class."""
+
+    @pytest.fixture
+    def index(self) -> ValueColumnIndex:
+        """Create the index of the sample columns with two scenarios."""
+        return ValueColumnIndex(COLUMNS, ["O", "P"])
+
+    def test_columns_are_parsed(self, index: ValueColumnIndex) -> None:
+        """Test that each valid column gets its code, year and scenario."""
+        position = index.columns.index("2-2030-O")
+
+        assert (index.codes[position], index.years[position], index.scenarios[position]) == (2, 2030, "O")
+        assert index.scenarios[index.columns.index("1-2015")] is None
+        assert index.codes[index.columns.index("2-2030-X")] is None
+
+    def test_columns_are_grouped(self, index: ValueColumnIndex) -> None:
+        """Test the grouping of valid columns by code and of all columns by prefix."""
+        assert index.columns_by_code[2] == ["2-2015", "2-2030-O", "2-2050-P", "2-2015"]
+        assert index.valid_codes == {1, 2, 12}
+        assert index.columns_by_prefix["3"] == ["3-abc"]
+        assert "4" not in index.columns_by_prefix
+        assert index.prefixes[index.columns.index("4")] == "4"
+
+    @pytest.mark.parametrize("scenarios", [[], ["O", "P"], ["O", "O-P"]])
+    def test_matches_collections_processing(self, scenarios) -> None:
+        """Test that the classification is the one of CollectionsProcessing."""
+        index = ValueColumnIndex(COLUMNS, scenarios)
+
+        matched, not_matched = CollectionsProcessing.categorize_strings_by_id_pattern_from_list(COLUMNS, scenarios)
+        codes, unmatched = CollectionsProcessing.extract_numeric_ids_and_unmatched_strings_from_list(COLUMNS, ["id"], scenarios)
+
+        assert index.valid_columns == matched
+        assert index.invalid_columns == not_matched
+        assert index.valid_codes == codes
+        assert index.unmatched_columns(["id"]) == unmatched
@@ -6,7 +6,8 @@ from typing import Any, Set
 import pandas as pd
 import pytest
 
-from data_validate.helpers.common.validation.value_processing import ValueProcessing
+from data_validate.helpers.common.formatting.issue_record import IssueRecord
+from data_validate.helpers.common.validation.value_processing import ValueColumnSummary, ValueProcessing
 
 
 class TestValidateNumericValue:
@@ -67,9 +68,9 @@ class TestValidateNumericValue:
         is_valid, error_msg, has_excessive_decimals = ValueProcessing.check_numeric_value(value, row_index, column, filename)
 
         assert is_valid is False
-        assert "não é um número válido e nem DI (Dado Indisponível)" in error_msg
-        assert f"{filename}, linha {row_index + 2}:" in error_msg
-        assert f"coluna '{column}'" in error_msg
+        assert "não é um número válido e nem DI (Dado Indisponível)" in IssueRecord.render(error_msg)
+        assert f"{filename}, linha {row_index + 2}:" in IssueRecord.render(error_msg)
+        assert f"coluna '{column}'" in IssueRecord.render(error_msg)
         assert has_excessive_decimals is False
 
     def test_validate_numeric_value_di_case(self) -> None:
@@ -87,7 +88,7 @@ class TestValidateNumericValue:
         is_valid, error_msg, has_excessive_decimals = ValueProcessing.check_numeric_value("invalid_text", 0, "test_col", "test.xlsx")
 
         assert is_valid is False
-        assert "não é um número válido e nem DI (Dado Indisponível)" in error_msg
+        assert "não é um número válido e nem DI (Dado Indisponível)" in IssueRecord.render(error_msg)
         assert has_excessive_decimals is False
 
 
@@ -117,8 +118,8 @@ class TestProcessColumnValidation:
         errors, excessive_decimal_rows = ValueProcessing.process_column_validation(sample_dataframe, "invalid_col", "test.xlsx")
 
         assert len(errors) == 1
-        assert "2 valores que não são número válido nem DI" in errors[0]
-        assert "entre as linhas 3 e 5" in errors[0]
+        assert "2 valores que não são número válido nem DI" in IssueRecord.render(errors[0])
+        assert "entre as linhas 3 e 5" in IssueRecord.render(errors[0])
         assert len(excessive_decimal_rows) == 0
 
     def test_process_column_validation_excessive_decimals(self, sample_dataframe: pd.DataFrame) -> None:
@@ -135,8 +136,8 @@ class TestProcessColumnValidation:
         errors, excessive_decimal_rows = ValueProcessing.process_column_validation(df, "col", "test.xlsx")
 
         assert len(errors) == 1
-        assert "não é um número válido e nem DI" in errors[0]
-        assert "linha 3:" in errors[0]
+        assert "não é um número válido e nem DI" in IssueRecord.render(errors[0])
+        assert "linha 3:" in IssueRecord.render(errors[0])
         assert len(excessive_decimal_rows) == 0
 
     def test_process_column_validation_empty_dataframe(self) -> None:
@@ -155,7 +156,7 @@ class TestProcessColumnValidation:
         errors, excessive_decimal_rows = ValueProcessing.process_column_validation(df, "col", "test.xlsx")
 
         assert len(errors) == 1
-        assert "2 valores que não são número válido nem DI" in errors[0]
+        assert "2 valores que não são número válido nem DI" in IssueRecord.render(errors[0])
         assert excessive_decimal_rows == {2, 4, 7}
 
 
@@ -244,7 +245,7 @@ class TestValidateDataValuesInColumns:
         errors, warnings = ValueProcessing.validate_data_values_in_columns(sample_dataframe, ["col3"], "test.xlsx")
 
         assert len(errors) == 1
-        assert "2 valores que não são número válido nem DI" in errors[0]
+        assert "2 valores que não são número válido nem DI" in IssueRecord.render(errors[0])
         assert len(warnings) == 0
 
     def test_validate_data_values_in_columns_all_invalid(self, sample_dataframe: pd.DataFrame) -> None:
@@ -252,7 +253,7 @@ class TestValidateDataValuesInColumns:
         errors, warnings = ValueProcessing.validate_data_values_in_columns(sample_dataframe, ["col4"], "test.xlsx")
 
         assert len(errors) == 1
-        assert "4 valores que não são número válido nem DI" in errors[0]
+        assert "4 valores que não são número válido nem DI" in IssueRecord.render(errors[0])
         assert len(warnings) == 0
 
     def test_validate_data_values_in_columns_multiple_columns(self, sample_dataframe: pd.DataFrame) -> None:
@@ -260,7 +261,7 @@ class TestValidateDataValuesInColumns:
         errors, warnings = ValueProcessing.validate_data_values_in_columns(sample_dataframe, ["col1", "col2", "col3"], "test.xlsx")
 
         assert len(errors) == 1
-        assert "2 valores que não são número válido nem DI" in errors[0]
+        assert "2 valores que não são número válido nem DI" in IssueRecord.render(errors[0])
         assert len(warnings) == 1
         assert "Existem 3 valores com mais de 2 casas decimais" in warnings[0]
 
@@ -315,6 +316,92 @@ class TestValidateDataValuesInColumns:
         assert "Existem 6 valores com mais de 2 casas decimais" in warnings[0]  # Updated count
 
 
+class TestChunkedValidation:
+    """Test suite for chunked validation of value columns."""
+
+    @pytest.fixture
+    def large_dataframe(self) -> pd.DataFrame:
+        """Create a DataFrame with errors and excessive decimals spread across rows."""
+        return pd.DataFrame(
+            {
+                "col_a": ["1.5", "invalid", "DI", "2.555", "3", "text", "4.1", "5.123"],
+                "col_b": ["1", "2", "3", "4", "5", "6", "7", "bad"],
+                "col_c": ["1.111", "2", "3", "4", "5", "6", "7", "8"],
+                "col_d": ["1", "2", "3", "4", "5", "6", "7", "8"],
+            }
+        )
+
+    @pytest.mark.parametrize("chunk_size", [None, 0, 1, 3, 8, 100])
+    def test_iter_row_chunks_covers_all_rows(self, large_dataframe: pd.DataFrame, chunk_size: Any) -> None:
+        """Test that chunks cover every row once and keep the original index."""
+        chunks = list(ValueProcessing.iter_row_chunks(large_dataframe, chunk_size))
+
+        assert pd.concat(chunks).equals(large_dataframe)
+        if chunk_size:
+            assert all(len(chunk) <= chunk_size for chunk in chunks)
+        else:
+            assert len(chunks) == 1
+
+    def test_iter_row_chunks_empty_dataframe(self) -> None:
+        """Test that an empty DataFrame yields a single empty chunk."""
+        chunks = list(ValueProcessing.iter_row_chunks(pd.DataFrame({"col": []}), 10))
+
+        assert len(chunks) == 1
+        assert chunks[0].empty
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7])
+    def test_chunked_results_match_single_pass(self, large_dataframe: pd.DataFrame, chunk_size: int) -> None:
+        """Test that chunked validation produces exactly the single pass messages."""
+        columns = ["col_a", "col_b", "col_c", "col_d"]
+
+        expected = ValueProcessing.validate_data_values_in_columns(large_dataframe, columns, "valores.xlsx")
+        result = ValueProcessing.validate_data_values_in_columns(large_dataframe, columns, "valores.xlsx", chunk_size=chunk_size)
+
+        assert result == expected
+        assert [IssueRecord.render(error) for error in expected[0]] == [
+            "valores.xlsx: 2 valores que não são número válido nem DI (Dado Indisponível) para a coluna 'col_a', entre as linhas 3 e 7.",
+            "valores.xlsx, linha 9: O valor bad não é um número válido e nem DI (Dado Indisponível) para a coluna 'col_b'.",
+        ]
+
+    def test_block_summaries_match_single_value_checks(self) -> None:
+        """Test that the vectorized block validation agrees with checking every cell on its own."""
+        samples = ["1", "-1", "+1", "1.", ".5", "-.5", "1,5", "0.25", "1.500", "1,234", "-0.001", " 1.5", "1e3", "1.5e-5", "inf", "-Infinity"]
+        samples += ["nan", "", "DI", "di", "1_000", "0x10", "1,2,3", "--1", "١٢", "text", float("nan"), None, 10.555, 7, float("inf")]
+        df = pd.DataFrame({f"col_{shift}": [samples[(index + shift) % len(samples)] for index in range(40)] for shift in range(len(samples))})
+        df.index = range(10, 50)
+
+        summaries = ValueProcessing.summarize_columns(df, list(df.columns), "valores.csv")
+
+        for column in df.columns:
+            expected = ValueColumnSummary(column)
+            for index, value in df[column].items():
+                is_valid, error_msg, has_excessive_decimals = ValueProcessing.check_numeric_value(value, index, column, "valores.csv")
+                if not is_valid:
+                    expected.add_invalid(index + 2, error_msg)
+                if has_excessive_decimals:
+                    expected.excessive_decimal_rows.add(index + 2)
+            assert vars(summaries[column]) == vars(expected)
+
+    def test_summary_merge(self) -> None:
+        """Test merging summaries of consecutive chunks."""
+        first = ValueColumnSummary("col")
+        second = ValueColumnSummary("col")
+        third = ValueColumnSummary("col")
+        second.add_invalid(5, "first error")
+        second.excessive_decimal_rows.add(4)
+        third.add_invalid(9, "second error")
+        third.excessive_decimal_rows.add(8)
+
+        first.merge(second)
+        first.merge(third)
+
+        assert first.invalid_count == 2
+        assert first.first_invalid_row == 5
+        assert first.last_invalid_row == 9
+        assert first.first_error_message == "first error"
+        assert first.excessive_decimal_rows == {4, 8}
+
+
 class TestEdgeCases:
     """Test suite for edge cases and boundary conditions."""
 
@@ -7,10 +7,14 @@ including data model creation, file loading, error handling, and facade operatio
 
 #  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
 
+import zipfile
+
 import pandas as pd
 from pathlib import Path
 
 from data_validate.helpers.tools.data_loader.api.facade import DataLoaderModel, DataLoaderFacade
+from data_validate.helpers.tools.data_loader.common.archive import ArchivePath
+from data_validate.helpers.tools.data_loader.engine.cache import SheetCache
 
 
 class TestDataLoaderModel:
@@ -483,3 +487,182 @@ class TestDataLoaderFacade:
         assert data["file2"].is_read_successful is False
         assert data["file1"].path == Path("file1")
         assert data["file2"].path == Path("file2")
+
+    def test_initialization_with_jobs(self, mocker) -> None:
+        """Test DataLoaderFacade stores the number of concurrent jobs."""
+        mocker.patch("data_validate.helpers.tools.data_loader.api.facade.FileScanner")
+        mocker.patch("data_validate.helpers.tools.data_loader.api.facade.Config")
+
+        assert DataLoaderFacade("/test/input").jobs == 1
+        assert DataLoaderFacade("/test/input", jobs=4).jobs == 4
+
+    def test_load_all_concurrent_matches_sequential(self, mocker) -> None:
+        """Test that concurrent loading keeps the sequential order of results and errors."""
+        files_map = {f"file{i}": Path(f"/test/file{i}.csv") for i in range(6)}
+        failing = {"file1": ValueError("bad value"), "file4": IOError("locked")}
+
+        def make_reader(path, strategy):
+            reader = mocker.MagicMock()
+            if path.stem in failing:
+                reader.read.side_effect = failing[path.stem]
+            else:
+                reader.read.return_value = pd.DataFrame({"col": [path.stem]})
+            return reader
+
+        mocker.patch("data_validate.helpers.tools.data_loader.api.facade.ReaderFactory.get_reader", side_effect=make_reader)
+
+        results = []
+        for jobs in (1, 4):
+            mock_scanner = mocker.MagicMock()
+            mock_scanner.scan.return_value = (files_map, [], [])
+            mock_config = mocker.MagicMock()
+            mock_config.file_specs = {name: ("required", "single", "|") for name in files_map}
+
+            facade = DataLoaderFacade("/test/input", jobs=jobs)
+            facade.scanner = mock_scanner
+            facade.config = mock_config
+            results.append(facade.load_all)
+
+        (sequential_data, sequential_errors), (concurrent_data, concurrent_errors) = results
+
+        assert concurrent_errors == sequential_errors
+        assert len(concurrent_errors) == 2
+        assert "file1.csv: Erro nos valores da planilha" in concurrent_errors[0]
+        assert "file4.csv: Erro de entrada/saída" in concurrent_errors[1]
+        assert list(concurrent_data) == list(sequential_data)
+        for name in files_map:
+            assert concurrent_data[name].is_read_successful == sequential_data[name].is_read_successful
+            assert concurrent_data[name].raw_data.equals(sequential_data[name].raw_data)
+
+    def test_load_all_uses_sheet_cache(self, mocker, tmp_path: Path) -> None:
+        """Test that a cached sheet is not parsed again on the next load."""
+        file_path = tmp_path / "file1.csv"
+        file_path.write_text("col\n1\n")
+
+        mock_reader = mocker.MagicMock()
+        mock_reader.read.return_value = pd.DataFrame({"col": ["1"]})
+        mocker.patch("data_validate.helpers.tools.data_loader.api.facade.ReaderFactory.get_reader", return_value=mock_reader)
+
+        cache = SheetCache(tmp_path / "cache")
+        loaded = []
+        for _ in range(2):
+            mock_scanner = mocker.MagicMock()
+            mock_scanner.scan.return_value = ({"file1": file_path}, [], [])
+            mock_config = mocker.MagicMock()
+            mock_config.file_specs = {"file1": ("required", "single", "|")}
+
+            facade = DataLoaderFacade(str(tmp_path), cache=cache)
+            facade.scanner = mock_scanner
+            facade.config = mock_config
+            loaded.append(facade.load_all)
+
+        mock_reader.read.assert_called_once()
+        (first_data, first_errors), (second_data, second_errors) = loaded
+        assert first_errors == second_errors == []
+        assert second_data["file1"].is_read_successful is True
+        pd.testing.assert_frame_equal(second_data["file1"].raw_data, first_data["file1"].raw_data)
+
+    def test_load_all_header_only(self, mocker, tmp_path: Path) -> None:
+        """Test that a header-only load reads only the first row, except for full read sheets."""
+        files_map = {name: tmp_path / f"{name}.csv" for name in ("file1", "file2")}
+        for path in files_map.values():
+            path.write_text("col\n1\n2\n")
+
+        mock_reader = mocker.MagicMock()
+        mock_reader.read.return_value = pd.DataFrame({"col": ["1"]})
+        mock_get_reader = mocker.patch("data_validate.helpers.tools.data_loader.api.facade.ReaderFactory.get_reader", return_value=mock_reader)
+
+        mock_scanner = mocker.MagicMock()
+        mock_scanner.scan.return_value = (files_map, [], [])
+        mock_config = mocker.MagicMock()
+        mock_config.file_specs = {name: ("required", "single", "|") for name in files_map}
+
+        cache = SheetCache(tmp_path / "cache")
+        facade = DataLoaderFacade(str(tmp_path), cache=cache, reader_options={"csv_engine": "c"}, header_only=True, full_read=["file2"])
+        facade.scanner = mock_scanner
+        facade.config = mock_config
+        data, errors = facade.load_all
+
+        assert errors == []
+        assert mock_get_reader.call_args_list[0].kwargs == {"csv_engine": "c", "nrows": DataLoaderFacade.HEADER_ONLY_NROWS}
+        assert mock_get_reader.call_args_list[1].kwargs == {"csv_engine": "c"}
+        assert data["file1"].header_only is True
+        assert data["file2"].header_only is False
+        # Header-only reads are never cached
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    def test_load_all_header_only_sheets(self, mocker, tmp_path: Path) -> None:
+        """Test that the sheets listed in header_only_sheets are read header-only in a full load."""
+        files_map = {name: tmp_path / f"{name}.csv" for name in ("file1", "file2")}
+        for path in files_map.values():
+            path.write_text("col\n1\n2\n")
+
+        mock_reader = mocker.MagicMock()
+        mock_reader.read.return_value = pd.DataFrame({"col": ["1"]})
+        mock_get_reader = mocker.patch("data_validate.helpers.tools.data_loader.api.facade.ReaderFactory.get_reader", return_value=mock_reader)
+
+        mock_scanner = mocker.MagicMock()
+        mock_scanner.scan.return_value = (files_map, [], [])
+        mock_config = mocker.MagicMock()
+        mock_config.file_specs = {name: ("required", "single", "|") for name in files_map}
+
+        facade = DataLoaderFacade(str(tmp_path), header_only_sheets=["file2"])
+        facade.scanner = mock_scanner
+        facade.config = mock_config
+        data, errors = facade.load_all
+
+        assert errors == []
+        assert mock_get_reader.call_args_list[0].kwargs == {}
+        assert mock_get_reader.call_args_list[1].kwargs == {"nrows": DataLoaderFacade.HEADER_ONLY_NROWS}
+        assert data["file1"].header_only is False
+        assert data["file2"].header_only is True
+
+    def test_load_all_from_zip_archive(self, tmp_path: Path) -> None:
+        """Test that a .zip submission is scanned and read in memory, like the extracted folder."""
+        archive_path = tmp_path / "submissao.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("descricao.csv", "codigo|nivel\n1|1\n2|2\n")
+            archive.writestr("legenda.qml", "<qgis/>")
+
+        facade = DataLoaderFacade(str(archive_path))
+        data, errors = facade.load_all
+
+        assert isinstance(facade.input_dir, ArchivePath)
+        assert data["descricao"].is_read_successful is True
+        assert data["descricao"].does_file_exist is True
+        assert data["descricao"].filename == "descricao.csv"
+        assert data["descricao"].raw_data["codigo"].tolist() == ["1", "2"]
+        assert data["qmls"] == ["<qgis/>"]
+        assert data["valores"].is_read_successful is False
+        assert list(tmp_path.iterdir()) == [archive_path]
+
+    def test_load_all_with_compactor(self, mocker, tmp_path: Path) -> None:
+        """Test parsed sheets go through the compactor, also when taken from the cache."""
+        file_path = tmp_path / "file1.csv"
+        file_path.write_text("col\n1\n")
+        parsed = pd.DataFrame({"col": ["1"]})
+
+        mock_reader = mocker.MagicMock()
+        mock_reader.read.return_value = parsed
+        mocker.patch("data_validate.helpers.tools.data_loader.api.facade.ReaderFactory.get_reader", return_value=mock_reader)
+        mock_compactor = mocker.MagicMock()
+        mock_compactor.compact.side_effect = lambda df: df.assign(col=["compact"])
+
+        cache = SheetCache(tmp_path / "cache")
+        loaded = []
+        for _ in range(2):
+            mock_scanner = mocker.MagicMock()
+            mock_scanner.scan.return_value = ({"file1": file_path}, [], [])
+            mock_config = mocker.MagicMock()
+            mock_config.file_specs = {"file1": ("required", "single", "|")}
+
+            facade = DataLoaderFacade(str(tmp_path), cache=cache, compactor=mock_compactor)
+            facade.scanner = mock_scanner
+            facade.config = mock_config
+            loaded.append(facade.load_all)
+
+        mock_reader.read.assert_called_once()
+        assert mock_compactor.compact.call_count == 2
+        for data, errors in loaded:
+            assert errors == []
+            assert data["file1"].raw_data["col"].tolist() == ["compact"]
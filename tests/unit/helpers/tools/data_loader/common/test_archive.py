@@ -0,0 +1,77 @@
+"""
+Unit tests for archive.py module.
+
+This module tests the ArchivePath class functionality including archive detection,
+member listing, path-like attributes and in-memory reads of zip members.
+"""
+
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from data_validate.helpers.tools.data_loader.common.archive import ArchivePath
+
+
+@pytest.fixture
+def archive_path(tmp_path: Path) -> Path:
+    """Create a zip archive with root-level files and an implicit folder."""
+    path = tmp_path / "submissao.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("descricao.csv", "codigo|nivel\n1|1\n")
+        archive.writestr("legenda.qml", "<qgis/>")
+        archive.writestr("extra/notas.txt", "texto")
+    return path
+
+
+class TestArchivePath:
+    """Test suite for ArchivePath class."""
+
+    def test_is_archive(self, archive_path: Path, tmp_path: Path) -> None:
+        """Test only existing .zip files are detected as archives."""
+        not_zip = tmp_path / "falso.zip"
+        not_zip.write_text("not a zip")
+
+        assert ArchivePath.is_archive(archive_path) is True
+        assert ArchivePath.is_archive(str(archive_path)) is True
+        assert ArchivePath.is_archive(not_zip) is False
+        assert ArchivePath.is_archive(tmp_path) is False
+        assert ArchivePath.is_archive(tmp_path / "missing.zip") is False
+
+    def test_iterdir_lists_root_entries(self, archive_path: Path) -> None:
+        """Test the archive root lists files and folders, including folders without an own entry."""
+        root = ArchivePath(archive_path)
+
+        assert [entry.name for entry in root.iterdir()] == ["descricao.csv", "legenda.qml", "extra"]
+        assert root.is_dir() is True
+        assert (root / "extra").is_dir() is True
+        assert (root / "extra").is_file() is False
+        assert [entry.name for entry in (root / "extra").iterdir()] == ["notas.txt"]
+
+    def test_member_attributes(self, archive_path: Path) -> None:
+        """Test members expose the same name attributes as pathlib.Path."""
+        member = ArchivePath(archive_path) / "descricao.csv"
+
+        assert member.name == "descricao.csv"
+        assert member.stem == "descricao"
+        assert member.suffix == ".csv"
+        assert member.exists() is True
+        assert member.is_file() is True
+        assert str(member) == f"{archive_path}/descricao.csv"
+        assert member == ArchivePath(archive_path, "descricao.csv")
+        assert (ArchivePath(archive_path) / "missing.csv").exists() is False
+
+    def test_reads_member_in_memory(self, archive_path: Path) -> None:
+        """Test members are read as bytes, text and in-memory buffers."""
+        root = ArchivePath(archive_path)
+
+        assert (root / "descricao.csv").read_bytes() == b"codigo|nivel\n1|1\n"
+        assert (root / "legenda.qml").read_text() == "<qgis/>"
+        assert (root / "descricao.csv").buffer().read() == b"codigo|nivel\n1|1\n"
+
+    def test_read_missing_member_raises_file_not_found(self, archive_path: Path) -> None:
+        """Test reading a missing member raises FileNotFoundError like pathlib.Path."""
+        with pytest.raises(FileNotFoundError):
+            (ArchivePath(archive_path) / "missing.csv").read_bytes()
@@ -0,0 +1,166 @@
+"""
+Unit tests for cache.py module.
+
+This module tests the SheetCache class functionality including key generation,
+storage and retrieval of parsed sheets, and LRU eviction by total size.
+"""
+
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import os
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from data_validate.helpers.tools.data_loader.common.archive import ArchivePath
+from data_validate.helpers.tools.data_loader.engine.cache import SheetCache
+
+
+class TestSheetCache:
+    """Test suite for SheetCache class."""
+
+    def test_default_dir_uses_xdg_cache_home(self, monkeypatch, tmp_path: Path) -> None:
+        """Test default cache directory honours XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert SheetCache.default_dir() == tmp_path / "canoa_data_validate" / "sheets"
+
+    def test_make_key_is_stable_for_unchanged_file(self, tmp_path: Path) -> None:
+        """Test the same file and variant always produce the same key."""
+        file_path = tmp_path / "valores.csv"
+        file_path.write_text("id|1-2015\n1|0.5\n")
+        cache = SheetCache(tmp_path / "cache")
+
+        assert cache.make_key(file_path, "CSVReader") == cache.make_key(file_path, "CSVReader")
+        assert cache.make_key(file_path, "CSVReader") != cache.make_key(file_path, "ExcelReader")
+
+    def test_make_key_changes_when_content_changes(self, tmp_path: Path) -> None:
+        """Test that editing a file invalidates its key."""
+        file_path = tmp_path / "valores.csv"
+        file_path.write_text("id|1-2015\n1|0.5\n")
+        cache = SheetCache(tmp_path / "cache")
+        first_key = cache.make_key(file_path)
+
+        file_path.write_text("id|1-2015\n1|0.7\n")
+        os.utime(file_path, ns=(0, 0))
+
+        assert cache.make_key(file_path) != first_key
+
+    def test_make_key_returns_none_for_missing_file(self, tmp_path: Path) -> None:
+        """Test that an unreadable file has no cache key."""
+        cache = SheetCache(tmp_path / "cache")
+
+        assert cache.make_key(tmp_path / "missing.csv") is None
+
+    def test_content_hash_ignores_location_and_modification_time(self, tmp_path: Path) -> None:
+        """Test the content hash depends only on the file bytes."""
+        first = tmp_path / "a" / "legenda.csv"
+        second = tmp_path / "b" / "legenda.csv"
+        for file_path in (first, second):
+            file_path.parent.mkdir()
+            file_path.write_text("codigo|label\n1|Baixo\n")
+        os.utime(second, ns=(0, 0))
+
+        assert SheetCache.content_hash(first) == SheetCache.content_hash(second)
+        second.write_text("codigo|label\n1|Alto\n")
+        assert SheetCache.content_hash(first) != SheetCache.content_hash(second)
+        assert SheetCache.content_hash(tmp_path / "missing.csv") is None
+
+    def test_make_key_for_archive_member(self, tmp_path: Path) -> None:
+        """Test that zip members get stable keys that change with the member content."""
+        archive_path = tmp_path / "submissao.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("valores.csv", "id|1-2015\n1|0.5\n")
+        cache = SheetCache(tmp_path / "cache")
+        member = ArchivePath(archive_path) / "valores.csv"
+        first_key = cache.make_key(member)
+
+        assert first_key is not None
+        assert cache.make_key(member) == first_key
+        assert cache.make_key(ArchivePath(archive_path) / "missing.csv") is None
+
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("valores.csv", "id|1-2015\n1|0.7\n")
+
+        assert cache.make_key(member) != first_key
+
+    def test_put_and_get_round_trip(self, tmp_path: Path) -> None:
+        """Test that stored sheets are returned unchanged, including double headers."""
+        cache = SheetCache(tmp_path / "cache")
+        df = pd.DataFrame([["1", None], ["2", "0.5"]], columns=pd.MultiIndex.from_tuples([("id", "id"), ("1", "2")]), dtype=str)
+
+        cache.put("key", df)
+        cached = cache.get("key")
+
+        assert cached is not None
+        pd.testing.assert_frame_equal(cached, df)
+
+    def test_get_missing_entry_returns_none(self, tmp_path: Path) -> None:
+        """Test cache miss returns None."""
+        cache = SheetCache(tmp_path / "cache")
+
+        assert cache.get("unknown") is None
+
+    def test_get_corrupted_entry_is_discarded(self, tmp_path: Path) -> None:
+        """Test that a corrupted entry is removed and treated as a miss."""
+        cache = SheetCache(tmp_path / "cache")
+        cache.cache_dir.mkdir(parents=True)
+        entry = cache.cache_dir / f"broken{SheetCache.ENTRY_SUFFIX}"
+        entry.write_bytes(b"not a pickle")
+
+        assert cache.get("broken") is None
+        assert not entry.exists()
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership and permissions")
+    def test_put_creates_private_folder(self, tmp_path: Path) -> None:
+        """Test the cache folder is created readable and writable only by its owner."""
+        cache = SheetCache(tmp_path / "cache")
+
+        cache.put("key", pd.DataFrame({"col": ["1"]}))
+
+        assert cache.cache_dir.stat().st_mode & 0o777 == 0o700
+        assert cache.is_private() is True
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership and permissions")
+    def test_shared_folder_is_not_used(self, tmp_path: Path) -> None:
+        """Test entries are neither read from nor written to a group or world-writable folder."""
+        cache = SheetCache(tmp_path / "cache")
+        cache.put("key", pd.DataFrame({"col": ["1"]}))
+        os.chmod(cache.cache_dir, 0o777)
+
+        assert cache.is_private() is False
+        assert cache.get("key") is None
+        assert (cache.cache_dir / f"key{SheetCache.ENTRY_SUFFIX}").exists()
+
+        cache.put("other", pd.DataFrame({"col": ["2"]}))
+
+        assert not (cache.cache_dir / f"other{SheetCache.ENTRY_SUFFIX}").exists()
+
+    def test_evict_removes_least_recently_used_entries(self, tmp_path: Path) -> None:
+        """Test LRU eviction keeps the cache under its size limit."""
+        cache = SheetCache(tmp_path / "cache")
+        df = pd.DataFrame({"col": ["x" * 1000] * 10})
+        for index, key in enumerate(["old", "middle", "new"]):
+            cache.put(key, df)
+            entry = cache.cache_dir / f"{key}{SheetCache.ENTRY_SUFFIX}"
+            os.utime(entry, ns=(index * 10**9, index * 10**9))
+
+        entry_size = (cache.cache_dir / f"new{SheetCache.ENTRY_SUFFIX}").stat().st_size
+        cache.max_size_bytes = entry_size * 2
+        cache.evict()
+
+        assert cache.get("old") is None
+        assert cache.get("middle") is not None
+        assert cache.get("new") is not None
+
+    def test_clear_removes_all_entries(self, tmp_path: Path) -> None:
+        """Test clear empties the cache directory."""
+        cache = SheetCache(tmp_path / "cache")
+        cache.put("a", pd.DataFrame({"col": ["1"]}))
+        cache.put("b", pd.DataFrame({"col": ["2"]}))
+
+        cache.clear()
+
+        assert list(cache.cache_dir.glob(f"*{SheetCache.ENTRY_SUFFIX}")) == []
@@ -0,0 +1,89 @@
+"""
+Unit tests for compactor.py module.
+
+This module tests the SheetCompactor class functionality including conversion of
+Python string columns to Arrow strings, interning of repeated values and
+preservation of values, missing markers and headers.
+"""
+
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_validate.helpers.tools.data_loader.engine.compactor import SheetCompactor
+
+PYTHON_STR = pd.StringDtype("python", na_value=np.nan)
+
+
+def make_values_frame() -> pd.DataFrame:
+    """Create a values sheet with repeated codes, "DI" markers and missing cells."""
+    return pd.DataFrame(
+        {
+            "id": ["1", "2", "3", "4"],
+            "1-2015": ["0,5", "DI", "DI", np.nan],
+            "1-2030-M": ["0,5", "0,5", "abc", "DI"],
+        },
+        dtype=PYTHON_STR,
+    )
+
+
+class TestSheetCompactor:
+    """Test suite for SheetCompactor class."""
+
+    def test_compact_uses_arrow_strings(self) -> None:
+        """Test python string columns move to Arrow storage with the same values."""
+        pytest.importorskip("pyarrow")
+        df = make_values_frame()
+
+        result = SheetCompactor(use_arrow=True).compact(df)
+
+        assert all(dtype.storage == "pyarrow" for dtype in result.dtypes)
+        assert all(dtype.na_value is np.nan for dtype in result.dtypes)
+        pd.testing.assert_frame_equal(result, df, check_dtype=False)
+        assert result.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum()
+        # The input frame is left untouched
+        assert all(dtype.storage == "python" for dtype in df.dtypes)
+
+    def test_compact_interns_repeated_values_without_arrow(self) -> None:
+        """Test repeated texts share a single object when Arrow strings are not used."""
+        df = make_values_frame()
+
+        result = SheetCompactor(use_arrow=False).compact(df)
+
+        assert result.dtypes.tolist() == df.dtypes.tolist()
+        pd.testing.assert_frame_equal(result, df)
+        values = result["1-2015"].to_numpy(dtype=object)
+        assert values[1] is values[2]
+        assert pd.isna(values[3])
+
+    def test_compact_object_columns_keep_dtype(self) -> None:
+        """Test object columns of text are interned, keeping the object dtype."""
+        df = pd.DataFrame({"cenario": ["O", "M", "O"], "numero": [1, 2, 3]}, dtype=object)
+
+        result = SheetCompactor(use_arrow=True).compact(df)
+
+        pd.testing.assert_frame_equal(result, df)
+        values = result["cenario"].to_numpy(dtype=object)
+        assert values[0] is values[2]
+
+    def test_compact_keeps_double_header_and_duplicated_names(self) -> None:
+        """Test MultiIndex headers and repeated column names are preserved."""
+        columns = pd.MultiIndex.from_tuples([("Unnamed: 0_level_0", "id"), ("1-2015", "1"), ("1-2015", "1")])
+        df = pd.DataFrame([["1-2015", "0.5", "0.7"]], columns=columns, dtype=PYTHON_STR)
+
+        result = SheetCompactor(use_arrow=False).compact(df)
+
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_compact_returns_same_frame_when_nothing_to_do(self) -> None:
+        """Test empty frames, non-frames and Arrow-backed frames are returned as they are."""
+        pytest.importorskip("pyarrow")
+        arrow_df = pd.DataFrame({"col": ["a"]}, dtype=pd.StringDtype("pyarrow", na_value=np.nan))
+        empty_df = pd.DataFrame()
+        compactor = SheetCompactor()
+
+        assert compactor.compact(arrow_df) is arrow_df
+        assert compactor.compact(empty_df) is empty_df
+        assert compactor.compact(None) is None
@@ -7,9 +7,11 @@ reader creation for different file types and error handling.
 
 #  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
 
-import pytest
+import threading
 from pathlib import Path
 
+import pytest
+
 from data_validate.helpers.tools.data_loader.engine.factory import ReaderFactory
 from data_validate.helpers.tools.data_loader.common.exceptions import ReaderNotFoundError
 
@@ -93,6 +95,12 @@ class TestReaderFactory:
         # Verify that the reader was created with the correct strategy
         assert reader.header_strategy == mock_strategy
 
+    def test_get_reader_passes_options_to_reader(self, mocker) -> None:
+        """Test get_reader forwards reader options to the reader constructor."""
+        reader = ReaderFactory.get_reader(Path("test.csv"), mocker.MagicMock(), csv_engine="pyarrow")
+
+        assert reader.options == {"csv_engine": "pyarrow"}
+
     def test_registry_contains_expected_readers(self) -> None:
         """Test that registry contains expected reader mappings."""
         expected_extensions = [".csv", ".xlsx", ".qml"]
@@ -122,3 +130,65 @@ class TestReaderFactory:
         from data_validate.helpers.tools.data_loader.readers.excel_reader import ExcelReader
 
         assert isinstance(reader, ExcelReader)
+
+    def test_get_reader_columnar_files(self, mocker) -> None:
+        """Test get_reader creates the built-in Parquet and Feather readers."""
+        mock_strategy = mocker.MagicMock()
+
+        from data_validate.helpers.tools.data_loader.readers.columnar_reader import FeatherReader, ParquetReader
+
+        assert isinstance(ReaderFactory.get_reader(Path("test.parquet"), mock_strategy), ParquetReader)
+        assert isinstance(ReaderFactory.get_reader(Path("test.feather"), mock_strategy), FeatherReader)
+
+    def test_register_new_reader(self, mocker) -> None:
+        """Test registering a reader makes its extension scannable and sets its precedence."""
+        from data_validate.helpers.tools.data_loader.common.config import Config
+        from data_validate.helpers.tools.data_loader.readers.base_reader import BaseReader
+
+        class TSVReader(BaseReader):
+            def _read_file(self):
+                return None
+
+        config = Config()
+        default_extensions, default_precedence = list(config.extensions), list(config.precedence)
+        try:
+            ReaderFactory.register("TSV", TSVReader, precedence=0)
+
+            assert isinstance(ReaderFactory.get_reader(Path("test.tsv"), mocker.MagicMock()), TSVReader)
+            assert ".tsv" in ReaderFactory.extensions()
+            assert ReaderFactory.precedence()[0] == ".tsv"
+            assert ReaderFactory.is_available(".tsv") is True
+            # The registry lives in the factory: the shared Config lists are left untouched
+            assert (config.extensions, config.precedence) == (default_extensions, default_precedence)
+        finally:
+            ReaderFactory.unregister(".tsv")
+
+        assert ".tsv" not in ReaderFactory.extensions()
+        assert ReaderFactory.precedence() == default_precedence
+        with pytest.raises(ReaderNotFoundError):
+            ReaderFactory.get_reader(Path("test.tsv"), mocker.MagicMock())
+
+    def test_register_from_concurrent_threads(self) -> None:
+        """Test concurrent registrations are all recorded, once each."""
+        from data_validate.helpers.tools.data_loader.readers.csv_reader import CSVReader
+
+        extensions = [f".t{index}" for index in range(32)]
+        threads = [threading.Thread(target=ReaderFactory.register, args=(ext, CSVReader), kwargs={"precedence": 0}) for ext in extensions]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert set(extensions) <= set(ReaderFactory.extensions())
+            assert sorted(ReaderFactory.precedence()[: len(extensions)]) == sorted(extensions)
+        finally:
+            for ext in extensions:
+                ReaderFactory.unregister(ext)
+
+        assert not set(extensions) & set(ReaderFactory.extensions() + ReaderFactory.precedence())
+
+    def test_register_rejects_non_reader(self) -> None:
+        """Test only BaseReader subclasses can be registered."""
+        with pytest.raises(TypeError):
+            ReaderFactory.register(".tsv", object)
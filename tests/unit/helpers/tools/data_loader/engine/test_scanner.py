@@ -300,3 +300,36 @@ class TestFileScanner:
         assert mock_qml1 in qmls
         assert mock_qml2 in qmls
         assert len(missing) == 0  # Non-required files don't appear in missing
+
+    def test_scan_prefers_fastest_format(self, mocker) -> None:
+        """Test scan follows the format precedence (.parquet, .feather, .csv, .xlsx)."""
+        mock_config = mocker.MagicMock()
+        mock_config.file_specs = {"file1": ("required", "single", "csv")}
+        mock_config.extensions = [".csv", ".xlsx", ".parquet", ".feather", ".qml"]
+
+        files = []
+        for suffix in (".xlsx", ".csv", ".parquet", ".feather"):
+            mock_file = mocker.MagicMock()
+            mock_file.stem = "file1"
+            mock_file.suffix = suffix
+            files.append(mock_file)
+        mock_dir = mocker.MagicMock()
+        mock_dir.iterdir.return_value = files
+
+        scanner = FileScanner(mock_dir)
+        scanner.config = mock_config
+        found, _, _ = scanner.scan()
+        assert found["file1"].suffix == ".parquet"
+
+        scanner = FileScanner(mock_dir, precedence=[".csv", ".parquet"])
+        scanner.config = mock_config
+        found, _, _ = scanner.scan()
+        assert found["file1"].suffix == ".csv"
+
+    def test_scan_skips_unavailable_readers(self, mocker) -> None:
+        """Test formats whose reader is unavailable lose to the available ones."""
+        mocker.patch("data_validate.helpers.tools.data_loader.readers.columnar_reader.ColumnarReader.is_available", return_value=False)
+
+        scanner = FileScanner(mocker.MagicMock())
+
+        assert scanner.select_extension([".parquet", ".xlsx", ".csv"]) == ".csv"
@@ -0,0 +1,105 @@
+"""
+Unit tests for columnar_reader.py module.
+
+This module tests the ParquetReader and FeatherReader classes functionality including
+text conversion of typed columns, double header handling, partial reads and column
+projection.
+"""
+
+#  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from data_validate.helpers.tools.data_loader.readers.columnar_reader import FeatherReader, ParquetReader
+from data_validate.helpers.tools.data_loader.strategies.header import DoubleHeaderStrategy, SingleHeaderStrategy
+
+pytest.importorskip("pyarrow")
+
+
+def write_columnar(df: pd.DataFrame, path: Path) -> Path:
+    """Write a DataFrame as Parquet or Feather according to the file extension."""
+    if path.suffix == ".parquet":
+        df.to_parquet(path)
+    else:
+        df.to_feather(path)
+    return path
+
+
+@pytest.mark.parametrize("reader_cls, suffix", [(ParquetReader, ".parquet"), (FeatherReader, ".feather")])
+class TestColumnarReader:
+    """Test suite for ParquetReader and FeatherReader classes."""
+
+    def test_is_available(self, reader_cls, suffix) -> None:
+        """Test the reader is available when pyarrow is installed."""
+        assert reader_cls.is_available() is True
+
+    def test_read_single_header_as_text(self, reader_cls, suffix, tmp_path: Path) -> None:
+        """Test typed columns are read as text, keeping missing values as NaN."""
+        df = pd.DataFrame({"codigo": [1, 2], "valor": [0.5, None], "nome": ["a", None]})
+        path = write_columnar(df, tmp_path / f"valores{suffix}")
+
+        result = reader_cls(path, SingleHeaderStrategy()).read()
+
+        assert list(result.columns) == ["codigo", "valor", "nome"]
+        assert result["codigo"].tolist() == ["1", "2"]
+        assert result["valor"].iloc[0] == "0.5"
+        assert pd.isna(result["valor"].iloc[1])
+        assert pd.isna(result["nome"].iloc[1])
+        assert all(isinstance(dtype, pd.StringDtype) for dtype in result.dtypes)
+
+    def test_read_double_header_from_first_row(self, reader_cls, suffix, tmp_path: Path) -> None:
+        """Test flat files take the second header level from the first row, filling merged labels."""
+        df = pd.DataFrame(
+            [["id", "1", "2"], ["1-2015", "0.5", "0.5"]],
+            columns=["Unnamed: 0_level_0", "1-2015", "Unnamed: 2_level_0"],
+        )
+        path = write_columnar(df, tmp_path / f"proporcionalidades{suffix}")
+
+        result = reader_cls(path, DoubleHeaderStrategy()).read()
+
+        assert list(result.columns) == [("Unnamed: 0_level_0", "id"), ("1-2015", "1"), ("1-2015", "2")]
+        assert result.values.tolist() == [["1-2015", "0.5", "0.5"]]
+
+    def test_read_double_header_stored_multiindex(self, reader_cls, suffix, tmp_path: Path) -> None:
+        """Test files written by pandas with MultiIndex columns keep the stored header."""
+        df = pd.DataFrame([["1-2015", "0.5"]], columns=pd.MultiIndex.from_tuples([("Unnamed: 0_level_0", "id"), ("1-2015", "1")]))
+        path = write_columnar(df, tmp_path / f"proporcionalidades{suffix}")
+
+        result = reader_cls(path, DoubleHeaderStrategy()).read()
+
+        assert list(result.columns) == [("Unnamed: 0_level_0", "id"), ("1-2015", "1")]
+        assert result.values.tolist() == [["1-2015", "0.5"]]
+
+    def test_read_with_nrows(self, reader_cls, suffix, tmp_path: Path) -> None:
+        """Test partial reads return only the first rows, also with a double header."""
+        single = write_columnar(pd.DataFrame({"codigo": ["1", "2", "3"]}), tmp_path / f"descricao{suffix}")
+        double = write_columnar(pd.DataFrame({"1-2015": ["1", "0.5", "0.7"]}), tmp_path / f"proporcionalidades{suffix}")
+        empty = write_columnar(pd.DataFrame({"codigo": pd.Series([], dtype=str)}), tmp_path / f"vazio{suffix}")
+
+        assert reader_cls(single, SingleHeaderStrategy(), nrows=1).read()["codigo"].tolist() == ["1"]
+        assert reader_cls(double, DoubleHeaderStrategy(), nrows=1).read().values.tolist() == [["0.5"]]
+        assert reader_cls(empty, SingleHeaderStrategy(), nrows=1).read().empty
+
+    def test_read_with_column_projection(self, reader_cls, suffix, tmp_path: Path) -> None:
+        """Test pruned columns come back empty, in their original position."""
+        df = pd.DataFrame({"codigo": ["1"], "extra": ["x"], "nivel": ["2"]})
+        path = write_columnar(df, tmp_path / f"descricao{suffix}")
+
+        result = reader_cls(path, SingleHeaderStrategy(), usecols=["codigo", "nivel"]).read()
+
+        assert list(result.columns) == ["codigo", "extra", "nivel"]
+        assert result["codigo"].tolist() == ["1"]
+        assert result["extra"].isna().all()
+        assert result["nivel"].tolist() == ["2"]
+
+    def test_read_matches_csv_values(self, reader_cls, suffix, tmp_path: Path) -> None:
+        """Test a text-only file yields the same frame as the CSV reader would."""
+        df = pd.DataFrame({"id": ["1", "2"], "1-2015": ["0,5", np.nan]}, dtype=str)
+        path = write_columnar(df, tmp_path / f"valores{suffix}")
+
+        result = reader_cls(path, SingleHeaderStrategy()).read()
+
+        pd.testing.assert_frame_equal(result, df)
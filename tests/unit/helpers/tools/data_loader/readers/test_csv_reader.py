@@ -8,10 +8,11 @@ CSV file reading, header processing, and separator handling.
 #  Copyright (c) 2026 National Institute for Space Research (INPE) (https://www.gov.br/inpe/pt-br). Documentation, source code, and more details about the AdaptaBrasil project are available at: https://github.com/AdaptaBrasil/.
 
 import pandas as pd
+import pytest
 from pathlib import Path
 
 from data_validate.helpers.tools.data_loader.readers.csv_reader import CSVReader
-from data_validate.helpers.tools.data_loader.strategies.header import DoubleHeaderStrategy
+from data_validate.helpers.tools.data_loader.strategies.header import DoubleHeaderStrategy, SingleHeaderStrategy
 
 
 class TestCSVReader:
@@ -232,3 +233,61 @@ class TestCSVReader:
 
         # Check that pandas.read_csv was called with correct parameters
         mock_read_csv.assert_called_once_with(file_path, header=0, sep=";", low_memory=False, dtype=str)
+
+    def test_initialization_stores_reader_options(self, mocker) -> None:
+        """Test CSVReader keeps reader options such as the CSV engine."""
+        reader = CSVReader(Path("test.csv"), mocker.MagicMock(), csv_engine="pyarrow")
+
+        assert reader.options == {"csv_engine": "pyarrow"}
+
+    @pytest.mark.parametrize(
+        "content,strategy",
+        [
+            ("id|1-2015|1-2030-O\n1|2|3\n4|5|6\n", SingleHeaderStrategy()),
+            ("|1-2015||2-2015\nid|2-2015|3-2015|4-2015\n1|0.5|0.5|DI\n2|0.1|0.9|DI\n", DoubleHeaderStrategy()),
+        ],
+    )
+    def test_read_file_with_nrows_option(self, tmp_path: Path, content: str, strategy) -> None:
+        """Test that the nrows option keeps the columns of a full read and only the first rows."""
+        file_path = tmp_path / ("proporcionalidades.csv" if isinstance(strategy, DoubleHeaderStrategy) else "valores.csv")
+        file_path.write_text(content, encoding="utf-8")
+
+        expected = CSVReader(file_path, strategy).read()
+        result = CSVReader(file_path, strategy, nrows=1, csv_engine="pyarrow").read()
+
+        pd.testing.assert_frame_equal(result, expected.iloc[:1])
+
+    def test_forward_fill_labels(self) -> None:
+        """Test that empty and unnamed level 0 labels inherit the previous label."""
+        labels = ["Group1", "Unnamed: 1_level_0", "", "Group2", float("nan")]
+
+        assert CSVReader._forward_fill_labels(labels) == ["Group1", "Group1", "Group1", "Group2", "Group2"]
+
+    def test_na_values_match_c_engine(self, tmp_path: Path) -> None:
+        """Test that the missing value texts given to pyarrow are the ones the C engine reads as missing."""
+        file_path = tmp_path / "valores.csv"
+        file_path.write_text("id\n" + "\n".join(f"{token}|" for token in CSVReader.NA_VALUES) + "\n", encoding="utf-8")
+
+        df = pd.read_csv(file_path, sep="|", dtype=str, usecols=[0])
+
+        assert df["id"].isna().all()
+        assert len(df) == len(CSVReader.NA_VALUES)
+
+    @pytest.mark.parametrize(
+        "content,strategy",
+        [
+            ('id|1-2015|1-2030-O\n 1 |007|NA\n\n2|1.50|""\n3|"a|b"|nan\n', SingleHeaderStrategy()),
+            ("|1-2015||2-2015|\nid|2-2015|3-2015|4-2015|x\n1|0.5|0.5|DI|\n", DoubleHeaderStrategy()),
+            ("id|a|b\n1|2\n3|4|5\n", SingleHeaderStrategy()),
+        ],
+    )
+    def test_pyarrow_engine_matches_c_engine(self, tmp_path: Path, content: str, strategy) -> None:
+        """Test that the pyarrow engine produces the same DataFrame as the C engine."""
+        pytest.importorskip("pyarrow")
+        file_path = tmp_path / ("proporcionalidades.csv" if isinstance(strategy, DoubleHeaderStrategy) else "valores.csv")
+        file_path.write_text(content, encoding="utf-8")
+
+        expected = CSVReader(file_path, strategy).read()
+        result = CSVReader(file_path, strategy, csv_engine="pyarrow").read()
+
+        pd.testing.assert_frame_equal(result, expected)
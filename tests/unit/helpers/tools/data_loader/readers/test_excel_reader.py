@@ -96,6 +96,21 @@ class TestExcelReader:
         # Check that pandas.read_excel was called with list header
         mock_read_excel.assert_called_once_with(file_path, header=[0, 1], dtype=str, engine="calamine")
 
+    def test_read_file_with_nrows_option(self, mocker) -> None:
+        """Test that the nrows option limits the rows read by pandas.read_excel."""
+        mock_strategy = mocker.MagicMock()
+        mock_strategy.get_header.return_value = 0
+
+        expected_df = pd.DataFrame({"col1": ["1"]})
+        mock_read_excel = mocker.patch("pandas.read_excel", return_value=expected_df)
+
+        file_path = Path("test.xlsx")
+        reader = ExcelReader(file_path, mock_strategy, nrows=1)
+
+        reader._read_file()
+
+        mock_read_excel.assert_called_once_with(file_path, header=0, dtype=str, engine="calamine", nrows=1)
+
     def test_read_file_with_none_header(self, mocker) -> None:
         """Test reading Excel file with None header."""
         # Mock dependencies
@@ -102,6 +102,22 @@ class TestLanguageManagerTextRetrieval:
         result = manager.text("hello")
         assert "Message for 'hello' missing" in result
 
+    def test_text_falls_back_to_default_language(self, mocker, tmp_path) -> None:
+        """Test keys missing in the current language are taken from the default language."""
+        mocker.patch("data_validate.helpers.tools.locale.language_manager.LanguageManager._congifure_language")
+        mocker.patch("data_validate.helpers.tools.locale.language_manager.LanguageManager._load_translations")
+        default_dir = tmp_path / LanguageEnum.DEFAULT_LANGUAGE.value
+        default_dir.mkdir()
+        (default_dir / "messages.json").write_text('{"only_default": {"message": "Olá {name}"}, "hello": {"message": "Olá"}}', encoding="utf-8")
+
+        manager = LanguageManager(path_locale_dir=str(tmp_path))
+        manager.current_language = "en_US"
+        manager.translations = {"hello": {"message": "Hello"}}
+
+        assert manager.text("hello") == "Hello"
+        assert manager.text("only_default", name="Ana") == "Olá Ana"
+        assert "missing or invalid structure" in manager.text("nonexistent_key")
+
 
 class TestLanguageManagerLanguageManagement:
     """Test suite for language management functionality."""
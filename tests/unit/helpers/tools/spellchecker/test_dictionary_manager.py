@@ -102,8 +102,8 @@ class TestDictionaryManager:
         assert result == mock_dictionary
         assert manager.dictionary == mock_dictionary
         mock_broker.request_dict.assert_called_once_with("pt_BR")
-        mock_dictionary.add.assert_any_call("word1")
-        mock_dictionary.add.assert_any_call("word2")
+        mock_dictionary.add_to_session.assert_any_call("word1")
+        mock_dictionary.add_to_session.assert_any_call("word2")
 
     def test_initialize_dictionary_with_comment_words(self, mocker) -> None:
         """Test dictionary initialization with comment words (starting with #)."""
@@ -120,10 +120,10 @@ class TestDictionaryManager:
         manager.initialize_dictionary(["word1", "#comment", "word2"])
 
         # Should only add non-comment words
-        mock_dictionary.add.assert_any_call("word1")
-        mock_dictionary.add.assert_any_call("word2")
+        mock_dictionary.add_to_session.assert_any_call("word1")
+        mock_dictionary.add_to_session.assert_any_call("word2")
         # Should not add comment word - check that it wasn't called with comment
-        calls = mock_dictionary.add.call_args_list
+        calls = mock_dictionary.add_to_session.call_args_list
         comment_calls = [call for call in calls if call[0][0] == "#comment"]
         assert len(comment_calls) == 0
 
@@ -142,10 +142,10 @@ class TestDictionaryManager:
         manager.initialize_dictionary(["word1", "", "word2"])
 
         # Should only add non-empty words
-        mock_dictionary.add.assert_any_call("word1")
-        mock_dictionary.add.assert_any_call("word2")
+        mock_dictionary.add_to_session.assert_any_call("word1")
+        mock_dictionary.add_to_session.assert_any_call("word2")
         # Should not add empty word - check that it wasn't called with empty string
-        calls = mock_dictionary.add.call_args_list
+        calls = mock_dictionary.add_to_session.call_args_list
         empty_calls = [call for call in calls if call[0][0] == ""]
         assert len(empty_calls) == 0
 
@@ -200,11 +200,11 @@ class TestDictionaryManager:
         manager._load_extra_words()
 
         # Should add non-comment, non-empty words
-        mock_dictionary.add.assert_any_call("word1")
-        mock_dictionary.add.assert_any_call("word2")
-        mock_dictionary.add.assert_any_call("word3")
+        mock_dictionary.add_to_session.assert_any_call("word1")
+        mock_dictionary.add_to_session.assert_any_call("word2")
+        mock_dictionary.add_to_session.assert_any_call("word3")
         # Should not add comment or empty lines - check that they weren't called
-        calls = mock_dictionary.add.call_args_list
+        calls = mock_dictionary.add_to_session.call_args_list
         comment_calls = [call for call in calls if call[0][0] == "#comment"]
         empty_calls = [call for call in calls if call[0][0] == ""]
         assert len(comment_calls) == 0
@@ -222,7 +222,7 @@ class TestDictionaryManager:
 
         assert len(manager._errors) == 1
         assert "Arquivo extra-words.dic não encontrado" in manager._errors[0]
-        mock_dictionary.add.assert_not_called()
+        mock_dictionary.add_to_session.assert_not_called()
 
     def test_load_extra_words_file_read_error(self, mocker) -> None:
         """Test loading extra words when file read fails."""
@@ -360,7 +360,7 @@ class TestDictionaryManagerEdgeCases:
         result = manager.initialize_dictionary(large_word_list)
 
         assert result == mock_dictionary
-        assert mock_dictionary.add.call_count == 10000
+        assert mock_dictionary.add_to_session.call_count == 10000
 
     def test_load_extra_words_empty_file(self, mocker) -> None:
         """Test loading extra words from empty file."""
@@ -377,7 +377,7 @@ class TestDictionaryManagerEdgeCases:
         manager._load_extra_words()
 
         # Should not add any words
-        mock_dictionary.add.assert_not_called()
+        mock_dictionary.add_to_session.assert_not_called()
 
     def test_load_extra_words_file_with_only_comments(self, mocker) -> None:
         """Test loading extra words from file with only comments."""
@@ -396,7 +396,7 @@ class TestDictionaryManagerEdgeCases:
         manager._load_extra_words()
 
         # Should not add any words
-        mock_dictionary.add.assert_not_called()
+        mock_dictionary.add_to_session.assert_not_called()
 
     def test_clean_temporary_files_no_files_exist(self, mocker) -> None:
         """Test cleanup when no temporary files exist."""